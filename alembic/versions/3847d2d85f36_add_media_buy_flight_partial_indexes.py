@@ -0,0 +1,59 @@
+"""add_media_buy_flight_partial_indexes
+
+Partial indexes on media_buys flight times so MediaBuyStatusScheduler's bulk
+status transitions only scan buys it can still move forward. Also merges the
+favicon_url and format_ids validation heads.
+
+Revision ID: 3847d2d85f36
+Revises: f319ed58b321, fix_format_ids_validation
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3847d2d85f36"
+down_revision: Union[str, Sequence[str], None] = ("f319ed58b321", "fix_format_ids_validation")
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add partial flight-time indexes on media_buys."""
+    op.create_index(
+        "idx_media_buys_live_start_time",
+        "media_buys",
+        ["start_time"],
+        postgresql_where=sa.text("status IN ('pending_activation', 'scheduled')"),
+    )
+    op.create_index(
+        "idx_media_buys_live_start_date",
+        "media_buys",
+        ["start_date"],
+        postgresql_where=sa.text("status IN ('pending_activation', 'scheduled') AND start_time IS NULL"),
+    )
+    op.create_index(
+        "idx_media_buys_live_end_time",
+        "media_buys",
+        ["end_time"],
+        postgresql_where=sa.text("status IN ('pending_activation', 'scheduled', 'active')"),
+    )
+    op.create_index(
+        "idx_media_buys_live_end_date",
+        "media_buys",
+        ["end_date"],
+        postgresql_where=sa.text("status IN ('pending_activation', 'scheduled', 'active') AND end_time IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Drop partial flight-time indexes on media_buys."""
+    op.drop_index("idx_media_buys_live_end_date", "media_buys")
+    op.drop_index("idx_media_buys_live_end_time", "media_buys")
+    op.drop_index("idx_media_buys_live_start_date", "media_buys")
+    op.drop_index("idx_media_buys_live_start_time", "media_buys")
@@ -0,0 +1,36 @@
+"""add_tenant_product_catalog_version
+
+Add tenants.product_catalog_version, bumped in the same transaction as any write
+to a tenant's products. get_products caches converted catalogs per process and
+compares this version to decide whether its cached copy is still current.
+
+Revision ID: 5c1d8e2f4a7b
+Revises: 86043f46ba9d
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c1d8e2f4a7b"
+down_revision: Union[str, Sequence[str], None] = "86043f46ba9d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add product_catalog_version to tenants."""
+    op.add_column(
+        "tenants",
+        sa.Column("product_catalog_version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    """Remove product_catalog_version from tenants."""
+    op.drop_column("tenants", "product_catalog_version")
@@ -0,0 +1,42 @@
+"""add_a2a_tasks
+
+Add the a2a_tasks table backing the database A2A task store, so every A2A
+server worker can answer tasks/get and tasks/cancel for any task.
+
+Revision ID: 7e3a9c1b5d2f
+Revises: 5c1d8e2f4a7b
+Create Date: 2026-10-16 23:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7e3a9c1b5d2f"
+down_revision: Union[str, Sequence[str], None] = "5c1d8e2f4a7b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create a2a_tasks."""
+    op.create_table(
+        "a2a_tasks",
+        sa.Column("task_id", sa.String(length=100), nullable=False),
+        sa.Column("context_id", sa.String(length=100), nullable=True),
+        sa.Column("task", sa.dialects.postgresql.JSONB, nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("task_id"),
+    )
+    op.create_index("idx_a2a_tasks_expires_at", "a2a_tasks", ["expires_at"])
+
+
+def downgrade() -> None:
+    """Drop a2a_tasks."""
+    op.drop_index("idx_a2a_tasks_expires_at", table_name="a2a_tasks")
+    op.drop_table("a2a_tasks")
@@ -0,0 +1,42 @@
+"""add_webhook_outbox_columns
+
+Turn webhook_deliveries into a durable outbox for delivery webhooks: rows are
+claimed when next_attempt_at is due, and config_id points at the push
+notification config used to authenticate and sign the request.
+
+Revision ID: 86043f46ba9d
+Revises: 3847d2d85f36
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "86043f46ba9d"
+down_revision: Union[str, Sequence[str], None] = "3847d2d85f36"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add outbox scheduling columns to webhook_deliveries."""
+    op.add_column("webhook_deliveries", sa.Column("next_attempt_at", sa.DateTime(), nullable=True))
+    op.add_column("webhook_deliveries", sa.Column("config_id", sa.String(50), nullable=True))
+    op.create_index(
+        "idx_webhook_deliveries_outbox_due",
+        "webhook_deliveries",
+        ["next_attempt_at"],
+        postgresql_where=sa.text("next_attempt_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Remove outbox scheduling columns from webhook_deliveries."""
+    op.drop_index("idx_webhook_deliveries_outbox_due", "webhook_deliveries")
+    op.drop_column("webhook_deliveries", "config_id")
+    op.drop_column("webhook_deliveries", "next_attempt_at")
@@ -4,12 +4,13 @@ AdCP Sales Agent A2A Server using official a2a-sdk library.
 Supports both standard A2A message format and JSON-RPC 2.0.
 """
 
+import asyncio
 import contextvars
 import logging
 import os
 import sys
 import uuid
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable, Iterator
 from typing import Any, cast
 
 # Fix import order to avoid local a2a directory conflict
@@ -41,10 +42,12 @@ from a2a.types import (
     MethodNotFoundError,
     Part,
     Task,
+    TaskArtifactUpdateEvent,
     TaskIdParams,
     TaskQueryParams,
     TaskState,
     TaskStatus,
+    TaskStatusUpdateEvent,
     TextPart,
     UnsupportedOperationError,
 )
@@ -60,6 +63,8 @@ from datetime import UTC, datetime
 
 from sqlalchemy import select
 
+from src.a2a_server.jsonrpc_middleware import JSONRPCPreprocessMiddleware
+from src.a2a_server.task_store import TaskStore, get_task_store, new_task_id
 from src.core.audit_logger import get_audit_logger
 from src.core.auth_utils import get_principal_from_token
 from src.core.config_loader import get_current_tenant
@@ -155,11 +160,81 @@ DISCOVERY_SKILLS = frozenset(
     }
 )
 
+# Products per artifact chunk when message/stream sends a get_products result
+A2A_STREAM_PRODUCT_BATCH = int(os.environ.get("ADCP_A2A_STREAM_PRODUCT_BATCH", "50"))
+
+# Explicit discovery skills in one message run concurrently, up to this many at a time,
+# each bounded by the timeout (seconds, 0 = no limit)
+A2A_SKILL_CONCURRENCY = int(os.environ.get("ADCP_A2A_SKILL_CONCURRENCY", "8"))
+A2A_SKILL_TIMEOUT = float(os.environ.get("ADCP_A2A_SKILL_TIMEOUT", "60"))
+
 # Context variables for current request (works with async code, unlike threading.local())
 _request_auth_token: contextvars.ContextVar[str | None] = contextvars.ContextVar("request_auth_token", default=None)
 _request_headers: contextvars.ContextVar[dict | None] = contextvars.ContextVar("request_headers", default=None)
 
 
+def _skill_batches(skill_invocations: list[dict[str, Any]]) -> list[list[int]]:
+    """Group explicit skill invocations (by index) into batches that may run concurrently.
+
+    Consecutive discovery skills, which are read-only, share a batch of up to
+    A2A_SKILL_CONCURRENCY. Every other skill is a batch of its own, so skills with
+    side effects run strictly in message order.
+    """
+    batches: list[list[int]] = []
+    for index, invocation in enumerate(skill_invocations):
+        if (
+            invocation["skill"] in DISCOVERY_SKILLS
+            and batches
+            and skill_invocations[batches[-1][0]]["skill"] in DISCOVERY_SKILLS
+            and len(batches[-1]) < A2A_SKILL_CONCURRENCY
+        ):
+            batches[-1].append(index)
+        else:
+            batches.append([index])
+    return batches
+
+
+# message/stream runs whose client disconnected, kept referenced until they finish
+_background_runs: set[asyncio.Future] = set()
+
+
+def _finish_background_run(runner: asyncio.Future) -> None:
+    """Release a finished background run and log its failure, which no client will see."""
+    _background_runs.discard(runner)
+    if not runner.cancelled() and (error := runner.exception()) is not None:
+        logger.error(f"message/stream run failed after its client disconnected: {error}", exc_info=error)
+
+
+def _chunk_artifact_event(event: TaskArtifactUpdateEvent) -> Iterator[TaskArtifactUpdateEvent]:
+    """Split a get_products artifact into product batches; other artifacts pass through.
+
+    The first chunk carries the text part and the response with only the first
+    batch of products. Each later chunk appends a DataPart with the next batch.
+    """
+    artifact = event.artifact
+    data_part = artifact.parts[-1].root
+    if not isinstance(data_part, DataPart):
+        yield event
+        return
+    products = data_part.data.get("products")
+    if not isinstance(products, list) or len(products) <= A2A_STREAM_PRODUCT_BATCH:
+        yield event
+        return
+
+    batch = A2A_STREAM_PRODUCT_BATCH
+    first_parts = [*artifact.parts[:-1], Part(root=DataPart(data={**data_part.data, "products": products[:batch]}))]
+    yield event.model_copy(update={"artifact": artifact.model_copy(update={"parts": first_parts}), "last_chunk": False})
+    for start in range(batch, len(products), batch):
+        parts = [Part(root=DataPart(data={"products": products[start : start + batch]}))]
+        yield event.model_copy(
+            update={
+                "artifact": artifact.model_copy(update={"parts": parts}),
+                "append": True,
+                "last_chunk": start + batch >= len(products),
+            }
+        )
+
+
 class MinimalContext:
     """Minimal context for unauthenticated requests that need tenant detection.
 
@@ -191,9 +266,14 @@ class MinimalContext:
 class AdCPRequestHandler(RequestHandler):
     """Request handler for AdCP A2A operations supporting JSON-RPC 2.0."""
 
-    def __init__(self):
-        """Initialize the AdCP A2A request handler."""
-        self.tasks = {}  # In-memory task storage
+    def __init__(self, task_store: TaskStore | None = None):
+        """Initialize the AdCP A2A request handler.
+
+        Args:
+            task_store: Where tasks are kept (defaults to the process-wide store, see task_store.py)
+        """
+        # An empty store is falsy (it defines __len__), so test for None explicitly
+        self.task_store = task_store if task_store is not None else get_task_store()
         logger.info("AdCP Request Handler initialized for direct function calls")
 
     def _get_auth_token(self) -> str | None:
@@ -526,6 +606,33 @@ class AdCPRequestHandler(RequestHandler):
             logger.debug(f"Could not reconstruct response object for {skill_name}: {e}")
         return None
 
+    def _build_skill_artifact(self, index: int, res: dict[str, Any]) -> Artifact:
+        """Build the artifact for the index-th (1-based) explicit skill result."""
+        artifact_data = res["result"] if res["success"] else {"error": res["error"]}
+
+        # Generate human-readable text from response __str__()
+        # Per A2A spec, use TextPart + DataPart pattern (not description field)
+        text_message = None
+        if res["success"] and isinstance(artifact_data, dict):
+            try:
+                response_obj = self._reconstruct_response_object(res["skill"], artifact_data)
+                if response_obj and hasattr(response_obj, "__str__"):
+                    text_message = str(response_obj)
+            except Exception:
+                pass  # If reconstruction fails, skip text part
+
+        # Build parts list per A2A spec: optional TextPart + required DataPart
+        parts = []
+        if text_message:
+            parts.append(Part(root=TextPart(text=text_message)))
+        parts.append(Part(root=DataPart(data=artifact_data)))
+
+        return Artifact(
+            artifact_id=f"skill_result_{index}",
+            name=f"{'error' if not res['success'] else res['skill']}_result",
+            parts=parts,
+        )
+
     async def on_message_send(
         self,
         params: MessageSendParams,
@@ -541,6 +648,24 @@ class AdCPRequestHandler(RequestHandler):
             params: Parameters including the message and configuration
             context: Server call context
 
+        Returns:
+            Task object or Message response
+        """
+        return await self._process_message(params)
+
+    async def _process_message(
+        self,
+        params: MessageSendParams,
+        on_event: Callable[[Event], None] | None = None,
+    ) -> Task | Message:
+        """Process a message for message/send and message/stream.
+
+        Args:
+            params: Parameters including the message and configuration
+            on_event: Called with progress events: the working status as soon as the task
+                exists, then one artifact event per explicit skill as it completes. Once a
+                skill is submitted for approval, only discovery skills' artifacts are sent
+
         Returns:
             Task object or Message response
         """
@@ -584,7 +709,7 @@ class AdCPRequestHandler(RequestHandler):
         combined_text = " ".join(text_parts).strip().lower()
 
         # Create task for tracking
-        task_id = f"task_{len(self.tasks) + 1}"
+        task_id = new_task_id()
         # Handle message_id being a number or string
         msg_id = str(params.message.message_id) if hasattr(params.message, "message_id") else None
         context_id = params.message.context_id or msg_id or f"ctx_{task_id}"
@@ -636,7 +761,9 @@ class AdCPRequestHandler(RequestHandler):
             status=TaskStatus(state=TaskState.working),
             metadata=task_metadata,
         )
-        self.tasks[task_id] = task
+        self.task_store.save(task)
+        if on_event:
+            on_event(TaskStatusUpdateEvent(task_id=task_id, context_id=context_id, status=task.status, final=False))
 
         try:
             # Get authentication token
@@ -662,25 +789,66 @@ class AdCPRequestHandler(RequestHandler):
 
             # Route: Handle explicit skill invocations first, then natural language fallback
             if skill_invocations:
-                # Process explicit skill invocations
-                results = []
-                for invocation in skill_invocations:
-                    skill_name = invocation["skill"]
-                    parameters = invocation["parameters"]
+                # Process explicit skill invocations. Consecutive discovery skills run
+                # concurrently; any other skill runs alone, in message order.
+                results: list[dict[str, Any]] = [{}] * len(skill_invocations)
+                artifacts: list[Artifact | None] = [None] * len(skill_invocations)
+                submitted = False
+
+                async def run_skill(index: int) -> None:
+                    nonlocal submitted
+                    skill_name = skill_invocations[index]["skill"]
+                    parameters = skill_invocations[index]["parameters"]
                     logger.info(f"Processing explicit skill: {skill_name} with parameters: {parameters}")
 
                     try:
-                        result = await self._handle_explicit_skill(
+                        call = self._handle_explicit_skill(
                             skill_name, parameters, auth_token,
                             push_notification_config=task_metadata.get("push_notification_config")
                         )
-                        results.append({"skill": skill_name, "result": result, "success": True})
+                        if skill_name in DISCOVERY_SKILLS and A2A_SKILL_TIMEOUT > 0:
+                            result = await asyncio.wait_for(call, timeout=A2A_SKILL_TIMEOUT)
+                        else:
+                            result = await call
+                        res = {"skill": skill_name, "result": result, "success": True}
                     except ServerError:
                         # ServerError should bubble up immediately (JSON-RPC error)
                         raise
+                    except TimeoutError:
+                        logger.error(f"Explicit skill {skill_name} timed out after {A2A_SKILL_TIMEOUT:g}s")
+                        res = {
+                            "skill": skill_name,
+                            "error": f"Skill {skill_name} timed out after {A2A_SKILL_TIMEOUT:g}s",
+                            "success": False,
+                        }
                     except Exception as e:
                         logger.error(f"Error in explicit skill {skill_name}: {e}")
-                        results.append({"skill": skill_name, "error": str(e), "success": False})
+                        res = {"skill": skill_name, "error": str(e), "success": False}
+
+                    results[index] = res
+                    artifact = self._build_skill_artifact(index + 1, res)
+                    artifacts[index] = artifact
+
+                    # Stream each artifact as its skill completes. A submitted task is returned
+                    # without artifacts, so once a skill is submitted only read-only discovery
+                    # results are still streamed.
+                    result = res.get("result")
+                    skill_submitted = isinstance(result, dict) and result.get("status") == "submitted"
+                    submitted = submitted or skill_submitted
+                    if not on_event or not artifact or skill_submitted:
+                        return
+                    if skill_name in DISCOVERY_SKILLS or not submitted:
+                        on_event(TaskArtifactUpdateEvent(task_id=task_id, context_id=context_id, artifact=artifact))
+
+                for batch in _skill_batches(skill_invocations):
+                    if len(batch) == 1:
+                        await run_skill(batch[0])
+                        continue
+                    # Let every skill in the batch finish, then raise the first ServerError in message order
+                    outcomes = await asyncio.gather(*(run_skill(index) for index in batch), return_exceptions=True)
+                    for outcome in outcomes:
+                        if isinstance(outcome, BaseException):
+                            raise outcome
 
                 # Check for submitted status (manual approval required) - return early without artifacts
                 # Per AdCP spec, async operations should return Task with status=submitted and no artifacts
@@ -693,38 +861,10 @@ class AdCPRequestHandler(RequestHandler):
                             logger.info(f"Task {task_id} requires manual approval, returning status=submitted with no artifacts")
                             # Send protocol-level webhook notification
                             await self._send_protocol_webhook(task, status="submitted")
-                            self.tasks[task_id] = task
+                            self.task_store.save(task)
                             return task
 
-                # Create artifacts for all skill results with human-readable text
-                for i, res in enumerate(results):
-                    artifact_data = res["result"] if res["success"] else {"error": res["error"]}
-
-                    # Generate human-readable text from response __str__()
-                    # Per A2A spec, use TextPart + DataPart pattern (not description field)
-                    text_message = None
-                    if res["success"] and isinstance(artifact_data, dict):
-                        try:
-                            response_obj = self._reconstruct_response_object(res["skill"], artifact_data)
-                            if response_obj and hasattr(response_obj, "__str__"):
-                                text_message = str(response_obj)
-                        except Exception:
-                            pass  # If reconstruction fails, skip text part
-
-                    # Build parts list per A2A spec: optional TextPart + required DataPart
-                    parts = []
-                    if text_message:
-                        parts.append(Part(root=TextPart(text=text_message)))
-                    parts.append(Part(root=DataPart(data=artifact_data)))
-
-                    task.artifacts = task.artifacts or []
-                    task.artifacts.append(
-                        Artifact(
-                            artifact_id=f"skill_result_{i + 1}",
-                            name=f"{'error' if not res['success'] else res['skill']}_result",
-                            parts=parts,
-                        )
-                    )
+                task.artifacts = [artifact for artifact in artifacts if artifact]
 
                 # Check if any skills failed and determine task status
                 failed_skills = [res["skill"] for res in results if not res["success"]]
@@ -1030,7 +1170,7 @@ class AdCPRequestHandler(RequestHandler):
             # Raise ServerError instead of creating failed task
             raise ServerError(InternalError(message=f"Message processing failed: {str(e)}"))
 
-        self.tasks[task_id] = task
+        self.task_store.save(task)
         return task
 
     async def on_message_send_stream(
@@ -1040,21 +1180,51 @@ class AdCPRequestHandler(RequestHandler):
     ) -> AsyncGenerator[Event]:
         """Handle 'message/stream' method for streaming requests.
 
+        Events are sent as the message is processed: a working status as soon as
+        the task exists, each explicit skill's artifact as that skill completes (after a
+        skill is submitted for approval, only discovery skills' artifacts), then the
+        remaining artifacts (natural language responses) and a final status.
+        get_products results are sent in chunks of ADCP_A2A_STREAM_PRODUCT_BATCH
+        products so no single event carries the whole catalog.
+
         Args:
             params: Parameters including the message and configuration
             context: Server call context
 
         Yields:
-            Event objects from the agent's execution
+            TaskStatusUpdateEvent and TaskArtifactUpdateEvent objects (or a Message)
         """
-        # For now, implement non-streaming behavior
-        # In production, this would yield events as they occur
-        result = await self.on_message_send(params, context)
+        events: asyncio.Queue[Event | None] = asyncio.Queue()
+        runner = asyncio.ensure_future(self._process_message(params, on_event=events.put_nowait))
+        runner.add_done_callback(lambda _: events.put_nowait(None))
 
-        # Yield a single event with the complete task
-        # result can be Task, Message, or other A2A types - all have model_dump()
-        # mypy doesn't understand that union members all have model_dump()
-        yield Event(type="task_update", data=result.model_dump())  # type: ignore[operator]
+        streamed: set[str] = set()
+        try:
+            while (event := await events.get()) is not None:
+                if isinstance(event, TaskArtifactUpdateEvent):
+                    streamed.add(event.artifact.artifact_id)
+                    for chunk in _chunk_artifact_event(event):
+                        yield chunk
+                else:
+                    yield event
+        finally:
+            if not runner.done():
+                # Client went away: let the task finish (and be stored) without it
+                _background_runs.add(runner)
+                runner.add_done_callback(_finish_background_run)
+
+        # Raises ServerError if processing failed
+        result = runner.result()
+        if isinstance(result, Message):
+            yield result
+            return
+
+        for artifact in result.artifacts or []:
+            if artifact.artifact_id not in streamed:
+                event = TaskArtifactUpdateEvent(task_id=result.id, context_id=result.context_id, artifact=artifact)
+                for chunk in _chunk_artifact_event(event):
+                    yield chunk
+        yield TaskStatusUpdateEvent(task_id=result.id, context_id=result.context_id, status=result.status, final=True)
 
     async def on_get_task(
         self,
@@ -1070,8 +1240,7 @@ class AdCPRequestHandler(RequestHandler):
         Returns:
             Task object if found, otherwise None
         """
-        task_id = params.id
-        return self.tasks.get(task_id)
+        return self.task_store.get(params.id)
 
     async def on_cancel_task(
         self,
@@ -1087,11 +1256,10 @@ class AdCPRequestHandler(RequestHandler):
         Returns:
             Task object with canceled status, or None if not found
         """
-        task_id = params.id
-        task = self.tasks.get(task_id)
+        task = self.task_store.get(params.id)
         if task:
             task.status = TaskStatus(state=TaskState.canceled)
-            self.tasks[task_id] = task
+            self.task_store.save(task)
         return task
 
     async def on_resubscribe_to_task(
@@ -1920,7 +2088,8 @@ class AdCPRequestHandler(RequestHandler):
             else:
                 # MinimalContext works with core tools directly
                 mcp_ctx = cast(ToolContext, tool_context)
-            response = core_list_creative_formats_tool(req=req, ctx=mcp_ctx)
+            # Sync core tool: run it off the event loop so batched discovery skills overlap
+            response = await asyncio.to_thread(core_list_creative_formats_tool, req=req, ctx=mcp_ctx)
 
             # Convert response to dict
             if isinstance(response, dict):
@@ -1976,7 +2145,10 @@ class AdCPRequestHandler(RequestHandler):
             # Call core function directly
             # Context can be None for unauthenticated calls - tenant will be detected from headers
             # MinimalContext is not compatible with ToolContext type, but works at runtime
-            response = core_list_authorized_properties_tool(req=request, ctx=tool_context)  # type: ignore[arg-type]
+            # Sync core tool: run it off the event loop so batched discovery skills overlap
+            response = await asyncio.to_thread(
+                core_list_authorized_properties_tool, req=request, ctx=tool_context  # type: ignore[arg-type]
+            )
 
             # Return spec-compliant response (no extra fields)
             # Per AdCP v2.4 spec: only publisher_domains, primary_channels, primary_countries,
@@ -2665,98 +2837,13 @@ def main():
     # Add debug route
     app.router.routes.append(Route("/debug/tenant", debug_tenant_endpoint, methods=["GET"]))
 
-    # Add middleware for backward compatibility with numeric messageId
-    @app.middleware("http")
-    async def messageId_compatibility_middleware(request, call_next):
-        """Middleware to handle both numeric and string messageId for backward compatibility."""
-        import json
-
-        # Only process JSON-RPC requests to /a2a
-        if request.url.path == "/a2a" and request.method == "POST":
-            # Read the body
-            body = await request.body()
-            try:
-                data = json.loads(body)
-
-                # Check if this is a JSON-RPC request with numeric messageId
-                if isinstance(data, dict) and "params" in data:
-                    params = data.get("params", {})
-                    if "message" in params and isinstance(params["message"], dict):
-                        message = params["message"]
-                        # Convert numeric messageId to string if needed
-                        if "messageId" in message and isinstance(message["messageId"], (int, float)):
-                            logger.warning(
-                                f"Converting numeric messageId {message['messageId']} to string for compatibility"
-                            )
-                            message["messageId"] = str(message["messageId"])
-                            # Update the request body
-                            body = json.dumps(data).encode()
-
-                # Also handle the outer id field for JSON-RPC
-                if "id" in data and isinstance(data["id"], (int, float)):
-                    logger.warning(f"Converting numeric JSON-RPC id {data['id']} to string for compatibility")
-                    data["id"] = str(data["id"])
-                    body = json.dumps(data).encode()
-
-            except (json.JSONDecodeError, KeyError):
-                # Not JSON or doesn't have expected structure, pass through
-                pass
-
-            # Create new request with potentially modified body
-            from starlette.requests import Request
-
-            request = Request(request.scope, receive=lambda: {"type": "http.request", "body": body})
-
-        response = await call_next(request)
-        return response
-
-    # Add authentication middleware for Bearer token extraction
-    @app.middleware("http")
-    async def auth_middleware(request, call_next):
-        """Extract Bearer token and set authentication context for A2A requests.
-
-        Accepts authentication via either:
-        - Authorization: Bearer <token> (standard A2A/HTTP)
-        - x-adcp-auth: <token> (AdCP convention, for compatibility with MCP)
-        """
-        # Only process A2A endpoint requests (handle both /a2a and /a2a/)
-        if request.url.path in ["/a2a", "/a2a/"] and request.method == "POST":
-            # Try Authorization header first (standard)
-            token = None
-            auth_source = None
-
-            for key, value in request.headers.items():
-                if key.lower() == "authorization":
-                    auth_header = value.strip()
-                    if auth_header.startswith("Bearer "):
-                        token = auth_header[7:]  # Remove "Bearer " prefix
-                        auth_source = "Authorization"
-                        break
-                elif key.lower() == "x-adcp-auth":
-                    # Also accept x-adcp-auth for compatibility with MCP clients
-                    token = value.strip()
-                    auth_source = "x-adcp-auth"
-                    # Don't break - prefer Authorization if both present
-
-            if token:
-                _request_auth_token.set(token)
-                _request_headers.set(dict(request.headers))
-                logger.info(f"Extracted token from {auth_source} header for A2A request: {token[:10]}...")
-            else:
-                logger.warning(
-                    f"A2A request to {request.url.path} missing authentication (checked Authorization and x-adcp-auth headers)"
-                )
-                _request_auth_token.set(None)
-                _request_headers.set(dict(request.headers))
-
-        response = await call_next(request)
-
-        # Clean up context variables (ContextVars automatically clean up at context boundary,
-        # but explicit cleanup ensures no leakage between requests)
-        _request_auth_token.set(None)
-        _request_headers.set(None)
-
-        return response
+    # Normalize numeric JSON-RPC IDs (backward compatibility) and extract the Bearer token
+    # for /a2a requests in one pass (see jsonrpc_middleware.py)
+    app.add_middleware(
+        JSONRPCPreprocessMiddleware,
+        auth_token_var=_request_auth_token,
+        headers_var=_request_headers,
+    )
 
     # Run with uvicorn
     import uvicorn
@@ -0,0 +1,134 @@
+"""Single-pass pre-processing of JSON-RPC requests to the A2A endpoint.
+
+Replaces two stacked ``@app.middleware("http")`` layers. One read and parsed the
+body, re-serialized it and rebuilt the Request to turn numeric IDs into strings.
+The other scanned every header to find the token and copied them into a dict.
+Each BaseHTTPMiddleware layer also runs the rest of the app in a separate task.
+
+``JSONRPCPreprocessMiddleware`` is plain ASGI. For POST /a2a it:
+
+- builds the header dict once from the raw ASGI headers (names are already
+  lowercase) and looks the token up by key
+- reads and parses the body once, re-encoding it only when an ID was numeric
+- replays the body to the app, then passes later receive() messages (e.g.
+  http.disconnect for streaming responses) through from the server
+"""
+
+import json
+import logging
+from contextvars import ContextVar
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+A2A_RPC_PATHS = frozenset({"/a2a", "/a2a/"})
+
+
+def extract_auth_token(headers: dict[str, str]) -> tuple[str | None, str | None]:
+    """Return (token, header name) from lowercase request headers.
+
+    ``Authorization: Bearer <token>`` (standard A2A/HTTP) takes precedence over
+    ``x-adcp-auth: <token>`` (AdCP convention, for compatibility with MCP clients).
+    """
+    authorization = headers.get("authorization", "").strip()
+    if authorization.startswith("Bearer "):
+        return authorization[7:], "Authorization"
+    token = headers.get("x-adcp-auth", "").strip()
+    if token:
+        return token, "x-adcp-auth"
+    return None, None
+
+
+def normalize_jsonrpc_ids(body: bytes) -> bytes:
+    """Convert numeric JSON-RPC ``id`` and ``params.message.messageId`` to strings.
+
+    Bodies that are not JSON objects, or have no numeric IDs, are returned as is.
+    """
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return body
+    if not isinstance(data, dict):
+        return body
+
+    changed = False
+    params = data.get("params")
+    message = params.get("message") if isinstance(params, dict) else None
+    if isinstance(message, dict) and isinstance(message.get("messageId"), (int, float)):
+        logger.warning(f"Converting numeric messageId {message['messageId']} to string for compatibility")
+        message["messageId"] = str(message["messageId"])
+        changed = True
+    if isinstance(data.get("id"), (int, float)):
+        logger.warning(f"Converting numeric JSON-RPC id {data['id']} to string for compatibility")
+        data["id"] = str(data["id"])
+        changed = True
+    return json.dumps(data).encode() if changed else body
+
+
+class JSONRPCPreprocessMiddleware:
+    """Normalize JSON-RPC IDs and set request auth context for POST /a2a."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        auth_token_var: ContextVar[str | None],
+        headers_var: ContextVar[dict | None],
+    ):
+        """Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI app
+            auth_token_var: Set to the request's token (or None) while the app runs
+            headers_var: Set to the request's headers while the app runs
+        """
+        self.app = app
+        self.auth_token_var = auth_token_var
+        self.headers_var = headers_var
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] not in A2A_RPC_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        headers = {name.decode("latin-1"): value.decode("latin-1") for name, value in scope["headers"]}
+        token, auth_source = extract_auth_token(headers)
+        if token:
+            logger.info(f"Extracted token from {auth_source} header for A2A request: {token[:10]}...")
+        else:
+            logger.warning(
+                f"A2A request to {scope['path']} missing authentication (checked Authorization and x-adcp-auth headers)"
+            )
+
+        body = await _read_body(receive)
+        if body is None:
+            return  # Client disconnected before sending the whole body
+        body = normalize_jsonrpc_ids(body)
+
+        body_sent = False
+
+        async def replay() -> Message:
+            nonlocal body_sent
+            if body_sent:
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        token_reset = self.auth_token_var.set(token)
+        headers_reset = self.headers_var.set(headers)
+        try:
+            await self.app(scope, replay, send)
+        finally:
+            self.auth_token_var.reset(token_reset)
+            self.headers_var.reset(headers_reset)
+
+
+async def _read_body(receive: Receive) -> bytes | None:
+    chunks: list[bytes] = []
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return None
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            return b"".join(chunks)
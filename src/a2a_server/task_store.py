@@ -0,0 +1,179 @@
+"""Bounded A2A task stores.
+
+AdCPRequestHandler used to keep every task in a plain dict for the life of the
+process and numbered them ``task_{len(tasks) + 1}``. That grew without bound on
+long-running servers. Behind a load balancer, workers also reused each other's
+IDs, and tasks/get missed tasks another worker had handled.
+
+Two backends implement ``TaskStore``:
+
+- ``InMemoryTaskStore``: per-process LRU with TTL (the default). Suitable for a
+  single worker.
+- ``DatabaseTaskStore``: the ``a2a_tasks`` table, shared by every worker. Rows
+  past their expiry are ignored on read and purged periodically.
+
+Task IDs are random (``new_task_id``), so they never collide across workers or
+restarts. Stored task counts are exported as the ``a2a_tasks_stored`` gauge.
+Evictions are counted in ``cache_evictions_total{cache="a2a_tasks"}``.
+
+Environment variables:
+    ADCP_A2A_TASK_STORE: "memory" (default) or "database"
+    ADCP_A2A_TASK_TTL: Seconds a task is kept after its last update (default 86400)
+    ADCP_A2A_TASK_MAX_ENTRIES: Maximum tasks per process for the memory store (default 10000)
+"""
+
+import logging
+import os
+import threading
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Protocol, cast
+
+from a2a.types import Task
+from sqlalchemy import CursorResult, delete, func, select
+
+from src.core.database.database_session import get_db_session
+from src.core.database.models import A2ATask
+from src.core.metrics import a2a_tasks_stored, cache_evictions_total
+from src.core.utils.ttl_cache import MISSING, TTLCache
+
+logger = logging.getLogger(__name__)
+
+A2A_TASK_STORE_BACKEND = os.environ.get("ADCP_A2A_TASK_STORE", "memory").lower()
+A2A_TASK_TTL_SECONDS = float(os.environ.get("ADCP_A2A_TASK_TTL", "86400"))
+A2A_TASK_MAX_ENTRIES = int(os.environ.get("ADCP_A2A_TASK_MAX_ENTRIES", "10000"))
+
+# Seconds between purges of expired rows by one process (database store)
+PURGE_INTERVAL_SECONDS = 300.0
+
+
+def new_task_id() -> str:
+    """Return a task ID that is unique across workers and restarts."""
+    return f"task_{uuid.uuid4().hex}"
+
+
+class TaskStore(Protocol):
+    """Storage for A2A tasks, keyed by task ID."""
+
+    def get(self, task_id: str) -> Task | None:
+        """Return the task, or None if unknown or expired."""
+        ...
+
+    def save(self, task: Task) -> None:
+        """Insert or replace the task and restart its TTL."""
+        ...
+
+    def __len__(self) -> int: ...
+
+
+class InMemoryTaskStore:
+    """Per-process task store with LRU eviction and a TTL."""
+
+    def __init__(self, maxsize: int = A2A_TASK_MAX_ENTRIES, ttl: float = A2A_TASK_TTL_SECONDS):
+        self._tasks = TTLCache(maxsize=maxsize, ttl=ttl, name="a2a_tasks")
+
+    def get(self, task_id: str) -> Task | None:
+        task = self._tasks.get(task_id)
+        return None if task is MISSING else task
+
+    def save(self, task: Task) -> None:
+        self._tasks.set(task.id, task)
+        a2a_tasks_stored.labels(backend="memory").set(len(self._tasks))
+
+    def clear(self) -> None:
+        self._tasks.clear()
+        a2a_tasks_stored.labels(backend="memory").set(0)
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+
+class DatabaseTaskStore:
+    """Task store on the a2a_tasks table, shared by all workers."""
+
+    def __init__(self, ttl: float = A2A_TASK_TTL_SECONDS):
+        self.ttl = ttl
+        self._last_purge = 0.0
+        self._purge_lock = threading.Lock()
+
+    def get(self, task_id: str) -> Task | None:
+        with get_db_session() as session:
+            row = session.scalars(
+                select(A2ATask).where(A2ATask.task_id == task_id, A2ATask.expires_at > _utcnow())
+            ).first()
+            return Task.model_validate(row.task) if row else None
+
+    def save(self, task: Task) -> None:
+        now = _utcnow()
+        with get_db_session() as session:
+            session.merge(
+                A2ATask(
+                    task_id=task.id,
+                    context_id=task.context_id,
+                    task=task.model_dump(mode="json"),
+                    updated_at=now,
+                    expires_at=now + timedelta(seconds=self.ttl),
+                )
+            )
+            session.commit()
+        self._maybe_purge()
+
+    def purge_expired(self) -> int:
+        """Delete expired tasks and refresh the stored-task gauge.
+
+        Returns:
+            Number of tasks deleted
+        """
+        with get_db_session() as session:
+            result = cast(CursorResult, session.execute(delete(A2ATask).where(A2ATask.expires_at <= _utcnow())))
+            deleted = result.rowcount or 0
+            session.commit()
+            remaining = session.scalar(select(func.count()).select_from(A2ATask)) or 0
+        if deleted:
+            cache_evictions_total.labels(cache="a2a_tasks", reason="expired").inc(deleted)
+            logger.info(f"Purged {deleted} expired A2A tasks")
+        a2a_tasks_stored.labels(backend="database").set(remaining)
+        return deleted
+
+    def _maybe_purge(self) -> None:
+        now = time.monotonic()
+        if now - self._last_purge < PURGE_INTERVAL_SECONDS or not self._purge_lock.acquire(blocking=False):
+            return
+        try:
+            self._last_purge = now
+            self.purge_expired()
+        except Exception as e:
+            logger.warning(f"Failed to purge expired A2A tasks: {e}")
+        finally:
+            self._purge_lock.release()
+
+    def __len__(self) -> int:
+        stmt = select(func.count()).select_from(A2ATask).where(A2ATask.expires_at > _utcnow())
+        with get_db_session() as session:
+            return session.scalar(stmt) or 0
+
+
+def _utcnow() -> datetime:
+    # a2a_tasks uses naive UTC timestamps
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+_store: TaskStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_task_store() -> TaskStore:
+    """Return the process-wide task store selected by ADCP_A2A_TASK_STORE."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                if A2A_TASK_STORE_BACKEND == "database":
+                    _store = DatabaseTaskStore()
+                else:
+                    if A2A_TASK_STORE_BACKEND != "memory":
+                        logger.warning(f"Unknown ADCP_A2A_TASK_STORE '{A2A_TASK_STORE_BACKEND}', using memory")
+                    _store = InMemoryTaskStore()
+                logger.info(f"A2A task store: {type(_store).__name__}")
+    return _store
@@ -1,4 +1,6 @@
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
@@ -18,6 +20,9 @@ from src.core.schemas import (
     UpdateMediaBuyResponse,
 )
 
+# Concurrent get_media_buy_delivery calls per batch for adapters without a bulk reporting API
+DELIVERY_FETCH_CONCURRENCY = int(os.environ.get("ADCP_DELIVERY_FETCH_CONCURRENCY", "8"))
+
 
 class CreativeEngineAdapter(ABC):
     """Abstract base class for creative engine adapters."""
@@ -143,6 +148,34 @@ class AdServerAdapter(ABC):
         """Gets delivery data for a media buy."""
         pass
 
+    def get_media_buys_delivery(
+        self, media_buy_ids: list[str], date_range: ReportingPeriod, today: datetime
+    ) -> dict[str, AdapterGetMediaBuyDeliveryResponse | Exception]:
+        """Gets delivery data for several media buys.
+
+        The default implementation calls get_media_buy_delivery concurrently.
+        Adapters that can report on many media buys in one request should
+        override this.
+
+        Returns:
+            Map of media_buy_id -> delivery data, or the exception raised while
+            fetching that media buy
+        """
+
+        def fetch(media_buy_id: str) -> AdapterGetMediaBuyDeliveryResponse | Exception:
+            try:
+                return self.get_media_buy_delivery(media_buy_id, date_range, today)
+            except Exception as e:
+                return e
+
+        if len(media_buy_ids) <= 1 or DELIVERY_FETCH_CONCURRENCY <= 1:
+            return {media_buy_id: fetch(media_buy_id) for media_buy_id in media_buy_ids}
+
+        with ThreadPoolExecutor(
+            max_workers=min(DELIVERY_FETCH_CONCURRENCY, len(media_buy_ids)), thread_name_prefix="delivery-fetch"
+        ) as executor:
+            return dict(zip(media_buy_ids, executor.map(fetch, media_buy_ids), strict=True))
+
     @abstractmethod
     def update_media_buy_performance_index(
         self, media_buy_id: str, package_performance: list[PackagePerformance]
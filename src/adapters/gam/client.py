@@ -6,6 +6,8 @@ Provides centralized access to GAM API services with health checking.
 """
 
 import logging
+import threading
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from googleads import ad_manager
@@ -31,6 +33,10 @@ class GAMClientManager:
         self.auth_manager = GAMAuthManager(config)
         self._client: ad_manager.AdManagerClient | None = None
         self._health_checker: GAMHealthChecker | None = None
+        # SOAP service stubs are expensive to build; keep one per service per thread
+        self._services = threading.local()
+        self._lock = threading.Lock()
+        self._current_user_id: str | None = None
 
     def get_client(self) -> ad_manager.AdManagerClient:
         """Get or create the GAM API client.
@@ -43,7 +49,9 @@ class GAMClientManager:
             Exception: If client initialization fails
         """
         if self._client is None:
-            self._client = self._init_client()
+            with self._lock:
+                if self._client is None:
+                    self._client = self._init_client()
         return self._client
 
     def _init_client(self) -> ad_manager.AdManagerClient:
@@ -80,14 +88,59 @@ class GAMClientManager:
     def get_service(self, service_name: str):
         """Get a specific GAM API service.
 
+        Service stubs are cached per thread, so repeated calls (and adapters
+        sharing this manager through the adapter client pool) reuse them.
+
         Args:
             service_name: Name of the service (e.g., 'OrderService', 'LineItemService')
 
         Returns:
             GAM service instance
         """
-        client = self.get_client()
-        return client.GetService(service_name, version="v202411")
+        services = getattr(self._services, "by_name", None)
+        if services is None:
+            services = self._services.by_name = {}
+        service = services.get(service_name)
+        if service is None:
+            client = self.get_client()
+            service = services[service_name] = client.GetService(service_name, version="v202411")
+        return service
+
+    def get_current_user_id(self) -> str:
+        """Get the ID of the GAM user the credentials belong to (fetched once).
+
+        Returns:
+            GAM user ID as a string
+        """
+        if self._current_user_id is None:
+            current_user = self.get_service("UserService").getCurrentUser()
+            self._current_user_id = str(current_user["id"])
+            logger.info(f"Detected GAM user: {self._current_user_id} ({current_user.get('name', 'Unknown')})")
+        return self._current_user_id
+
+    def refresh_credentials_if_expiring(self, margin_seconds: float) -> bool:
+        """Refresh the OAuth access token if it expires within ``margin_seconds``.
+
+        Tokens that were never fetched are left alone; the first request
+        fetches them.
+
+        Returns:
+            True if the token was refreshed
+        """
+        if self._client is None:
+            return False
+        oauth2_client = self._client.oauth2_client
+        creds = getattr(oauth2_client, "creds", None)
+        expiry = getattr(creds, "expiry", None)
+        # google-auth keeps expiry as naive UTC
+        if creds is None or expiry is None or expiry - datetime.now(UTC).replace(tzinfo=None) > timedelta(seconds=margin_seconds):
+            return False
+        with self._lock:
+            if creds.expiry != expiry:
+                return False  # Another thread refreshed it
+            oauth2_client.Refresh()
+        logger.debug(f"Refreshed GAM credentials for network {self.network_code} ahead of expiry")
+        return True
 
     def get_statement_builder(self):
         """Get a StatementBuilder for GAM API queries.
@@ -116,6 +169,7 @@ class GAMClientManager:
     def reset_client(self) -> None:
         """Reset the client connection (force re-initialization on next access)."""
         self._client = None
+        self._services = threading.local()
         logger.info("GAM client reset - will re-initialize on next access")
 
     def get_health_checker(self, dry_run: bool = False) -> GAMHealthChecker:
@@ -201,6 +255,9 @@ class GAMClientManager:
         manager.auth_manager = GAMAuthManager(config)
         manager._client = client
         manager._health_checker = None
+        manager._services = threading.local()
+        manager._lock = threading.Lock()
+        manager._current_user_id = None
 
         logger.info(f"Created GAMClientManager from existing client (network: {network_code})")
         return manager
@@ -0,0 +1,244 @@
+"""
+Shared GAM report job manager
+
+GAM reports are asynchronous: runReportJob returns an ID that has to be polled
+until the job completes. Every reporting request used to start its own job and
+block its thread in a sleep loop while polling. This module centralizes that:
+
+- One poller thread tracks every outstanding job and checks each with
+  exponential backoff. Status checks and downloads run on separate small worker
+  pools, so no request thread sleeps and slow downloads never hold up the
+  status checks that detect other jobs completing.
+- Concurrent callers asking for the same report (same network, query and date
+  range) share one GAM job via a single in-flight Future.
+- Completed results are cached until GAM's data would have moved forward (see
+  GAMReportingService._report_cache_ttl), capped by a maximum TTL.
+
+Environment variables:
+    ADCP_GAM_REPORT_CACHE_MAX_TTL: Upper bound on result cache TTL in seconds
+        (default 900, 0 disables caching)
+    ADCP_GAM_REPORT_CACHE_MAX_ENTRIES: Maximum cached reports (default 256)
+"""
+
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.core.utils.ttl_cache import MISSING, TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class ReportJobConfig:
+    """Polling settings for GAM report jobs."""
+
+    POLL_INITIAL_INTERVAL_SECONDS = 1.0  # First re-check after the immediate one
+    POLL_MAX_INTERVAL_SECONDS = 15.0
+    POLL_BACKOFF_FACTOR = 1.5
+    POLL_WORKERS = 4  # Concurrent status checks
+    DOWNLOAD_WORKERS = 4  # Concurrent downloads of completed reports
+
+
+@dataclass(order=True)
+class _PendingJob:
+    next_poll_at: float
+    sequence: int
+    report_service: Any = field(compare=False)
+    job_id: Any = field(compare=False)
+    fetch: Callable[[Any], Any] = field(compare=False)
+    future: Future = field(compare=False)
+    deadline: float = field(compare=False)
+    timeout: float = field(compare=False)
+    interval: float = field(compare=False)
+
+
+class GAMReportJobManager:
+    """Runs GAM report jobs with shared polling, in-flight dedup and a result cache."""
+
+    def __init__(self, cache_max_ttl: float = 900, cache_max_entries: int = 256):
+        self._results = TTLCache(maxsize=cache_max_entries, ttl=cache_max_ttl, name="gam_reports")
+        self._in_flight: dict[Hashable, Future] = {}
+        self._pending: list[_PendingJob] = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._poll_executor: ThreadPoolExecutor | None = None
+        self._download_executor: ThreadPoolExecutor | None = None
+        self._poller: threading.Thread | None = None
+        self._pid: int | None = None
+
+    def submit(
+        self,
+        report_service: Any,
+        report_job: dict[str, Any],
+        fetch: Callable[[Any], Any],
+        timeout: float,
+        cache_key: Hashable | None = None,
+        ttl: float | None = None,
+    ) -> Future:
+        """Start (or join) a report job and return a Future for its processed result
+
+        Args:
+            report_service: GAM ReportService used to run and poll the job
+            report_job: ReportJob definition passed to runReportJob
+            fetch: Called with the report job ID once it completes; its return
+                value is the Future's result (e.g. downloads and aggregates the CSV)
+            timeout: Seconds to wait for the job to complete before failing
+            cache_key: Identity of the report for dedup and caching. None runs
+                an unshared, uncached job.
+            ttl: Seconds to cache the result (capped by the manager's max TTL)
+        """
+        if cache_key is not None:
+            cached = self._results.get(cache_key)
+            if cached is not MISSING:
+                future: Future = Future()
+                future.set_result(cached)
+                return future
+
+            with self._lock:
+                in_flight = self._in_flight.get(cache_key)
+                if in_flight is not None:
+                    logger.info("Joining in-flight GAM report job for identical query")
+                    return in_flight
+                future = self._in_flight[cache_key] = Future()
+        else:
+            future = Future()
+
+        if cache_key is not None:
+            future.add_done_callback(lambda f: self._on_done(cache_key, f, ttl))
+
+        try:
+            report_job_response = report_service.runReportJob(report_job)
+        except Exception as e:
+            future.set_exception(e)
+            return future
+
+        # runReportJob returns a ReportJob object with an 'id' field
+        if hasattr(report_job_response, "id"):
+            report_job_id = report_job_response.id
+        elif isinstance(report_job_response, dict) and "id" in report_job_response:
+            report_job_id = report_job_response["id"]
+        else:
+            # If it's already just the ID
+            report_job_id = report_job_response
+
+        logger.info(f"Started GAM report job with ID: {report_job_id}")
+
+        now = time.monotonic()
+        self._schedule(
+            _PendingJob(
+                next_poll_at=now,  # First status check right away
+                sequence=next(self._sequence),
+                report_service=report_service,
+                job_id=report_job_id,
+                fetch=fetch,
+                future=future,
+                deadline=now + timeout,
+                timeout=timeout,
+                interval=ReportJobConfig.POLL_INITIAL_INTERVAL_SECONDS,
+            )
+        )
+        return future
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._results.clear()
+
+    def _on_done(self, cache_key: Hashable, future: Future, ttl: float | None) -> None:
+        # Cache before releasing the in-flight slot so later callers find one or the other
+        if future.exception() is None and (ttl is None or ttl > 0):
+            self._results.set(cache_key, future.result(), ttl=None if ttl is None else min(ttl, self._results.ttl))
+        with self._lock:
+            if self._in_flight.get(cache_key) is future:
+                del self._in_flight[cache_key]
+
+    def _schedule(self, job: _PendingJob) -> None:
+        with self._wakeup:
+            heapq.heappush(self._pending, job)
+            if self._poller is None or not self._poller.is_alive() or self._pid != os.getpid():
+                if self._poll_executor is None or self._pid != os.getpid():
+                    # A forked child inherits the executor objects but none of their worker threads
+                    self._poll_executor = ThreadPoolExecutor(
+                        max_workers=ReportJobConfig.POLL_WORKERS, thread_name_prefix="gam-report-poll"
+                    )
+                    self._download_executor = ThreadPoolExecutor(
+                        max_workers=ReportJobConfig.DOWNLOAD_WORKERS, thread_name_prefix="gam-report-download"
+                    )
+                self._pid = os.getpid()
+                self._poller = threading.Thread(target=self._poll_loop, name="gam-report-poller", daemon=True)
+                self._poller.start()
+            self._wakeup.notify()
+
+    def _poll_loop(self) -> None:
+        while True:
+            with self._wakeup:
+                while not self._pending or self._pending[0].next_poll_at > time.monotonic():
+                    timeout = self._pending[0].next_poll_at - time.monotonic() if self._pending else None
+                    self._wakeup.wait(timeout)
+                job = heapq.heappop(self._pending)
+                executor = self._poll_executor
+            assert executor is not None
+            executor.submit(self._check, job)
+
+    def _check(self, job: _PendingJob) -> None:
+        try:
+            status = job.report_service.getReportJobStatus(job.job_id)
+            if status == "COMPLETED":
+                with self._lock:
+                    executor = self._download_executor
+                assert executor is not None
+                executor.submit(self._download, job)
+                return
+            if status == "FAILED":
+                raise Exception("GAM report job failed")
+
+            now = time.monotonic()
+            if now >= job.deadline:
+                raise Exception(f"GAM report job timed out after {job.timeout} seconds")
+        except Exception as e:
+            job.future.set_exception(e)
+            return
+
+        # Still running: back off and check again
+        job.next_poll_at = min(now + job.interval, job.deadline)
+        job.interval = min(
+            job.interval * ReportJobConfig.POLL_BACKOFF_FACTOR, ReportJobConfig.POLL_MAX_INTERVAL_SECONDS
+        )
+        job.sequence = next(self._sequence)
+        self._schedule(job)
+
+    def _download(self, job: _PendingJob) -> None:
+        try:
+            job.future.set_result(job.fetch(job.job_id))
+        except Exception as e:
+            job.future.set_exception(e)
+
+
+_manager: GAMReportJobManager | None = None
+_manager_lock = threading.Lock()
+
+
+def get_report_job_manager() -> GAMReportJobManager:
+    """Get the process-wide GAM report job manager, creating it on first use."""
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = GAMReportJobManager(
+                    cache_max_ttl=float(os.environ.get("ADCP_GAM_REPORT_CACHE_MAX_TTL", "900")),
+                    cache_max_entries=int(os.environ.get("ADCP_GAM_REPORT_CACHE_MAX_ENTRIES", "256")),
+                )
+    return _manager
+
+
+def clear_report_cache() -> None:
+    """Drop cached GAM report results (e.g. after changing GAM credentials, and in tests)."""
+    if _manager is not None:
+        _manager.clear()
@@ -10,8 +10,11 @@ Provides comprehensive reporting data from GAM including:
 import csv
 import gzip
 import io
+import json
 import logging
-import time
+import operator
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any, Literal
@@ -20,6 +23,8 @@ from urllib.parse import urlparse
 import pytz
 import requests
 
+from src.adapters.gam_report_jobs import get_report_job_manager
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,12 +35,12 @@ class ReportingConfig:
     ALLOWED_DOMAINS = [".google.com", ".googleapis.com"]
 
     # Memory management
-    MAX_ROWS_PER_REPORT = 100000  # Prevent OOM from large reports
+    MAX_ROWS_PER_REPORT = 100000  # Prevent OOM when raw rows are materialized (_run_report only)
+    DOWNLOAD_CHUNK_SIZE = 256 * 1024  # Bytes read from the download stream at a time
     MAX_CSV_SIZE_BYTES = 10 * 1024 * 1024  # 10MB limit for CSV data
 
     # Network and timing
-    REPORT_TIMEOUT_SECONDS = 600  # 10 minutes maximum for report completion
-    POLL_INTERVAL_SECONDS = 5  # Check report status every 5 seconds
+    REPORT_TIMEOUT_SECONDS = 600  # 10 minutes maximum for report completion (polling: see gam_report_jobs)
     HTTP_CONNECT_TIMEOUT = 30  # 30 seconds for connection establishment
     HTTP_READ_TIMEOUT = 300  # 5 minutes for data transfer
 
@@ -58,6 +63,174 @@ class ReportingData:
     metrics: dict[str, Any]
 
 
+# Map possible CSV column names to our field names
+# GAM CSV might use different names than the API constants
+REPORT_COLUMN_MAPPINGS = {
+    # Dimensions - including both IDs and names
+    "Dimension.ADVERTISER_ID": "ADVERTISER_ID",
+    "Dimension.ADVERTISER_NAME": "ADVERTISER_NAME",
+    "Dimension.ORDER_ID": "ORDER_ID",
+    "Dimension.ORDER_NAME": "ORDER_NAME",
+    "Dimension.LINE_ITEM_ID": "LINE_ITEM_ID",
+    "Dimension.LINE_ITEM_NAME": "LINE_ITEM_NAME",
+    "Dimension.DATE": "DATE",
+    "Dimension.HOUR": "HOUR",
+    "Dimension.COUNTRY_NAME": "COUNTRY_NAME",
+    "Dimension.AD_UNIT_ID": "AD_UNIT_ID",
+    "Dimension.AD_UNIT_NAME": "AD_UNIT_NAME",
+    # Metrics - only including the ones we're actually requesting
+    "Column.AD_SERVER_IMPRESSIONS": "AD_SERVER_IMPRESSIONS",
+    "Column.AD_SERVER_CLICKS": "AD_SERVER_CLICKS",
+    "Column.AD_SERVER_CPM_AND_CPC_REVENUE": "AD_SERVER_CPM_AND_CPC_REVENUE",
+}
+
+# Aggregation key dimensions (after the timestamp) and the names carried alongside them
+_KEY_FIELDS = ("ADVERTISER_ID", "ORDER_ID", "LINE_ITEM_ID", "COUNTRY_NAME", "AD_UNIT_ID")
+_NAME_FIELDS = ("ADVERTISER_NAME", "ORDER_NAME", "LINE_ITEM_NAME", "AD_UNIT_NAME")
+
+
+class _ChunkStream(io.RawIOBase):
+    """Read-only file object over an iterator of byte chunks (e.g. Response.iter_content)"""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            try:
+                self._pending = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+class _ReportAggregator:
+    """Aggregates report records on the fly into one compact accumulator per key
+
+    Column positions are resolved once from the CSV header, so each record is
+    handled as a plain list of values without building a dict per row.
+    """
+
+    def __init__(self, service: "GAMReportingService", header: list[str], granularity: str):
+        self.service = service
+        self.granularity = granularity
+        self.raw_rows = 0
+
+        positions: dict[str, int] = {}
+        for i, column in enumerate(header):
+            positions.setdefault(REPORT_COLUMN_MAPPINGS.get(column, column), i)
+
+        # Missing columns point at a trailing "" appended to every record
+        self._width = len(header)
+        missing = self._width
+        self._impressions = positions.get("AD_SERVER_IMPRESSIONS", missing)
+        self._clicks = positions.get("AD_SERVER_CLICKS", missing)
+        self._revenue = positions.get("AD_SERVER_CPM_AND_CPC_REVENUE", missing)
+        self._date = positions.get("DATE")
+        self._hour = positions.get("HOUR")
+        self._key = operator.itemgetter(*(positions.get(field, missing) for field in _KEY_FIELDS))
+        self._names = operator.itemgetter(*(positions.get(field, missing) for field in _NAME_FIELDS))
+
+        self._timestamps: dict[tuple[Any, Any], str] = {}
+        # key -> [impressions, clicks, revenue_micros, row_count, *names]
+        self._accumulators: dict[tuple, list[Any]] = {}
+
+    def add_records(self, records: Iterable[list[Any]]) -> None:
+        """Fold records (lists of values in header order) into the accumulators"""
+        accumulators = self._accumulators
+        width = self._width
+        impressions_at, clicks_at, revenue_at = self._impressions, self._clicks, self._revenue
+        key_of, names_of, timestamp_of = self._key, self._names, self._timestamp
+
+        raw_rows = 0
+        for record in records:
+            raw_rows += 1
+            if len(record) < width:
+                record = list(record) + [""] * (width - len(record))
+            record.append("")
+
+            # Skip rows with zero impressions to reduce data volume
+            impressions = int(record[impressions_at] or 0)
+            if impressions == 0:
+                continue
+
+            key = (timestamp_of(record), *key_of(record))
+            acc = accumulators.get(key)
+            if acc is None:
+                acc = accumulators[key] = [0, 0, 0, 0, *names_of(record)]
+            acc[0] += impressions
+            acc[1] += int(record[clicks_at] or 0)
+            acc[2] += float(record[revenue_at] or 0)  # Keep in micros for accurate summing
+            acc[3] += 1
+
+        self.raw_rows += raw_rows
+
+    def _timestamp(self, record: list[Any]) -> str:
+        date = record[self._date] if self._date is not None else None
+        hour = record[self._hour] if self._hour is not None else None
+        timestamp = self._timestamps.get((date, hour))
+        if timestamp is None:
+            row = {}
+            if date is not None:
+                row["DATE"] = date
+            if hour is not None:
+                row["HOUR"] = hour
+            timestamp = self._timestamps[(date, hour)] = self.service._parse_timestamp(row, self.granularity)
+        return timestamp
+
+    def results(self) -> list[dict[str, Any]]:
+        """Build processed rows with derived metrics, sorted by timestamp then spend"""
+        processed = []
+        for key, acc in self._accumulators.items():
+            timestamp, advertiser_id, order_id, line_item_id, country, ad_unit_id = key
+            impressions, clicks, revenue_micros, row_count = acc[:4]
+            advertiser_name, order_name, line_item_name, ad_unit_name = acc[4:]
+
+            # Convert revenue from micros to dollars
+            spend = revenue_micros / 1_000_000
+
+            # Calculate CTR (clicks/impressions as percentage)
+            ctr = (clicks / impressions * 100) if impressions > 0 else 0.0
+
+            # Calculate CPM (cost per thousand impressions)
+            cpm = (spend / impressions * 1000) if impressions > 0 else 0.0
+
+            processed.append(
+                {
+                    "timestamp": timestamp,
+                    "advertiser_id": advertiser_id,
+                    "advertiser_name": advertiser_name,
+                    "order_id": order_id,
+                    "order_name": order_name,
+                    "line_item_id": line_item_id,
+                    "line_item_name": line_item_name,
+                    "country": country,
+                    "ad_unit_id": ad_unit_id,
+                    "ad_unit_name": ad_unit_name,
+                    "impressions": impressions,
+                    "clicks": clicks,
+                    "ctr": round(ctr, 4),
+                    "spend": round(spend, 2),
+                    "cpm": round(cpm, 2),  # Changed from ecpm to cpm for clarity
+                    "aggregated_rows": row_count,  # Useful for debugging
+                }
+            )
+
+        # Sort by timestamp and then by spend (descending)
+        processed.sort(key=lambda x: (x["timestamp"], -x["spend"]))
+
+        logger.info(f"Aggregated {self.raw_rows} raw rows into {len(processed)} aggregated rows")
+
+        return processed
+
+
 class GAMReportingService:
     """Service for getting comprehensive reporting data from Google Ad Manager"""
 
@@ -93,6 +266,7 @@ class GAMReportingService:
         requested_timezone: str = "America/New_York",
         include_country: bool = False,
         include_ad_unit: bool = False,
+        order_ids: list[str] | None = None,
     ) -> ReportingData:
         """
         Get reporting data for specified date range and filters
@@ -105,6 +279,7 @@ class GAMReportingService:
             requested_timezone: Timezone for the request (data will be converted if different)
             include_country: Include country dimension in the report
             include_ad_unit: Include ad unit dimension in the report
+            order_ids: Optional filter on several order IDs (one report for many orders)
 
         Returns:
             ReportingData object containing results and metadata
@@ -115,17 +290,16 @@ class GAMReportingService:
         )
 
         # Build the report query
-        report_job = self._build_report_query(dimensions, start_date, end_date, advertiser_id, order_id, line_item_id)
+        report_job = self._build_report_query(
+            dimensions, start_date, end_date, advertiser_id, order_id, line_item_id, order_ids
+        )
 
-        # Run the report
-        report_data = self._run_report(report_job)
+        # Run the report (shared with identical concurrent queries and cached), aggregating rows as they stream in
+        processed_data, _ = self._run_aggregated_report(report_job, granularity, date_range, requested_timezone)
 
         # Calculate data freshness
         data_valid_until = self._calculate_data_validity(date_range, requested_timezone)
 
-        # Process and aggregate the data
-        processed_data = self._process_report_data(report_data, granularity, requested_timezone)
-
         # Calculate summary metrics
         metrics = self._calculate_metrics(processed_data)
 
@@ -237,6 +411,7 @@ class GAMReportingService:
         advertiser_id: str | None = None,
         order_id: str | None = None,
         line_item_id: str | None = None,
+        order_ids: list[str] | None = None,
     ) -> dict[str, Any]:
         """Build the GAM report query"""
 
@@ -267,6 +442,17 @@ class GAMReportingService:
             except (ValueError, TypeError):
                 logger.warning(f"Invalid order_id format: {order_id}")
 
+        if order_ids:
+            # IDs are validated as integers, so they can be inlined into the IN list safely
+            numeric_order_ids = []
+            for value in order_ids:
+                try:
+                    numeric_order_ids.append(str(int(value)))
+                except (ValueError, TypeError):
+                    logger.warning(f"Invalid order_id format: {value}")
+            if numeric_order_ids:
+                where_clauses.append(f"ORDER_ID IN ({', '.join(numeric_order_ids)})")
+
         if line_item_id:
             # Validate numeric ID
             try:
@@ -307,230 +493,193 @@ class GAMReportingService:
 
         return report_job
 
-    def _run_report(self, report_job: dict[str, Any]) -> list[dict[str, Any]]:
-        """Run the report and return the data"""
+    def _download_report(self, report_job_id: Any) -> requests.Response:
+        """Open a streaming download for a completed report job"""
+        # Use modern ReportService method instead of deprecated GetDataDownloader
         try:
-            # Start the report job - returns a ReportJob object with an 'id' field
-            report_job_response = self.report_service.runReportJob(report_job)
-
-            # Extract the report job ID from the response
-            if hasattr(report_job_response, "id"):
-                report_job_id = report_job_response.id
-            elif isinstance(report_job_response, dict) and "id" in report_job_response:
-                report_job_id = report_job_response["id"]
-            else:
-                # If it's already just the ID
-                report_job_id = report_job_response
-
-            logger.info(f"Started GAM report job with ID: {report_job_id}")
+            download_url = self.report_service.getReportDownloadURL(report_job_id, "CSV_DUMP")
+        except Exception as e:
+            raise Exception(f"Failed to get GAM report download URL: {str(e)}") from e
 
-            # Wait for completion - longer timeout for reports with multiple dimensions
-            max_wait = ReportingConfig.REPORT_TIMEOUT_SECONDS
-            wait_time = 0
-            poll_interval = ReportingConfig.POLL_INTERVAL_SECONDS
+        # Validate URL is from Google for security
+        parsed_url = urlparse(download_url)
+        if not parsed_url.hostname or not any(
+            parsed_url.hostname.endswith(domain) for domain in ReportingConfig.ALLOWED_DOMAINS
+        ):
+            raise Exception(f"Invalid download URL: not from Google domain ({parsed_url.hostname})")
 
-            while wait_time < max_wait:
-                status = self.report_service.getReportJobStatus(report_job_id)
-                if status == "COMPLETED":
-                    break
-                elif status == "FAILED":
-                    raise Exception("GAM report job failed")
+        # Download the report using requests with proper timeout and error handling
+        try:
+            response = requests.get(
+                download_url,
+                timeout=(ReportingConfig.HTTP_CONNECT_TIMEOUT, ReportingConfig.HTTP_READ_TIMEOUT),
+                headers={"User-Agent": ReportingConfig.USER_AGENT},
+                stream=True,  # Body is consumed incrementally by _iter_report_csv
+            )
+            response.raise_for_status()
+        except requests.exceptions.Timeout as e:
+            raise Exception(f"GAM report download timed out: {str(e)}") from e
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Failed to download GAM report: {str(e)}") from e
 
-                # Log progress for long-running reports
-                if wait_time > 0 and wait_time % 30 == 0:
-                    logger.info(f"Still waiting for GAM report {report_job_id} - {wait_time}s elapsed")
+        return response
 
-                time.sleep(poll_interval)
-                wait_time += poll_interval
+    def _iter_report_csv(self, response: requests.Response) -> Iterator[list[str]]:
+        """Yield CSV records (header first) from a gzipped report download.
 
-            if self.report_service.getReportJobStatus(report_job_id) != "COMPLETED":
-                raise Exception(f"GAM report job timed out after {max_wait} seconds")
+        The body is decompressed and parsed chunk by chunk, so memory use does
+        not depend on report size.
+        """
+        raw = io.BufferedReader(
+            _ChunkStream(response.iter_content(chunk_size=ReportingConfig.DOWNLOAD_CHUNK_SIZE)),
+            buffer_size=ReportingConfig.DOWNLOAD_CHUNK_SIZE,
+        )
+        with gzip.GzipFile(fileobj=raw) as gz_file, io.TextIOWrapper(gz_file, encoding="utf-8", newline="") as text:
+            yield from csv.reader(text)
 
-            # Use modern ReportService method instead of deprecated GetDataDownloader
-            try:
-                download_url = self.report_service.getReportDownloadURL(report_job_id, "CSV_DUMP")
-            except Exception as e:
-                raise Exception(f"Failed to get GAM report download URL: {str(e)}") from e
-
-            # Validate URL is from Google for security
-            parsed_url = urlparse(download_url)
-            if not parsed_url.hostname or not any(
-                parsed_url.hostname.endswith(domain) for domain in ReportingConfig.ALLOWED_DOMAINS
-            ):
-                raise Exception(f"Invalid download URL: not from Google domain ({parsed_url.hostname})")
-
-            # Download the report using requests with proper timeout and error handling
-            try:
-                response = requests.get(
-                    download_url,
-                    timeout=(ReportingConfig.HTTP_CONNECT_TIMEOUT, ReportingConfig.HTTP_READ_TIMEOUT),
-                    headers={"User-Agent": ReportingConfig.USER_AGENT},
-                    stream=True,  # For better memory handling of large files
-                )
-                response.raise_for_status()
-            except requests.exceptions.Timeout as e:
-                raise Exception(f"GAM report download timed out: {str(e)}") from e
-            except requests.exceptions.RequestException as e:
-                raise Exception(f"Failed to download GAM report: {str(e)}") from e
+    def _read_report_rows(self, report_job_id: Any) -> list[dict[str, Any]]:
+        """Download a completed report as raw row dicts (capped at MAX_ROWS_PER_REPORT)"""
+        response = self._download_report(report_job_id)
+        try:
+            records = self._iter_report_csv(response)
+            header = next(records, None)
+            data = []
+            if header is not None:
+                for i, record in enumerate(records):
+                    if i >= ReportingConfig.MAX_ROWS_PER_REPORT:
+                        logger.warning(
+                            f"GAM report truncated at {ReportingConfig.MAX_ROWS_PER_REPORT} rows to prevent memory issues"
+                        )
+                        break
+                    data.append(dict(zip(header, record, strict=False)))
+        except Exception as e:
+            raise Exception(f"Failed to parse GAM report CSV data: {str(e)}") from e
+        finally:
+            response.close()
 
-            # Parse the CSV data directly from the response with memory limits
-            try:
-                data = []
-
-                with gzip.open(io.BytesIO(response.content), "rt") as gz_file:
-                    csv_reader = csv.DictReader(gz_file)
-                    for i, row in enumerate(csv_reader):
-                        if i >= ReportingConfig.MAX_ROWS_PER_REPORT:
-                            logger.warning(
-                                f"GAM report truncated at {ReportingConfig.MAX_ROWS_PER_REPORT} rows to prevent memory issues"
-                            )
-                            break
-                        data.append(row)
-            except Exception as e:
-                raise Exception(f"Failed to parse GAM report CSV data: {str(e)}") from e
-
-            # Debug: Log the first row to see column names
-            if data:
-                logger.info(f"CSV columns: {list(data[0].keys())}")
-                logger.info(f"First row sample: {data[0]}")
-                logger.info(f"Total rows in report: {len(data)}")
-            else:
-                logger.warning("GAM report returned no data rows")
+        if data:
+            logger.info(f"CSV columns: {list(data[0].keys())}")
+            logger.info(f"Total rows in report: {len(data)}")
+        else:
+            logger.warning("GAM report returned no data rows")
 
-            return data
+        return data
 
+    def _aggregate_report(self, report_job_id: Any, granularity: str) -> tuple[list[dict[str, Any]], int]:
+        """Download a completed report, aggregating rows while they stream in"""
+        response = self._download_report(report_job_id)
+        try:
+            records = self._iter_report_csv(response)
+            header = next(records, None)
+            if header is None:
+                logger.warning("GAM report returned no data rows")
+                return [], 0
+            logger.info(f"CSV columns: {header}")
+            aggregator = _ReportAggregator(self, header, granularity)
+            aggregator.add_records(records)
+        except Exception as e:
+            raise Exception(f"Failed to parse GAM report CSV data: {str(e)}") from e
+        finally:
+            response.close()
+
+        return aggregator.results(), aggregator.raw_rows
+
+    def _wait_for_report(self, future: Future) -> Any:
+        """Wait for a report job submitted to the shared job manager"""
+        # The manager enforces REPORT_TIMEOUT_SECONDS on the job; allow for the download on top
+        timeout = (
+            ReportingConfig.REPORT_TIMEOUT_SECONDS
+            + ReportingConfig.HTTP_CONNECT_TIMEOUT
+            + ReportingConfig.HTTP_READ_TIMEOUT
+        )
+        try:
+            return future.result(timeout=timeout)
         except Exception as e:
             raise Exception(f"Error running GAM report: {str(e)}")
 
-    def _process_report_data(
-        self, raw_data: list[dict[str, Any]], granularity: str, requested_tz: str
-    ) -> list[dict[str, Any]]:
-        """Process and aggregate the raw report data"""
-
-        # Map possible CSV column names to our field names
-        # GAM CSV might use different names than the API constants
-        column_mappings = {
-            # Dimensions - including both IDs and names
-            "Dimension.ADVERTISER_ID": "ADVERTISER_ID",
-            "Dimension.ADVERTISER_NAME": "ADVERTISER_NAME",
-            "Dimension.ORDER_ID": "ORDER_ID",
-            "Dimension.ORDER_NAME": "ORDER_NAME",
-            "Dimension.LINE_ITEM_ID": "LINE_ITEM_ID",
-            "Dimension.LINE_ITEM_NAME": "LINE_ITEM_NAME",
-            "Dimension.DATE": "DATE",
-            "Dimension.HOUR": "HOUR",
-            "Dimension.COUNTRY_NAME": "COUNTRY_NAME",
-            "Dimension.AD_UNIT_ID": "AD_UNIT_ID",
-            "Dimension.AD_UNIT_NAME": "AD_UNIT_NAME",
-            # Metrics - only including the ones we're actually requesting
-            "Column.AD_SERVER_IMPRESSIONS": "AD_SERVER_IMPRESSIONS",
-            "Column.AD_SERVER_CLICKS": "AD_SERVER_CLICKS",
-            "Column.AD_SERVER_CPM_AND_CPC_REVENUE": "AD_SERVER_CPM_AND_CPC_REVENUE",
-        }
-
-        # Dictionary to store aggregated data
-        # Key will be a tuple of dimension values
-        aggregated_data = {}
-
-        for row in raw_data:
-            # Normalize column names
-            normalized_row = {}
-            for key, value in row.items():
-                # Check if it's a GAM CSV column name
-                if key in column_mappings:
-                    normalized_row[column_mappings[key]] = value
-                else:
-                    # Use as-is
-                    normalized_row[key] = value
-
-            # Skip rows with zero impressions to reduce data volume
-            impressions = int(normalized_row.get("AD_SERVER_IMPRESSIONS", 0) or 0)
-            if impressions == 0:
-                continue
-
-            # Build aggregation key from dimensions
-            # Include timestamp for time-based aggregation
-            timestamp = self._parse_timestamp(normalized_row, granularity)
-
-            agg_key = (
-                timestamp,
-                normalized_row.get("ADVERTISER_ID", ""),
-                normalized_row.get("ORDER_ID", ""),
-                normalized_row.get("LINE_ITEM_ID", ""),
-                normalized_row.get("COUNTRY_NAME", ""),
-                normalized_row.get("AD_UNIT_ID", ""),
-            )
-
-            # Initialize or update aggregated metrics
-            if agg_key not in aggregated_data:
-                aggregated_data[agg_key] = {
-                    "timestamp": timestamp,
-                    "advertiser_id": normalized_row.get("ADVERTISER_ID", ""),
-                    "advertiser_name": normalized_row.get("ADVERTISER_NAME", ""),
-                    "order_id": normalized_row.get("ORDER_ID", ""),
-                    "order_name": normalized_row.get("ORDER_NAME", ""),
-                    "line_item_id": normalized_row.get("LINE_ITEM_ID", ""),
-                    "line_item_name": normalized_row.get("LINE_ITEM_NAME", ""),
-                    "country": normalized_row.get("COUNTRY_NAME", ""),
-                    "ad_unit_id": normalized_row.get("AD_UNIT_ID", ""),
-                    "ad_unit_name": normalized_row.get("AD_UNIT_NAME", ""),
-                    "impressions": 0,
-                    "clicks": 0,
-                    "revenue_micros": 0,  # Keep in micros for accurate summing
-                    "row_count": 0,  # Track number of rows aggregated
-                }
+    def _run_report(self, report_job: dict[str, Any]) -> list[dict[str, Any]]:
+        """Run the report and return the raw rows as dicts (capped at MAX_ROWS_PER_REPORT)
 
-            # Aggregate metrics
-            agg = aggregated_data[agg_key]
-            agg["impressions"] += int(normalized_row.get("AD_SERVER_IMPRESSIONS", 0) or 0)
-            agg["clicks"] += int(normalized_row.get("AD_SERVER_CLICKS", 0) or 0)
-            agg["revenue_micros"] += float(normalized_row.get("AD_SERVER_CPM_AND_CPC_REVENUE", 0) or 0)
-            agg["row_count"] += 1
+        Prefer _run_aggregated_report, which streams, has no row cap and is cached.
+        """
+        future = get_report_job_manager().submit(
+            self.report_service,
+            report_job,
+            fetch=self._read_report_rows,
+            timeout=ReportingConfig.REPORT_TIMEOUT_SECONDS,
+        )
+        return self._wait_for_report(future)
 
-        # Convert aggregated data to list and calculate derived metrics
-        processed = []
-        for agg_data in aggregated_data.values():
-            # Convert revenue from micros to dollars
-            spend = agg_data["revenue_micros"] / 1_000_000
+    def _run_aggregated_report(
+        self,
+        report_job: dict[str, Any],
+        granularity: str,
+        date_range: str | None = None,
+        requested_tz: str = "America/New_York",
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Run the report and aggregate rows while they stream in
 
-            # Calculate derived metrics
-            impressions = agg_data["impressions"]
-            clicks = agg_data["clicks"]
+        When ``date_range`` is given, identical concurrent queries share one GAM
+        job and the result is cached until GAM's data would have moved forward.
 
-            # Calculate CTR (clicks/impressions as percentage)
-            ctr = (clicks / impressions * 100) if impressions > 0 else 0.0
+        Returns:
+            Tuple of (processed rows as returned by _process_report_data, raw row count)
+        """
+        cache_key = self._report_cache_key(report_job, granularity, date_range, requested_tz)
+        future = get_report_job_manager().submit(
+            self.report_service,
+            report_job,
+            fetch=lambda report_job_id: self._aggregate_report(report_job_id, granularity),
+            timeout=ReportingConfig.REPORT_TIMEOUT_SECONDS,
+            cache_key=cache_key,
+            ttl=self._report_cache_ttl(date_range, requested_tz) if cache_key else None,
+        )
+        processed, raw_rows = self._wait_for_report(future)
+        # Results may be shared with other callers; hand out copies
+        return [dict(row) for row in processed], raw_rows
 
-            # Calculate CPM (cost per thousand impressions)
-            cpm = (spend / impressions * 1000) if impressions > 0 else 0.0
+    def _report_cache_key(
+        self, report_job: dict[str, Any], granularity: str, date_range: str | None, requested_tz: str
+    ) -> tuple | None:
+        """Identity of a report for sharing: (network, query, date range)
 
-            processed_row = {
-                "timestamp": agg_data["timestamp"],
-                "advertiser_id": agg_data["advertiser_id"],
-                "advertiser_name": agg_data.get("advertiser_name", ""),
-                "order_id": agg_data["order_id"],
-                "order_name": agg_data.get("order_name", ""),
-                "line_item_id": agg_data["line_item_id"],
-                "line_item_name": agg_data.get("line_item_name", ""),
-                "country": agg_data.get("country", ""),
-                "ad_unit_id": agg_data.get("ad_unit_id", ""),
-                "ad_unit_name": agg_data.get("ad_unit_name", ""),
-                "impressions": impressions,
-                "clicks": clicks,
-                "ctr": round(ctr, 4),
-                "spend": round(spend, 2),
-                "cpm": round(cpm, 2),  # Changed from ecpm to cpm for clarity
-                "aggregated_rows": agg_data["row_count"],  # Useful for debugging
-            }
+        The report query only carries calendar dates, so the key is stable for a
+        day. Returns None (no sharing) when the network can't be identified.
+        """
+        network_code = getattr(self.client, "network_code", None)
+        if date_range is None or not isinstance(network_code, str | int) or not network_code:
+            return None
+        query = json.dumps(report_job, sort_keys=True, default=str)
+        return (str(network_code), query, date_range, requested_tz, granularity)
 
-            processed.append(processed_row)
+    def _report_cache_ttl(self, date_range: str | None, requested_tz: str) -> float:
+        """Seconds until _calculate_data_validity would return a later timestamp
 
-        # Sort by timestamp and then by spend (descending)
-        processed.sort(key=lambda x: (x["timestamp"], -x["spend"]))
+        Hourly ("today") data advances at every hour boundary; daily data
+        advances once a day at 7 AM in the requested timezone.
+        """
+        now = datetime.now(pytz.timezone(requested_tz))
+        if date_range == "today":
+            next_change = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        else:
+            next_change = now.replace(hour=7, minute=0, second=0, microsecond=0)
+            if next_change <= now:
+                next_change += timedelta(days=1)
+        return max(0.0, (next_change - now).total_seconds())
 
-        # Log aggregation results
-        logger.info(f"Aggregated {len(raw_data)} raw rows into {len(processed)} aggregated rows")
+    def _process_report_data(
+        self, raw_data: list[dict[str, Any]], granularity: str, requested_tz: str
+    ) -> list[dict[str, Any]]:
+        """Process and aggregate raw report rows (dicts keyed by CSV column name)"""
+        if not raw_data:
+            logger.info("Aggregated 0 raw rows into 0 aggregated rows")
+            return []
 
-        return processed
+        # Columns are resolved once from the first row's keys, not per row
+        header = list(raw_data[0].keys())
+        aggregator = _ReportAggregator(self, header, granularity)
+        aggregator.add_records([row.get(column) for column in header] for row in raw_data)
+        return aggregator.results()
 
     def _parse_timestamp(self, row: dict[str, Any], granularity: str) -> str:
         """Parse timestamp from row based on granularity"""
@@ -665,12 +814,11 @@ class GAMReportingService:
             line_item_id=line_item_id,
         )
 
-        raw_data = self._run_report(report_query)
-
-        logger.info(f"Country breakdown report returned {len(raw_data)} rows (aggregated, no DATE dimension)")
+        processed_data, raw_row_count = self._run_aggregated_report(
+            report_query, granularity, date_range, requested_timezone
+        )
 
-        # Process the aggregated data
-        processed_data = self._process_report_data(raw_data, granularity, requested_timezone)
+        logger.info(f"Country breakdown report returned {raw_row_count} rows (aggregated, no DATE dimension)")
 
         # Aggregate by country
         country_summary = {}
@@ -735,7 +883,7 @@ class GAMReportingService:
             "advertisers": advertiser_names,  # Include advertiser name mapping
             "raw_data": processed_data,  # Include full data for filters
             "total_countries": len(sorted_countries),
-            "total_rows_processed": len(raw_data),  # Show how many rows GAM returned
+            "total_rows_processed": raw_row_count,  # Show how many rows GAM returned
         }
 
     def get_ad_unit_breakdown(
@@ -783,12 +931,11 @@ class GAMReportingService:
             else:
                 report_query["reportQuery"]["statement"] = {"query": f"WHERE COUNTRY_NAME = '{country}'"}
 
-        raw_data = self._run_report(report_query)
-
-        logger.info(f"Ad unit breakdown report returned {len(raw_data)} rows (aggregated, no DATE dimension)")
+        processed_data, raw_row_count = self._run_aggregated_report(
+            report_query, granularity, date_range, requested_timezone
+        )
 
-        # Process the aggregated data
-        processed_data = self._process_report_data(raw_data, granularity, requested_timezone)
+        logger.info(f"Ad unit breakdown report returned {raw_row_count} rows (aggregated, no DATE dimension)")
 
         # Filter by country if specified (in case it wasn't in WHERE clause)
         filtered_data = processed_data
@@ -885,7 +1032,7 @@ class GAMReportingService:
             "raw_data": filtered_data,  # Include full data for filters
             "total_ad_units": len(sorted_ad_units),
             "filtered_by_country": country,
-            "total_rows_processed": len(raw_data),  # Show how many rows GAM returned
+            "total_rows_processed": raw_row_count,  # Show how many rows GAM returned
         }
 
     def get_advertiser_summary(
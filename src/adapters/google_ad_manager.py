@@ -81,6 +81,7 @@ class GoogleAdManager(AdServerAdapter):
         dry_run: bool = False,
         audit_logger: AuditLogger | None = None,
         tenant_id: str | None = None,
+        client_manager: GAMClientManager | None = None,
     ):
         """Initialize Google Ad Manager adapter with modular managers.
 
@@ -93,6 +94,8 @@ class GoogleAdManager(AdServerAdapter):
             dry_run: Whether to run in dry-run mode
             audit_logger: Audit logging instance
             tenant_id: Tenant identifier
+            client_manager: Already-initialized client manager to reuse (e.g. from
+                the adapter client pool); built from config when omitted
         """
         super().__init__(config, principal, dry_run, None, tenant_id)
 
@@ -130,19 +133,15 @@ class GoogleAdManager(AdServerAdapter):
 
         # Initialize modular components
         if not self.dry_run:
-            self.client_manager = GAMClientManager(self.config, self.network_code)
+            self.client_manager = client_manager or GAMClientManager(self.config, self.network_code)
             # Legacy client property for backward compatibility
             self.client = self.client_manager.get_client()
 
             # Auto-detect trafficker_id if not provided
             if not self.trafficker_id:
                 try:
-                    user_service = self.client.GetService("UserService", version="v202411")
-                    current_user = user_service.getCurrentUser()
-                    self.trafficker_id = str(current_user["id"])
-                    logger.info(
-                        f"Auto-detected trafficker_id: {self.trafficker_id} ({current_user.get('name', 'Unknown')})"
-                    )
+                    self.trafficker_id = self.client_manager.get_current_user_id()
+                    logger.info(f"Auto-detected trafficker_id: {self.trafficker_id}")
                 except Exception as e:
                     logger.warning(f"Could not auto-detect trafficker_id: {e}")
 
@@ -1117,23 +1116,10 @@ class GoogleAdManager(AdServerAdapter):
 
         reporting_service = GAMReportingService(self.client)
 
-        # Parse date range
-        start_dt = dt.fromisoformat(date_range.start.replace("Z", "+00:00"))
-        end_dt = dt.fromisoformat(date_range.end.replace("Z", "+00:00"))
-
-        # Determine date range type for reporting
-        days_diff = (end_dt - start_dt).days
-        if days_diff <= 1:
-            range_type: str = "today"
-        elif days_diff <= 31:
-            range_type = "this_month"
-        else:
-            range_type = "lifetime"
-
         # Fetch delivery data from GAM
         # Note: We'll aggregate across all line items associated with this media buy
         reporting_data = reporting_service.get_reporting_data(
-            date_range=cast("Literal['lifetime', 'this_month', 'today']", range_type),
+            date_range=self._delivery_range_type(date_range),
             advertiser_id=self.advertiser_id,
             requested_timezone="America/New_York",
         )
@@ -1155,47 +1141,7 @@ class GoogleAdManager(AdServerAdapter):
         avg_ctr = reporting_data.metrics.get("average_ctr", 0.0)
 
         # Build daily breakdown from reporting data
-        daily_breakdown = []
-        daily_metrics = {}
-        for row in reporting_data.data:
-            # Extract date from the row (reporting service uses DATE dimension)
-            date_str = row.get("date", row.get("DATE", ""))
-            if date_str:
-                # Ensure date format is YYYY-MM-DD
-                if not isinstance(date_str, str):
-                    date_str = str(date_str)
-
-                # Parse and reformat if needed (handle various date formats)
-                try:
-                    # Try parsing ISO format first
-                    if "T" in date_str:
-                        date_obj = datetime.fromisoformat(date_str.split("T")[0])
-                        date_str = date_obj.strftime("%Y-%m-%d")
-                    # Handle YYYY-MM-DD format (already correct)
-                    elif len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
-                        pass  # Already in correct format
-                except Exception:
-                    # If parsing fails, skip this row
-                    continue
-
-                if date_str not in daily_metrics:
-                    daily_metrics[date_str] = {
-                        "impressions": 0.0,
-                        "spend": 0.0,
-                    }
-                daily_metrics[date_str]["impressions"] += float(row.get("impressions", 0))
-                daily_metrics[date_str]["spend"] += float(row.get("spend", 0.0))
-
-        # Convert daily metrics dict to sorted list of DailyBreakdown objects
-        for date_str in sorted(daily_metrics.keys()):
-            metrics = daily_metrics[date_str]
-            daily_breakdown.append(
-                {
-                    "date": date_str,
-                    "impressions": metrics["impressions"],
-                    "spend": metrics["spend"],
-                }
-            )
+        daily_breakdown = self._daily_breakdown(reporting_data.data)
 
         # Build package-level delivery data if we have line item IDs
         by_package = []
@@ -1247,6 +1193,189 @@ class GoogleAdManager(AdServerAdapter):
             daily_breakdown=daily_breakdown if daily_breakdown else None,
         )
 
+    @staticmethod
+    def _delivery_range_type(date_range: ReportingPeriod) -> Literal["lifetime", "this_month", "today"]:
+        """Pick the GAM report date range that covers a reporting period."""
+        start_dt = datetime.fromisoformat(date_range.start.replace("Z", "+00:00"))
+        end_dt = datetime.fromisoformat(date_range.end.replace("Z", "+00:00"))
+
+        days_diff = (end_dt - start_dt).days
+        if days_diff <= 1:
+            return "today"
+        elif days_diff <= 31:
+            return "this_month"
+        return "lifetime"
+
+    @staticmethod
+    def _daily_breakdown(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Sum impressions and spend per day of GAM report rows, oldest day first."""
+        daily_metrics: dict[str, dict[str, float]] = {}
+        for row in rows:
+            # Extract date from the row (reporting service uses DATE dimension)
+            date_str = row.get("date", row.get("DATE", ""))
+            if date_str:
+                # Ensure date format is YYYY-MM-DD
+                if not isinstance(date_str, str):
+                    date_str = str(date_str)
+
+                # Parse and reformat if needed (handle various date formats)
+                try:
+                    # Try parsing ISO format first
+                    if "T" in date_str:
+                        date_obj = datetime.fromisoformat(date_str.split("T")[0])
+                        date_str = date_obj.strftime("%Y-%m-%d")
+                    # Handle YYYY-MM-DD format (already correct)
+                    elif len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+                        pass  # Already in correct format
+                except Exception:
+                    # If parsing fails, skip this row
+                    continue
+
+                if date_str not in daily_metrics:
+                    daily_metrics[date_str] = {
+                        "impressions": 0.0,
+                        "spend": 0.0,
+                    }
+                daily_metrics[date_str]["impressions"] += float(row.get("impressions", 0))
+                daily_metrics[date_str]["spend"] += float(row.get("spend", 0.0))
+
+        # Convert daily metrics dict to sorted list of DailyBreakdown objects
+        return [
+            {"date": date_str, "impressions": metrics["impressions"], "spend": metrics["spend"]}
+            for date_str, metrics in sorted(daily_metrics.items())
+        ]
+
+    def get_media_buys_delivery(
+        self, media_buy_ids: list[str], date_range: ReportingPeriod, today: datetime
+    ) -> dict[str, AdapterGetMediaBuyDeliveryResponse | Exception]:
+        """Get delivery metrics for several media buys from one GAM report.
+
+        Runs a single report filtered to the orders of all requested media buys
+        (media_buy_id is the GAM order ID) and splits its rows by order, instead
+        of one report per media buy.
+
+        Args:
+            media_buy_ids: Media buy IDs to report on
+            date_range: Reporting period with start/end dates
+            today: Current date for time-based calculations
+
+        Returns:
+            Map of media_buy_id -> delivery data, or the exception raised for that media buy
+        """
+        from sqlalchemy import select
+
+        from src.adapters.gam_reporting_service import GAMReportingService
+        from src.core.database.database_session import get_db_session
+        from src.core.database.models import MediaBuy
+        from src.core.schemas import AdapterPackageDelivery, DeliveryTotals
+
+        if self.dry_run or not self.client or len(media_buy_ids) <= 1:
+            return super().get_media_buys_delivery(media_buy_ids, date_range, today)
+
+        def empty(media_buy_id: str, currency: str = "USD") -> AdapterGetMediaBuyDeliveryResponse:
+            return AdapterGetMediaBuyDeliveryResponse(
+                media_buy_id=media_buy_id,
+                reporting_period=date_range,
+                by_package=[],
+                totals=DeliveryTotals(
+                    impressions=0, spend=0, clicks=None, ctr=None, video_completions=None, completion_rate=None
+                ),
+                currency=currency,
+            )
+
+        with get_db_session() as session:
+            stmt = select(MediaBuy.media_buy_id, MediaBuy.currency, MediaBuy.raw_request).where(
+                MediaBuy.media_buy_id.in_(media_buy_ids)
+            )
+            buys = {row.media_buy_id: row for row in session.execute(stmt)}
+
+        order_ids = [media_buy_id for media_buy_id in buys if media_buy_id.isdigit()]
+        results: dict[str, AdapterGetMediaBuyDeliveryResponse | Exception] = {}
+        if not order_ids:
+            for media_buy_id in media_buy_ids:
+                buy = buys.get(media_buy_id)
+                results[media_buy_id] = empty(media_buy_id, str(buy.currency or "USD") if buy else "USD")
+            return results
+
+        reporting_service = GAMReportingService(self.client)
+        try:
+            reporting_data = reporting_service.get_reporting_data(
+                date_range=self._delivery_range_type(date_range),
+                advertiser_id=self.advertiser_id,
+                requested_timezone="America/New_York",
+                order_ids=order_ids,
+            )
+            target_date = datetime.fromisoformat(date_range.end.replace("Z", "+00:00"))
+            if not validate_and_log_freshness(reporting_data, f"{len(order_ids)} orders", target_date=target_date):
+                raise ValueError("GAM data is not fresh enough for the requested media buys")
+        except Exception as e:
+            return dict.fromkeys(media_buy_ids, e)
+
+        # order_id -> report rows, totals and per-line-item metrics
+        order_rows: dict[str, list[dict[str, Any]]] = {}
+        order_totals: dict[str, dict[str, float]] = {}
+        line_item_metrics: dict[str, dict[str, dict[str, float]]] = {}
+        for row in reporting_data.data:
+            order_id = str(row.get("order_id", ""))
+            if not order_id:
+                continue
+            order_rows.setdefault(order_id, []).append(row)
+            totals = order_totals.setdefault(order_id, {"impressions": 0, "clicks": 0, "spend": 0.0})
+            totals["impressions"] += row.get("impressions", 0)
+            totals["clicks"] += row.get("clicks", 0)
+            totals["spend"] += row.get("spend", 0.0)
+            line_item_id = row.get("line_item_id", "")
+            if line_item_id:
+                metrics = line_item_metrics.setdefault(order_id, {}).setdefault(
+                    str(line_item_id), {"impressions": 0, "spend": 0.0}
+                )
+                metrics["impressions"] += row.get("impressions", 0)
+                metrics["spend"] += row.get("spend", 0.0)
+
+        for media_buy_id in media_buy_ids:
+            buy = buys.get(media_buy_id)
+            if buy is None:
+                logger.error(f"Media buy {media_buy_id} not found in database")
+                results[media_buy_id] = empty(media_buy_id)
+                continue
+
+            totals = order_totals.get(media_buy_id, {"impressions": 0, "clicks": 0, "spend": 0.0})
+            by_line_item = line_item_metrics.get(media_buy_id, {})
+            by_package = []
+            for i, pkg_data in enumerate((buy.raw_request or {}).get("packages", [])):
+                platform_line_item_id = pkg_data.get("platform_line_item_id")
+                if platform_line_item_id and str(platform_line_item_id) in by_line_item:
+                    metrics = by_line_item[str(platform_line_item_id)]
+                    by_package.append(
+                        AdapterPackageDelivery(
+                            package_id=pkg_data.get("package_id", f"pkg_{i}"),
+                            impressions=int(metrics["impressions"]),
+                            spend=round(metrics["spend"], 2),
+                        )
+                    )
+
+            impressions = int(totals["impressions"])
+            clicks = int(totals["clicks"])
+            ctr = (clicks / impressions * 100) if impressions > 0 else 0.0
+            daily_breakdown = self._daily_breakdown(order_rows.get(media_buy_id, []))
+            results[media_buy_id] = AdapterGetMediaBuyDeliveryResponse(
+                media_buy_id=media_buy_id,
+                reporting_period=date_range,
+                by_package=by_package,
+                totals=DeliveryTotals(
+                    impressions=impressions,
+                    spend=round(totals["spend"], 2),
+                    clicks=clicks if clicks > 0 else None,
+                    ctr=round(ctr, 4) if ctr > 0 else None,
+                    video_completions=None,
+                    completion_rate=None,
+                ),
+                currency=str(buy.currency or "USD"),
+                daily_breakdown=daily_breakdown if daily_breakdown else None,
+            )
+
+        return results
+
     def update_media_buy(
         self,
         media_buy_id: str,
@@ -0,0 +1,241 @@
+"""
+Pooled HTTP clients for third-party ad server APIs
+
+The Kevel, Xandr and Triton adapters used to call module-level requests.get/post,
+so every campaign, flight, creative and ad was a fresh connection (new TCP and
+TLS handshake) with no timeout. Adapters now get a shared client per
+(adapter, base URL) from get_http_client(), which provides:
+
+- A pooled requests.Session with keep-alive, shared by every adapter instance
+  and thread in the process
+- Connect/read timeouts on every request
+- Optional client-side rate limiting per base URL
+- Retries with exponential backoff and full jitter for transient failures:
+  timeouts, connection errors and 429/502/503/504. Non-idempotent requests
+  (POST, PATCH) are only retried when the server cannot have processed them
+  (connect timeout, 429), so a retry never creates a duplicate campaign.
+- Per-adapter latency and error metrics (adapter_http_* in src/core/metrics.py)
+
+Responses are returned as-is; callers still call raise_for_status().
+
+Environment variables:
+    ADCP_ADAPTER_HTTP_CONNECT_TIMEOUT: Connect timeout in seconds (default 5)
+    ADCP_ADAPTER_HTTP_READ_TIMEOUT: Read timeout in seconds (default 30)
+    ADCP_ADAPTER_HTTP_MAX_RETRIES: Retries for transient failures (default 2)
+    ADCP_ADAPTER_HTTP_POOL_SIZE: Keep-alive connections per base URL (default 10)
+    ADCP_ADAPTER_HTTP_RATE_LIMIT: Requests per second per base URL, 0 for no
+        limit (default 0)
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.core.metrics import adapter_http_errors_total, adapter_http_request_duration, adapter_http_retries_total
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth retrying; 429 means the request was rejected before processing
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class RetryConfig:
+    """Backoff settings for adapter HTTP retries."""
+
+    BACKOFF_BASE_SECONDS = 0.5
+    BACKOFF_MAX_SECONDS = 10.0
+
+
+@dataclass(frozen=True)
+class HTTPClientSettings:
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    max_retries: int = 2
+    pool_size: int = 10
+    rate_limit: float = 0.0
+
+    @classmethod
+    def from_env(cls) -> "HTTPClientSettings":
+        return cls(
+            connect_timeout=float(os.environ.get("ADCP_ADAPTER_HTTP_CONNECT_TIMEOUT", "5")),
+            read_timeout=float(os.environ.get("ADCP_ADAPTER_HTTP_READ_TIMEOUT", "30")),
+            max_retries=int(os.environ.get("ADCP_ADAPTER_HTTP_MAX_RETRIES", "2")),
+            pool_size=int(os.environ.get("ADCP_ADAPTER_HTTP_POOL_SIZE", "10")),
+            rate_limit=float(os.environ.get("ADCP_ADAPTER_HTTP_RATE_LIMIT", "0")),
+        )
+
+
+class RateLimiter:
+    """Thread-safe limiter spacing requests at least 1/rate seconds apart."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserve the next slot and return how long to wait for it."""
+        if not self.interval:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        return max(0.0, wait)
+
+
+def _backoff_delay(attempt: int, retry_after: str | None = None) -> float:
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), RetryConfig.BACKOFF_MAX_SECONDS)
+    return random.uniform(0, min(RetryConfig.BACKOFF_BASE_SECONDS * 2**attempt, RetryConfig.BACKOFF_MAX_SECONDS))
+
+
+def _retry_status(method: str, status_code: int) -> bool:
+    return status_code in RETRY_STATUSES and (method in IDEMPOTENT_METHODS or status_code == 429)
+
+
+def _status_label(status_code: int) -> str:
+    return f"{status_code // 100}xx"
+
+
+class AdapterHTTPClient:
+    """Pooled, rate-limited requests client with retries for one ad server base URL."""
+
+    def __init__(self, adapter: str, base_url: str, settings: HTTPClientSettings | None = None):
+        self.adapter = adapter
+        self.base_url = base_url
+        self.settings = settings or HTTPClientSettings.from_env()
+        self._limiter = RateLimiter(self.settings.rate_limit)
+        self.session = requests.Session()
+        pool = HTTPAdapter(pool_connections=1, pool_maxsize=self.settings.pool_size)
+        self.session.mount("https://", pool)
+        self.session.mount("http://", pool)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request, retrying transient failures.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            **kwargs: Passed to requests.Session.request (headers, json, params, ...)
+
+        Returns:
+            The final response (any status); raises the last error if every attempt failed
+        """
+        method = method.upper()
+        kwargs.setdefault("timeout", (self.settings.connect_timeout, self.settings.read_timeout))
+
+        for attempt in range(self.settings.max_retries + 1):
+            last_attempt = attempt == self.settings.max_retries
+            wait = self._limiter.reserve()
+            if wait:
+                time.sleep(wait)
+
+            start = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.exceptions.ConnectTimeout as e:
+                # Never reached the server: safe to retry any method
+                self._observe_error(method, "timeout", start)
+                if last_attempt:
+                    raise
+                cause: Any = e
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                reason = "timeout" if isinstance(e, requests.exceptions.Timeout) else "connection"
+                self._observe_error(method, reason, start)
+                if last_attempt or method not in IDEMPOTENT_METHODS:
+                    raise
+                cause = e
+            else:
+                self._observe_response(method, response.status_code, start)
+                if last_attempt or not _retry_status(method, response.status_code):
+                    return response
+                cause = f"HTTP {response.status_code}"
+                delay = _backoff_delay(attempt, response.headers.get("Retry-After"))
+                response.close()
+                self._log_retry(method, url, attempt, cause, delay)
+                time.sleep(delay)
+                continue
+
+            delay = _backoff_delay(attempt)
+            self._log_retry(method, url, attempt, cause, delay)
+            time.sleep(delay)
+
+        raise AssertionError("unreachable")
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+    def _observe(self, method: str, status: str, start: float) -> None:
+        adapter_http_request_duration.labels(adapter=self.adapter, method=method, status=status).observe(
+            time.perf_counter() - start
+        )
+
+    def _observe_response(self, method: str, status_code: int, start: float) -> None:
+        self._observe(method, _status_label(status_code), start)
+        if status_code >= 400:
+            adapter_http_errors_total.labels(adapter=self.adapter, reason=f"http_{_status_label(status_code)}").inc()
+
+    def _observe_error(self, method: str, reason: str, start: float) -> None:
+        self._observe(method, reason, start)
+        adapter_http_errors_total.labels(adapter=self.adapter, reason=reason).inc()
+
+    def _log_retry(self, method: str, url: str, attempt: int, cause: Any, delay: float) -> None:
+        adapter_http_retries_total.labels(adapter=self.adapter).inc()
+        logger.warning(
+            f"{self.adapter} {method} {url} failed ({cause}), "
+            f"retrying in {delay:.2f}s (attempt {attempt + 1}/{self.settings.max_retries + 1})"
+        )
+
+
+_clients: dict[tuple[str, str], AdapterHTTPClient] = {}
+_clients_lock = threading.Lock()
+_clients_pid: int | None = None
+
+
+def _check_pid() -> None:
+    # Called with _clients_lock held. A forked child must not reuse the parent's sockets.
+    global _clients_pid
+    if _clients_pid != os.getpid():
+        _clients.clear()
+        _clients_pid = os.getpid()
+
+
+def get_http_client(adapter: str, base_url: str) -> AdapterHTTPClient:
+    """Get the process-wide pooled client for an adapter's base URL, creating it on first use."""
+    key = (adapter, base_url.rstrip("/"))
+    with _clients_lock:
+        _check_pid()
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = AdapterHTTPClient(adapter, key[1])
+        return client
+
+
+def reset_http_clients() -> None:
+    """Close and drop all pooled clients (e.g. in tests, or after changing settings)."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
@@ -7,6 +7,7 @@ from adcp.types.aliases import Package as ResponsePackage
 
 from src.adapters.base import AdServerAdapter, CreativeEngineAdapter
 from src.adapters.constants import REQUIRED_UPDATE_ACTIONS
+from src.adapters.http_client import get_http_client
 from src.core.schemas import *
 
 
@@ -39,6 +40,8 @@ class Kevel(AdServerAdapter):
         self.network_id = self.config.get("network_id")
         self.api_key = self.config.get("api_key")
         self.base_url = "https://api.kevel.co/v1"
+        # Pooled session shared by all Kevel adapter instances (keep-alive, timeouts, retries)
+        self.http = get_http_client(self.adapter_name, self.base_url)
 
         # Feature flags
         self.userdb_enabled = self.config.get("userdb_enabled", False)
@@ -307,7 +310,7 @@ class Kevel(AdServerAdapter):
                 "IsActive": True,
             }
 
-            response = requests.post(f"{self.base_url}/campaign", headers=self.headers, json=campaign_payload)
+            response = self.http.post(f"{self.base_url}/campaign", headers=self.headers, json=campaign_payload)
             response.raise_for_status()
             campaign_data = response.json()
             campaign_id = campaign_data["Id"]
@@ -355,7 +358,7 @@ class Kevel(AdServerAdapter):
                             )  # Convert to hours, minimum 1
                             flight_payload["FreqCapType"] = 1  # 1 = per user (cookie-based)
 
-                flight_response = requests.post(f"{self.base_url}/flight", headers=self.headers, json=flight_payload)
+                flight_response = self.http.post(f"{self.base_url}/flight", headers=self.headers, json=flight_payload)
                 flight_response.raise_for_status()
                 flight_data = flight_response.json()
                 flight_id = flight_data.get("Id")
@@ -437,7 +440,7 @@ class Kevel(AdServerAdapter):
         else:
             try:
                 # Get all flights for the campaign to map package names to flight IDs
-                flights_response = requests.get(
+                flights_response = self.http.get(
                     f"{self.base_url}/flight", headers=self.headers, params={"campaignId": media_buy_id}
                 )
                 flights_response.raise_for_status()
@@ -467,7 +470,7 @@ class Kevel(AdServerAdapter):
                         continue
 
                     # Create the creative
-                    creative_response = requests.post(
+                    creative_response = self.http.post(
                         f"{self.base_url}/creative", headers=self.headers, json=creative_payload
                     )
                     creative_response.raise_for_status()
@@ -482,7 +485,7 @@ class Kevel(AdServerAdapter):
                     if flight_ids_to_associate:
                         for flight_id in flight_ids_to_associate:
                             ad_payload = {"CreativeId": creative_id, "FlightId": flight_id, "IsActive": True}
-                            ad_response = requests.post(f"{self.base_url}/ad", headers=self.headers, json=ad_payload)
+                            ad_response = self.http.post(f"{self.base_url}/ad", headers=self.headers, json=ad_payload)
                             ad_response.raise_for_status()
 
                     created_asset_statuses.append(AssetStatus(creative_id=asset["creative_id"], status="approved"))
@@ -587,7 +590,7 @@ class Kevel(AdServerAdapter):
                 "Filter": {"CampaignId": media_buy_id},
             }
 
-            response = requests.post(f"{self.base_url}/report/queue", headers=self.headers, json=report_request)
+            response = self.http.post(f"{self.base_url}/report/queue", headers=self.headers, json=report_request)
             response.raise_for_status()
             report_id = response.json()["Id"]
 
@@ -597,7 +600,7 @@ class Kevel(AdServerAdapter):
             time.sleep(1)
 
             # Get report results
-            results_response = requests.get(f"{self.base_url}/report/{report_id}/results", headers=self.headers)
+            results_response = self.http.get(f"{self.base_url}/report/{report_id}/results", headers=self.headers)
             results_response.raise_for_status()
 
             # Parse results and aggregate
@@ -740,14 +743,14 @@ class Kevel(AdServerAdapter):
                 if action in ["pause_media_buy", "resume_media_buy"]:
                     # Update campaign status
                     update_payload = {"IsActive": action == "resume_media_buy"}
-                    update_response = requests.put(
+                    update_response = self.http.put(
                         f"{self.base_url}/campaign/{campaign_id}", headers=self.headers, json=update_payload
                     )
                     update_response.raise_for_status()
 
                 elif action in ["pause_package", "resume_package"] and package_id:
                     # Get flight ID by name
-                    flights_response = requests.get(
+                    flights_response = self.http.get(
                         f"{self.base_url}/flight", headers=self.headers, params={"campaignId": campaign_id}
                     )
                     flights_response.raise_for_status()
@@ -764,7 +767,7 @@ class Kevel(AdServerAdapter):
                     # Update flight status
                     is_resume = action == "resume_package"
                     update_payload = {"IsActive": is_resume}
-                    update_response = requests.put(
+                    update_response = self.http.put(
                         f"{self.base_url}/flight/{flight['Id']}", headers=self.headers, json=update_payload
                     )
                     update_response.raise_for_status()
@@ -791,7 +794,7 @@ class Kevel(AdServerAdapter):
                     and budget is not None
                 ):
                     # Get flight ID by name
-                    flights_response = requests.get(
+                    flights_response = self.http.get(
                         f"{self.base_url}/flight", headers=self.headers, params={"campaignId": campaign_id}
                     )
                     flights_response.raise_for_status()
@@ -815,7 +818,7 @@ class Kevel(AdServerAdapter):
 
                     # Update flight impressions
                     impressions_payload: dict[str, int] = {"Impressions": new_impressions}
-                    update_response = requests.put(
+                    update_response = self.http.put(
                         f"{self.base_url}/flight/{flight['Id']}", headers=self.headers, json=impressions_payload
                     )
                     update_response.raise_for_status()
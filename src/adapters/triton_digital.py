@@ -7,6 +7,7 @@ from adcp.types.aliases import Package as ResponsePackage
 
 from src.adapters.base import AdServerAdapter, CreativeEngineAdapter
 from src.adapters.constants import REQUIRED_UPDATE_ACTIONS
+from src.adapters.http_client import get_http_client
 from src.core.schemas import *
 
 
@@ -38,6 +39,8 @@ class TritonDigital(AdServerAdapter):
         # Get Triton configuration
         self.base_url = self.config.get("base_url", "https://tap-api.tritondigital.com/v1")
         self.auth_token = self.config.get("auth_token")
+        # Pooled session shared by all Triton adapter instances (keep-alive, timeouts, retries)
+        self.http = get_http_client(self.adapter_name, self.base_url)
 
         if self.dry_run:
             self.log("Running in dry-run mode - Triton API calls will be simulated", dry_run_prefix=False)
@@ -229,7 +232,7 @@ class TritonDigital(AdServerAdapter):
                 "active": True,
             }
 
-            response = requests.post(f"{self.base_url}/campaigns", headers=self.headers, json=campaign_payload)
+            response = self.http.post(f"{self.base_url}/campaigns", headers=self.headers, json=campaign_payload)
             response.raise_for_status()
             campaign_data = response.json()
             campaign_id = campaign_data["id"]
@@ -265,7 +268,7 @@ class TritonDigital(AdServerAdapter):
                     if targeting and "stationIds" in targeting:
                         flight_payload["stationIds"] = targeting["stationIds"]
 
-                flight_response = requests.post(f"{self.base_url}/flights", headers=self.headers, json=flight_payload)
+                flight_response = self.http.post(f"{self.base_url}/flights", headers=self.headers, json=flight_payload)
                 flight_response.raise_for_status()
                 flight_data = flight_response.json()
                 flight_id = flight_data.get("id")
@@ -337,7 +340,7 @@ class TritonDigital(AdServerAdapter):
                 campaign_id = media_buy_id.replace("triton_", "")
 
                 # Get all flights for the campaign to map package names to flight IDs
-                flights_response = requests.get(
+                flights_response = self.http.get(
                     f"{self.base_url}/flights", headers=self.headers, params={"campaignId": campaign_id}
                 )
                 flights_response.raise_for_status()
@@ -353,7 +356,7 @@ class TritonDigital(AdServerAdapter):
 
                     creative_payload = {"name": asset["name"], "type": "AUDIO", "url": asset["media_url"]}
 
-                    creative_response = requests.post(
+                    creative_response = self.http.post(
                         f"{self.base_url}/creatives", headers=self.headers, json=creative_payload
                     )
                     creative_response.raise_for_status()
@@ -368,7 +371,7 @@ class TritonDigital(AdServerAdapter):
                     if flight_ids_to_associate:
                         for flight_id in flight_ids_to_associate:
                             association_payload = {"creativeIds": [creative_id]}
-                            assoc_response = requests.put(
+                            assoc_response = self.http.put(
                                 f"{self.base_url}/flights/{flight_id}", headers=self.headers, json=association_payload
                             )
                             assoc_response.raise_for_status()
@@ -417,7 +420,7 @@ class TritonDigital(AdServerAdapter):
                 # Extract campaign ID from media_buy_id
                 campaign_id = media_buy_id.replace("triton_", "")
 
-                response = requests.get(f"{self.base_url}/campaigns/{campaign_id}", headers=self.headers)
+                response = self.http.get(f"{self.base_url}/campaigns/{campaign_id}", headers=self.headers)
                 response.raise_for_status()
                 campaign_data = response.json()
 
@@ -489,7 +492,7 @@ class TritonDigital(AdServerAdapter):
             }
 
             try:
-                response = requests.post(f"{self.base_url}/reports", headers=self.headers, json=report_payload)
+                response = self.http.post(f"{self.base_url}/reports", headers=self.headers, json=report_payload)
                 response.raise_for_status()
                 report_job = response.json()
                 job_id = report_job["id"]
@@ -497,7 +500,7 @@ class TritonDigital(AdServerAdapter):
                 import time
 
                 for _ in range(10):  # Poll for up to 5 seconds
-                    status_response = requests.get(f"{self.base_url}/reports/{job_id}", headers=self.headers)
+                    status_response = self.http.get(f"{self.base_url}/reports/{job_id}", headers=self.headers)
                     status_response.raise_for_status()
                     status_data = status_response.json()
                     if status_data["status"] == "COMPLETED":
@@ -507,7 +510,7 @@ class TritonDigital(AdServerAdapter):
                 else:
                     raise Exception("Triton report did not complete in time.")
 
-                report_response = requests.get(report_url)
+                report_response = self.http.get(report_url)
                 report_response.raise_for_status()
 
                 import csv
@@ -670,14 +673,14 @@ class TritonDigital(AdServerAdapter):
                 if action in ["pause_media_buy", "resume_media_buy"]:
                     # Update campaign status
                     update_payload: dict[str, Any] = {"active": action == "resume_media_buy"}
-                    response = requests.put(
+                    response = self.http.put(
                         f"{self.base_url}/campaigns/{campaign_id}", headers=self.headers, json=update_payload
                     )
                     response.raise_for_status()
 
                 elif action in ["pause_package", "resume_package"] and package_id:
                     # Get flight ID by name
-                    flights_response = requests.get(
+                    flights_response = self.http.get(
                         f"{self.base_url}/flights", headers=self.headers, params={"campaignId": campaign_id}
                     )
                     flights_response.raise_for_status()
@@ -694,7 +697,7 @@ class TritonDigital(AdServerAdapter):
                     # Update flight status
                     is_resume = action == "resume_package"
                     flight_update_payload: dict[str, Any] = {"active": is_resume}
-                    response = requests.put(
+                    response = self.http.put(
                         f"{self.base_url}/flights/{flight['id']}", headers=self.headers, json=flight_update_payload
                     )
                     response.raise_for_status()
@@ -721,7 +724,7 @@ class TritonDigital(AdServerAdapter):
                     and budget is not None
                 ):
                     # Get flight and update goal
-                    flights_response = requests.get(
+                    flights_response = self.http.get(
                         f"{self.base_url}/flights", headers=self.headers, params={"campaignId": campaign_id}
                     )
                     flights_response.raise_for_status()
@@ -744,7 +747,7 @@ class TritonDigital(AdServerAdapter):
                         new_impressions = budget  # budget param contains impressions
 
                     goal_update_payload: dict[str, Any] = {"goal": {"type": "IMPRESSIONS", "value": new_impressions}}
-                    response = requests.put(
+                    response = self.http.put(
                         f"{self.base_url}/flights/{flight['id']}", headers=self.headers, json=goal_update_payload
                     )
                     response.raise_for_status()
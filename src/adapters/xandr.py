@@ -11,6 +11,7 @@ from typing import Any
 import requests
 
 from src.adapters.base import AdServerAdapter
+from src.adapters.http_client import get_http_client
 from src.core.retry_utils import api_retry
 from src.core.schemas import (
     AdapterGetMediaBuyDeliveryResponse,
@@ -211,6 +212,8 @@ class XandrAdapter(AdServerAdapter):
 
         # Extract Xandr-specific config
         self.api_endpoint = config.get("api_endpoint", "https://api.appnexus.com")
+        # Pooled session shared by all Xandr adapter instances (keep-alive, timeouts, retries)
+        self.http = get_http_client("xandr", self.api_endpoint)
         self.username = config.get("username")
         self.password = config.get("password")
         self.member_id = config.get("member_id")
@@ -241,7 +244,7 @@ class XandrAdapter(AdServerAdapter):
         auth_data = {"auth": {"username": self.username, "password": self.password}}
 
         try:
-            response = requests.post(auth_url, json=auth_data)
+            response = self.http.post(auth_url, json=auth_data)
             response.raise_for_status()
 
             data = response.json()
@@ -257,7 +260,6 @@ class XandrAdapter(AdServerAdapter):
             logger.error(f"Xandr authentication error: {e}")
             raise
 
-    @api_retry
     def _make_request(self, method: str, endpoint: str, data: dict | None = None) -> dict:
         """Make authenticated request to Xandr API."""
         self._authenticate()
@@ -268,13 +270,13 @@ class XandrAdapter(AdServerAdapter):
 
         try:
             if method == "GET":
-                response = requests.get(url, headers=headers, params=data)
+                response = self.http.get(url, headers=headers, params=data)
             elif method == "POST":
-                response = requests.post(url, headers=headers, json=data)
+                response = self.http.post(url, headers=headers, json=data)
             elif method == "PUT":
-                response = requests.put(url, headers=headers, json=data)
+                response = self.http.put(url, headers=headers, json=data)
             elif method == "DELETE":
-                response = requests.delete(url, headers=headers)
+                response = self.http.delete(url, headers=headers)
             else:
                 raise ValueError(f"Unsupported method: {method}")
 
@@ -2,9 +2,8 @@
 
 import json
 import logging
-import time
 from collections import defaultdict
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 
 from flask import Blueprint, Response, jsonify, request
 from sqlalchemy import select
@@ -12,6 +11,7 @@ from sqlalchemy import select
 from src.admin.utils import require_tenant_access
 from src.core.database.database_session import get_db_session
 from src.core.database.models import AuditLog
+from src.services.activity_hub import get_activity_hub
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +23,9 @@ MAX_CONNECTIONS_PER_TENANT = 10
 connection_counts: dict[str, int] = defaultdict(int)
 connection_timestamps: dict[str, list[float]] = defaultdict(list)
 
+# Seconds between SSE heartbeats when no activity arrives
+HEARTBEAT_INTERVAL = 15
+
 
 def format_activity_from_audit_log(audit_log: AuditLog) -> dict:
     """Convert AuditLog database record to activity feed format with rich details."""
@@ -164,8 +167,15 @@ def format_activity_from_audit_log(audit_log: AuditLog) -> dict:
     }
 
 
-def get_recent_activities(tenant_id: str, since: datetime = None, limit: int = 50) -> list[dict]:
-    """Get recent activities for a tenant from the database."""
+def get_recent_activities(
+    tenant_id: str, since: datetime = None, limit: int = 50, after_id: int | None = None
+) -> list[dict]:
+    """Get recent activities for a tenant from the database, newest first.
+
+    With ``after_id``, returns the oldest ``limit`` activities after that log_id
+    (still newest first), so a caller advancing a cursor never skips rows when
+    more than ``limit`` arrive between fetches.
+    """
     # Validate input parameters
     if not tenant_id or not isinstance(tenant_id, str) or len(tenant_id) > 50:
         logger.warning(f"Invalid tenant_id provided: {tenant_id}")
@@ -180,9 +190,16 @@ def get_recent_activities(tenant_id: str, since: datetime = None, limit: int = 5
 
             if since:
                 stmt = stmt.filter(AuditLog.timestamp > since)
+            if after_id is not None:
+                stmt = stmt.filter(AuditLog.log_id > after_id)
 
-            # Order by timestamp descending and limit results
-            audit_logs = db_session.scalars(stmt.order_by(AuditLog.timestamp.desc()).limit(limit)).all()
+            if after_id is not None:
+                # Page forward from the cursor, then present newest first like the unfiltered query
+                stmt = stmt.order_by(AuditLog.log_id.asc()).limit(limit)
+                audit_logs = list(reversed(db_session.scalars(stmt).all()))
+            else:
+                # Order by timestamp descending and limit results
+                audit_logs = list(db_session.scalars(stmt.order_by(AuditLog.timestamp.desc()).limit(limit)).all())
 
             # Convert to activity format
             activities = []
@@ -200,6 +217,11 @@ def get_recent_activities(tenant_id: str, since: datetime = None, limit: int = 5
         return []
 
 
+def _fetch_new_activities(tenant_id: str, after_id: int | None, limit: int) -> list[dict]:
+    """Fetch callback for the activity hub's per-tenant producers."""
+    return get_recent_activities(tenant_id, limit=limit, after_id=after_id)
+
+
 @activity_stream_bp.route("/tenant/<tenant_id>/activity", methods=["GET"])
 @require_tenant_access(api_mode=False)  # Use normal redirect auth for polling
 def activity_feed(tenant_id, **kwargs):
@@ -264,91 +286,52 @@ def activity_events(tenant_id, **kwargs):
         """Generator function that yields SSE formatted data."""
         # Track resources for cleanup
         cleanup_needed = False
+        subscription = None
 
         try:
-            # Send initial historical data
+            # New activities are pushed by the tenant's shared producer (see activity_hub),
+            # so this connection never queries the database itself
             logger.info(f"Starting SSE stream for tenant {tenant_id}")
-            recent_activities = get_recent_activities(tenant_id, limit=50)
+            subscription = get_activity_hub(_fetch_new_activities).subscribe(tenant_id)
+            cleanup_needed = True
 
-            for activity in reversed(recent_activities):  # Reverse to show oldest first
+            # Send initial historical data (oldest first)
+            for activity in subscription.backlog:
                 data = json.dumps(activity)
                 yield f"data: {data}\n\n"
 
-            # Keep track of last check time
-            last_check = datetime.now(UTC)
-            cleanup_needed = True
-
-            # Poll for new activities every 2 seconds
             while True:
-                try:
-                    # Check for new activities since last check
-                    new_activities = get_recent_activities(
-                        tenant_id,
-                        since=last_check - timedelta(seconds=1),  # Small overlap to avoid missing events
-                        limit=10,
-                    )
-
-                    # Send new activities
-                    for activity in reversed(new_activities):  # Newest activities last
-                        data = json.dumps(activity)
-                        yield f"data: {data}\n\n"
-
-                    # Update last check time
-                    if new_activities:
-                        # Use timestamp of newest activity
-                        newest_timestamp_str = new_activities[0]["timestamp"]
-                        newest_timestamp = datetime.fromisoformat(newest_timestamp_str.replace("Z", "+00:00"))
-                        last_check = max(last_check, newest_timestamp)
-                    else:
-                        last_check = datetime.now(UTC)
-
+                activity = subscription.get(timeout=HEARTBEAT_INTERVAL)
+                if activity is None:
                     # Send heartbeat to keep connection alive
                     yield ": heartbeat\n\n"
+                    continue
+                data = json.dumps(activity)
+                yield f"data: {data}\n\n"
 
-                    # Wait before next poll
-                    time.sleep(2)
-
-                except GeneratorExit:
-                    logger.info(f"SSE client disconnected for tenant {tenant_id}")
-                    cleanup_needed = True
-                    break
-                except Exception as e:
-                    logger.error(f"Error in SSE stream for tenant {tenant_id}: {e}")
-                    cleanup_needed = True
-                    # Send error event
-                    error_data = json.dumps(
-                        {
-                            "type": "error",
-                            "message": "Stream error occurred",
-                            "timestamp": datetime.now(UTC).isoformat(),
-                        }
-                    )
-                    yield f"event: error\ndata: {error_data}\n\n"
-                    time.sleep(5)  # Wait longer after error
-
+        except GeneratorExit:
+            logger.info(f"SSE client disconnected for tenant {tenant_id}")
         except Exception as e:
-            logger.error(f"Failed to start SSE stream for tenant {tenant_id}: {e}")
+            logger.error(f"Error in SSE stream for tenant {tenant_id}: {e}")
             cleanup_needed = True
             error_data = json.dumps(
                 {
                     "type": "error",
-                    "message": "Failed to start activity stream",
+                    "message": "Activity stream error occurred",
                     "timestamp": datetime.now(UTC).isoformat(),
                 }
             )
             yield f"event: error\ndata: {error_data}\n\n"
         finally:
             # Clean up resources
+            if subscription is not None:
+                get_activity_hub(_fetch_new_activities).unsubscribe(subscription)
             if cleanup_needed:
                 old_count = connection_counts[tenant_id]
                 connection_counts[tenant_id] = max(0, connection_counts[tenant_id] - 1)
                 logger.info(
                     f"Cleaning up SSE stream resources for tenant {tenant_id} - connection count: {old_count} -> {connection_counts[tenant_id]}"
                 )
-                # Force garbage collection for any lingering resources
-                import gc
-
-                gc.collect()
 
     # Set appropriate headers for SSE
     response = Response(
@@ -19,6 +19,7 @@ from flask import Blueprint, abort, current_app, flash, redirect, render_templat
 from sqlalchemy import select
 
 from src.admin.utils import is_super_admin
+from src.core.adapter_pool import invalidate_adapter_pool
 from src.core.database.database_session import get_db_session
 from src.core.database.models import Tenant
 from src.core.domain_config import (
@@ -1141,6 +1142,7 @@ def gam_callback():
             tenant.ad_server = "google_ad_manager"
 
             db_session.commit()
+            invalidate_adapter_pool(tenant_id)
 
         logger.info(f"GAM OAuth completed successfully for tenant {tenant_id}")
         flash("Google Ad Manager OAuth setup completed successfully! Your refresh token has been saved.", "success")
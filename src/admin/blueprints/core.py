@@ -23,6 +23,7 @@ from sqlalchemy import select, text
 
 from src.admin.utils import require_auth
 from src.admin.utils.audit_decorator import log_admin_action
+from src.core.auth_cache import invalidate_tenant_auth_cache
 from src.core.database.database_session import get_db_session
 from src.core.database.models import Tenant
 from src.core.domain_config import (
@@ -539,6 +540,7 @@ def reactivate_tenant(tenant_id):
             tenant.is_active = True
             tenant.updated_at = datetime.now(UTC)
             db_session.commit()
+            invalidate_tenant_auth_cache(tenant_id)
 
             logger.info(
                 f"Tenant {tenant_id} ({tenant.name}) reactivated by super admin {session.get('user', 'unknown')}"
@@ -14,6 +14,7 @@ from src.adapters.gam_inventory_discovery import GAMInventoryDiscovery
 from src.adapters.gam_reporting_service import GAMReportingService
 from src.admin.utils import require_tenant_access
 from src.admin.utils.audit_decorator import log_admin_action
+from src.core.adapter_pool import invalidate_adapter_pool
 from src.core.database.database_session import get_db_session
 from src.core.database.models import GAMLineItem, GAMOrder, Tenant
 
@@ -453,6 +454,7 @@ def configure_gam(tenant_id):
                     logger.info(f"Auto-created CurrencyLimit for GAM currency {network_currency}")
 
             db_session.commit()
+            invalidate_adapter_pool(tenant_id)
 
             logger.info(f"GAM configuration saved for tenant {tenant_id}")
 
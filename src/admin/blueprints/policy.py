@@ -9,6 +9,7 @@ from sqlalchemy import select
 from src.admin.utils import get_tenant_config_from_db, require_auth
 from src.admin.utils.audit_decorator import log_admin_action
 from src.core.audit_logger import AuditLogger
+from src.core.auth_cache import invalidate_tenant_auth_cache
 from src.core.database.database_session import get_db_session
 from src.core.database.models import AuditLog, Context, Tenant, WorkflowStep
 
@@ -192,6 +193,7 @@ def update(tenant_id):
             if tenant:
                 tenant.policy_settings = json.dumps(policy_settings)
                 db_session.commit()
+                invalidate_tenant_auth_cache(tenant_id)
 
         return redirect(url_for("policy.index", tenant_id=tenant_id))
 
@@ -12,6 +12,7 @@ from sqlalchemy import func, select
 from src.admin.services import DashboardService
 from src.admin.utils import require_tenant_access
 from src.admin.utils.audit_decorator import log_admin_action
+from src.core.auth_cache import invalidate_principal_auth_cache
 from src.core.database.database_session import get_db_session
 from src.core.database.models import MediaBuy, Principal, PushNotificationConfig, Tenant
 
@@ -749,6 +750,7 @@ def delete_principal(tenant_id, principal_id):
             # Delete the principal (cascades to related records)
             db_session.delete(principal)
             db_session.commit()
+            invalidate_principal_auth_cache(tenant_id, principal_id)
 
             logger.info(f"Deleted principal {principal_id} ({principal_name}) from tenant {tenant_id}")
 
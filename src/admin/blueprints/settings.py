@@ -18,6 +18,8 @@ from sqlalchemy import select
 
 from src.admin.utils import require_auth, require_tenant_access
 from src.admin.utils.audit_decorator import log_admin_action
+from src.core.adapter_pool import invalidate_adapter_pool
+from src.core.auth_cache import invalidate_tenant_auth_cache
 from src.core.database.database_session import get_db_session
 from src.core.database.models import Tenant
 
@@ -281,6 +283,7 @@ def update_general(tenant_id):
 
             tenant.updated_at = datetime.now(UTC)
             db_session.commit()
+            invalidate_tenant_auth_cache(tenant_id)
 
             flash("General settings updated successfully", "success")
 
@@ -460,6 +463,8 @@ def update_adapter(tenant_id):
             tenant.ad_server = new_adapter
             tenant.updated_at = datetime.now(UTC)
             db_session.commit()
+            invalidate_tenant_auth_cache(tenant_id)
+            invalidate_adapter_pool(tenant_id)
 
             # Return appropriate response based on request type
             if request.is_json:
@@ -513,6 +518,7 @@ def update_slack(tenant_id):
             tenant.slack_audit_webhook_url = audit_webhook_url if audit_webhook_url else None
             tenant.updated_at = datetime.now(UTC)
             db_session.commit()
+            invalidate_tenant_auth_cache(tenant_id)
 
             if webhook_url or audit_webhook_url:
                 flash("Slack integration updated successfully", "success")
@@ -576,6 +582,7 @@ def update_ai(tenant_id):
             tenant.ai_config = new_config
             tenant.updated_at = datetime.now(UTC)
             db_session.commit()
+            invalidate_tenant_auth_cache(tenant_id)
 
             provider_name = provider.title()
             if new_config.get("api_key"):
@@ -1217,6 +1224,7 @@ def update_business_rules(tenant_id):
                             tenant.adapter_config.kevel_manual_approval_required = False
 
                 db_session.commit()
+                invalidate_tenant_auth_cache(tenant_id)
 
         # Success
         if request.is_json:
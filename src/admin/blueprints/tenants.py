@@ -18,6 +18,7 @@ from sqlalchemy import func, select
 from src.admin.services import DashboardService
 from src.admin.utils import get_tenant_config_from_db, require_tenant_access
 from src.admin.utils.audit_decorator import log_admin_action
+from src.core.auth_cache import invalidate_tenant_auth_cache
 from src.core.config_loader import is_single_tenant_mode
 from src.core.database.database_session import get_db_session
 from src.core.database.models import Principal, Tenant
@@ -460,6 +461,7 @@ def update(tenant_id):
             tenant.updated_at = datetime.now(UTC)
 
             db_session.commit()
+            invalidate_tenant_auth_cache(tenant_id)
             flash("Tenant settings updated successfully", "success")
 
     except Exception as e:
@@ -499,6 +501,7 @@ def update_slack(tenant_id):
             tenant.updated_at = datetime.now(UTC)
 
             db_session.commit()
+            invalidate_tenant_auth_cache(tenant_id)
             flash("Slack settings updated successfully", "success")
 
     except Exception as e:
@@ -599,6 +602,7 @@ def deactivate_tenant(tenant_id):
             tenant.is_active = False
             tenant.updated_at = datetime.now(UTC)
             db_session.commit()
+            invalidate_tenant_auth_cache(tenant_id)
 
             # Log to application logs
             logger.info(f"Tenant {tenant_id} ({tenant.name}) deactivated by user {session.get('user', 'unknown')}")
@@ -10,6 +10,8 @@ from functools import wraps
 from flask import Blueprint, jsonify, request
 from sqlalchemy import delete, func, select
 
+from src.core.adapter_pool import invalidate_adapter_pool
+from src.core.auth_cache import invalidate_tenant_auth_cache
 from src.core.database.database_session import get_db_session
 from src.core.database.models import (
     AdapterConfig,
@@ -485,6 +487,8 @@ def update_tenant(tenant_id):
                     adapter.updated_at = datetime.now(UTC)
 
             db_session.commit()
+            invalidate_tenant_auth_cache(tenant_id)
+            invalidate_adapter_pool(tenant_id)
 
             return jsonify(
                 {
@@ -538,6 +542,8 @@ def delete_tenant(tenant_id):
                 message = "Tenant deactivated successfully"
 
             db_session.commit()
+            invalidate_tenant_auth_cache(tenant_id)
+            invalidate_adapter_pool(tenant_id)
 
             return jsonify({"message": message, "tenant_id": tenant_id})
 
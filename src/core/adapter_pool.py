@@ -0,0 +1,161 @@
+"""Per-tenant pool of initialized ad server clients.
+
+``get_adapter()`` builds a new adapter on every tool call. Adapters are cheap
+(they hold the principal and a few managers), but the GAM client behind them
+is not: a ``GAMClientManager`` performs an OAuth credential exchange, builds
+the ``AdManagerClient`` and creates SOAP service stubs, and the adapter looks
+up the trafficker's user ID with an extra API call. This module keeps
+initialized client managers per tenant so adapters built for later requests
+reuse them.
+
+Entries are keyed by (tenant_id, adapter_type, config version, credential
+digest). The config version is ``AdapterConfig.updated_at``, so an edit made
+by any process produces a new key; admin UI writes also call
+``invalidate_adapter_pool()`` so the old client is released immediately.
+Credentials are never part of the key in clear text.
+
+Entries idle for ``ADCP_ADAPTER_POOL_IDLE_TTL`` seconds are evicted. On each
+hit the OAuth access token is refreshed if it expires within
+``ADCP_ADAPTER_POOL_REFRESH_MARGIN`` seconds, so requests do not pay for the
+refresh (or fail on an expired token) mid-call.
+
+Environment variables:
+    ADCP_ADAPTER_POOL_IDLE_TTL: Seconds an unused client is kept (default 1800, 0 disables pooling)
+    ADCP_ADAPTER_POOL_MAX_ENTRIES: Maximum pooled clients per process (default 256)
+    ADCP_ADAPTER_POOL_REFRESH_MARGIN: Refresh tokens expiring within this many seconds (default 300)
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+from src.core.utils.ttl_cache import MISSING, TTLCache
+
+logger = logging.getLogger(__name__)
+
+ADAPTER_POOL_IDLE_TTL_SECONDS = float(os.environ.get("ADCP_ADAPTER_POOL_IDLE_TTL", "1800"))
+ADAPTER_POOL_MAX_ENTRIES = int(os.environ.get("ADCP_ADAPTER_POOL_MAX_ENTRIES", "256"))
+ADAPTER_POOL_REFRESH_MARGIN_SECONDS = float(os.environ.get("ADCP_ADAPTER_POOL_REFRESH_MARGIN", "300"))
+
+T = TypeVar("T")
+
+# (tenant_id, adapter_type, config_version, credential_digest) -> client
+_pool = TTLCache(maxsize=ADAPTER_POOL_MAX_ENTRIES, ttl=ADAPTER_POOL_IDLE_TTL_SECONDS, name="adapter_clients")
+
+# One lock per key so concurrent first requests for a tenant build a single client
+_build_locks: dict[Hashable, threading.Lock] = {}
+_build_locks_guard = threading.Lock()
+
+
+def credential_digest(*values: Any) -> str:
+    """Return a digest of credential fields for use in pool keys."""
+    return hashlib.sha256("\x1f".join("" if v is None else str(v) for v in values).encode("utf-8")).hexdigest()
+
+
+def get_pooled_client(key: tuple[str, str, str, str], build: Callable[[], T]) -> T:
+    """Return the pooled client for ``key``, building it with ``build()`` on a miss.
+
+    A hit renews the entry's idle timeout. Failed builds are not pooled.
+
+    Args:
+        key: (tenant_id, adapter_type, config_version, credential_digest)
+        build: Creates and fully initializes the client
+
+    Returns:
+        The pooled (or newly built) client
+    """
+    client = _pool.get(key)
+    if client is not MISSING:
+        _pool.set(key, client)
+        return client
+
+    if not _pool.enabled:
+        return _timed_build(key[1], build)
+
+    with _build_locks_guard:
+        lock = _build_locks.setdefault(key, threading.Lock())
+    with lock:
+        client = _pool.get(key)
+        if client is MISSING:
+            client = _timed_build(key[1], build)
+            # Drop superseded entries (older config versions) for this tenant/adapter
+            _pool.invalidate_where(lambda k, _v: k[:2] == key[:2] and k != key)
+            _pool.set(key, client)
+    with _build_locks_guard:
+        _build_locks.pop(key, None)
+    return client
+
+
+def _timed_build(adapter_type: str, build: Callable[[], T]) -> T:
+    from src.core.metrics import adapter_client_build_duration
+
+    started = time.perf_counter()
+    client = build()
+    elapsed = time.perf_counter() - started
+    adapter_client_build_duration.labels(adapter=adapter_type).observe(elapsed)
+    logger.info(f"Built {adapter_type} client in {elapsed:.2f}s")
+    return client
+
+
+def get_gam_client_manager(
+    tenant_id: str,
+    config_version: str,
+    network_code: str,
+    auth_config: dict[str, Any],
+):
+    """Return a pooled, initialized ``GAMClientManager`` for a tenant.
+
+    Args:
+        tenant_id: Tenant the client belongs to
+        config_version: Version of the tenant's adapter config (``AdapterConfig.updated_at``)
+        network_code: GAM network code
+        auth_config: Credential settings accepted by ``GAMAuthManager``
+
+    Returns:
+        Client manager with an initialized ``AdManagerClient``
+    """
+    from src.adapters.gam.client import GAMClientManager
+
+    key = (
+        tenant_id,
+        "google_ad_manager",
+        config_version,
+        credential_digest(
+            network_code,
+            auth_config.get("refresh_token"),
+            auth_config.get("service_account_json"),
+            auth_config.get("service_account_key_file"),
+        ),
+    )
+
+    def build() -> GAMClientManager:
+        manager = GAMClientManager(auth_config, network_code)
+        manager.get_client()
+        return manager
+
+    manager = get_pooled_client(key, build)
+    try:
+        manager.refresh_credentials_if_expiring(ADAPTER_POOL_REFRESH_MARGIN_SECONDS)
+    except Exception as e:
+        # The client library refreshes on demand as well; don't fail the request here
+        logger.warning(f"Ahead-of-expiry GAM credential refresh failed for tenant {tenant_id}: {e}")
+    return manager
+
+
+def invalidate_adapter_pool(tenant_id: str) -> None:
+    """Drop every pooled client for ``tenant_id``.
+
+    Call after any change to a tenant's adapter configuration or credentials.
+    """
+    removed = _pool.invalidate_where(lambda key, _value: key[0] == tenant_id)
+    if removed:
+        logger.debug(f"Invalidated {removed} pooled adapter client(s) for tenant {tenant_id}")
+
+
+def clear_adapter_pool() -> None:
+    """Drop all pooled clients."""
+    _pool.clear()
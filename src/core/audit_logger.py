@@ -7,9 +7,13 @@ Implements security-compliant logging with:
 - Operation tracking
 - Success/failure status
 - Database-based audit trail with optional file backup
+
+Database rows, backup JSONL files, log lines and Slack notifications are
+written by a background batch writer (see src/core/audit_writer.py) so tool
+latency does not include audit I/O.
 """
 
-import json
+import copy
 import logging
 from datetime import UTC, datetime
 from pathlib import Path
@@ -17,8 +21,8 @@ from typing import Any
 
 from sqlalchemy import select
 
+from src.core.audit_writer import AuditRecord, get_audit_log_writer
 from src.core.database.database_session import get_db_session
-from src.core.database.models import AuditLog
 
 # Create logs directory if it doesn't exist (for backup)
 LOG_DIR = Path("logs")
@@ -49,6 +53,68 @@ console_handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
 audit_logger.addHandler(console_handler)
 
 
+# Operations that always trigger a Slack audit notification
+SENSITIVE_OPERATIONS = frozenset(
+    [
+        # Media buy operations (business critical)
+        "create_media_buy",
+        "update_media_buy",
+        "delete_media_buy",
+        "approve_creative",
+        "reject_creative",
+        "manual_approval",
+        # Admin UI - User management (security critical)
+        "add_user",
+        "toggle_user",
+        "update_user_role",
+        "update_role",
+        # Admin UI - Tenant management (security critical)
+        "create_tenant",
+        "deactivate_tenant",
+        "reactivate_tenant",
+        "update",  # General tenant settings update
+        "update_general_settings",
+        "add_authorized_domain",
+        "remove_authorized_domain",
+        "add_authorized_email",
+        "remove_authorized_email",
+        # Admin UI - Adapter configuration (infrastructure critical)
+        "update_adapter",
+        "setup_adapter",
+        "configure_gam",
+        "detect_gam_network",
+        # Admin UI - Principal management (access control)
+        "create_principal",
+        "update_mappings",
+        "update_principal_mappings",
+        "register_webhook",
+        "delete_webhook",
+        # Admin UI - Policy changes (business critical)
+        "update_policy",
+        "update_business_rules",
+        "review_policy_task",
+    ]
+)
+
+
+def _load_tenant_for_notification(tenant_id: str | None) -> tuple[str | None, dict[str, Any] | None]:
+    """Return (tenant_name, tenant_config) for Slack notifications."""
+    if not tenant_id:
+        return None, None
+    try:
+        with get_db_session() as db_session:
+            from src.core.database.models import Tenant
+            from src.core.utils.tenant_utils import serialize_tenant_to_dict
+
+            stmt = select(Tenant).filter_by(tenant_id=tenant_id)
+            tenant = db_session.scalars(stmt).first()
+            if tenant:
+                return tenant.name, serialize_tenant_to_dict(tenant)
+    except:
+        pass
+    return None, None
+
+
 class AuditLogger:
     """Provides security-compliant audit logging for AdCP operations."""
 
@@ -69,6 +135,9 @@ class AuditLogger:
     ):
         """Log an adapter operation with full audit context.
 
+        The record is queued for the background audit writer; this call does
+        no I/O on the caller's thread.
+
         Args:
             operation: The operation being performed (e.g., "create_media_buy")
             principal_name: Human-readable principal name
@@ -81,163 +150,69 @@ class AuditLogger:
         """
         # Use provided tenant_id or fall back to instance tenant_id
         tenant_id = tenant_id or self.tenant_id
+        now = datetime.now(UTC)
+
+        # The record is written later by the background writer; snapshot details
+        # so changes the caller makes after this call are not recorded
+        details = copy.deepcopy(details) if details else details
 
         # Build log message in security documentation format
         message = f"{self.adapter_name}.{operation} for principal '{principal_name}' ({self.adapter_name} advertiser ID: {adapter_id})"
 
         if success:
-            audit_logger.info(message)
             if details:
-                for key, value in details.items():
-                    audit_logger.info(f"  {key}: {value}")
+                message += " | " + ", ".join(f"{key}: {value}" for key, value in details.items())
+            log_lines = [(logging.INFO, message)]
         else:
-            audit_logger.error(f"{message} - FAILED")
+            message += " - FAILED"
             if error:
-                audit_logger.error(f"  Error: {error}")
-
-        # Write to database
-        try:
-            with get_db_session() as db_session:
-                audit_log = AuditLog(
-                    tenant_id=tenant_id,
-                    timestamp=datetime.now(UTC),
-                    operation=f"{self.adapter_name}.{operation}",
-                    principal_name=principal_name,
-                    principal_id=principal_id,
-                    adapter_id=adapter_id,
-                    success=success,
-                    error_message=error if not success else None,
-                    # Pass dict directly - JSONType column handles serialization
-                    details=details or {},
-                )
-                db_session.add(audit_log)
-                db_session.commit()
-        except Exception as e:
-            audit_logger.error(f"Failed to write audit log to database: {e}")
-            # Continue with file logging as fallback
-
-        # Also write structured JSON log for machine processing (backup)
-        self._write_structured_log(
-            operation=operation,
-            principal_name=principal_name,
-            principal_id=principal_id,
-            adapter_id=adapter_id,
-            success=success,
-            details=details,
-            error=error,
-            tenant_id=tenant_id,
+                message += f" | Error: {error}"
+            log_lines = [(logging.ERROR, message)]
+
+        record = AuditRecord(
+            row={
+                "tenant_id": tenant_id,
+                "timestamp": now,
+                "operation": f"{self.adapter_name}.{operation}",
+                "principal_name": principal_name,
+                "principal_id": principal_id,
+                "adapter_id": adapter_id,
+                "success": success,
+                "error_message": error if not success else None,
+                # Pass dict directly - JSONType column handles serialization
+                "details": details or {},
+            },
+            # Structured JSON log for machine processing (backup)
+            backup_file="structured.jsonl",
+            backup_entry={
+                "timestamp": now.isoformat(),
+                "adapter": self.adapter_name,
+                "operation": operation,
+                "principal_name": principal_name,
+                "principal_id": principal_id,
+                "adapter_id": adapter_id,
+                "success": success,
+                "details": details,
+                "error": error,
+                "tenant_id": tenant_id,
+            },
+            log_lines=log_lines,
         )
 
         # Send to Slack audit channel if configured
-        try:
-            # Get tenant name and config for context
-            tenant_name = None
-            if tenant_id:
-                try:
-                    with get_db_session() as db_session:
-                        from src.core.database.models import Tenant
-
-                        stmt = select(Tenant).filter_by(tenant_id=tenant_id)
-                        tenant = db_session.scalars(stmt).first()
-                        if tenant:
-                            tenant_name = tenant.name
-                except:
-                    pass
-
-            # Send notification based on criteria
-            should_notify = False
-            security_alert = False
-
-            # Always notify on failures
-            if not success:
-                should_notify = True
-
-            # Notify on sensitive operations
-            sensitive_ops = [
-                # Media buy operations (business critical)
-                "create_media_buy",
-                "update_media_buy",
-                "delete_media_buy",
-                "approve_creative",
-                "reject_creative",
-                "manual_approval",
-                # Admin UI - User management (security critical)
-                "add_user",
-                "toggle_user",
-                "update_user_role",
-                "update_role",
-                # Admin UI - Tenant management (security critical)
-                "create_tenant",
-                "deactivate_tenant",
-                "reactivate_tenant",
-                "update",  # General tenant settings update
-                "update_general_settings",
-                "add_authorized_domain",
-                "remove_authorized_domain",
-                "add_authorized_email",
-                "remove_authorized_email",
-                # Admin UI - Adapter configuration (infrastructure critical)
-                "update_adapter",
-                "setup_adapter",
-                "configure_gam",
-                "detect_gam_network",
-                # Admin UI - Principal management (access control)
-                "create_principal",
-                "update_mappings",
-                "update_principal_mappings",
-                "register_webhook",
-                "delete_webhook",
-                # Admin UI - Policy changes (business critical)
-                "update_policy",
-                "update_business_rules",
-                "review_policy_task",
-            ]
-            if operation in sensitive_ops:
-                should_notify = True
-
-            # Check for high-value operations
-            if details and isinstance(details, dict):
-                if "budget" in details and isinstance(details["budget"], (int, float)) and details["budget"] > 10000:
-                    should_notify = True
-                if (
-                    "total_budget" in details
-                    and isinstance(details["total_budget"], (int, float))
-                    and details["total_budget"] > 10000
-                ):
-                    should_notify = True
-
-            if should_notify:
-                from src.core.utils.tenant_utils import serialize_tenant_to_dict
-                from src.services.slack_notifier import get_slack_notifier
-
-                # Get tenant config for Slack notifier
-                tenant_config = None
-                if tenant_id:
-                    try:
-                        with get_db_session() as db_session:
-                            from src.core.database.models import Tenant
-
-                            stmt = select(Tenant).filter_by(tenant_id=tenant_id)
-                            tenant = db_session.scalars(stmt).first()
-                            if tenant:
-                                tenant_config = serialize_tenant_to_dict(tenant)
-                    except:
-                        pass
-
-                slack_notifier = get_slack_notifier(tenant_config=tenant_config)
-                slack_notifier.notify_audit_log(
-                    operation=operation,
-                    principal_name=principal_name,
-                    success=success,
-                    adapter_id=adapter_id,
-                    tenant_name=tenant_name,
-                    error_message=error,
-                    details=details,
-                    security_alert=security_alert,
-                )
-        except Exception:
-            # Don't let Slack failures affect core functionality
-            pass
+        if self._should_notify(operation, success, details):
+            record.after_write = lambda: self._notify_slack(
+                tenant_id=tenant_id,
+                operation=operation,
+                principal_name=principal_name,
+                success=success,
+                adapter_id=adapter_id,
+                error_message=error,
+                details=details,
+                security_alert=False,
+            )
+
+        get_audit_log_writer(LOG_DIR, audit_logger).submit(record)
 
     def log_security_violation(
         self, operation: str, principal_id: str, resource_id: str, reason: str, tenant_id: str | None = None
@@ -245,72 +220,52 @@ class AuditLogger:
         """Log a security violation attempt."""
         # Use provided tenant_id or fall back to instance tenant_id
         tenant_id = tenant_id or self.tenant_id
+        now = datetime.now(UTC)
 
         message = (
             f"SECURITY VIOLATION: {self.adapter_name}.{operation} "
             f"Principal '{principal_id}' attempted to access resource '{resource_id}' - {reason}"
         )
-        audit_logger.error(message)
-
-        # Write to database
-        try:
-            with get_db_session() as db_session:
-                audit_log = AuditLog(
-                    tenant_id=tenant_id,
-                    timestamp=datetime.now(UTC),
-                    operation=f"SECURITY_VIOLATION:{self.adapter_name}.{operation}",
-                    principal_name=None,  # principal_name not available
-                    principal_id=principal_id,
-                    adapter_id=None,  # adapter_id not applicable
-                    success=False,  # Security violations are failures
-                    error_message=f"Attempted to access resource '{resource_id}' - {reason}",
-                    details=json.dumps({"resource_id": resource_id, "reason": reason}),
-                )
-                db_session.add(audit_log)
-                db_session.commit()
-        except Exception as e:
-            audit_logger.error(f"Failed to write security violation to database: {e}")
-
-        # Write to security log (backup)
-        self._write_security_log(
-            operation=operation, principal_id=principal_id, resource_id=resource_id, reason=reason, tenant_id=tenant_id
-        )
 
-        # Send security alert to Slack
-        try:
-            from src.core.utils.tenant_utils import serialize_tenant_to_dict
-            from src.services.slack_notifier import get_slack_notifier
-
-            # Get tenant name and config
-            tenant_name = None
-            tenant_config = None
-            if tenant_id:
-                try:
-                    with get_db_session() as db_session:
-                        from src.core.database.models import Tenant
-
-                        stmt = select(Tenant).filter_by(tenant_id=tenant_id)
-                        tenant = db_session.scalars(stmt).first()
-                        if tenant:
-                            tenant_name = tenant.name
-                            tenant_config = serialize_tenant_to_dict(tenant)
-                except:
-                    pass
-
-            slack_notifier = get_slack_notifier(tenant_config=tenant_config)
-            slack_notifier.notify_audit_log(
+        record = AuditRecord(
+            row={
+                "tenant_id": tenant_id,
+                "timestamp": now,
+                "operation": f"SECURITY_VIOLATION:{self.adapter_name}.{operation}",
+                "principal_name": None,  # principal_name not available
+                "principal_id": principal_id,
+                "adapter_id": None,  # adapter_id not applicable
+                "success": False,  # Security violations are failures
+                "error_message": f"Attempted to access resource '{resource_id}' - {reason}",
+                "details": {"resource_id": resource_id, "reason": reason},
+            },
+            # Security-specific log entry (backup)
+            backup_file="security.jsonl",
+            backup_entry={
+                "timestamp": now.isoformat(),
+                "adapter": self.adapter_name,
+                "type": "security_violation",
+                "operation": operation,
+                "principal_id": principal_id,
+                "resource_id": resource_id,
+                "reason": reason,
+                "tenant_id": tenant_id,
+            },
+            log_lines=[(logging.ERROR, message)],
+            # Send security alert to Slack
+            after_write=lambda: self._notify_slack(
+                tenant_id=tenant_id,
                 operation=operation,
                 principal_name=f"UNAUTHORIZED: {principal_id}",
                 success=False,
                 adapter_id=self.adapter_name,
-                tenant_name=tenant_name,
                 error_message=f"Security violation: {reason}",
                 details={"resource_id": resource_id, "violation_type": "unauthorized_access"},
                 security_alert=True,
-            )
-        except Exception:
-            # Don't let Slack failures affect core functionality
-            pass
+            ),
+        )
+
+        get_audit_log_writer(LOG_DIR, audit_logger).submit(record)
 
     def log_success(self, message: str):
         """Log a success message with checkmark."""
@@ -324,30 +279,32 @@ class AuditLogger:
         """Log an informational message."""
         audit_logger.info(message)
 
-    def _write_structured_log(self, **kwargs):
-        """Write structured JSON log for machine processing (backup)."""
-        log_entry = {"timestamp": datetime.now(UTC).isoformat(), "adapter": self.adapter_name, **kwargs}
-
+    @staticmethod
+    def _should_notify(operation: str, success: bool, details: dict[str, Any] | None) -> bool:
+        """Decide whether an operation warrants a Slack audit notification."""
+        # Always notify on failures and sensitive operations
+        if not success or operation in SENSITIVE_OPERATIONS:
+            return True
+
+        # Check for high-value operations
+        if details and isinstance(details, dict):
+            for key in ("budget", "total_budget"):
+                value = details.get(key)
+                if isinstance(value, (int, float)) and value > 10000:
+                    return True
+        return False
+
+    def _notify_slack(self, tenant_id: str | None, **kwargs: Any) -> None:
+        """Send an audit notification to the tenant's Slack audit channel."""
         try:
-            with open(LOG_DIR / "structured.jsonl", "a") as f:
-                f.write(json.dumps(log_entry) + "\n")
-        except Exception as e:
-            audit_logger.error(f"Failed to write structured log: {e}")
-
-    def _write_security_log(self, **kwargs):
-        """Write security-specific log entry (backup)."""
-        log_entry = {
-            "timestamp": datetime.now(UTC).isoformat(),
-            "adapter": self.adapter_name,
-            "type": "security_violation",
-            **kwargs,
-        }
+            from src.services.slack_notifier import get_slack_notifier
 
-        try:
-            with open(LOG_DIR / "security.jsonl", "a") as f:
-                f.write(json.dumps(log_entry) + "\n")
-        except Exception as e:
-            audit_logger.error(f"Failed to write security log: {e}")
+            tenant_name, tenant_config = _load_tenant_for_notification(tenant_id)
+            slack_notifier = get_slack_notifier(tenant_config=tenant_config)
+            slack_notifier.notify_audit_log(tenant_name=tenant_name, **kwargs)
+        except Exception:
+            # Don't let Slack failures affect core functionality
+            pass
 
 
 # Convenience function for getting logger
@@ -0,0 +1,344 @@
+"""Background writer for audit log records.
+
+AuditLogger used to open a DB session, commit one AuditLog row, append to
+structured.jsonl and emit several logger lines inline with every tool call.
+This module moves all of that off the request path:
+
+- Records are placed on a bounded in-memory queue (non-blocking).
+- A single daemon thread drains the queue and flushes in batches, either when
+  ``batch_size`` records are waiting or ``flush_interval`` seconds have passed.
+- Each batch is one multi-row INSERT into audit_logs and one append to the
+  JSONL backup files, which are kept open for the life of the writer.
+- When the queue is full, records are dropped and counted rather than blocking
+  the caller (audit_log_records_total{result="dropped"}).
+- Pending records are drained on shutdown (atexit and app lifespan).
+- After each batch the Admin UI activity stream is signalled for the affected
+  tenants (see src/services/activity_hub.py).
+- Per-record side effects (Slack notifications) run on a small separate thread
+  pool, so a slow webhook never holds up database batches.
+
+Environment variables:
+    ADCP_AUDIT_LOG_ASYNC: "true"/"false". Defaults to true, except when
+        ADCP_TESTING=true where writes are synchronous so tests can assert
+        on rows immediately.
+    ADCP_AUDIT_LOG_QUEUE_SIZE: Maximum queued records (default 10000)
+    ADCP_AUDIT_LOG_BATCH_SIZE: Maximum rows per INSERT (default 200)
+    ADCP_AUDIT_LOG_FLUSH_INTERVAL: Seconds between flushes (default 1.0)
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any
+
+from sqlalchemy import insert
+
+from src.core.database.database_session import get_db_session
+from src.core.database.models import AuditLog
+from src.core.metrics import (
+    audit_log_batch_size,
+    audit_log_flush_duration,
+    audit_log_queue_depth,
+    audit_log_records_total,
+)
+from src.services.activity_hub import publish_activity
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AuditRecord:
+    """One audit event, pre-rendered for every sink."""
+
+    # AuditLog column values
+    row: dict[str, Any]
+    # Backup file name (relative to the log directory) and JSON payload
+    backup_file: str
+    backup_entry: dict[str, Any]
+    # (level, message) pairs for the adcp.audit logger
+    log_lines: list[tuple[int, str]] = field(default_factory=list)
+    # Optional side effect (e.g. Slack notification) run off the writer thread after the batch is persisted
+    after_write: Callable[[], None] | None = None
+
+
+def _is_async_enabled() -> bool:
+    value = os.environ.get("ADCP_AUDIT_LOG_ASYNC")
+    if value is None:
+        return os.environ.get("ADCP_TESTING") != "true"
+    return value.lower() == "true"
+
+
+class AuditLogWriter:
+    """Batches audit records and writes them from a background thread."""
+
+    def __init__(
+        self,
+        log_dir: Path,
+        audit_logger: logging.Logger,
+        max_queue_size: int = 10000,
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+        notify_workers: int = 2,
+    ):
+        self.log_dir = log_dir
+        self.audit_logger = audit_logger
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.notify_workers = notify_workers
+        self._queue: queue.Queue[AuditRecord | None] = queue.Queue(maxsize=max_queue_size)
+        self._files: dict[str, IO[str]] = {}
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self._notify_executor: ThreadPoolExecutor | None = None
+        self._notify_pid: int | None = None
+        self._start_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._stopping = False
+
+    def submit(self, record: AuditRecord) -> bool:
+        """Queue a record for writing. Never blocks.
+
+        Returns:
+            False if the record was dropped because the queue is full
+        """
+        if self._stopping or not _is_async_enabled():
+            self._write_batch([record])
+            return True
+
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            audit_log_records_total.labels(result="dropped").inc()
+            logger.warning(f"Audit log queue full ({self._queue.maxsize}), dropping {record.row.get('operation')}")
+            return False
+        audit_log_queue_depth.set(self._queue.qsize())
+        return True
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Block until every queued record has been written.
+
+        Returns:
+            True if the queue drained within ``timeout``
+        """
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline or not self._is_running():
+                return False
+            time.sleep(0.01)
+        return True
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the worker after draining pending records."""
+        self._stopping = True
+        if self._is_running():
+            self._queue.put(None)
+            assert self._thread is not None
+            self._thread.join(timeout)
+        # Anything left (worker died or timed out) is written inline
+        self._write_batch(self._drain_nowait())
+        self._close_files()
+        if self._notify_executor is not None:
+            # Queued notifications still go out; the interpreter joins the pool's threads at exit
+            self._notify_executor.shutdown(wait=False)
+
+    def _is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive() and self._pid == os.getpid()
+
+    def _ensure_started(self) -> None:
+        if self._is_running():
+            return
+        with self._start_lock:
+            if self._is_running():
+                return
+            # A forked child inherits the queue object but not the worker thread
+            self._pid = os.getpid()
+            self._files = {}
+            self._thread = threading.Thread(target=self._run, name="audit-log-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch: list[AuditRecord] = []
+            stop = False
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.task_done()
+                    stop = True
+                    break
+                batch.append(item)
+
+            if batch:
+                try:
+                    self._write_batch(batch)
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+                audit_log_queue_depth.set(self._queue.qsize())
+
+            if stop:
+                return
+
+    def _drain_nowait(self) -> list[AuditRecord]:
+        records: list[AuditRecord] = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return records
+            self._queue.task_done()
+            if item is not None:
+                records.append(item)
+
+    def _write_batch(self, records: list[AuditRecord]) -> None:
+        if not records:
+            return
+
+        start = time.perf_counter()
+        with self._write_lock:
+            for record in records:
+                for level, message in record.log_lines:
+                    self.audit_logger.log(level, message)
+
+            self._insert_rows(records)
+            self._append_backup(records)
+
+        audit_log_batch_size.observe(len(records))
+        audit_log_flush_duration.observe(time.perf_counter() - start)
+
+        # Wake activity stream producers watching these tenants
+        publish_activity(record.row["tenant_id"] for record in records if record.row.get("tenant_id"))
+
+        hooks = [record.after_write for record in records if record.after_write]
+        if hooks:
+            executor = self._get_notify_executor()
+            for hook in hooks:
+                executor.submit(self._run_after_write, hook)
+
+    def _get_notify_executor(self) -> ThreadPoolExecutor:
+        with self._start_lock:
+            # A forked child inherits the executor but not its threads
+            if self._notify_executor is None or self._notify_pid != os.getpid():
+                self._notify_executor = ThreadPoolExecutor(
+                    max_workers=self.notify_workers, thread_name_prefix="audit-after-write"
+                )
+                self._notify_pid = os.getpid()
+            return self._notify_executor
+
+    @staticmethod
+    def _run_after_write(hook: Callable[[], None]) -> None:
+        try:
+            hook()
+        except Exception as e:
+            logger.debug(f"Audit after_write hook failed: {e}")
+
+    def _insert_rows(self, records: list[AuditRecord]) -> None:
+        rows = []
+        for record in records:
+            if not record.row.get("tenant_id"):
+                self.audit_logger.error(
+                    f"Failed to write audit log to database: missing tenant_id for {record.row.get('operation')}"
+                )
+                audit_log_records_total.labels(result="failed").inc()
+                continue
+            rows.append(record.row)
+        if not rows:
+            return
+
+        try:
+            with get_db_session() as db_session:
+                db_session.execute(insert(AuditLog), rows)
+                db_session.commit()
+            audit_log_records_total.labels(result="written").inc(len(rows))
+            return
+        except Exception as e:
+            if len(rows) == 1:
+                self.audit_logger.error(f"Failed to write audit log to database: {e}")
+                audit_log_records_total.labels(result="failed").inc()
+                return
+            logger.warning(f"Batched audit insert of {len(rows)} rows failed, retrying row by row: {e}")
+
+        # One bad row (e.g. deleted tenant) must not lose the rest of the batch
+        for row in rows:
+            try:
+                with get_db_session() as db_session:
+                    db_session.execute(insert(AuditLog), [row])
+                    db_session.commit()
+                audit_log_records_total.labels(result="written").inc()
+            except Exception as e:
+                self.audit_logger.error(f"Failed to write audit log to database: {e}")
+                audit_log_records_total.labels(result="failed").inc()
+
+    def _append_backup(self, records: list[AuditRecord]) -> None:
+        lines_by_file: dict[str, list[str]] = {}
+        for record in records:
+            lines_by_file.setdefault(record.backup_file, []).append(json.dumps(record.backup_entry, default=str))
+
+        for filename, lines in lines_by_file.items():
+            try:
+                handle = self._files.get(filename)
+                if handle is None or handle.closed:
+                    handle = self._files[filename] = open(self.log_dir / filename, "a")
+                handle.write("\n".join(lines) + "\n")
+                handle.flush()
+            except Exception as e:
+                self.audit_logger.error(f"Failed to write {filename}: {e}")
+                self._files.pop(filename, None)
+
+    def _close_files(self) -> None:
+        for handle in self._files.values():
+            try:
+                handle.close()
+            except Exception:
+                pass
+        self._files = {}
+
+
+_writer: AuditLogWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def get_audit_log_writer(log_dir: Path, audit_logger: logging.Logger) -> AuditLogWriter:
+    """Get the process-wide audit log writer, creating it on first use."""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = AuditLogWriter(
+                    log_dir=log_dir,
+                    audit_logger=audit_logger,
+                    max_queue_size=int(os.environ.get("ADCP_AUDIT_LOG_QUEUE_SIZE", "10000")),
+                    batch_size=int(os.environ.get("ADCP_AUDIT_LOG_BATCH_SIZE", "200")),
+                    flush_interval=float(os.environ.get("ADCP_AUDIT_LOG_FLUSH_INTERVAL", "1.0")),
+                )
+                atexit.register(_writer.shutdown)
+    return _writer
+
+
+def flush_audit_logs(timeout: float = 10.0) -> bool:
+    """Wait for queued audit records to be written (no-op if nothing was logged)."""
+    if _writer is None:
+        return True
+    return _writer.flush(timeout)
+
+
+def shutdown_audit_log_writer(timeout: float = 5.0) -> None:
+    """Drain and stop the audit log writer (called at application shutdown)."""
+    if _writer is not None:
+        _writer.shutdown(timeout)
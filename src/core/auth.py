@@ -4,7 +4,11 @@ This module provides authentication and principal resolution functions used
 by both MCP and A2A protocols.
 """
 
+import json
 import logging
+import os
+import random
+import time
 from typing import TYPE_CHECKING, Any, Union
 
 from fastmcp.server.context import Context
@@ -12,9 +16,9 @@ from fastmcp.server.context import Context
 if TYPE_CHECKING:
     from src.core.tool_context import ToolContext
 from fastmcp.server.dependencies import get_http_headers
-from rich.console import Console
 from sqlalchemy import select
 
+from src.core.auth_cache import cache_principal, cache_tenant, get_cached_principal, get_cached_tenant
 from src.core.config_loader import (
     get_current_tenant,
     get_tenant_by_id,
@@ -26,9 +30,18 @@ from src.core.database.database_session import get_db_session
 from src.core.database.models import Principal as ModelPrincipal
 from src.core.database.models import Tenant
 from src.core.schemas import Principal
+from src.core.utils.ttl_cache import MISSING
 
 logger = logging.getLogger(__name__)
-console = Console()
+tenant_detection_logger = logging.getLogger("adcp.tenant_detection")
+
+# Tenant detection diagnostics (off by default - see _tenant_detection_diagnostics_enabled)
+TENANT_DETECTION_DEBUG_HEADER = "x-adcp-debug-tenant-detection"
+TENANT_DETECTION_DEBUG_HEADER_ENABLED = os.environ.get("ADCP_TENANT_DETECTION_DEBUG_HEADER", "").lower() == "true"
+TENANT_DETECTION_DIAGNOSTICS_TENANTS = frozenset(
+    t.strip() for t in os.environ.get("ADCP_TENANT_DETECTION_DIAGNOSTICS_TENANTS", "").split(",") if t.strip()
+)
+TENANT_DETECTION_DIAGNOSTICS_SAMPLE_RATE = float(os.environ.get("ADCP_TENANT_DETECTION_DIAGNOSTICS_SAMPLE_RATE", "0"))
 
 
 def get_principal_from_token(token: str, tenant_id: str | None = None) -> str | None:
@@ -36,10 +49,15 @@ def get_principal_from_token(token: str, tenant_id: str | None = None) -> str |
 
     If tenant_id is provided, only looks in that specific tenant.
     If not provided, searches globally by token and sets the tenant context.
+
+    Successful resolutions are cached in-process (see src.core.auth_cache).
     """
-    console.print(
-        f"[blue]Looking up principal: tenant_id={tenant_id}, token={'***' + token[-6:] if token else 'None'}[/blue]"
-    )
+    cached = get_cached_principal(token, tenant_id)
+    if cached is not None:
+        cached_principal_id, cached_tenant = cached
+        if not tenant_id and cached_tenant:
+            set_current_tenant(cached_tenant)
+        return cached_principal_id
 
     # Use standardized session management
     with get_db_session() as session:
@@ -47,65 +65,111 @@ def get_principal_from_token(token: str, tenant_id: str | None = None) -> str |
         with session.begin():
             if tenant_id:
                 # If tenant_id specified, ONLY look in that tenant
-                console.print(f"[blue]Searching for principal in tenant '{tenant_id}'[/blue]")
                 stmt = select(ModelPrincipal).filter_by(access_token=token, tenant_id=tenant_id)
                 principal = session.scalars(stmt).first()
 
                 if not principal:
-                    console.print(f"[yellow]No principal found in tenant '{tenant_id}', checking admin token[/yellow]")
                     # Also check if it's the admin token for this specific tenant
                     tenant_stmt = select(Tenant).filter_by(tenant_id=tenant_id, is_active=True)
                     tenant = session.scalars(tenant_stmt).first()
 
                     if tenant and tenant.admin_token == token:
-                        console.print(f"[green]Token matches admin token for tenant '{tenant_id}'[/green]")
                         # Return a special admin principal ID
-                        return f"{tenant_id}_admin"
+                        admin_principal_id = f"{tenant_id}_admin"
+                        cache_principal(token, tenant_id, admin_principal_id, tenant_id)
+                        return admin_principal_id
 
-                    console.print(f"[red]Token not found in tenant '{tenant_id}'[/red]")
                     return None
-                else:
-                    console.print(f"[green]Found principal '{principal.principal_id}' in tenant '{tenant_id}'[/green]")
             else:
                 # No tenant specified - search globally by token
-                console.print("[blue]No tenant specified - searching globally by token[/blue]")
                 stmt = select(ModelPrincipal).filter_by(access_token=token)
                 principal = session.scalars(stmt).first()
 
                 if not principal:
-                    console.print("[red]No principal found with this token globally[/red]")
                     return None
 
-                console.print(
-                    f"[green]Found principal '{principal.principal_id}' in tenant '{principal.tenant_id}'[/green]"
-                )
-
                 # CRITICAL: Validate the tenant exists and is active before proceeding
                 tenant_check_stmt = select(Tenant).filter_by(tenant_id=principal.tenant_id, is_active=True)
                 tenant_check = session.scalars(tenant_check_stmt).first()
                 if not tenant_check:
-                    console.print(f"[red]Tenant '{principal.tenant_id}' is inactive or deleted[/red]")
                     # Tenant is disabled or deleted - fail securely
+                    logger.warning(f"Token matched principal in inactive or deleted tenant '{principal.tenant_id}'")
                     return None
 
             # Only set tenant context if we didn't have one specified (global lookup case)
             # If tenant_id was provided, context was already set by the caller
-            if not tenant_id:
-                # Get the tenant for this principal and set it as current context
-                tenant_ctx_stmt = select(Tenant).filter_by(tenant_id=principal.tenant_id, is_active=True)
-                tenant = session.scalars(tenant_ctx_stmt).first()
-                if tenant:
-                    from src.core.utils.tenant_utils import serialize_tenant_to_dict
-
-                    tenant_dict = serialize_tenant_to_dict(tenant)
-                    set_current_tenant(tenant_dict)
-                    console.print(
-                        f"[bold green]Set tenant context to '{tenant.tenant_id}' (from principal)[/bold green]"
-                    )
+            tenant_dict = None
+            if not tenant_id and tenant_check is not None:
+                # Reuse the active-tenant row validated above as the current context
+                from src.core.utils.tenant_utils import serialize_tenant_to_dict
 
+                tenant_dict = serialize_tenant_to_dict(tenant_check)
+                set_current_tenant(tenant_dict)
+
+            cache_principal(token, tenant_id, principal.principal_id, principal.tenant_id, tenant_dict)
             return principal.principal_id
 
 
+def _tenant_detection_diagnostics_enabled(headers: dict, tenant_id: str | None, principal_id: str | None) -> bool:
+    """Decide whether to emit a tenant detection record for this request.
+
+    Diagnostics are off by default. They are enabled per tenant via
+    ADCP_TENANT_DETECTION_DIAGNOSTICS_TENANTS, or for a random sample of
+    requests via ADCP_TENANT_DETECTION_DIAGNOSTICS_SAMPLE_RATE (0.0-1.0).
+
+    A single request can opt in by sending ``x-adcp-debug-tenant-detection: true``,
+    but the header is only honored when ADCP_TENANT_DETECTION_DEBUG_HEADER=true
+    or the caller authenticated with the tenant's admin token. Otherwise
+    any client could make the server log (and time) its requests.
+    """
+    debug_header = _get_header_case_insensitive(headers, TENANT_DETECTION_DEBUG_HEADER)
+    if debug_header and debug_header.lower() in ("1", "true", "yes"):
+        is_tenant_admin = bool(tenant_id and principal_id == f"{tenant_id}_admin")
+        if TENANT_DETECTION_DEBUG_HEADER_ENABLED or is_tenant_admin:
+            return True
+    if tenant_id and tenant_id in TENANT_DETECTION_DIAGNOSTICS_TENANTS:
+        return True
+    return TENANT_DETECTION_DIAGNOSTICS_SAMPLE_RATE > 0 and random.random() < TENANT_DETECTION_DIAGNOSTICS_SAMPLE_RATE
+
+
+def _log_tenant_detection(
+    headers: dict,
+    tenant_id: str | None,
+    detection_method: str | None,
+    principal_id: str | None,
+    outcome: str,
+    started_at: float,
+) -> None:
+    """Emit one structured tenant detection record if diagnostics are enabled."""
+    if not _tenant_detection_diagnostics_enabled(headers, tenant_id, principal_id):
+        return
+
+    record = {
+        "type": "tenant_detection",
+        "outcome": outcome,
+        "tenant_id": tenant_id,
+        "detection_method": detection_method,
+        "principal_id": principal_id,
+        "host": _get_header_case_insensitive(headers, "host"),
+        "apx_incoming_host": _get_header_case_insensitive(headers, "apx-incoming-host"),
+        "x_adcp_tenant": _get_header_case_insensitive(headers, "x-adcp-tenant"),
+        "auth_token_present": _get_header_case_insensitive(headers, "x-adcp-auth") is not None,
+        "header_count": len(headers),
+        "duration_ms": round((time.perf_counter() - started_at) * 1000, 3),
+    }
+    tenant_detection_logger.info(json.dumps(record))
+
+
+def _lookup_tenant(kind: str, value: str, loader) -> dict[str, Any] | None:
+    """Resolve a tenant via ``loader(value)``, consulting the auth cache first."""
+    cached = get_cached_tenant(kind, value)
+    if cached is not MISSING:
+        return cached
+    tenant = loader(value)
+    cache_tenant(kind, value, tenant)
+    return tenant
+
+
 def _get_header_case_insensitive(headers: dict, header_name: str) -> str | None:
     """Get a header value with case-insensitive lookup.
 
@@ -212,23 +276,7 @@ def get_principal_from_context(
     if not headers:
         return (None, None)
 
-    # Log all relevant headers for debugging
-    host_header = _get_header_case_insensitive(headers, "host")
-    apx_host_header = _get_header_case_insensitive(headers, "apx-incoming-host")
-    tenant_header = _get_header_case_insensitive(headers, "x-adcp-tenant")
-
-    logger.info("=" * 80)
-    logger.info("TENANT DETECTION - Auth Headers Debug:")
-    logger.info(f"  Host: {host_header}")
-    logger.info(f"  Apx-Incoming-Host: {apx_host_header}")
-    logger.info(f"  x-adcp-tenant: {tenant_header}")
-    logger.info(f"  Total headers available: {len(headers)}")
-    logger.info("=" * 80)
-
-    console.print("[blue]Auth Headers Debug:[/blue]")
-    console.print(f"  Host: {host_header}")
-    console.print(f"  Apx-Incoming-Host: {apx_host_header}")
-    console.print(f"  x-adcp-tenant: {tenant_header}")
+    started_at = time.perf_counter()
 
     # ALWAYS resolve tenant from headers first (even without auth for public discovery endpoints)
     requested_tenant_id = None
@@ -236,116 +284,74 @@ def get_principal_from_context(
     detection_method = None
 
     # 1. Check host header - try virtual host FIRST, then fall back to subdomain
-    if not requested_tenant_id:
-        host = _get_header_case_insensitive(headers, "host") or ""
-        apx_host = _get_header_case_insensitive(headers, "apx-incoming-host")
-
-        console.print(f"[blue]Checking Host header: {host}[/blue]")
-
-        # CRITICAL: Try virtual host lookup FIRST before extracting subdomain
-        # This prevents issues where a subdomain happens to match a virtual host
-        # (e.g., "test-agent" subdomain vs "test-agent.adcontextprotocol.org" virtual host)
-        tenant_context = get_tenant_by_virtual_host(host)
-        if tenant_context:
-            requested_tenant_id = tenant_context["tenant_id"]
-            detection_method = "host header (virtual host)"
-            set_current_tenant(tenant_context)
-            console.print(
-                f"[green]Tenant detected from Host header virtual host: {host} → tenant_id: {requested_tenant_id}[/green]"
-            )
-        else:
-            # Fallback to subdomain extraction if virtual host lookup failed
-            subdomain = host.split(".")[0] if "." in host else None
-            console.print(f"[blue]No virtual host match, extracting subdomain from Host header: {subdomain}[/blue]")
-            if subdomain and subdomain not in ["localhost", "adcp-sales-agent", "www", "admin"]:
-                # Look up tenant by subdomain to get actual tenant_id
-                console.print(f"[blue]Looking up tenant by subdomain: {subdomain}[/blue]")
-                tenant_context = get_tenant_by_subdomain(subdomain)
-                if tenant_context:
-                    requested_tenant_id = tenant_context["tenant_id"]
-                    detection_method = "subdomain"
-                    set_current_tenant(tenant_context)
-                    console.print(
-                        f"[green]Tenant detected from subdomain: {subdomain} → tenant_id: {requested_tenant_id}[/green]"
-                    )
-                else:
-                    console.print(f"[yellow]No tenant found for subdomain: {subdomain}[/yellow]")
+    host = _get_header_case_insensitive(headers, "host") or ""
+
+    # CRITICAL: Try virtual host lookup FIRST before extracting subdomain
+    # This prevents issues where a subdomain happens to match a virtual host
+    # (e.g., "test-agent" subdomain vs "test-agent.adcontextprotocol.org" virtual host)
+    tenant_context = _lookup_tenant("virtual_host", host, get_tenant_by_virtual_host)
+    if tenant_context:
+        requested_tenant_id = tenant_context["tenant_id"]
+        detection_method = "host header (virtual host)"
+        set_current_tenant(tenant_context)
+    else:
+        # Fallback to subdomain extraction if virtual host lookup failed
+        subdomain = host.split(".")[0] if "." in host else None
+        if subdomain and subdomain not in ["localhost", "adcp-sales-agent", "www", "admin"]:
+            # Look up tenant by subdomain to get actual tenant_id
+            tenant_context = _lookup_tenant("subdomain", subdomain, get_tenant_by_subdomain)
+            if tenant_context:
+                requested_tenant_id = tenant_context["tenant_id"]
+                detection_method = "subdomain"
+                set_current_tenant(tenant_context)
 
     # 2. Check x-adcp-tenant header (set by nginx for path-based routing)
     if not requested_tenant_id:
         tenant_hint = _get_header_case_insensitive(headers, "x-adcp-tenant")
         if tenant_hint:
-            console.print(f"[blue]Looking up tenant from x-adcp-tenant header: {tenant_hint}[/blue]")
             # Try to look up by subdomain first (most common case)
-            tenant_context = get_tenant_by_subdomain(tenant_hint)
+            tenant_context = _lookup_tenant("subdomain", tenant_hint, get_tenant_by_subdomain)
             if tenant_context:
                 requested_tenant_id = tenant_context["tenant_id"]
                 detection_method = "x-adcp-tenant header (subdomain lookup)"
                 set_current_tenant(tenant_context)
-                console.print(
-                    f"[green]Tenant detected from x-adcp-tenant: {tenant_hint} → tenant_id: {requested_tenant_id}[/green]"
-                )
             else:
                 # Fallback: assume it's already a tenant_id
                 requested_tenant_id = tenant_hint
                 detection_method = "x-adcp-tenant header (direct)"
                 # Need to look up and set tenant context
-                tenant_context = get_tenant_by_id(tenant_hint)
+                tenant_context = _lookup_tenant("tenant_id", tenant_hint, get_tenant_by_id)
                 if tenant_context:
                     set_current_tenant(tenant_context)
-                    console.print(f"[green]Tenant context set for tenant_id: {requested_tenant_id}[/green]")
-                else:
-                    console.print(f"[yellow]Using x-adcp-tenant as tenant_id directly: {requested_tenant_id}[/yellow]")
 
     # 3. Check Apx-Incoming-Host header (for Approximated.app virtual hosts)
     if not requested_tenant_id:
         apx_host = _get_header_case_insensitive(headers, "apx-incoming-host")
-        console.print(f"[blue]Checking Apx-Incoming-Host header: {apx_host}[/blue]")
         if apx_host:
-            console.print(f"[blue]Looking up tenant by virtual host (via Apx-Incoming-Host): {apx_host}[/blue]")
-            tenant_context = get_tenant_by_virtual_host(apx_host)
-            console.print(f"[blue]get_tenant_by_virtual_host() returned: {tenant_context}[/blue]")
+            tenant_context = _lookup_tenant("virtual_host", apx_host, get_tenant_by_virtual_host)
             if tenant_context:
                 requested_tenant_id = tenant_context["tenant_id"]
                 detection_method = "apx-incoming-host"
                 # Set tenant context immediately for virtual host routing
                 set_current_tenant(tenant_context)
-                console.print(f"[green]✅ Tenant detected from Apx-Incoming-Host: {requested_tenant_id}[/green]")
-            else:
-                console.print(f"[yellow]⚠️ No tenant found for virtual host: {apx_host}[/yellow]")
-        else:
-            console.print("[yellow]Apx-Incoming-Host header not present[/yellow]")
 
     # 4. Fallback for localhost in development: use "default" tenant
     if not requested_tenant_id:
-        host = _get_header_case_insensitive(headers, "host") or ""
         # Extract hostname without port (handles localhost:8091, 127.0.0.1:8001, etc)
         hostname = host.split(":")[0]
         if hostname in ["localhost", "127.0.0.1", "localhost.localdomain"]:
-            console.print("[blue]Localhost detected - checking for 'default' tenant[/blue]")
-            tenant_context = get_tenant_by_subdomain("default")
+            tenant_context = _lookup_tenant("subdomain", "default", get_tenant_by_subdomain)
             if tenant_context:
                 requested_tenant_id = tenant_context["tenant_id"]
                 detection_method = "localhost fallback (default tenant)"
                 set_current_tenant(tenant_context)
-                console.print(
-                    f"[green]Localhost fallback: Using 'default' tenant → tenant_id: {requested_tenant_id}[/green]"
-                )
-            else:
-                console.print("[yellow]No 'default' tenant found for localhost fallback[/yellow]")
-
-    if not requested_tenant_id:
-        console.print("[yellow]No tenant detected from headers[/yellow]")
-    else:
-        console.print(f"[bold green]Final tenant_id: {requested_tenant_id} (via {detection_method})[/bold green]")
 
     # NOW check for auth token (after tenant resolution)
     auth_token = _get_header_case_insensitive(headers, "x-adcp-auth")
-    console.print(f"  x-adcp-auth: {'Present' if auth_token else 'Missing'}")
 
     if not auth_token:
-        console.print("[yellow]No x-adcp-auth token found - OK for discovery endpoints[/yellow]")
         # Return tenant context without auth for public discovery endpoints
+        _log_tenant_detection(headers, requested_tenant_id, detection_method, None, "no_auth", started_at)
         return (None, tenant_context)
 
     # Validate token and get principal
@@ -358,7 +364,6 @@ def get_principal_from_context(
         # 2. Find which tenant it belongs to
         # 3. Set that tenant's context
         # 4. Return principal_id only if token is valid for that tenant
-        console.print("[yellow]Using global token lookup (finds tenant from token)[/yellow]")
         detection_method = "global token lookup"
 
     principal_id = get_principal_from_token(auth_token, requested_tenant_id)
@@ -366,6 +371,7 @@ def get_principal_from_context(
     # If token was provided but invalid, raise an error (unless require_valid_token=False for discovery)
     # This distinguishes between "no auth" (OK) and "bad auth" (error or warning)
     if principal_id is None:
+        _log_tenant_detection(headers, requested_tenant_id, detection_method, None, "invalid_token", started_at)
         if require_valid_token:
             from fastmcp.exceptions import ToolError
 
@@ -376,9 +382,6 @@ def get_principal_from_context(
             )
         else:
             # For discovery endpoints, treat invalid token like missing token
-            console.print(
-                f"[yellow]Invalid token for tenant '{requested_tenant_id or 'any'}' - continuing without auth (discovery endpoint)[/yellow]"
-            )
             return (None, tenant_context)
 
     # If tenant_context wasn't set by header detection, get it from current tenant
@@ -386,6 +389,10 @@ def get_principal_from_context(
     if not tenant_context:
         tenant_context = get_current_tenant()
 
+    _log_tenant_detection(
+        headers, tenant_context.get("tenant_id"), detection_method, principal_id, "authenticated", started_at
+    )
+
     # Return both principal_id and tenant_context explicitly
     # Caller MUST call set_current_tenant(tenant_context) in their async context
     return (principal_id, tenant_context)
@@ -0,0 +1,124 @@
+"""In-process cache for token → principal and host → tenant resolution.
+
+Every MCP/A2A request resolves its tenant from request headers and its
+principal from the ``x-adcp-auth`` token. Without caching that is up to three
+SELECTs plus a tenant serialization per call. This module keeps the results
+in bounded TTL caches so repeat callers skip the database.
+
+Tokens are never stored in clear text - keys use a SHA-256 digest.
+
+Staleness is bounded by ``ADCP_AUTH_CACHE_TTL`` (seconds, default 60; 0 disables
+the cache). Admin UI and tenant management API writes call the
+``invalidate_*`` hooks below so changes in the same process apply immediately;
+other worker processes pick them up when their entries expire.
+
+Environment variables:
+    ADCP_AUTH_CACHE_TTL: Entry lifetime in seconds (default 60, 0 disables)
+    ADCP_AUTH_CACHE_MAX_ENTRIES: Maximum entries per cache (default 10000)
+"""
+
+import hashlib
+import logging
+import os
+from typing import Any
+
+from src.core.utils.ttl_cache import MISSING, TTLCache
+
+logger = logging.getLogger(__name__)
+
+AUTH_CACHE_TTL_SECONDS = float(os.environ.get("ADCP_AUTH_CACHE_TTL", "60"))
+AUTH_CACHE_MAX_ENTRIES = int(os.environ.get("ADCP_AUTH_CACHE_MAX_ENTRIES", "10000"))
+
+# (token_hash, tenant_id | None) -> (principal_id, principal_tenant_id, tenant_dict | None)
+_principal_cache = TTLCache(maxsize=AUTH_CACHE_MAX_ENTRIES, ttl=AUTH_CACHE_TTL_SECONDS, name="auth_principal")
+
+# (lookup_kind, value) -> tenant_dict | None  (None is cached: unknown hosts are common)
+_tenant_cache = TTLCache(maxsize=AUTH_CACHE_MAX_ENTRIES, ttl=AUTH_CACHE_TTL_SECONDS, name="auth_tenant")
+
+
+def hash_token(token: str) -> str:
+    """Return the cache key digest for an access token."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def get_cached_principal(token: str, tenant_id: str | None) -> tuple[str, dict[str, Any] | None] | None:
+    """Look up a cached principal resolution.
+
+    Args:
+        token: Raw access token from the request
+        tenant_id: Tenant the token was validated against, or None for global lookup
+
+    Returns:
+        (principal_id, tenant_dict) on hit, None on miss. tenant_dict is only
+        populated for global lookups (where the tenant is derived from the token).
+    """
+    entry = _principal_cache.get((hash_token(token), tenant_id))
+    if entry is MISSING:
+        return None
+    principal_id, _principal_tenant_id, tenant_dict = entry
+    return principal_id, dict(tenant_dict) if tenant_dict is not None else None
+
+
+def cache_principal(
+    token: str,
+    tenant_id: str | None,
+    principal_id: str,
+    principal_tenant_id: str,
+    tenant_dict: dict[str, Any] | None = None,
+) -> None:
+    """Cache a successful token → principal resolution.
+
+    Failed lookups are deliberately not cached so that newly created tokens
+    work immediately and invalid tokens cannot fill the cache.
+    """
+    _principal_cache.set(
+        (hash_token(token), tenant_id),
+        (principal_id, principal_tenant_id, dict(tenant_dict) if tenant_dict is not None else None),
+    )
+
+
+def get_cached_tenant(kind: str, value: str) -> Any:
+    """Look up a cached tenant resolution.
+
+    Args:
+        kind: Lookup type ("virtual_host", "subdomain" or "tenant_id")
+        value: Header-derived value that was looked up
+
+    Returns:
+        Tenant dict (a copy), None for a cached negative result, or MISSING on cache miss
+    """
+    tenant = _tenant_cache.get((kind, value))
+    if tenant is MISSING or tenant is None:
+        return tenant
+    return dict(tenant)
+
+
+def cache_tenant(kind: str, value: str, tenant: dict[str, Any] | None) -> None:
+    """Cache a tenant resolution result (including "not found")."""
+    _tenant_cache.set((kind, value), dict(tenant) if tenant is not None else None)
+
+
+def invalidate_tenant_auth_cache(tenant_id: str) -> None:
+    """Drop every cached resolution that involves ``tenant_id``.
+
+    Call after any change to a tenant's routing (subdomain, virtual host),
+    activation state, admin token or settings (the cached tenant dict carries
+    the serialized settings), and after principal changes.
+
+    Host lookups are cleared entirely: a tenant edit can make a previously
+    unknown host resolve, and there are few host entries.
+    """
+    removed = _principal_cache.invalidate_where(lambda key, value: key[1] == tenant_id or value[1] == tenant_id)
+    _tenant_cache.clear()
+    logger.debug(f"Invalidated auth cache for tenant {tenant_id} ({removed} principal entries)")
+
+
+def invalidate_principal_auth_cache(tenant_id: str, principal_id: str) -> None:
+    """Drop cached resolutions for one principal (e.g. after delete)."""
+    _principal_cache.invalidate_where(lambda key, value: value[1] == tenant_id and value[0] == principal_id)
+
+
+def clear_auth_cache() -> None:
+    """Clear all cached auth resolutions."""
+    _principal_cache.clear()
+    _tenant_cache.clear()
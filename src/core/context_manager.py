@@ -1,13 +1,12 @@
 """Context persistence manager for A2A protocol support."""
 
-import asyncio
 import logging
 import uuid
 from datetime import UTC, datetime
 from typing import Any
 
 from rich.console import Console
-from sqlalchemy import select
+from sqlalchemy import bindparam, exists, select
 
 from a2a.types import Task, TaskStatusUpdateEvent
 from adcp import create_a2a_webhook_payload, create_mcp_webhook_payload
@@ -15,13 +14,34 @@ from adcp.types import McpWebhookPayload
 from adcp.webhooks import GeneratedTaskStatus
 
 from src.core.database.database_session import DatabaseManager
-from src.core.database.models import Context, ObjectWorkflowMapping, WorkflowStep
-from src.services.protocol_webhook_service import get_protocol_webhook_service
+from src.core.database.models import Context, ObjectWorkflowMapping, PushNotificationConfig, WorkflowStep
+from src.services.workflow_notification_service import get_workflow_notification_service
 
 logger = logging.getLogger(__name__)
 
 console = Console()
 
+# Tenant, principal and first mapped action for a step status notification. No row
+# unless the step is mapped to an object and its principal has an active push
+# notification config.
+_PUSH_TARGET_STMT = select(
+    Context.tenant_id,
+    Context.principal_id,
+    select(ObjectWorkflowMapping.action)
+    .where(ObjectWorkflowMapping.step_id == bindparam("step_id"))
+    .order_by(ObjectWorkflowMapping.id)
+    .limit(1)
+    .scalar_subquery(),
+).where(
+    Context.context_id == bindparam("context_id"),
+    exists().where(ObjectWorkflowMapping.step_id == bindparam("step_id")),
+    exists().where(
+        PushNotificationConfig.tenant_id == Context.tenant_id,
+        PushNotificationConfig.principal_id == Context.principal_id,
+        PushNotificationConfig.is_active.is_(True),
+    ),
+)
+
 
 class ContextManager(DatabaseManager):
     """Manages persistent context for conversations and tasks.
@@ -572,7 +592,11 @@ class ContextManager(DatabaseManager):
             session.close()
 
     def _send_push_notifications(self, step: WorkflowStep, new_status: str, session: Any) -> None:
-        """Send push notifications via registered webhooks for workflow step status changes.
+        """Queue a push notification for a workflow step status change.
+
+        Runs after the step is committed. The notification is delivered out of band
+        by the workflow notification service (see workflow_notification_service.py),
+        so the caller never waits on the buyer's webhook.
 
         Args:
             step: The workflow step that was updated
@@ -580,156 +604,53 @@ class ContextManager(DatabaseManager):
             session: Active database session
         """
         try:
-            import requests
-
-            from src.core.database.models import PushNotificationConfig
-
-            # Get object mappings for this step
-            stmt = select(ObjectWorkflowMapping).filter_by(step_id=step.step_id)
-            mappings = session.scalars(stmt).all()
-
-            if not mappings:
-                console.print(f"[yellow]No object mappings found for step {step.step_id}[/yellow]")
+            url = ((step.request_data or {}).get("push_notification_config") or {}).get("url")
+            if not url:
+                logger.debug(f"No push notification URL for step {step.step_id}; skipping webhook")
                 return
 
-            # Get context to find tenant_id
-            context_stmt = select(Context).filter_by(context_id=step.context_id)
-            context = session.scalars(context_stmt).first()
-            if not context:
-                console.print(f"[yellow]No context found for step {step.step_id}[/yellow]")
+            target = session.execute(
+                _PUSH_TARGET_STMT, {"step_id": step.step_id, "context_id": step.context_id}
+            ).first()
+            if target is None:
+                logger.debug(f"No mapped object or active push notification config for step {step.step_id}")
                 return
+            tenant_id, principal_id, action = target
+
+            try:
+                status_enum = GeneratedTaskStatus(new_status)
+            except ValueError:
+                status_enum = GeneratedTaskStatus.unknown
+
+            # Build webhook payload based on protocol type
+            payload: Task | TaskStatusUpdateEvent | McpWebhookPayload
+            protocol = (step.request_data or {}).get("protocol", "mcp")  # Default to MCP
+            if protocol == "a2a":
+                payload = create_a2a_webhook_payload(
+                    task_id=step.step_id,
+                    status=status_enum,
+                    context_id=step.context_id,
+                    result=step.response_data or {},
+                )
+            else:
+                # TODO: Fix in adcp python client - create_mcp_webhook_payload should return
+                # McpWebhookPayload instead of dict[str, Any] for proper type safety
+                mcp_payload_dict = create_mcp_webhook_payload(step.step_id, status_enum, step.response_data)
+                payload = McpWebhookPayload.model_construct(**mcp_payload_dict)
 
-            tenant_id = context.tenant_id
-            principal_id = context.principal_id
-
-            # Find registered webhooks for this principal
-            # NOTE: PushNotificationConfig doesn't have object_type/object_id columns
-            # Those are in ObjectWorkflowMapping which we already have via 'mappings'
-            webhook_stmt = select(PushNotificationConfig).filter_by(
+            delivery_id = get_workflow_notification_service().enqueue(
                 tenant_id=tenant_id,
-                principal_id=principal_id,
-                is_active=True,
+                step_id=step.step_id,
+                url=url,
+                payload=payload.model_dump(mode="json", exclude_none=True),
+            )
+            logger.info(
+                f"Queued {step.tool_name or action} webhook {delivery_id} for step {step.step_id} "
+                f"({new_status}, principal {principal_id})"
             )
-            webhooks = session.scalars(webhook_stmt).all()
-
-            console.print(f"[cyan]🔍 Found {len(webhooks)} active webhook configs for principal {principal_id}[/cyan]")
-
-            # Send notifications for each mapping (media buy, creative, etc.)
-            for mapping in mappings:
-                console.print(
-                    f"[cyan]📦 Processing mapping: {mapping.object_type} {mapping.object_id} action={mapping.action}[/cyan]"
-                )
-
-                for _webhook_config in webhooks:
-                    # build push notification config from step request data
-                    from uuid import uuid4
-
-                    cfg_dict = (step.request_data or {}).get("push_notification_config") or {}
-                    url = cfg_dict.get("url")
-                    if not url:
-                        console.print("[red]No push notification URL present; skipping webhook[/red]")
-                        continue
-
-                    authentication = cfg_dict.get("authentication") or {}
-                    schemes = authentication.get("schemes") or []
-                    auth_type = schemes[0] if isinstance(schemes, list) and schemes else None
-                    auth_token = authentication.get("credentials")
-
-                    # Derive principal/tenant from the step context if available
-                    context_obj = getattr(step, "context", None)
-                    derived_tenant_id = tenant_id or (getattr(context_obj, "tenant_id", None))
-                    derived_principal_id = getattr(context_obj, "principal_id", None)
-
-                    push_notification_config = PushNotificationConfig(
-                        id=cfg_dict.get("id") or f"pnc_{uuid4().hex[:16]}",
-                        tenant_id=derived_tenant_id,
-                        principal_id=derived_principal_id,
-                        url=url,
-                        authentication_type=auth_type,
-                        authentication_token=auth_token,
-                        is_active=True,
-                    )
-
-                    service = get_protocol_webhook_service()
-
-                    console.print(
-                        f"[cyan]📤 Sending webhook to {push_notification_config.url} for {mapping.object_type} {mapping.object_id}[/cyan]"
-                    )
-
-                    # Build webhook payload based on protocol type
-                    task_type_str = step.tool_name or mapping.action or "unknown"
-                    protocol = (step.request_data or {}).get("protocol", "mcp")  # Default to MCP
-                    try:
-                        status_enum = GeneratedTaskStatus(new_status)
-                    except ValueError:
-                        status_enum = GeneratedTaskStatus.unknown
-
-                    payload: Task | TaskStatusUpdateEvent | McpWebhookPayload
-                    if protocol == "a2a":
-                        payload = create_a2a_webhook_payload(
-                            task_id=step.step_id,
-                            status=status_enum,
-                            context_id=step.context_id,
-                            result=step.response_data or {},
-                        )
-                    else:
-                        # TODO: Fix in adcp python client - create_mcp_webhook_payload should return
-                        # McpWebhookPayload instead of dict[str, Any] for proper type safety
-                        mcp_payload_dict = create_mcp_webhook_payload(step.step_id, status_enum, step.response_data)
-                        payload = McpWebhookPayload.model_construct(**mcp_payload_dict)
-
-                    metadata: dict[str, Any] = {
-                        "task_type": task_type_str,
-                        "tenant_id": derived_tenant_id,
-                        "principal_id": derived_principal_id,
-                    }
-
-                    try:
-                        # If we're already in an event loop, schedule the send; otherwise run it directly
-                        try:
-                            loop = asyncio.get_running_loop()
-                            task = loop.create_task(
-                                service.send_notification(
-                                    push_notification_config=push_notification_config,
-                                    payload=payload,
-                                    metadata=metadata,
-                                )
-                            )
-
-                            def _log_task_result(
-                                t: asyncio.Task, config_url: str = push_notification_config.url
-                            ) -> None:
-                                try:
-                                    t.result()
-                                    console.print(f"[green]✅ Webhook sent successfully for {config_url}[/green]")
-                                except Exception as e:  # noqa: BLE001
-                                    console.print(f"[red]❌ Webhook failed for {config_url}: {str(e)}[/red]")
-
-                            task.add_done_callback(_log_task_result)
-                        except RuntimeError:
-                            # No running loop; safe to run synchronously
-                            asyncio.run(
-                                service.send_notification(
-                                    push_notification_config=push_notification_config,
-                                    payload=payload,
-                                    metadata=metadata,
-                                )
-                            )
-                            console.print(
-                                f"[green]✅ Webhook sent successfully for {push_notification_config.url}[/green]"
-                            )
-
-                    except requests.exceptions.Timeout:
-                        console.print(f"[red]❌ Webhook timeout for {push_notification_config.url}[/red]")
-                    except requests.exceptions.RequestException as e:
-                        console.print(f"[red]❌ Webhook failed for {push_notification_config.url}: {str(e)}[/red]")
-
         except Exception as e:
-            console.print(f"[red]Error sending push notifications: {e}[/red]")
             # Don't fail the workflow update if notifications fail
-            import traceback
-
-            traceback.print_exc()
+            logger.error(f"Error queuing push notification for step {step.step_id}: {e}", exc_info=True)
 
 
 # Singleton instance getter for compatibility
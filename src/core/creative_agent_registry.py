@@ -3,7 +3,7 @@
 This module provides:
 1. Creative agent registry (system defaults + tenant-specific)
 2. Dynamic format discovery via MCP
-3. Format caching (in-memory with TTL)
+3. Format caching (in-memory with TTL, stale-while-revalidate)
 4. Multi-agent support for DCO platforms, custom creative agents
 
 Architecture:
@@ -12,9 +12,29 @@ Architecture:
 - Format resolution: Query agents via MCP, cache results
 - Preview generation: Delegate to creative agent
 - Generative creative: Use agent's create_generative_creative tool
+
+Format caching:
+- Each agent's full format list is cached by agent URL. Filters (dimensions,
+  type, asset types, name) are applied locally against indexes built once per
+  fetch, so filtered queries never reach the remote agent.
+- Agents are fetched concurrently, each bounded by its own timeout.
+- Fetches run on a shared worker pool (callers each use short-lived event
+  loops), and concurrent callers join the in-flight fetch for an agent.
+- Expired entries are served for up to ADCP_CREATIVE_FORMAT_CACHE_MAX_STALE
+  seconds while a background fetch refreshes them.
+
+Environment variables:
+    ADCP_CREATIVE_FORMAT_CACHE_TTL: Seconds a format list is fresh (default 3600)
+    ADCP_CREATIVE_FORMAT_CACHE_MAX_STALE: Seconds past expiry a list may still be served (default 86400)
 """
 
-from dataclasses import dataclass
+import asyncio
+import logging
+import os
+import threading
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -26,6 +46,13 @@ from adcp.types import FormatCategory as FormatType
 from src.core.schemas import Format, FormatId
 from src.core.utils.mcp_client import create_mcp_client  # Keep for custom tools (preview, build)
 
+logger = logging.getLogger(__name__)
+
+FORMAT_CACHE_TTL_SECONDS = int(os.environ.get("ADCP_CREATIVE_FORMAT_CACHE_TTL", "3600"))
+FORMAT_CACHE_MAX_STALE_SECONDS = int(os.environ.get("ADCP_CREATIVE_FORMAT_CACHE_MAX_STALE", "86400"))
+# Minimum gap between background refresh attempts after a failed one
+FORMAT_REFRESH_RETRY_SECONDS = 60
+
 
 @dataclass
 class CreativeAgent:
@@ -40,6 +67,121 @@ class CreativeAgent:
     timeout: int = 30  # Request timeout in seconds
 
 
+def _enum_value(value: Any) -> str:
+    return value.value if hasattr(value, "value") else str(value)
+
+
+def format_dimensions(fmt: Format) -> list[tuple[int | None, int | None]]:
+    """Get all (width, height) pairs from a format's renders."""
+    dimensions: list[tuple[int | None, int | None]] = []
+    for render in fmt.renders or []:
+        dims = getattr(render, "dimensions", None)
+        if dims:
+            w = getattr(dims, "width", None)
+            h = getattr(dims, "height", None)
+            if w is not None or h is not None:
+                dimensions.append((w, h))
+    return dimensions
+
+
+def format_is_responsive(fmt: Format) -> bool:
+    """Check if a format is responsive (any render with a fluid width or height)."""
+    for render in fmt.renders or []:
+        dims = getattr(render, "dimensions", None)
+        responsive = getattr(dims, "responsive", None) if dims else None
+        if responsive and (getattr(responsive, "width", False) or getattr(responsive, "height", False)):
+            return True
+    return False
+
+
+def format_asset_types(fmt: Format) -> set[str]:
+    """Get all asset types from a format's assets_required, including repeatable groups."""
+    types: set[str] = set()
+    for asset_req in fmt.assets_required or []:
+        asset_type = getattr(asset_req, "asset_type", None)
+        if asset_type:
+            types.add(_enum_value(asset_type))
+        for asset in getattr(asset_req, "assets", None) or []:
+            at = getattr(asset, "asset_type", None)
+            if at:
+                types.add(_enum_value(at))
+    return types
+
+
+class FormatIndex:
+    """Lookup indexes over one agent's format list, built once per fetch.
+
+    ``filter()`` matches the AdCP list_creative_formats filter semantics: a
+    dimension constraint matches if ANY render satisfies it, and formats
+    without dimensions are excluded when a dimension filter is given.
+    """
+
+    def __init__(self, formats: list[Format]):
+        self.formats = formats
+        self.by_type: dict[str, set[int]] = {}
+        self.by_asset_type: dict[str, set[int]] = {}
+        self.by_dimensions: dict[tuple[int | None, int | None], set[int]] = {}
+        self.responsive: set[int] = set()
+        self.names = [fmt.name.lower() for fmt in formats]
+
+        for i, fmt in enumerate(formats):
+            if fmt.type is not None:
+                self.by_type.setdefault(_enum_value(fmt.type), set()).add(i)
+            for asset_type in format_asset_types(fmt):
+                self.by_asset_type.setdefault(asset_type, set()).add(i)
+            for dims in format_dimensions(fmt):
+                self.by_dimensions.setdefault(dims, set()).add(i)
+            if format_is_responsive(fmt):
+                self.responsive.add(i)
+
+    def filter(
+        self,
+        max_width: int | None = None,
+        max_height: int | None = None,
+        min_width: int | None = None,
+        min_height: int | None = None,
+        is_responsive: bool | None = None,
+        asset_types: Iterable[str] | None = None,
+        name_search: str | None = None,
+        type_filter: str | None = None,
+    ) -> list[Format]:
+        """Return the formats matching every given filter, in original order."""
+        matches: set[int] | None = None
+
+        def narrow(candidates: set[int]) -> None:
+            nonlocal matches
+            matches = candidates if matches is None else matches & candidates
+
+        if type_filter is not None:
+            narrow(self.by_type.get(_enum_value(type_filter), set()))
+        if asset_types:
+            wanted: set[int] = set()
+            for asset_type in asset_types:
+                wanted |= self.by_asset_type.get(_enum_value(asset_type), set())
+            narrow(wanted)
+        if is_responsive is not None:
+            narrow(self.responsive if is_responsive else set(range(len(self.formats))) - self.responsive)
+        for bound, axis, compare in (
+            (min_width, 0, lambda v, b: v >= b),
+            (max_width, 0, lambda v, b: v <= b),
+            (min_height, 1, lambda v, b: v >= b),
+            (max_height, 1, lambda v, b: v <= b),
+        ):
+            if bound is not None:
+                within: set[int] = set()
+                for dims, positions in self.by_dimensions.items():
+                    if dims[axis] and compare(dims[axis], bound):
+                        within |= positions
+                narrow(within)
+        if name_search is not None:
+            term = name_search.lower()
+            narrow({i for i, name in enumerate(self.names) if term in name})
+
+        if matches is None:
+            return list(self.formats)
+        return [self.formats[i] for i in sorted(matches)]
+
+
 @dataclass
 class CachedFormats:
     """Cached format list from a creative agent."""
@@ -47,11 +189,20 @@ class CachedFormats:
     formats: list[Format]
     fetched_at: datetime
     ttl_seconds: int = 3600  # 1 hour default
+    index: FormatIndex = field(init=False, repr=False)
+    refresh_failed_at: datetime | None = None
+
+    def __post_init__(self) -> None:
+        self.index = FormatIndex(self.formats)
 
     def is_expired(self) -> bool:
         """Check if cache has expired."""
         return datetime.now(UTC) > self.fetched_at + timedelta(seconds=self.ttl_seconds)
 
+    def is_servable(self, max_stale_seconds: int) -> bool:
+        """Check if the entry may still be served (fresh, or expired within the stale window)."""
+        return datetime.now(UTC) <= self.fetched_at + timedelta(seconds=self.ttl_seconds + max_stale_seconds)
+
 
 class CreativeAgentRegistry:
     """Registry of creative agents with dynamic format discovery and caching.
@@ -85,6 +236,9 @@ class CreativeAgentRegistry:
     def __init__(self):
         """Initialize registry with empty cache."""
         self._format_cache: dict[str, CachedFormats] = {}  # Key: agent_url
+        self._inflight: dict[str, Future[CachedFormats]] = {}  # Key: agent_url
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="creative-formats")
 
     def _build_adcp_client(self, agents: list[CreativeAgent]) -> ADCPMultiAgentClient:
         """Build AdCP client from creative agent configs.
@@ -111,7 +265,7 @@ class CreativeAgentRegistry:
                 auth_token=auth_token,
                 auth_type=auth_type,
                 auth_header=agent.auth_header or "x-adcp-auth",
-                timeout=30.0,
+                timeout=float(agent.timeout),
             )
             agent_configs.append(config)
 
@@ -196,10 +350,6 @@ class CreativeAgentRegistry:
         Returns:
             List of Format objects from the agent
         """
-        import logging
-
-        logger = logging.getLogger(__name__)
-
         try:
             # Convert string asset_types to AssetType enums
             typed_asset_types: list[AssetType] | None = None
@@ -276,6 +426,82 @@ class CreativeAgentRegistry:
             logger.error(f"AdCP error with creative agent {agent.name}: {e.message}")
             raise RuntimeError(str(e.message)) from e
 
+    def _refresh(self, agent: CreativeAgent) -> Future[CachedFormats]:
+        """Start a fetch of the agent's full format list, or join the one in flight.
+
+        The fetch runs on the registry's worker pool with its own event loop, so
+        it outlives the caller's loop (background refreshes) and can be awaited
+        from any loop or thread.
+        """
+        with self._lock:
+            future = self._inflight.get(agent.agent_url)
+            if future is None:
+                future = self._executor.submit(self._fetch_and_cache, agent)
+                self._inflight[agent.agent_url] = future
+            return future
+
+    def _fetch_and_cache(self, agent: CreativeAgent) -> CachedFormats:
+        try:
+            client = self._build_adcp_client([agent])
+            formats = asyncio.run(
+                asyncio.wait_for(self._fetch_formats_from_agent(client, agent), timeout=agent.timeout)
+            )
+            entry = CachedFormats(formats=formats, fetched_at=datetime.now(UTC), ttl_seconds=FORMAT_CACHE_TTL_SECONDS)
+            with self._lock:
+                self._format_cache[agent.agent_url] = entry
+            return entry
+        except Exception as e:
+            # Back off before retrying a failing (or hung) agent for its stale entry
+            with self._lock:
+                cached = self._format_cache.get(agent.agent_url)
+                if cached:
+                    cached.refresh_failed_at = datetime.now(UTC)
+            if isinstance(e, TimeoutError):
+                raise RuntimeError(f"Request to creative agent {agent.name} timed out after {agent.timeout}s") from e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(agent.agent_url, None)
+
+    async def _get_cached_formats(self, agent: CreativeAgent, force_refresh: bool = False) -> CachedFormats:
+        """Get the agent's cached format list, fetching it if missing or too stale.
+
+        Expired entries within the stale window are returned immediately while a
+        background fetch refreshes them.
+        """
+        from src.core.metrics import cache_lookups_total
+
+        with self._lock:
+            cached = self._format_cache.get(agent.agent_url)
+
+        if cached and not force_refresh:
+            if not cached.is_expired():
+                cache_lookups_total.labels(cache="creative_formats", result="hit").inc()
+                return cached
+            if cached.is_servable(FORMAT_CACHE_MAX_STALE_SECONDS):
+                cache_lookups_total.labels(cache="creative_formats", result="stale").inc()
+                retry_at = (cached.refresh_failed_at or datetime.min.replace(tzinfo=UTC)) + timedelta(
+                    seconds=FORMAT_REFRESH_RETRY_SECONDS
+                )
+                if datetime.now(UTC) >= retry_at:
+                    self._refresh(agent).add_done_callback(lambda f: self._log_refresh_failure(agent, f))
+                return cached
+
+        cache_lookups_total.labels(cache="creative_formats", result="miss").inc()
+        try:
+            # Shield so one caller giving up doesn't cancel the fetch other callers share
+            return await asyncio.shield(asyncio.wrap_future(self._refresh(agent)))
+        except Exception:
+            if cached and cached.is_servable(FORMAT_CACHE_MAX_STALE_SECONDS):
+                logger.warning(f"Refreshing formats from {agent.agent_url} failed, serving cached list", exc_info=True)
+                return cached
+            raise
+
+    @staticmethod
+    def _log_refresh_failure(agent: CreativeAgent, future: Future[CachedFormats]) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(f"Background format refresh from {agent.agent_url} failed: {future.exception()}")
+
     async def get_formats_for_agent(
         self,
         agent: CreativeAgent,
@@ -291,6 +517,8 @@ class CreativeAgentRegistry:
     ) -> list[Format]:
         """Get formats from agent with caching.
 
+        Filters are applied locally to the agent's cached full format list.
+
         Args:
             agent: CreativeAgent to query
             force_refresh: Skip cache and fetch fresh data
@@ -306,31 +534,8 @@ class CreativeAgentRegistry:
         Returns:
             List of Format objects
         """
-        # Check cache - only use cache if no filtering parameters provided
-        has_filters = any(
-            [
-                max_width is not None,
-                max_height is not None,
-                min_width is not None,
-                min_height is not None,
-                is_responsive is not None,
-                asset_types is not None,
-                name_search is not None,
-                type_filter is not None,
-            ]
-        )
-
-        cached = self._format_cache.get(agent.agent_url)
-        if cached and not cached.is_expired() and not force_refresh and not has_filters:
-            return cached.formats
-
-        # Build client for this agent
-        client = self._build_adcp_client([agent])
-
-        # Fetch from agent
-        formats = await self._fetch_formats_from_agent(
-            client,
-            agent,
+        cached = await self._get_cached_formats(agent, force_refresh=force_refresh)
+        return cached.index.filter(
             max_width=max_width,
             max_height=max_height,
             min_width=min_width,
@@ -341,14 +546,6 @@ class CreativeAgentRegistry:
             type_filter=type_filter,
         )
 
-        # Update cache only if no filtering parameters (cache full result set)
-        if not has_filters:
-            self._format_cache[agent.agent_url] = CachedFormats(
-                formats=formats, fetched_at=datetime.now(UTC), ttl_seconds=3600
-            )
-
-        return formats
-
     async def list_all_formats(
         self,
         tenant_id: str | None = None,
@@ -364,6 +561,9 @@ class CreativeAgentRegistry:
     ) -> list[Format]:
         """List all formats from all registered agents.
 
+        Agents are queried concurrently; an agent that fails or times out is
+        skipped. Results keep agent priority order.
+
         Args:
             tenant_id: Optional tenant ID for tenant-specific agents
             force_refresh: Skip cache and fetch fresh data
@@ -380,63 +580,31 @@ class CreativeAgentRegistry:
             List of all Format objects across all agents
         """
         agents = self._get_tenant_agents(tenant_id)
-        all_formats = []
-
-        import logging
-
-        logger = logging.getLogger(__name__)
         logger.info(f"list_all_formats: Found {len(agents)} agents for tenant {tenant_id}")
 
-        # Build client for all agents
-        client = self._build_adcp_client(agents)
-
-        for agent in agents:
-            logger.info(f"list_all_formats: Fetching from {agent.agent_url}")
-            try:
-                # Check cache first if no filters and not forcing refresh
-                has_filters = any(
-                    [
-                        max_width is not None,
-                        max_height is not None,
-                        min_width is not None,
-                        min_height is not None,
-                        is_responsive is not None,
-                        asset_types is not None,
-                        name_search is not None,
-                        type_filter is not None,
-                    ]
-                )
-
-                cached = self._format_cache.get(agent.agent_url)
-                if cached and not cached.is_expired() and not force_refresh and not has_filters:
-                    formats = cached.formats
-                else:
-                    # Fetch from agent
-                    formats = await self._fetch_formats_from_agent(
-                        client,
-                        agent,
-                        max_width=max_width,
-                        max_height=max_height,
-                        min_width=min_width,
-                        min_height=min_height,
-                        is_responsive=is_responsive,
-                        asset_types=asset_types,
-                        name_search=name_search,
-                        type_filter=type_filter,
-                    )
-
-                    # Update cache only if no filtering parameters
-                    if not has_filters:
-                        self._format_cache[agent.agent_url] = CachedFormats(
-                            formats=formats, fetched_at=datetime.now(UTC), ttl_seconds=3600
-                        )
+        results = await asyncio.gather(
+            *(self._get_cached_formats(agent, force_refresh=force_refresh) for agent in agents),
+            return_exceptions=True,
+        )
 
-                logger.info(f"list_all_formats: Got {len(formats)} formats from {agent.agent_url}")
-                all_formats.extend(formats)
-            except Exception as e:
+        all_formats: list[Format] = []
+        for agent, result in zip(agents, results, strict=True):
+            if isinstance(result, BaseException):
                 # Log error but continue with other agents
-                logger.error(f"Failed to fetch formats from {agent.agent_url}: {e}", exc_info=True)
+                logger.error(f"Failed to fetch formats from {agent.agent_url}: {result}", exc_info=result)
                 continue
+            all_formats.extend(
+                result.index.filter(
+                    max_width=max_width,
+                    max_height=max_height,
+                    min_width=min_width,
+                    min_height=min_height,
+                    is_responsive=is_responsive,
+                    asset_types=asset_types,
+                    name_search=name_search,
+                    type_filter=type_filter,
+                )
+            )
 
         logger.info(f"list_all_formats: Returning {len(all_formats)} total formats")
         return all_formats
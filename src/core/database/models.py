@@ -20,9 +20,12 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    event,
+    inspect,
     text,
+    update,
 )
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from src.core.database.json_type import JSONType
@@ -118,6 +121,10 @@ class Tenant(Base, JSONValidatorMixin):
     # Can be an absolute URL or a path to an uploaded file (e.g., /static/favicons/tenant_id/favicon.ico)
     favicon_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
 
+    # Product catalog version - bumped in the same transaction as any write to the tenant's
+    # products (see _bump_product_catalog_versions below); keys the converted catalog cache
+    product_catalog_version: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+
     # Relationships
     products = relationship("Product", back_populates="tenant", cascade="all, delete-orphan")
     principals = relationship("Principal", back_populates="tenant", cascade="all, delete-orphan")
@@ -852,6 +859,28 @@ class MediaBuy(Base):
         Index("idx_media_buys_tenant", "tenant_id"),
         Index("idx_media_buys_status", "status"),
         Index("idx_media_buys_strategy", "strategy_id"),
+        # Partial indexes for MediaBuyStatusScheduler's bulk transitions; only
+        # buys it can still move forward are indexed
+        Index(
+            "idx_media_buys_live_start_time",
+            "start_time",
+            postgresql_where=text("status IN ('pending_activation', 'scheduled')"),
+        ),
+        Index(
+            "idx_media_buys_live_start_date",
+            "start_date",
+            postgresql_where=text("status IN ('pending_activation', 'scheduled') AND start_time IS NULL"),
+        ),
+        Index(
+            "idx_media_buys_live_end_time",
+            "end_time",
+            postgresql_where=text("status IN ('pending_activation', 'scheduled', 'active')"),
+        ),
+        Index(
+            "idx_media_buys_live_end_date",
+            "end_date",
+            postgresql_where=text("status IN ('pending_activation', 'scheduled', 'active') AND end_time IS NULL"),
+        ),
     )
 
 
@@ -1888,6 +1917,13 @@ class WebhookDeliveryRecord(Base):
     last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
     response_code: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
+    # Outbox (src/services/webhook_outbox.py): when the row is next due for
+    # delivery, or its lease expires while "sending". NULL once delivered/failed
+    # and for rows delivered inline.
+    next_attempt_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    # PushNotificationConfig supplying auth and signing secret at delivery time
+    config_id: Mapped[str | None] = mapped_column(String(50), nullable=True)
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now())
 
@@ -1900,6 +1936,11 @@ class WebhookDeliveryRecord(Base):
         Index("idx_webhook_deliveries_event_type", "event_type"),
         Index("idx_webhook_deliveries_object_id", "object_id"),
         Index("idx_webhook_deliveries_created", "created_at"),
+        Index(
+            "idx_webhook_deliveries_outbox_due",
+            "next_attempt_at",
+            postgresql_where=text("next_attempt_at IS NOT NULL"),
+        ),
     )
 
 
@@ -1958,3 +1999,57 @@ class WebhookDeliveryLog(Base):
         Index("idx_webhook_log_status", "status"),
         Index("idx_webhook_log_created_at", "created_at"),
     )
+
+
+class A2ATask(Base):
+    """A2A protocol task shared by all A2A server workers.
+
+    Used by the database task store (src/a2a_server/task_store.py) so tasks/get and
+    tasks/cancel find a task whichever worker handled message/send. Rows past
+    expires_at are treated as gone and purged periodically.
+    """
+
+    __tablename__ = "a2a_tasks"
+
+    task_id: Mapped[str] = mapped_column(String(100), primary_key=True)
+    context_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    task: Mapped[dict] = mapped_column(JSONType, nullable=False)  # Task.model_dump(mode="json")
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    __table_args__ = (Index("idx_a2a_tasks_expires_at", "expires_at"),)
+
+
+# Tenant fields read when converting products to AdCP schema (publisher_domain resolution)
+_CATALOG_TENANT_FIELDS = ("subdomain", "virtual_host")
+
+
+@event.listens_for(Session, "before_flush")
+def _bump_product_catalog_versions(session: Session, flush_context, instances) -> None:
+    """Bump tenants.product_catalog_version when a flush changes a tenant's product catalog.
+
+    Covers products, their pricing options and inventory profiles (which products inherit
+    formats and properties from), plus the tenant fields product conversion reads. The
+    bump runs in the flush's transaction, so processes caching converted catalogs (see
+    src/core/product_catalog.py) see the new version exactly when the change commits.
+    """
+    tenant_ids: set[str] = set()
+    for obj in (*session.new, *session.deleted):
+        if isinstance(obj, Product | PricingOption | InventoryProfile):
+            tenant_ids.add(obj.tenant_id)
+    for obj in session.dirty:
+        if isinstance(obj, Product | PricingOption | InventoryProfile):
+            if session.is_modified(obj):
+                tenant_ids.add(obj.tenant_id)
+        elif isinstance(obj, Tenant):
+            state = inspect(obj)
+            if any(state.attrs[field].history.has_changes() for field in _CATALOG_TENANT_FIELDS):
+                tenant_ids.add(obj.tenant_id)
+
+    if tenant_ids:
+        session.execute(
+            update(Tenant)
+            .where(Tenant.tenant_id.in_(tenant_ids))
+            .values(product_catalog_version=Tenant.product_catalog_version + 1)
+            .execution_options(synchronize_session=False)
+        )
@@ -8,6 +8,7 @@ from src.adapters.google_ad_manager import GoogleAdManager
 from src.adapters.kevel import Kevel
 from src.adapters.mock_ad_server import MockAdServer as MockAdServerAdapter
 from src.adapters.triton_digital import TritonDigital
+from src.core.adapter_pool import get_gam_client_manager
 from src.core.config_loader import get_current_tenant
 from src.core.database.database_session import get_db_session
 from src.core.database.models import AdapterConfig
@@ -33,7 +34,9 @@ def get_adapter(
         config_row = session.scalars(stmt).first()
 
         adapter_config: dict[str, Any] = {"enabled": True}
+        config_version = ""
         if config_row:
+            config_version = config_row.updated_at.isoformat() if config_row.updated_at else ""
             adapter_type = config_row.adapter_type
             logger.info(f"[ADAPTER_SELECT] adapter_type from AdapterConfig: {adapter_type}")
             # Use adapter_type from AdapterConfig as the source of truth
@@ -117,6 +120,12 @@ def get_adapter(
         logger.info(
             f"[ADAPTER_SELECT] GAM params: network_code={adapter_config.get('network_code')}, advertiser_id={adapter_config.get('company_id')}, trafficker_id={adapter_config.get('trafficker_id')}, dry_run={dry_run}"
         )
+        # Reuse the tenant's initialized GAM client (dry-run adapters don't create one)
+        client_manager = None
+        if not dry_run and adapter_config.get("refresh_token"):
+            client_manager = get_gam_client_manager(
+                tenant_id, config_version, network_code, {"refresh_token": adapter_config["refresh_token"]}
+            )
         return GoogleAdManager(
             adapter_config,
             principal,
@@ -125,6 +134,7 @@ def get_adapter(
             trafficker_id=adapter_config.get("trafficker_id"),
             dry_run=dry_run,
             tenant_id=tenant_id,
+            client_manager=client_manager,
         )
     elif selected_adapter == "kevel":
         return Kevel(adapter_config, principal, dry_run, tenant_id=tenant_id)
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 from datetime import UTC, datetime
@@ -135,6 +136,18 @@ async def lifespan_context(app):
     except Exception as e:
         logger.error(f"Failed to start media buy status scheduler: {e}", exc_info=True)
 
+    # Startup: Deliver webhooks queued in the outbox (including any left from a previous run)
+    from src.services.webhook_delivery_service import webhook_delivery_service
+    from src.services.workflow_notification_service import get_workflow_notification_service
+
+    logger.info("Starting webhook outbox...")
+    try:
+        webhook_delivery_service.start()
+        get_workflow_notification_service().start()
+        logger.info("✅ Webhook outbox started")
+    except Exception as e:
+        logger.error(f"Failed to start webhook outbox: {e}", exc_info=True)
+
     yield
 
     # Shutdown: Stop media buy status scheduler
@@ -157,6 +170,25 @@ async def lifespan_context(app):
     except Exception as e:
         logger.error(f"Failed to stop delivery webhook scheduler: {e}", exc_info=True)
 
+    # Shutdown: Let in-flight webhook deliveries record their outcome
+    logger.info("Stopping webhook outbox...")
+    try:
+        await asyncio.to_thread(webhook_delivery_service.stop)
+        await asyncio.to_thread(get_workflow_notification_service().stop)
+        logger.info("✅ Webhook outbox stopped")
+    except Exception as e:
+        logger.error(f"Failed to stop webhook outbox: {e}", exc_info=True)
+
+    # Shutdown: Drain pending audit log records
+    from src.core.audit_writer import shutdown_audit_log_writer
+
+    logger.info("Draining audit log writer...")
+    try:
+        await asyncio.to_thread(shutdown_audit_log_writer)
+        logger.info("✅ Audit log writer stopped")
+    except Exception as e:
+        logger.error(f"Failed to drain audit log writer: {e}", exc_info=True)
+
 
 mcp = FastMCP(
     name="AdCPSalesAgent",
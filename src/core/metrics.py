@@ -1,4 +1,4 @@
-"""Prometheus metrics for monitoring AI review and webhook operations."""
+"""Prometheus metrics for monitoring AI review, webhook and cache operations."""
 
 from prometheus_client import REGISTRY, Counter, Gauge, Histogram, generate_latest
 
@@ -63,6 +63,120 @@ webhook_queue_size = Gauge(
     ["tenant_id"],
 )
 
+webhook_queue_oldest_age = Gauge(
+    "webhook_queue_oldest_age_seconds",
+    "Age of the oldest webhook pending delivery",
+    ["tenant_id"],
+)
+
+# In-process cache metrics (see src/core/utils/ttl_cache.py)
+cache_lookups_total = Counter(
+    "cache_lookups_total",
+    "In-process cache lookups by result",
+    ["cache", "result"],
+)
+
+cache_evictions_total = Counter(
+    "cache_evictions_total",
+    "In-process cache evictions by reason",
+    ["cache", "reason"],
+)
+
+# A2A task store metrics (see src/a2a_server/task_store.py); evictions are in cache_evictions_total{cache="a2a_tasks"}
+a2a_tasks_stored = Gauge(
+    "a2a_tasks_stored",
+    "A2A tasks currently held by the task store",
+    ["backend"],
+)
+
+# Audit log writer metrics (see src/core/audit_writer.py)
+audit_log_records_total = Counter(
+    "audit_log_records_total",
+    "Audit log records by outcome (written, failed, dropped)",
+    ["result"],
+)
+
+audit_log_queue_depth = Gauge(
+    "audit_log_queue_depth",
+    "Audit log records waiting to be written",
+)
+
+audit_log_batch_size = Histogram(
+    "audit_log_batch_size",
+    "Audit log records written per batch",
+    buckets=[1, 5, 10, 25, 50, 100, 200, 500],
+)
+
+audit_log_flush_duration = Histogram(
+    "audit_log_flush_duration_seconds",
+    "Time to write one batch of audit log records",
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5],
+)
+
+
+# Admin activity stream metrics (see src/services/activity_hub.py)
+activity_stream_subscribers = Gauge(
+    "activity_stream_subscribers",
+    "Connected activity stream (SSE) subscribers",
+)
+
+activity_stream_fetches_total = Counter(
+    "activity_stream_fetches_total",
+    "Activity stream audit log queries by trigger (initial, notify, poll)",
+    ["trigger"],
+)
+
+activity_stream_events_total = Counter(
+    "activity_stream_events_total",
+    "Activity stream events by outcome (delivered, dropped)",
+    ["result"],
+)
+
+
+# Third-party ad server HTTP metrics (see src/adapters/http_client.py)
+adapter_http_request_duration = Histogram(
+    "adapter_http_request_duration_seconds",
+    "Ad server API request latency in seconds, per attempt",
+    ["adapter", "method", "status"],
+    buckets=[0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0],
+)
+
+adapter_http_errors_total = Counter(
+    "adapter_http_errors_total",
+    "Failed ad server API attempts by reason (timeout, connection, http_4xx, http_5xx)",
+    ["adapter", "reason"],
+)
+
+adapter_http_retries_total = Counter(
+    "adapter_http_retries_total",
+    "Ad server API requests retried",
+    ["adapter"],
+)
+
+
+# Adapter client pool (see src/core/adapter_pool.py); hit rate is
+# cache_lookups_total{cache="adapter_clients"}
+adapter_client_build_duration = Histogram(
+    "adapter_client_build_duration_seconds",
+    "Time to build and initialize a pooled ad server client",
+    ["adapter"],
+    buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+)
+
+
+# Product catalog cache (see src/core/product_catalog.py); hit rate is
+# cache_lookups_total{cache="product_catalog"}
+product_catalog_conversion_duration = Histogram(
+    "product_catalog_conversion_duration_seconds",
+    "Time to load and convert a tenant's product catalog on a cache miss",
+    buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+)
+
+product_catalog_conversion_saved_seconds = Counter(
+    "product_catalog_conversion_saved_seconds_total",
+    "Catalog conversion time avoided by cache hits (the cached catalog's measured conversion time per hit)",
+)
+
 
 def get_metrics_text() -> str:
     """Return current metrics in Prometheus text format."""
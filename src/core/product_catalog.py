@@ -0,0 +1,123 @@
+"""Versioned per-tenant cache of converted product catalogs.
+
+Converting a tenant's ``Product`` rows (with pricing options, inventory profile
+and tenant) to AdCP ``Product`` schema objects is the bulk of a ``get_products``
+call, yet catalogs change a few times a day. ``load_product_catalog()`` keeps the
+converted catalog per tenant and reuses it while the tenant's
+``product_catalog_version`` is unchanged.
+
+The version lives in the ``tenants`` table and is bumped by a ``before_flush``
+hook (``_bump_product_catalog_versions`` in ``src/core/database/models.py``) in the
+same transaction as any ORM write to the tenant's products, pricing options or
+inventory profiles - admin edits, dynamic variant generation and variant
+archival alike. Every process compares the cached version against the database
+on each call (one primary-key lookup), so a write made by any worker is seen by
+all of them as soon as it commits.
+
+Cached products are shared between requests and must not be mutated; callers
+copy the products they return (see ``_get_products_impl``).
+
+Environment variables:
+    ADCP_PRODUCT_CATALOG_CACHE_TTL: Seconds a converted catalog is kept (default 3600, 0 disables caching)
+    ADCP_PRODUCT_CATALOG_CACHE_MAX_TENANTS: Maximum cached tenant catalogs per process (default 256)
+"""
+
+import logging
+import os
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from src.core.database.models import Product as ProductModel
+from src.core.database.models import Tenant
+from src.core.product_conversion import convert_product_model_to_schema
+from src.core.schemas import Product
+from src.core.utils.ttl_cache import MISSING, TTLCache
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_CATALOG_CACHE_TTL_SECONDS = float(os.environ.get("ADCP_PRODUCT_CATALOG_CACHE_TTL", "3600"))
+PRODUCT_CATALOG_CACHE_MAX_TENANTS = int(os.environ.get("ADCP_PRODUCT_CATALOG_CACHE_MAX_TENANTS", "256"))
+
+# tenant_id -> ProductCatalog
+_catalogs = TTLCache(maxsize=PRODUCT_CATALOG_CACHE_MAX_TENANTS, ttl=PRODUCT_CATALOG_CACHE_TTL_SECONDS)
+
+
+@dataclass(frozen=True)
+class ProductCatalog:
+    """A tenant's converted products, ordered by product_id, at one catalog version.
+
+    ``version`` is None when the tenant row has no version (the catalog is then not cached).
+    """
+
+    version: int | None
+    products: tuple[Product, ...]
+    conversion_seconds: float
+
+
+def load_product_catalog(session: Session, tenant_id: str) -> ProductCatalog:
+    """Return the tenant's products as AdCP schema objects.
+
+    The products are shared with other requests: copy before mutating.
+
+    Args:
+        session: Database session used for the version check and, on a miss, the reload
+        tenant_id: Tenant whose catalog to load
+
+    Raises:
+        ValueError: If a product fails to convert (data corruption or migration issue)
+    """
+    from src.core.metrics import (
+        cache_lookups_total,
+        product_catalog_conversion_duration,
+        product_catalog_conversion_saved_seconds,
+    )
+
+    version = session.scalar(select(Tenant.product_catalog_version).where(Tenant.tenant_id == tenant_id))
+
+    cached = _catalogs.get(tenant_id)
+    if cached is not MISSING and version is not None and cached.version == version:
+        cache_lookups_total.labels(cache="product_catalog", result="hit").inc()
+        product_catalog_conversion_saved_seconds.inc(cached.conversion_seconds)
+        return cached
+    cache_lookups_total.labels(cache="product_catalog", result="miss" if cached is MISSING else "stale").inc()
+
+    # The version is read first, so the products loaded below are at least that
+    # new; a write committing in between only causes one extra reload
+    start = time.perf_counter()
+    stmt = (
+        select(ProductModel)
+        .options(
+            selectinload(ProductModel.pricing_options),
+            selectinload(ProductModel.inventory_profile),
+            joinedload(ProductModel.tenant),
+        )
+        .filter_by(tenant_id=tenant_id)
+        .order_by(ProductModel.product_id)
+    )
+    products = []
+    for product_obj in session.scalars(stmt).all():
+        try:
+            products.append(convert_product_model_to_schema(product_obj))
+        except Exception as e:
+            error_msg = (
+                f"Product '{product_obj.product_id}' failed to convert to AdCP schema. "
+                f"This indicates data corruption or migration issue. Error: {e}"
+            )
+            logger.error(error_msg)
+            raise ValueError(error_msg) from e
+    elapsed = time.perf_counter() - start
+
+    product_catalog_conversion_duration.observe(elapsed)
+    catalog = ProductCatalog(version=version, products=tuple(products), conversion_seconds=elapsed)
+    if version is not None:
+        _catalogs.set(tenant_id, catalog)
+    logger.debug(f"Converted {len(products)} products for tenant {tenant_id} (catalog v{version}) in {elapsed:.3f}s")
+    return catalog
+
+
+def clear_product_catalog_cache() -> None:
+    """Drop all cached catalogs (tests)."""
+    _catalogs.clear()
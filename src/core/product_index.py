@@ -0,0 +1,351 @@
+"""Per-tenant inverted index over the product catalog for get_products filtering.
+
+``get_products`` used to re-derive every product's format types, format IDs,
+countries and channels on each request and test them against the filters one
+product at a time (resolving format types through the creative agent registry
+along the way). ``ProductIndex`` derives those keys once per product version and
+keeps an inverted index from each key to the set of products carrying it, so a
+request is answered by intersecting a handful of precomputed sets.
+
+Sets are Python ints used as bitsets: each product owns one bit (its slot), and
+union/intersection are ``|``/``&`` on ints. Access control is indexed the same
+way - one bitset of unrestricted products plus one per principal listed in any
+``allowed_principal_ids`` - so visibility is ``unrestricted | by_principal[id]``.
+
+``sync()`` updates the index in place from the current catalog: products whose
+object is unchanged are skipped, changed products are re-keyed only if their
+keys actually differ, and removed products release their slot. Because a freed
+slot can be reused by another product, bitsets are only meaningful until the
+next ``sync()``. Requests sharing a tenant's index therefore use ``query()``,
+which syncs, filters and materializes products under one lock.
+
+Environment variables:
+    ADCP_PRODUCT_INDEX_TTL: Seconds a tenant's index is kept (default 3600, 0 disables reuse)
+    ADCP_PRODUCT_INDEX_MAX_TENANTS: Maximum tenant indexes per process (default 1024)
+"""
+
+import logging
+import os
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from src.core.utils.ttl_cache import MISSING, TTLCache
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_INDEX_TTL_SECONDS = float(os.environ.get("ADCP_PRODUCT_INDEX_TTL", "3600"))
+PRODUCT_INDEX_MAX_TENANTS = int(os.environ.get("ADCP_PRODUCT_INDEX_MAX_TENANTS", "1024"))
+
+# IAB standard format IDs follow these prefixes (standard_formats_only filter)
+STANDARD_FORMAT_PREFIXES = ("display_", "video_", "audio_", "native_")
+
+_indexes = TTLCache(maxsize=PRODUCT_INDEX_MAX_TENANTS, ttl=PRODUCT_INDEX_TTL_SECONDS, name="product_index")
+_indexes_lock = threading.Lock()
+
+
+def _value(obj: Any) -> Any:
+    """Unwrap enums (``.value``) and RootModels (``.root``) to their plain value."""
+    if hasattr(obj, "value"):
+        return obj.value
+    if hasattr(obj, "root"):
+        return obj.root
+    return obj
+
+
+def _format_id_str(format_id: Any) -> str | None:
+    """Return the format ID string of a str, dict or FormatId entry."""
+    if isinstance(format_id, str):
+        return format_id
+    if isinstance(format_id, dict):
+        return format_id.get("id")
+    return getattr(format_id, "id", None)
+
+
+def _format_type(format_id: Any) -> Any:
+    """Return the format type of a format ID entry, resolving string IDs through the registry."""
+    if isinstance(format_id, str):
+        from src.core.schemas import get_format_by_id
+
+        format_obj = get_format_by_id(format_id)
+        return _value(format_obj.type) if format_obj else None
+    if hasattr(format_id, "type"):
+        return _value(format_id.type)
+    return None
+
+
+@dataclass(frozen=True)
+class ProductKeys:
+    """The filterable attributes of one product, as index keys."""
+
+    delivery_type: Any
+    format_types: frozenset
+    format_ids: frozenset[str]
+    standard_formats_only: bool
+    countries: frozenset[str]
+    channels: frozenset[str]
+    allowed_principal_ids: frozenset[str]
+
+    @classmethod
+    def from_product(cls, product: Any) -> "ProductKeys":
+        format_ids = list(getattr(product, "format_ids", None) or [])
+        format_id_strs = [_format_id_str(f) for f in format_ids]
+        format_types = {_format_type(f) for f in format_ids}
+        format_types.discard(None)
+        return cls(
+            delivery_type=_value(getattr(product, "delivery_type", None)),
+            format_types=frozenset(format_types),
+            format_ids=frozenset(f for f in format_id_strs if f is not None),
+            standard_formats_only=all(not f or f.startswith(STANDARD_FORMAT_PREFIXES) for f in format_id_strs),
+            countries=frozenset(getattr(product, "countries", None) or ()),
+            channels=frozenset(c.lower() for c in getattr(product, "channels", None) or ()),
+            allowed_principal_ids=frozenset(getattr(product, "allowed_principal_ids", None) or ()),
+        )
+
+
+@dataclass
+class _Entry:
+    slot: int
+    rank: int
+    product: Any
+    keys: ProductKeys
+
+
+class ProductIndex:
+    """Inverted index from filter keys to bitsets of products.
+
+    ``query()`` is the entry point for indexes shared between requests. The
+    lower-level ``sync()``, ``visible_to()``, ``matching()`` and ``products()``
+    each lock separately, so they are only consistent when nothing else syncs
+    the index in between (e.g. a per-request index).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[str, _Entry] = {}
+        self._by_slot: dict[int, _Entry] = {}
+        self._free_slots: list[int] = []
+        self._next_slot = 0
+        self._all = 0
+        self._unrestricted = 0
+        self._standard_formats_only = 0
+        self._no_countries = 0
+        self._no_channels = 0
+        self._by_principal: dict[str, int] = {}
+        self._by_delivery_type: dict[Any, int] = {}
+        self._by_format_type: dict[Any, int] = {}
+        self._by_format_id: dict[str, int] = {}
+        self._by_country: dict[str, int] = {}
+        self._by_channel: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def query(
+        self,
+        products: Iterable[Any],
+        principal_id: str | None,
+        filters: Any,
+        adapter_channels: Iterable[str] = (),
+    ) -> tuple[list[Any], int]:
+        """Sync with the catalog, then return the products ``principal_id`` may see that match ``filters``.
+
+        All three steps run under one lock, so a concurrent ``sync()`` with another
+        catalog version cannot reassign slots between computing and reading bitsets.
+
+        Args:
+            products: The tenant's catalog in display order (see ``sync()``)
+            principal_id: Requesting principal, None when anonymous (see ``visible_to()``)
+            filters: ProductFilters from the request (see ``matching()``)
+            adapter_channels: The tenant adapter's default channels (see ``matching()``)
+
+        Returns:
+            (matching visible products in catalog order, number of visible products)
+        """
+        with self._lock:
+            self._sync(products)
+            visible = self._visible_to(principal_id)
+            return self._products(visible & self._matching(filters, adapter_channels)), visible.bit_count()
+
+    def sync(self, products: Iterable[Any]) -> None:
+        """Bring the index in line with ``products``, the tenant's catalog in display order.
+
+        Only products that were added, removed or whose keys changed touch the bitsets.
+        """
+        with self._lock:
+            self._sync(products)
+
+    def visible_to(self, principal_id: str | None) -> int:
+        """Bitset of products ``principal_id`` may see (unrestricted only when anonymous)."""
+        with self._lock:
+            return self._visible_to(principal_id)
+
+    def matching(self, filters: Any, adapter_channels: Iterable[str] = ()) -> int:
+        """Bitset of products matching the catalog-level AdCP ``filters``.
+
+        Covers delivery_type, format_types, format_ids, standard_formats_only,
+        countries and channels. ``is_fixed_price`` depends on pricing options,
+        which dynamic pricing may extend per request, so it is not indexed.
+
+        Args:
+            filters: ProductFilters from the request (None matches everything)
+            adapter_channels: The tenant adapter's default channels, which products
+                without explicit channels are matched against
+        """
+        with self._lock:
+            return self._matching(filters, adapter_channels)
+
+    def products(self, mask: int) -> list[Any]:
+        """Return the products whose bits are set in ``mask``, in catalog order."""
+        with self._lock:
+            return self._products(mask)
+
+    def _sync(self, products: Iterable[Any]) -> None:
+        seen: set[str] = set()
+        for rank, product in enumerate(products):
+            product_id = product.product_id
+            seen.add(product_id)
+            entry = self._entries.get(product_id)
+            if entry is None:
+                slot = self._free_slots.pop() if self._free_slots else self._allocate_slot()
+                entry = _Entry(slot=slot, rank=rank, product=product, keys=ProductKeys.from_product(product))
+                self._entries[product_id] = entry
+                self._by_slot[slot] = entry
+                self._add(entry)
+                continue
+            entry.rank = rank
+            if entry.product is not product:
+                keys = ProductKeys.from_product(product)
+                if keys != entry.keys:
+                    self._remove(entry)
+                    entry.keys = keys
+                    self._add(entry)
+                entry.product = product
+
+        for product_id in [pid for pid in self._entries if pid not in seen]:
+            entry = self._entries.pop(product_id)
+            self._remove(entry)
+            del self._by_slot[entry.slot]
+            self._free_slots.append(entry.slot)
+
+    def _visible_to(self, principal_id: str | None) -> int:
+        if principal_id is None:
+            return self._unrestricted
+        return self._unrestricted | self._by_principal.get(principal_id, 0)
+
+    def _matching(self, filters: Any, adapter_channels: Iterable[str]) -> int:
+        mask = self._all
+        if filters is None:
+            return mask
+
+        if filters.delivery_type:
+            mask &= self._by_delivery_type.get(_value(filters.delivery_type), 0)
+
+        if filters.format_types:
+            mask &= self._union(self._by_format_type, (_value(t) for t in filters.format_types))
+
+        if filters.format_ids:
+            mask &= self._union(self._by_format_id, (_format_id_str(f) for f in filters.format_ids))
+
+        if filters.standard_formats_only:
+            mask &= self._standard_formats_only
+
+        if filters.countries:
+            requested_countries = {str(_value(c)).upper() for c in filters.countries}
+            # Products without countries are available everywhere
+            mask &= self._union(self._by_country, requested_countries) | self._no_countries
+
+        if filters.channels:
+            requested_channels = {str(_value(c)).lower() for c in filters.channels}
+            channel_mask = self._union(self._by_channel, requested_channels)
+            # Products without channels inherit the adapter's default channels
+            defaults = set(adapter_channels)
+            if not defaults or requested_channels & defaults:
+                channel_mask |= self._no_channels
+            mask &= channel_mask
+
+        return mask
+
+    def _products(self, mask: int) -> list[Any]:
+        entries = []
+        while mask:
+            low_bit = mask & -mask
+            entry = self._by_slot.get(low_bit.bit_length() - 1)
+            if entry is not None:
+                entries.append(entry)
+            mask ^= low_bit
+        entries.sort(key=lambda e: e.rank)
+        return [e.product for e in entries]
+
+    def _allocate_slot(self) -> int:
+        slot = self._next_slot
+        self._next_slot += 1
+        return slot
+
+    @staticmethod
+    def _union(index: dict[Any, int], keys: Iterable[Any]) -> int:
+        mask = 0
+        for key in keys:
+            mask |= index.get(key, 0)
+        return mask
+
+    def _postings(self, keys: ProductKeys) -> list[tuple[dict[Any, int], Any]]:
+        """(index, key) pairs the product with ``keys`` is listed under."""
+        postings: list[tuple[dict[Any, int], Any]] = [(self._by_delivery_type, keys.delivery_type)]
+        postings.extend((self._by_format_type, t) for t in keys.format_types)
+        postings.extend((self._by_format_id, f) for f in keys.format_ids)
+        postings.extend((self._by_country, c) for c in keys.countries)
+        postings.extend((self._by_channel, c) for c in keys.channels)
+        postings.extend((self._by_principal, p) for p in keys.allowed_principal_ids)
+        return postings
+
+    def _add(self, entry: _Entry) -> None:
+        bit = 1 << entry.slot
+        keys = entry.keys
+        self._all |= bit
+        for index, key in self._postings(keys):
+            index[key] = index.get(key, 0) | bit
+        if not keys.allowed_principal_ids:
+            self._unrestricted |= bit
+        if keys.standard_formats_only:
+            self._standard_formats_only |= bit
+        if not keys.countries:
+            self._no_countries |= bit
+        if not keys.channels:
+            self._no_channels |= bit
+
+    def _remove(self, entry: _Entry) -> None:
+        keep = ~(1 << entry.slot)
+        self._all &= keep
+        for index, key in self._postings(entry.keys):
+            remaining = index.get(key, 0) & keep
+            if remaining:
+                index[key] = remaining
+            else:
+                index.pop(key, None)
+        self._unrestricted &= keep
+        self._standard_formats_only &= keep
+        self._no_countries &= keep
+        self._no_channels &= keep
+
+
+def get_product_index(tenant_id: str) -> ProductIndex:
+    """Return the tenant's product index, creating an empty one if needed.
+
+    The index is shared by concurrent requests; callers use ``query()`` with the
+    current catalog.
+    """
+    index = _indexes.get(tenant_id)
+    if index is MISSING:
+        with _indexes_lock:
+            index = _indexes.get(tenant_id)
+            if index is MISSING:
+                index = ProductIndex()
+                _indexes.set(tenant_id, index)
+    return index
+
+
+def clear_product_indexes() -> None:
+    """Drop all tenant indexes (tests)."""
+    _indexes.clear()
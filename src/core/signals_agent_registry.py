@@ -25,9 +25,23 @@ Migration Note: Now uses official `adcp` library (v1.0.1) instead of custom MCP
 - ~100 lines of custom code replaced with official library
 - Custom auth headers now fully supported (was critical blocker)
 - Maintains backward compatibility with existing API
+
+Performance:
+- Agents are queried concurrently under an overall deadline; agents that have
+  not answered by then are dropped from the result (partial results).
+- Per-agent results are cached by normalized brief + deliver_to, and agents
+  that fail are skipped for a short period (negative caching).
+
+Environment variables:
+    ADCP_SIGNALS_DEADLINE: Seconds to wait for all agents (default 10)
+    ADCP_SIGNALS_CACHE_TTL: Seconds to reuse an agent's signals for the same brief (default 300, 0 disables)
+    ADCP_SIGNALS_FAILURE_TTL: Seconds to skip an agent after it fails (default 60, 0 disables)
 """
 
+import asyncio
+import json
 import logging
+import os
 from dataclasses import dataclass
 from typing import Any
 
@@ -35,8 +49,14 @@ from adcp import ADCPMultiAgentClient, AgentConfig, GetSignalsRequest, PlatformD
 from adcp.exceptions import ADCPAuthenticationError, ADCPConnectionError, ADCPError, ADCPTimeoutError
 from adcp.types import DeliverTo
 
+from src.core.utils.ttl_cache import MISSING, TTLCache
+
 logger = logging.getLogger(__name__)
 
+SIGNALS_DEADLINE_SECONDS = float(os.environ.get("ADCP_SIGNALS_DEADLINE", "10"))
+SIGNALS_CACHE_TTL_SECONDS = float(os.environ.get("ADCP_SIGNALS_CACHE_TTL", "300"))
+SIGNALS_FAILURE_TTL_SECONDS = float(os.environ.get("ADCP_SIGNALS_FAILURE_TTL", "60"))
+
 
 @dataclass
 class SignalsAgent:
@@ -71,7 +91,19 @@ class SignalsAgentRegistry:
 
     def __init__(self):
         """Initialize registry."""
-        pass  # No cache needed - adcp library handles connection pooling
+        # (tenant_id, agent_url, normalized brief, deliver_to) -> signals
+        self._signals_cache = TTLCache(maxsize=2048, ttl=SIGNALS_CACHE_TTL_SECONDS, name="signals_results")
+        # (tenant_id, agent_url) -> error message
+        self._failure_cache = TTLCache(maxsize=512, ttl=SIGNALS_FAILURE_TTL_SECONDS, name="signals_failures")
+
+    @staticmethod
+    def _cache_key(
+        tenant_id: str, agent: SignalsAgent, brief: str, context: dict[str, Any] | None
+    ) -> tuple[str, str, str, str]:
+        """Build the result cache key from the normalized brief and deliver_to."""
+        normalized_brief = " ".join(brief.lower().split())
+        deliver_to = json.dumps((context or {}).get("deliver_to"), sort_keys=True, default=str)
+        return (tenant_id, agent.agent_url, normalized_brief, deliver_to)
 
     def _get_tenant_agents(self, tenant_id: str) -> list[SignalsAgent]:
         """Get list of signals agents for a tenant.
@@ -284,7 +316,8 @@ class SignalsAgentRegistry:
             principal_data: Optional principal information
 
         Returns:
-            List of all signal objects across all agents
+            List of all signal objects across all agents. Agents that fail or
+            miss the overall deadline contribute no signals.
         """
         agents = self._get_tenant_agents(tenant_id)
         all_signals: list[dict[str, Any]] = []
@@ -294,30 +327,65 @@ class SignalsAgentRegistry:
         if not agents:
             return all_signals
 
-        # Build AdCP client for all agents and use as async context manager
-        client = self._build_adcp_client(agents)
-
-        # Use async context manager to ensure proper cleanup
-        async with client:
-            # Query each agent
-            for agent in agents:
-                logger.info(f"get_signals: Fetching from {agent.agent_url}")
-                try:
-                    signals = await self._get_signals_from_agent(
-                        client,
-                        agent,
-                        brief=brief,
-                        tenant_id=tenant_id,
-                        principal_id=principal_id,
-                        context=context,
-                        principal_data=principal_data,
+        # Serve cached results and skip recently failing agents; query the rest
+        results: dict[str, list[dict[str, Any]]] = {}
+        to_query: list[SignalsAgent] = []
+        for agent in agents:
+            cached = self._signals_cache.get(self._cache_key(tenant_id, agent, brief, context))
+            if cached is not MISSING:
+                results[agent.agent_url] = cached
+            elif (error := self._failure_cache.get((tenant_id, agent.agent_url))) is not MISSING:
+                logger.info(f"get_signals: Skipping {agent.agent_url}, failed recently: {error}")
+            else:
+                to_query.append(agent)
+
+        if to_query:
+            # Build AdCP client for the agents to query and use as async context manager
+            client = self._build_adcp_client(to_query)
+
+            # Use async context manager to ensure proper cleanup
+            async with client:
+                tasks = {
+                    asyncio.ensure_future(
+                        self._get_signals_from_agent(
+                            client,
+                            agent,
+                            brief=brief,
+                            tenant_id=tenant_id,
+                            principal_id=principal_id,
+                            context=context,
+                            principal_data=principal_data,
+                        )
+                    ): agent
+                    for agent in to_query
+                }
+                done, pending = await asyncio.wait(tasks, timeout=SIGNALS_DEADLINE_SECONDS)
+
+                for task in pending:
+                    # Slow agents don't hold up the others; they are retried on the next request
+                    task.cancel()
+                    logger.warning(
+                        f"get_signals: {tasks[task].agent_url} did not answer within {SIGNALS_DEADLINE_SECONDS}s"
                     )
+                if pending:
+                    await asyncio.wait(pending)
+
+                for task in done:
+                    agent = tasks[task]
+                    error = task.exception()
+                    if error is not None:
+                        # Log error but continue with other agents (graceful degradation)
+                        logger.error(f"Failed to fetch signals from {agent.agent_url}: {error}", exc_info=error)
+                        self._failure_cache.set((tenant_id, agent.agent_url), str(error))
+                        continue
+                    signals = task.result()
                     logger.info(f"get_signals: Got {len(signals)} signals from {agent.agent_url}")
-                    all_signals.extend(signals)
-                except Exception as e:
-                    # Log error but continue with other agents (graceful degradation)
-                    logger.error(f"Failed to fetch signals from {agent.agent_url}: {e}", exc_info=True)
-                    continue
+                    self._signals_cache.set(self._cache_key(tenant_id, agent, brief, context), signals)
+                    results[agent.agent_url] = signals
+
+        # Keep agent order stable regardless of completion order
+        for agent in agents:
+            all_signals.extend(dict(signal) for signal in results.get(agent.agent_url, []))
 
         logger.info(f"get_signals: Returning {len(all_signals)} total signals")
         return all_signals
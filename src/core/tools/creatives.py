@@ -7,10 +7,14 @@ Handles creative operations including:
 - Creative discovery and filtering
 """
 
+import asyncio
 import logging
+import os
 import time
 import uuid
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
+from functools import partial
 from typing import Any, cast
 
 from adcp import CreativeFilters, PushNotificationConfig
@@ -54,6 +58,263 @@ from src.core.schemas import (
 from src.core.validation_helpers import format_validation_error, run_async_in_sync_context
 
 
+# Maximum concurrent creative agent calls (format lookups, previews, builds) per sync_creatives request
+SYNC_CREATIVES_AGENT_CONCURRENCY = int(os.environ.get("ADCP_SYNC_CREATIVES_CONCURRENCY", "8"))
+
+
+async def _gather_bounded(calls: dict[Any, Callable[[], Awaitable[Any]]], limit: int) -> dict[Any, Any]:
+    """Run ``calls`` concurrently, at most ``limit`` at a time.
+
+    Returns each call's result, or the exception it raised, under its key.
+    """
+    semaphore = asyncio.Semaphore(max(limit, 1))
+
+    async def run(call: Callable[[], Awaitable[Any]]) -> Any:
+        async with semaphore:
+            return await call()
+
+    keys = list(calls)
+    results = await asyncio.gather(*(run(calls[key]) for key in keys), return_exceptions=True)
+    return dict(zip(keys, results, strict=True))
+
+
+def _call_result(results: dict[Any, Any], key: Any, call: Callable[[], Awaitable[Any]] | None) -> Any:
+    """Return a prefetched creative agent result, making the call now if it wasn't prefetched.
+
+    Returns None when nothing was prefetched and there is no call to make.
+    """
+    if key not in results:
+        return run_async_in_sync_context(call()) if call is not None else None
+    result = results[key]
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+def _validate_sync_creative(creative: dict, principal_id: str) -> Creative:
+    """Validate a synced creative against the schema and business rules.
+
+    Raises:
+        ValidationError: If the creative doesn't match the Creative schema
+        ValueError: If the name or format is missing
+    """
+    # Create temporary schema object for validation (AdCP v1 spec compliant)
+    # Only include AdCP spec fields + internal fields
+    schema_data = {
+        "creative_id": creative.get("creative_id") or str(uuid.uuid4()),
+        "name": creative.get("name", ""),  # Ensure name is never None
+        "format_id": creative.get("format_id") or creative.get("format"),  # Support both field names
+        "assets": creative.get("assets", {}),  # Required by AdCP v1 spec
+        # Internal fields (added by sales agent)
+        "principal_id": principal_id,
+        "created_at": datetime.now(UTC),
+        "updated_at": datetime.now(UTC),
+        "status": CreativeStatusEnum.pending_review.value,
+    }
+
+    # Add optional AdCP v1 fields if provided
+    if creative.get("inputs"):
+        schema_data["inputs"] = creative.get("inputs")
+    if creative.get("tags"):
+        schema_data["tags"] = creative.get("tags")
+    if creative.get("approved") is not None:
+        schema_data["approved"] = creative.get("approved")
+
+    # Validate by creating a Creative schema object
+    # This will fail if required fields are missing or invalid (like empty name)
+    # Also auto-upgrades string format_ids to FormatId objects via validator
+    validated_creative = Creative(**schema_data)
+
+    # Additional business logic validation
+    if not creative.get("name") or str(creative.get("name")).strip() == "":
+        raise ValueError("Creative name cannot be empty")
+
+    if not creative.get("format_id") and not creative.get("format"):
+        raise ValueError("Creative format is required")
+
+    return validated_creative
+
+
+def _creative_format_key(format_value: Any) -> tuple[str, str] | None:
+    """Return (agent_url, format_id) for a FormatId, or None if it has no agent reference."""
+    if hasattr(format_value, "agent_url") and hasattr(format_value, "id"):
+        return str(format_value.agent_url), format_value.id
+    return None
+
+
+def _check_creative_format(format_value: Any, format_specs: dict[Any, Any]) -> None:
+    """Check that a creative's format exists in its creative agent.
+
+    Args:
+        format_value: Validated FormatId
+        format_specs: get_format results (or exceptions) keyed by _creative_format_key
+
+    Raises:
+        ValueError: If the agent was unreachable or doesn't know the format
+    """
+    format_key = _creative_format_key(format_value)
+    if format_key is None:
+        return
+    agent_url, format_id = format_key
+    format_spec = format_specs.get(format_key)
+
+    if isinstance(format_spec, BaseException):
+        # Network error, agent unreachable, etc.
+        logger.warning(
+            f"Failed to fetch format '{format_id}' from agent {agent_url}: {format_spec}", exc_info=format_spec
+        )
+        raise ValueError(
+            f"Cannot validate format '{format_id}': Creative agent at {agent_url} "
+            f"is unreachable or returned an error. Please verify the agent URL is correct "
+            f"and the agent is running. Error: {str(format_spec)}"
+        )
+    if not format_spec:
+        # Format not found (agent is reachable but format doesn't exist)
+        raise ValueError(
+            f"Unknown format '{format_id}' from agent {agent_url}. "
+            f"Format must be registered with the creative agent. "
+            f"Use list_creative_formats to see available formats."
+        )
+    # TODO(#767): Call validate_creative when available in creative agent spec
+    # to validate that creative manifest matches format requirements
+
+
+def _extract_creative_url(creative: dict) -> str | None:
+    """Return the creative's URL, falling back to a URL from its assets."""
+    url = creative.get("url")
+    if not url and creative.get("assets"):
+        assets = creative["assets"]
+
+        # Priority 1: Try common asset_ids
+        for priority_key in ["main", "image", "video", "creative", "content"]:
+            if priority_key in assets and isinstance(assets[priority_key], dict):
+                url = assets[priority_key].get("url")
+                if url:
+                    logger.debug(f"[sync_creatives] Extracted URL from assets.{priority_key}.url")
+                    break
+
+        # Priority 2: First available asset URL
+        if not url:
+            for asset_id, asset_data in assets.items():
+                if isinstance(asset_data, dict) and asset_data.get("url"):
+                    url = asset_data["url"]
+                    logger.debug(f"[sync_creatives] Extracted URL from assets.{asset_id}.url (fallback)")
+                    break
+    return url
+
+
+def _creative_agent_call(
+    registry: Any, creative: dict, existing_creative: Any, all_formats: list[Any]
+) -> Callable[[], Awaitable[Any]] | None:
+    """Build the creative agent call that validates a synced creative.
+
+    Generative formats call build_creative, static formats call preview_creative.
+    Everything the call needs is read from ``creative`` and ``existing_creative`` up
+    front, so the call can run concurrently with others and outside the session.
+
+    Returns:
+        Zero-argument coroutine function, or None if no call is needed (unknown format,
+        no Gemini API key, or a generative update without a message)
+    """
+    creative_format = creative.get("format_id") or creative.get("format")
+    if not creative_format:
+        return None
+    format_obj = next((fmt for fmt in all_formats if fmt.format_id == creative_format), None)
+    if not format_obj or not format_obj.agent_url:
+        return None
+    agent_url = format_obj.agent_url
+
+    # Extract string ID from FormatId object if needed
+    format_id_str = creative_format.id if hasattr(creative_format, "id") else str(creative_format)
+
+    if getattr(format_obj, "output_format_ids", None):
+        from src.core.config import get_config
+
+        gemini_api_key = get_config().gemini_api_key
+        if not gemini_api_key:
+            return None
+
+        # Extract message/brief from assets or inputs
+        message = None
+        assets = creative.get("assets") or {}
+        for role, asset in assets.items():
+            if role in ["message", "brief", "prompt"] and isinstance(asset, dict):
+                message = asset.get("content") or asset.get("text")
+                break
+        if not message and creative.get("inputs"):
+            inputs = creative.get("inputs", [])
+            if inputs and isinstance(inputs[0], dict):
+                message = inputs[0].get("context_description")
+
+        # Extract promoted_offerings from assets if available
+        promoted_offerings = next(
+            (asset for role, asset in assets.items() if role == "promoted_offerings" and isinstance(asset, dict)),
+            None,
+        )
+
+        if existing_creative is not None:
+            # Updates only rebuild when given a message (refinement) and continue the existing context
+            if not message:
+                return None
+            creative_id = existing_creative.creative_id
+            build_format_id = creative_format
+            context_id = creative.get("context_id") or (existing_creative.data or {}).get("generative_context_id")
+        else:
+            if not message:
+                message = f"Create a creative for: {creative.get('name')}"
+                logger.warning("[sync_creatives] No message found in assets/inputs, using creative name as fallback")
+            creative_id = creative.get("creative_id")
+            build_format_id = format_id_str
+            context_id = creative.get("context_id")
+
+        async def build() -> Any:
+            logger.info(
+                f"[sync_creatives] Calling build_creative for {creative_id}: format {format_id_str} "
+                f"from agent {agent_url}, message_length={len(message)}, context_id={context_id}"
+            )
+            return await registry.build_creative(
+                agent_url=agent_url,
+                format_id=build_format_id,
+                message=message,
+                gemini_api_key=gemini_api_key,
+                promoted_offerings=promoted_offerings,
+                context_id=context_id,
+                finalize=creative.get("approved", False),
+            )
+
+        return build
+
+    # Static creative - build creative manifest from available data
+    if existing_creative is not None:
+        creative_id = existing_creative.creative_id
+        name = creative.get("name") or existing_creative.name
+    else:
+        creative_id = creative.get("creative_id") or str(uuid.uuid4())
+        name = creative.get("name")
+    url = _extract_creative_url(creative)
+
+    async def preview() -> Any:
+        creative_manifest = {"creative_id": creative_id, "name": name, "format_id": format_id_str}
+        # Add any provided asset data for validation
+        # Validate assets are in dict format (AdCP v2.4+)
+        if creative.get("assets"):
+            validated_assets = _validate_creative_assets(creative.get("assets"))
+            if validated_assets:
+                creative_manifest["assets"] = validated_assets
+        if url:
+            creative_manifest["url"] = url
+
+        logger.info(
+            f"[sync_creatives] Calling preview_creative for validation: {creative_id} format {format_id_str} "
+            f"from agent {agent_url}, has_assets={bool(creative.get('assets'))}, has_url={bool(url)}"
+        )
+        return await registry.preview_creative(
+            agent_url=agent_url, format_id=format_id_str, creative_manifest=creative_manifest
+        )
+
+    return preview
+
+
 def _sync_creatives_impl(
     creatives: list[dict],
     assignments: dict | None = None,
@@ -172,94 +433,86 @@ def _sync_creatives_impl(
     registry = get_creative_agent_registry()
     all_formats = run_async_in_sync_context(registry.list_all_formats(tenant_id=tenant["tenant_id"]))
 
-    with get_db_session() as session:
-        # Process each creative with proper transaction isolation
-        for creative in raw_creatives:
+    # Validate every creative up front (schema + business rules), then look up each
+    # distinct format once. Failures are reported per creative in payload order below.
+    validated: list[Creative | Exception] = []
+    for creative in raw_creatives:
+        try:
+            validated.append(_validate_sync_creative(creative, principal_id))
+        except (ValidationError, ValueError) as validation_error:
+            validated.append(validation_error)
+
+    format_lookups: dict[Any, Callable[[], Awaitable[Any]]] = {}
+    for outcome in validated:
+        format_key = None if isinstance(outcome, Exception) else _creative_format_key(outcome.format)
+        if format_key and format_key not in format_lookups:
+            format_lookups[format_key] = partial(registry.get_format, *format_key)
+    # Format lookups use the registry's in-memory cache (1-hour TTL)
+    format_specs = (
+        run_async_in_sync_context(_gather_bounded(format_lookups, SYNC_CREATIVES_AGENT_CONCURRENCY))
+        if format_lookups
+        else {}
+    )
+    for index, outcome in enumerate(validated):
+        if not isinstance(outcome, Exception):
             try:
-                # First, validate the creative against the schema before database operations
-                try:
-                    # Create temporary schema object for validation (AdCP v1 spec compliant)
-                    # Only include AdCP spec fields + internal fields
-                    schema_data = {
-                        "creative_id": creative.get("creative_id") or str(uuid.uuid4()),
-                        "name": creative.get("name", ""),  # Ensure name is never None
-                        "format_id": creative.get("format_id") or creative.get("format"),  # Support both field names
-                        "assets": creative.get("assets", {}),  # Required by AdCP v1 spec
-                        # Internal fields (added by sales agent)
-                        "principal_id": principal_id,
-                        "created_at": datetime.now(UTC),
-                        "updated_at": datetime.now(UTC),
-                        "status": CreativeStatusEnum.pending_review.value,
-                    }
-
-                    # Add optional AdCP v1 fields if provided
-                    if creative.get("inputs"):
-                        schema_data["inputs"] = creative.get("inputs")
-                    if creative.get("tags"):
-                        schema_data["tags"] = creative.get("tags")
-                    if creative.get("approved") is not None:
-                        schema_data["approved"] = creative.get("approved")
-
-                    # Validate by creating a Creative schema object
-                    # This will fail if required fields are missing or invalid (like empty name)
-                    # Also auto-upgrades string format_ids to FormatId objects via validator
-                    validated_creative = Creative(**schema_data)
-
-                    # Additional business logic validation
-                    if not creative.get("name") or str(creative.get("name")).strip() == "":
-                        raise ValueError("Creative name cannot be empty")
-
-                    if not creative.get("format_id") and not creative.get("format"):
-                        raise ValueError("Creative format is required")
-
-                    # Use validated format (auto-upgraded from string if needed)
-                    format_value = validated_creative.format
-
-                    # Validate format exists in creative agent
-                    # Extract agent_url and format_id from FormatId
-                    if hasattr(format_value, "agent_url") and hasattr(format_value, "id"):
-                        agent_url = str(format_value.agent_url)
-                        format_id = format_value.id
-
-                        # Check if format exists (uses in-memory cache with 1-hour TTL)
-                        # Use run_async_in_sync_context to handle both sync and async contexts
-                        format_spec = None
-                        validation_error = None
-
-                        try:
-                            format_spec = run_async_in_sync_context(registry.get_format(agent_url, format_id))
-                        except Exception as e:
-                            # Network error, agent unreachable, etc.
-                            validation_error = e
-                            logger.warning(
-                                f"Failed to fetch format '{format_id}' from agent {agent_url}: {e}", exc_info=True
-                            )
+                _check_creative_format(outcome.format, format_specs)
+            except ValueError as validation_error:
+                validated[index] = validation_error
 
-                        if validation_error:
-                            # Agent unreachable or network error
-                            raise ValueError(
-                                f"Cannot validate format '{format_id}': Creative agent at {agent_url} "
-                                f"is unreachable or returned an error. Please verify the agent URL is correct "
-                                f"and the agent is running. Error: {str(validation_error)}"
-                            )
-                        elif not format_spec:
-                            # Format not found (agent is reachable but format doesn't exist)
-                            raise ValueError(
-                                f"Unknown format '{format_id}' from agent {agent_url}. "
-                                f"Format must be registered with the creative agent. "
-                                f"Use list_creative_formats to see available formats."
-                            )
-                        # TODO(#767): Call validate_creative when available in creative agent spec
-                        # to validate that creative manifest matches format requirements
+    with get_db_session() as session:
+        from src.core.database.models import Creative as DBCreative
+
+        # Load existing creatives in one query (always check for upsert/patch behavior)
+        # SECURITY: Must filter by principal_id to prevent cross-principal modification
+        requested_ids = {
+            creative["creative_id"]
+            for creative, outcome in zip(raw_creatives, validated, strict=True)
+            if creative.get("creative_id") and not isinstance(outcome, Exception)
+        }
+        existing_by_id: dict[str, DBCreative] = {}
+        if requested_ids:
+            stmt = select(DBCreative).where(
+                DBCreative.tenant_id == tenant["tenant_id"],
+                DBCreative.principal_id == principal_id,
+                DBCreative.creative_id.in_(requested_ids),
+            )
+            existing_by_id = {row.creative_id: row for row in session.scalars(stmt).all()}
+
+        # Call creative agents (preview / build) for all valid creatives concurrently, outside any
+        # savepoint. Repeated creative_ids are left to the loop, as they depend on the earlier write.
+        agent_calls: dict[int, Callable[[], Awaitable[Any]]] = {}
+        seen_ids: set[str] = set()
+        for index, (creative, outcome) in enumerate(zip(raw_creatives, validated, strict=True)):
+            creative_id = creative.get("creative_id")
+            if creative_id in seen_ids or isinstance(outcome, Exception):
+                continue
+            if creative_id:
+                seen_ids.add(creative_id)
+            call = _creative_agent_call(
+                registry, creative, existing_by_id.get(creative_id) if creative_id else None, all_formats
+            )
+            if call:
+                agent_calls[index] = call
+        agent_results = (
+            run_async_in_sync_context(_gather_bounded(agent_calls, SYNC_CREATIVES_AGENT_CONCURRENCY))
+            if agent_calls
+            else {}
+        )
 
-                except (ValidationError, ValueError) as validation_error:
+        # Process each creative with proper transaction isolation
+        for index, creative in enumerate(raw_creatives):
+            try:
+                outcome = validated[index]
+                if isinstance(outcome, Exception):
                     # Creative failed validation - add to failed list
+                    error = outcome
                     creative_id = creative.get("creative_id", "unknown")
                     # Format ValidationError nicely for clients, pass through ValueError as-is
-                    if isinstance(validation_error, ValidationError):
-                        error_msg = format_validation_error(validation_error, context=f"creative {creative_id}")
+                    if isinstance(error, ValidationError):
+                        error_msg = format_validation_error(error, context=f"creative {creative_id}")
                     else:
-                        error_msg = str(validation_error)
+                        error_msg = str(error)
                     failed_creatives.append({"creative_id": creative_id, "error": error_msg})
                     failed_count += 1
                     results.append(
@@ -276,21 +529,14 @@ def _sync_creatives_impl(
                     )
                     continue  # Skip to next creative
 
+                # Use validated format (auto-upgraded from string if needed)
+                format_value = outcome.format
+
                 # Use savepoint for individual creative transaction isolation
                 with session.begin_nested():
-                    # Check if creative already exists (always check for upsert/patch behavior)
-                    # SECURITY: Must filter by principal_id to prevent cross-principal modification
-                    existing_creative = None
-                    if creative.get("creative_id"):
-                        from src.core.database.models import Creative as DBCreative
-
-                        # Query for existing creative with security filter
-                        stmt = select(DBCreative).filter_by(
-                            tenant_id=tenant["tenant_id"],
-                            principal_id=principal_id,  # SECURITY: Prevent cross-principal modification
-                            creative_id=creative.get("creative_id"),
-                        )
-                        existing_creative = session.scalars(stmt).first()
+                    existing_creative = (
+                        existing_by_id.get(creative["creative_id"]) if creative.get("creative_id") else None
+                    )
 
                     if existing_creative:
                         # Update existing creative with upsert semantics (AdCP 2.5)
@@ -381,29 +627,7 @@ def _sync_creatives_impl(
                         # AdCP 2.5: Full upsert semantics (replace all data, not merge)
                         # Extract URL from assets if not provided at top level
                         # Use same priority logic as schema_data above
-                        url = creative.get("url")
-                        if not url and creative.get("assets"):
-                            assets = creative["assets"]
-
-                            # Priority 1: Try common asset_ids
-                            for priority_key in ["main", "image", "video", "creative", "content"]:
-                                if priority_key in assets and isinstance(assets[priority_key], dict):
-                                    url = assets[priority_key].get("url")
-                                    if url:
-                                        logger.debug(
-                                            f"[sync_creatives] Extracted URL from assets.{priority_key}.url for data storage"
-                                        )
-                                        break
-
-                            # Priority 2: First available asset URL
-                            if not url:
-                                for asset_id, asset_data in assets.items():
-                                    if isinstance(asset_data, dict) and asset_data.get("url"):
-                                        url = asset_data["url"]
-                                        logger.debug(
-                                            f"[sync_creatives] Extracted URL from assets.{asset_id}.url for data storage (fallback)"
-                                        )
-                                        break
+                        url = _extract_creative_url(creative)
 
                         data = {
                             "url": url,
@@ -446,10 +670,7 @@ def _sync_creatives_impl(
                                         # Get Gemini API key from config
                                         from src.core.config import get_config
 
-                                        config = get_config()
-                                        gemini_api_key = config.gemini_api_key
-
-                                        if not gemini_api_key:
+                                        if not get_config().gemini_api_key:
                                             error_msg = (
                                                 f"Cannot update generative creative {creative_format}: "
                                                 f"GEMINI_API_KEY not configured"
@@ -457,58 +678,12 @@ def _sync_creatives_impl(
                                             logger.error(f"[sync_creatives] {error_msg}")
                                             raise ValueError(error_msg)
 
-                                        # Extract message/brief from assets or inputs
-                                        message = None
-                                        if creative.get("assets"):
-                                            assets = creative.get("assets", {})
-                                            for role, asset in assets.items():
-                                                if role in ["message", "brief", "prompt"] and isinstance(asset, dict):
-                                                    message = asset.get("content") or asset.get("text")
-                                                    break
-
-                                        if not message and creative.get("inputs"):
-                                            inputs = creative.get("inputs", [])
-                                            if inputs and isinstance(inputs[0], dict):
-                                                message = inputs[0].get("context_description")
-
-                                        # Extract promoted_offerings from assets if available
-                                        promoted_offerings = None
-                                        if creative.get("assets"):
-                                            assets = creative.get("assets", {})
-                                            for role, asset in assets.items():
-                                                if role == "promoted_offerings" and isinstance(asset, dict):
-                                                    promoted_offerings = asset
-                                                    break
-
-                                        # Get existing context_id for refinement
-                                        existing_context_id = None
-                                        if existing_creative.data:
-                                            existing_context_id = existing_creative.data.get("generative_context_id")
-
-                                        # Use provided context_id or existing one
-                                        context_id = creative.get("context_id") or existing_context_id
-
                                         # Only call build_creative if we have a message (refinement)
-                                        if message:
-                                            logger.info(
-                                                f"[sync_creatives] Calling build_creative for update: "
-                                                f"{existing_creative.creative_id} format {creative_format} "
-                                                f"from agent {format_obj.agent_url}, "
-                                                f"message_length={len(message) if message else 0}, "
-                                                f"context_id={context_id}"
-                                            )
-
-                                            build_result = run_async_in_sync_context(
-                                                registry.build_creative(
-                                                    agent_url=format_obj.agent_url,
-                                                    format_id=creative_format,
-                                                    message=message,
-                                                    gemini_api_key=gemini_api_key,
-                                                    promoted_offerings=promoted_offerings,
-                                                    context_id=context_id,
-                                                    finalize=creative.get("approved", False),
-                                                )
-                                            )
+                                        build_call = agent_calls.get(index) or _creative_agent_call(
+                                            registry, creative, existing_creative, all_formats
+                                        )
+                                        if build_call:
+                                            build_result = _call_result(agent_results, index, build_call)
 
                                             # Store build result in data
                                             if build_result:
@@ -569,49 +744,13 @@ def _sync_creatives_impl(
                                         # Skip preview_creative call since we already have the output
                                         preview_result = None
                                     else:
-                                        # Static creative - use preview_creative
-                                        # Build creative manifest from available data
-                                        # Extract string ID from FormatId object if needed
-                                        format_id_str = (
-                                            creative_format.id
-                                            if hasattr(creative_format, "id")
-                                            else str(creative_format)
-                                        )
-                                        creative_manifest = {
-                                            "creative_id": existing_creative.creative_id,
-                                            "name": creative.get("name") or existing_creative.name,
-                                            "format_id": format_id_str,
-                                        }
-
-                                        # Add any provided asset data for validation
-                                        # Validate assets are in dict format (AdCP v2.4+)
-                                        if creative.get("assets"):
-                                            validated_assets = _validate_creative_assets(creative.get("assets"))
-                                            if validated_assets:
-                                                creative_manifest["assets"] = validated_assets
-                                        if data.get("url"):
-                                            creative_manifest["url"] = data.get("url")
-
-                                        # Call creative agent's preview_creative for validation + preview
-                                        # Extract string ID from FormatId object if needed
-                                        format_id_str = (
-                                            creative_format.id
-                                            if hasattr(creative_format, "id")
-                                            else str(creative_format)
-                                        )
-                                        logger.info(
-                                            f"[sync_creatives] Calling preview_creative for validation (update): "
-                                            f"{existing_creative.creative_id} format {format_id_str} "
-                                            f"from agent {format_obj.agent_url}, has_assets={bool(creative.get('assets'))}, "
-                                            f"has_url={bool(data.get('url'))}"
-                                        )
-
-                                        preview_result = run_async_in_sync_context(
-                                            registry.preview_creative(
-                                                agent_url=format_obj.agent_url,
-                                                format_id=format_id_str,
-                                                creative_manifest=creative_manifest,
-                                            )
+                                        # Static creative - call creative agent's preview_creative
+                                        # for validation + preview
+                                        preview_result = _call_result(
+                                            agent_results,
+                                            index,
+                                            agent_calls.get(index)
+                                            or _creative_agent_call(registry, creative, existing_creative, all_formats),
                                         )
 
                                     # Extract preview data and store in data field
@@ -781,36 +920,12 @@ def _sync_creatives_impl(
 
                     else:
                         # Create new creative
-                        from src.core.database.models import Creative as DBCreative
-
                         # Extract creative_id for error reporting (must be defined before any validation)
                         creative_id = creative.get("creative_id", "unknown")
 
                         # Prepare data field with all creative properties
                         # Extract URL from assets if not provided at top level
-                        url = creative.get("url")
-                        if not url and creative.get("assets"):
-                            assets = creative["assets"]
-
-                            # Priority 1: Try common asset_ids
-                            for priority_key in ["main", "image", "video", "creative", "content"]:
-                                if priority_key in assets and isinstance(assets[priority_key], dict):
-                                    url = assets[priority_key].get("url")
-                                    if url:
-                                        logger.debug(
-                                            f"[sync_creatives] Extracted URL from assets.{priority_key}.url for create"
-                                        )
-                                        break
-
-                            # Priority 2: First available asset URL
-                            if not url:
-                                for asset_id, asset_data in assets.items():
-                                    if isinstance(asset_data, dict) and asset_data.get("url"):
-                                        url = asset_data["url"]
-                                        logger.debug(
-                                            f"[sync_creatives] Extracted URL from assets.{asset_id}.url for create (fallback)"
-                                        )
-                                        break
+                        url = _extract_creative_url(creative)
 
                         data = {
                             "url": url,
@@ -861,10 +976,7 @@ def _sync_creatives_impl(
                                         # Get Gemini API key from config
                                         from src.core.config import get_config
 
-                                        config = get_config()
-                                        gemini_api_key = config.gemini_api_key
-
-                                        if not gemini_api_key:
+                                        if not get_config().gemini_api_key:
                                             error_msg = (
                                                 f"Cannot build generative creative {creative_format}: "
                                                 f"GEMINI_API_KEY not configured"
@@ -872,59 +984,11 @@ def _sync_creatives_impl(
                                             logger.error(f"[sync_creatives] {error_msg}")
                                             raise ValueError(error_msg)
 
-                                        # Extract message/brief from assets or inputs
-                                        message = None
-                                        if creative.get("assets"):
-                                            assets = creative.get("assets", {})
-                                            for role, asset in assets.items():
-                                                if role in ["message", "brief", "prompt"] and isinstance(asset, dict):
-                                                    message = asset.get("content") or asset.get("text")
-                                                    break
-
-                                        if not message and creative.get("inputs"):
-                                            inputs = creative.get("inputs", [])
-                                            if inputs and isinstance(inputs[0], dict):
-                                                message = inputs[0].get("context_description")
-
-                                        if not message:
-                                            message = f"Create a creative for: {creative.get('name')}"
-                                            logger.warning(
-                                                "[sync_creatives] No message found in assets/inputs, "
-                                                "using creative name as fallback"
-                                            )
-
-                                        # Extract promoted_offerings from assets if available
-                                        promoted_offerings = None
-                                        if creative.get("assets"):
-                                            assets = creative.get("assets", {})
-                                            for role, asset in assets.items():
-                                                if role == "promoted_offerings" and isinstance(asset, dict):
-                                                    promoted_offerings = asset
-                                                    break
-
-                                        # Call build_creative
-                                        # Extract string ID from FormatId object if needed
-                                        format_id_str = (
-                                            creative_format.id
-                                            if hasattr(creative_format, "id")
-                                            else str(creative_format)
-                                        )
-                                        logger.info(
-                                            f"[sync_creatives] Calling build_creative for generative format: "
-                                            f"{format_id_str} from agent {format_obj.agent_url}, "
-                                            f"message_length={len(message) if message else 0}"
-                                        )
-
-                                        build_result = run_async_in_sync_context(
-                                            registry.build_creative(
-                                                agent_url=format_obj.agent_url,
-                                                format_id=format_id_str,
-                                                message=message,
-                                                gemini_api_key=gemini_api_key,
-                                                promoted_offerings=promoted_offerings,
-                                                context_id=creative.get("context_id"),
-                                                finalize=creative.get("approved", False),
-                                            )
+                                        build_result = _call_result(
+                                            agent_results,
+                                            index,
+                                            agent_calls.get(index)
+                                            or _creative_agent_call(registry, creative, existing_creative, all_formats),
                                         )
 
                                         # Store build result
@@ -974,48 +1038,13 @@ def _sync_creatives_impl(
                                         # Skip preview_creative call since we already have the output
                                         preview_result = None
                                     else:
-                                        # Static creative - use preview_creative
-                                        # Build creative manifest from available data
-                                        # Extract string ID from FormatId object if needed
-                                        format_id_str = (
-                                            creative_format.id
-                                            if hasattr(creative_format, "id")
-                                            else str(creative_format)
-                                        )
-                                        creative_manifest = {
-                                            "creative_id": creative.get("creative_id") or str(uuid.uuid4()),
-                                            "name": creative.get("name"),
-                                            "format_id": format_id_str,
-                                        }
-
-                                        # Add any provided asset data for validation
-                                        # Validate assets are in dict format (AdCP v2.4+)
-                                        if creative.get("assets"):
-                                            validated_assets = _validate_creative_assets(creative.get("assets"))
-                                            if validated_assets:
-                                                creative_manifest["assets"] = validated_assets
-                                        if data.get("url"):
-                                            creative_manifest["url"] = data.get("url")
-
-                                        # Call creative agent's preview_creative for validation + preview
-                                        # Extract string ID from FormatId object if needed
-                                        format_id_str = (
-                                            creative_format.id
-                                            if hasattr(creative_format, "id")
-                                            else str(creative_format)
-                                        )
-                                        logger.info(
-                                            f"[sync_creatives] Calling preview_creative for validation: {format_id_str} "
-                                            f"from agent {format_obj.agent_url}, has_assets={bool(creative.get('assets'))}, "
-                                            f"has_url={bool(data.get('url'))}"
-                                        )
-
-                                        preview_result = run_async_in_sync_context(
-                                            registry.preview_creative(
-                                                agent_url=format_obj.agent_url,
-                                                format_id=format_id_str,
-                                                creative_manifest=creative_manifest,
-                                            )
+                                        # Static creative - call creative agent's preview_creative
+                                        # for validation + preview
+                                        preview_result = _call_result(
+                                            agent_results,
+                                            index,
+                                            agent_calls.get(index)
+                                            or _creative_agent_call(registry, creative, existing_creative, all_formats),
                                         )
 
                                     # Extract preview data and store in data field
@@ -1234,6 +1263,10 @@ def _sync_creatives_impl(
                     # If we reach here, creative processing succeeded
                     synced_creatives.append(creative)
 
+                if not existing_creative:
+                    # Later entries with the same creative_id update this row
+                    existing_by_id[db_creative.creative_id] = db_creative
+
             except Exception as e:
                 # Savepoint automatically rolls back this creative only
                 creative_id = creative.get("creative_id", "unknown")
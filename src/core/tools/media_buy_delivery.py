@@ -165,6 +165,20 @@ def _get_media_buy_delivery_impl(
         and buy.raw_request.get("pricing_option_id") is not None
     ]
     pricing_options = _get_pricing_options(pricing_option_ids)
+    package_pricing_by_buy = _get_package_pricing([media_buy_id for media_buy_id, _ in target_media_buys])
+
+    # Fetch adapter delivery for all media buys in one batch (simulated in testing mode)
+    use_adapter = not any(
+        [testing_ctx.dry_run, testing_ctx.mock_time, testing_ctx.jump_to_event, testing_ctx.test_session_id]
+    )
+    adapter_deliveries: dict[str, Any] = {}
+    if use_adapter and target_media_buys:
+        # Note: Mock adapter returns simulated data, GAM adapter returns real data from Reporting API
+        adapter_deliveries = adapter.get_media_buys_delivery(
+            [media_buy_id for media_buy_id, _ in target_media_buys],
+            date_range=reporting_period,
+            today=end_dt,
+        )
 
     # Collect delivery data for each media buy
     deliveries = []
@@ -210,17 +224,12 @@ def _get_media_buy_delivery_impl(
             total_spend_from_adapter = 0.0
             total_impressions_from_adapter = 0
 
-            if not any(
-                [testing_ctx.dry_run, testing_ctx.mock_time, testing_ctx.jump_to_event, testing_ctx.test_session_id]
-            ):
-                # Call adapter to get per-package delivery metrics
-                # Note: Mock adapter returns simulated data, GAM adapter returns real data from Reporting API
+            if use_adapter:
+                # Per-package delivery metrics from the batched adapter call
                 try:
-                    adapter_response = adapter.get_media_buy_delivery(
-                        media_buy_id=media_buy_id,
-                        date_range=reporting_period,
-                        today=simulation_datetime,
-                    )
+                    adapter_response = adapter_deliveries[media_buy_id]
+                    if isinstance(adapter_response, Exception):
+                        raise adapter_response
 
                     # Map adapter's by_package to package_id -> metrics
                     for adapter_pkg in adapter_response.by_package:
@@ -278,16 +287,8 @@ def _get_media_buy_delivery_impl(
             # Create package delivery data
             package_deliveries = []
 
-            # Get pricing info from MediaPackage.package_config
-            package_pricing_map = {}
-            with get_db_session() as session:
-                media_package_stmt = select(MediaPackage).where(MediaPackage.media_buy_id == media_buy_id)
-                media_packages = session.scalars(media_package_stmt).all()
-                for media_pkg in media_packages:
-                    package_config = media_pkg.package_config or {}
-                    pricing_info = package_config.get("pricing_info")
-                    if pricing_info:
-                        package_pricing_map[media_pkg.package_id] = pricing_info
+            # Get pricing info from MediaPackage.package_config (prefetched for all media buys)
+            package_pricing_map = package_pricing_by_buy.get(media_buy_id, {})
 
             # Get packages from raw_request
             if buy.raw_request and isinstance(buy.raw_request, dict):
@@ -687,3 +688,19 @@ def _get_pricing_options(pricing_option_ids: list[Any | None]) -> dict[str, Pric
         statement = select(PricingOption).where(PricingOption.id.in_(pricing_option_ids))
         pricing_options = session.scalars(statement).all()
         return {str(pricing_option.id): pricing_option for pricing_option in pricing_options}
+
+
+def _get_package_pricing(media_buy_ids: list[str]) -> dict[str, dict[str, Any]]:
+    """Load MediaPackage pricing_info for all media buys in one query: media_buy_id -> package_id -> pricing_info."""
+    package_pricing: dict[str, dict[str, Any]] = {}
+    if not media_buy_ids:
+        return package_pricing
+    with get_db_session() as session:
+        statement = select(MediaPackage.media_buy_id, MediaPackage.package_id, MediaPackage.package_config).where(
+            MediaPackage.media_buy_id.in_(media_buy_ids)
+        )
+        for media_buy_id, package_id, package_config in session.execute(statement):
+            pricing_info = (package_config or {}).get("pricing_info")
+            if pricing_info:
+                package_pricing.setdefault(media_buy_id, {})[package_id] = pricing_info
+    return package_pricing
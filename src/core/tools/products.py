@@ -19,15 +19,12 @@ from fastmcp.exceptions import ToolError
 from fastmcp.server.context import Context
 from fastmcp.tools.tool import ToolResult
 from pydantic import ValidationError
-from sqlalchemy import select
-
-# Imports for implementation
-from sqlalchemy.orm import joinedload
 
 from src.core.audit_logger import get_audit_logger
 from src.core.auth import get_principal_from_context, get_principal_object
 from src.core.config_loader import set_current_tenant
 from src.core.database.database_session import get_db_session
+from src.core.product_index import ProductIndex, get_product_index
 from src.core.schema_helpers import create_get_products_request
 from src.core.schemas import (
     GetProductsResponse,
@@ -367,70 +364,37 @@ async def _get_products_impl(
             f"Request violates content policy: {policy_result.reason}. Restrictions: {', '.join(restrictions_list)}",
         )
 
-    # Query products directly from database
-    # This replaces the product_catalog_providers abstraction with simple direct access
-    from src.core.database.models import Product as ProductModel
+    # Load the tenant's converted catalog; it is cached per process and reused until
+    # the tenant's product_catalog_version changes (see src/core/product_catalog.py)
+    from src.core.product_catalog import load_product_catalog
 
     with get_db_session() as db_session:
-        stmt = (
-            select(ProductModel)
-            .options(joinedload(ProductModel.pricing_options), joinedload(ProductModel.tenant))
-            .filter_by(tenant_id=tenant["tenant_id"])
-            .order_by(ProductModel.product_id)
-        )
-        result = db_session.execute(stmt).unique()
-        db_products = list(result.scalars().all())
-
-        # Convert database Product models to AdCP Product schema
-        products = []
-        for product_obj in db_products:
-            try:
-                validated_product = convert_product_model_to_schema(product_obj)
-                products.append(validated_product)
-                logger.debug(f"Successfully converted product {product_obj.product_id}")
-            except Exception as e:
-                error_msg = (
-                    f"Product '{product_obj.product_id}' failed to convert to AdCP schema. "
-                    f"This indicates data corruption or migration issue. Error: {e}"
-                )
-                logger.error(error_msg)
-                raise ValueError(error_msg) from e
+        catalog = load_product_catalog(db_session, tenant["tenant_id"])
+    products = list(catalog.products)
 
     logger.info(f"[GET_PRODUCTS] Got {len(products)} products from database for tenant {tenant['tenant_id']}")
 
-    # Filter products by principal access control
-    # Products with allowed_principal_ids set are only visible to those specific principals
-    # Products with null/empty allowed_principal_ids are visible to all (default)
-    if principal_id:
-        filtered_by_access = []
-        for product in products:
-            # Check if product has access restrictions
-            allowed_ids = getattr(product, "allowed_principal_ids", None)
-            if allowed_ids is None or len(allowed_ids) == 0:
-                # No restrictions - visible to all
-                filtered_by_access.append(product)
-            elif principal_id in allowed_ids:
-                # Principal is in the allowed list
-                filtered_by_access.append(product)
-            else:
-                # Principal not in allowed list - skip this product
-                logger.debug(f"Product {product.product_id} hidden from principal {principal_id} (not in allowed list)")
-        products = filtered_by_access
-        logger.info(f"[GET_PRODUCTS] After principal access filtering: {len(products)} products")
-    else:
-        # No principal authenticated - only show unrestricted products
-        # This handles anonymous/discovery requests
-        filtered_by_access = []
-        for product in products:
-            allowed_ids = getattr(product, "allowed_principal_ids", None)
-            if allowed_ids is None or len(allowed_ids) == 0:
-                # No restrictions - visible to anonymous users
-                filtered_by_access.append(product)
-            else:
-                # Product has restrictions - hide from anonymous users
-                logger.debug(f"Product {product.product_id} hidden from anonymous user (has access restrictions)")
-        products = filtered_by_access
-        logger.info(f"[GET_PRODUCTS] After anonymous access filtering: {len(products)} products")
+    # Principal access control and catalog-level filters are answered from the tenant's
+    # product index: products with allowed_principal_ids set are only visible to those
+    # principals, and anonymous requests only see unrestricted products
+    adapter_channels: list[str] = []
+    if req.filters and req.filters.channels:
+        # Products without explicit channels are matched against the adapter's defaults
+        ad_server_config = tenant.get("ad_server", {})
+        adapter_type = (
+            ad_server_config.get("adapter", "mock") if isinstance(ad_server_config, dict) else ad_server_config
+        )
+        adapter_channels = get_adapter_default_channels(adapter_type)
+
+    matched, visible_count = get_product_index(tenant["tenant_id"]).query(
+        products, principal_id, req.filters, adapter_channels
+    )
+    logger.info(
+        f"[GET_PRODUCTS] After {'principal' if principal_id else 'anonymous'} access filtering: "
+        f"{visible_count} products"
+    )
+    # Catalog products are shared with other requests; copy the ones this request may modify
+    products = [product.model_copy(deep=True) for product in matched]
 
     # Generate dynamic product variants from signals agents
     try:
@@ -442,15 +406,16 @@ async def _get_products_impl(
         dynamic_variants = await generate_variants_for_brief(tenant["tenant_id"], brief_text, our_agent_url)
         if dynamic_variants:
             # Convert Product models to Product schemas for response
+            variant_schemas = [convert_product_model_to_schema(variant_model) for variant_model in dynamic_variants]
 
-            for variant_model in dynamic_variants:
-                # Convert database model to schema (returns library Product)
-                # Cast to our extended Product type for mypy compatibility
-                variant_schema = convert_product_model_to_schema(variant_model)
-                # Type: ignore - library Product is compatible with our extended Product at runtime
-                products.append(variant_schema)
+            # Variants are generated per brief, so they get a throwaway index for the request filters
+            if req.filters:
+                variant_index = ProductIndex()
+                variant_index.sync(variant_schemas)
+                variant_schemas = variant_index.products(variant_index.matching(req.filters, adapter_channels))
 
-            logger.info(f"[GET_PRODUCTS] Added {len(dynamic_variants)} dynamic product variants")
+            products.extend(variant_schemas)
+            logger.info(f"[GET_PRODUCTS] Added {len(variant_schemas)} dynamic product variants")
     except Exception as e:
         logger.warning(f"Failed to generate dynamic product variants: {e}. Continuing with static products only.")
 
@@ -477,161 +442,15 @@ async def _get_products_impl(
 
     # Apply AdCP filters if provided
     if req.filters:
-        filtered_products = []
-        for product in products:
-            # Filter by delivery_type
-            if req.filters.delivery_type and product.delivery_type != req.filters.delivery_type:
-                continue
-
-            # Filter by is_fixed_price (check pricing_options)
-            if req.filters.is_fixed_price is not None:
-                # Check if product has any pricing option matching the fixed/auction filter
-                # Use getattr for discriminated union field access
-                has_matching_pricing = any(
-                    getattr(po, "is_fixed", None) == req.filters.is_fixed_price for po in product.pricing_options
-                )
-                if not has_matching_pricing:
-                    continue
-
-            # Filter by format_types
-            if req.filters.format_types:
-                # Product.format_ids is list[str] (format IDs), need to look up types from FORMAT_REGISTRY
-                from src.core.schemas import get_format_by_id
-
-                product_format_types = set()
-                for format_id in product.format_ids:
-                    if isinstance(format_id, str):
-                        format_obj = get_format_by_id(format_id)
-                        if format_obj:
-                            product_format_types.add(format_obj.type)
-                    elif hasattr(format_id, "type"):
-                        # Already a Format object
-                        product_format_types.add(format_id.type)
-
-                if not any(fmt_type in product_format_types for fmt_type in req.filters.format_types):
-                    continue
-
-            # Filter by format_ids
-            if req.filters.format_ids:
-                # Product.format_ids is list[str] or list[dict] (format IDs)
-                product_format_ids: set[str] = set()
-                for format_id in product.format_ids:
-                    if isinstance(format_id, str):
-                        product_format_ids.add(format_id)
-                    elif isinstance(format_id, dict):
-                        # Dict with 'id' key (from database)
-                        dict_id = format_id.get("id")
-                        if dict_id is not None:
-                            product_format_ids.add(dict_id)
-                    elif hasattr(format_id, "id"):
-                        # FormatId object (has .id attribute, not .format_id)
-                        product_format_ids.add(format_id.id)
-
-                # req.filters.format_ids contains FormatId objects, extract .id from them
-                request_format_ids: set[str] = set()
-                for fmt_id in req.filters.format_ids:
-                    if isinstance(fmt_id, str):
-                        request_format_ids.add(fmt_id)
-                    elif hasattr(fmt_id, "id"):
-                        # FormatId object
-                        request_format_ids.add(fmt_id.id)
-                    elif isinstance(fmt_id, dict):
-                        dict_id = fmt_id.get("id")
-                        if dict_id is not None:
-                            request_format_ids.add(dict_id)
-
-                if not any(fmt_id in product_format_ids for fmt_id in request_format_ids):
-                    continue
-
-            # Filter by standard_formats_only
-            if req.filters.standard_formats_only:
-                # Check if all formats are IAB standard formats
-                # IAB standard formats typically follow patterns like "display_", "video_", "audio_", "native_"
-                has_only_standard = True
-                for format_id in product.format_ids:
-                    format_id_str: str | None = None
-                    if isinstance(format_id, str):
-                        format_id_str = format_id
-                    elif isinstance(format_id, dict):
-                        format_id_str = format_id.get("id")
-                    elif hasattr(format_id, "id"):
-                        # FormatId object (has .id attribute, not .format_id)
-                        format_id_str = format_id.id
-
-                    if format_id_str and not format_id_str.startswith(("display_", "video_", "audio_", "native_")):
-                        has_only_standard = False
-                        break
-
-                if not has_only_standard:
-                    continue
-
-            # Filter by countries
-            if req.filters.countries:
-                # Get product's countries from the placements or targeting
-                product_countries: set[str] = set()
-
-                # Check if product has countries field (from database)
-                # Our extended Product may have a countries field
-                if hasattr(product, "countries") and product.countries:
-                    product_countries.update(product.countries)
-
-                # If no countries specified, product is considered available everywhere
-                if not product_countries:
-                    # Product has no country restrictions, matches any country filter
-                    pass
-                else:
-                    # Extract country codes from filter (Country is a RootModel[str])
-                    request_countries: set[str] = set()
-                    for country in req.filters.countries:
-                        if isinstance(country, str):
-                            request_countries.add(country.upper())
-                        elif hasattr(country, "root"):
-                            # RootModel - access .root for the string value
-                            request_countries.add(country.root.upper())
-
-                    # Check if any requested country is in the product's countries
-                    if not product_countries.intersection(request_countries):
-                        continue
-
-            # Filter by channels
-            if req.filters.channels:
-                # Check if product has channels field
-                product_channels: set[str] = set()
-                if hasattr(product, "channels") and product.channels:
-                    product_channels = {c.lower() for c in product.channels}
-
-                # Extract channel values from filter (enum values)
-                request_channels: set[str] = set()
-                for channel in req.filters.channels:
-                    if isinstance(channel, str):
-                        request_channels.add(channel.lower())
-                    elif hasattr(channel, "value"):
-                        # Enum - access .value
-                        request_channels.add(channel.value.lower())
-
-                if product_channels:
-                    # Product has explicit channels - must have at least one match
-                    if not product_channels.intersection(request_channels):
-                        continue
-                else:
-                    # Product has no channels - use adapter defaults
-                    # Get adapter type from tenant config
-                    ad_server_config = tenant.get("ad_server", {})
-                    adapter_type = (
-                        ad_server_config.get("adapter", "mock")
-                        if isinstance(ad_server_config, dict)
-                        else ad_server_config
-                    )
-                    adapter_channels = get_adapter_default_channels(adapter_type)
-
-                    # Product matches if any of adapter's default channels is in request
-                    if adapter_channels and not request_channels.intersection(set(adapter_channels)):
-                        continue
-
-            # Product passed all filters
-            filtered_products.append(product)
-
-        products = filtered_products
+        # Catalog-level filters were applied through the product index above; is_fixed_price
+        # is checked here because dynamic pricing may have added a pricing option
+        if req.filters.is_fixed_price is not None:
+            # Use getattr for discriminated union field access
+            products = [
+                product
+                for product in products
+                if any(getattr(po, "is_fixed", None) == req.filters.is_fixed_price for po in product.pricing_options)
+            ]
         logger.info(f"Applied filters: {req.filters.model_dump(exclude_none=True)}. {len(products)} products remain.")
 
     # Filter products based on policy compliance (if policy checks are enabled)
@@ -681,49 +500,48 @@ async def _get_products_impl(
     product_ranking_prompt = tenant.get("product_ranking_prompt")
     if product_ranking_prompt and brief_text and eligible_products:
         try:
-            from src.services.ai.agents.ranking_agent import (
-                create_ranking_agent,
-                rank_products_async,
-            )
             from src.services.ai.factory import get_factory
+            from src.services.product_ranking_service import get_catalog_digests, get_ranking_agent, rank_products
 
             factory = get_factory()
             if factory.is_ai_enabled():
-                model = factory.create_model()
-                agent = create_ranking_agent(model)
-
-                # Convert products to dicts for ranking
-                products_for_ranking = [p.model_dump() for p in eligible_products]
-
-                # Run AI ranking
-                ranking_result = await rank_products_async(
-                    agent=agent,
+                # Scores are cached per (tenant, prompt, brief, catalog version); with a latency
+                # budget configured, None means the model did not answer in time
+                ranking_map = await rank_products(
+                    agent=get_ranking_agent(factory),
+                    tenant_id=tenant["tenant_id"],
+                    catalog_version=catalog.version,
                     custom_prompt=product_ranking_prompt,
                     brief=brief_text,
-                    products=products_for_ranking,
+                    products=eligible_products,
+                    catalog_digests=get_catalog_digests(tenant["tenant_id"], catalog.version, catalog.products),
                 )
 
-                # Build a map of product_id -> (score, reason)
-                ranking_map = {r.product_id: (r.relevance_score, r.reason) for r in ranking_result.rankings}
-
-                # Sort products by relevance score (highest first)
-                # Products not in ranking_map get score 0
-                eligible_products.sort(
-                    key=lambda p: ranking_map.get(p.product_id, (0.0, ""))[0],
-                    reverse=True,
-                )
-
-                # Filter out products with very low relevance (score < 0.1)
-                eligible_products = [p for p in eligible_products if ranking_map.get(p.product_id, (0.0, ""))[0] >= 0.1]
+                if ranking_map is None:
+                    logger.info("[GET_PRODUCTS] AI ranking exceeded latency budget, returning products unranked")
+                else:
+                    # Log the ranking results
+                    for product in eligible_products:
+                        score, reason = ranking_map.get(product.product_id, (0.0, ""))
+                        logger.info(f"[AI_RANKING] {product.product_id}: score={score:.2f}, reason={reason}")
+                    ranked_count = len(eligible_products)
+
+                    # Sort products by relevance score (highest first)
+                    # Products not in ranking_map get score 0
+                    eligible_products.sort(
+                        key=lambda p: ranking_map.get(p.product_id, (0.0, ""))[0],
+                        reverse=True,
+                    )
 
-                # Log the ranking results
-                for r in ranking_result.rankings:
-                    logger.info(f"[AI_RANKING] {r.product_id}: score={r.relevance_score:.2f}, reason={r.reason}")
+                    # Filter out products with very low relevance (score < 0.1)
+                    eligible_products = [
+                        p for p in eligible_products if ranking_map.get(p.product_id, (0.0, ""))[0] >= 0.1
+                    ]
 
-                logger.info(
-                    f"[GET_PRODUCTS] AI ranking applied: {len(ranking_result.rankings)} products ranked, "
-                    f"{len(eligible_products)} products above threshold"
-                )
+                    logger.info(
+                        f"[GET_PRODUCTS] AI ranking applied: {ranked_count} products ranked, "
+                        f"{len(eligible_products)} products above threshold"
+                    )
             else:
                 logger.debug("[GET_PRODUCTS] AI ranking configured but AI not enabled (no API key)")
         except Exception as e:
@@ -0,0 +1,125 @@
+"""Bounded, thread-safe in-memory cache with TTL eviction.
+
+Hot-path lookups (auth, tenant resolution, remote agent results) use this
+instead of ad-hoc module-level dicts so that:
+- memory is bounded (least-recently-used entries are evicted at ``maxsize``)
+- entries expire after ``ttl`` seconds
+- hit/miss/eviction counts are exported to Prometheus when a ``name`` is given
+
+The cache is per-process. Callers that need cross-process consistency must
+keep the TTL short or invalidate explicitly on writes.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+# Sentinel returned by TTLCache.get() when a key is absent, so callers can
+# distinguish "not cached" from a cached None (negative caching).
+MISSING: Any = object()
+
+
+class TTLCache:
+    """LRU cache with per-entry expiry.
+
+    Args:
+        maxsize: Maximum number of entries before the least-recently-used entry is evicted
+        ttl: Default time-to-live in seconds. A TTL <= 0 disables caching entirely.
+        name: Optional cache name used as the ``cache`` label on Prometheus metrics
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0, name: str | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.name = name
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        # Labelled Prometheus children, resolved once (labels() is costly on the hot path)
+        self._lookup_counters: dict[str, Any] = {}
+        self._eviction_counters: dict[str, Any] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.maxsize > 0
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """Return the cached value for ``key`` or ``default`` if absent/expired."""
+        if not self.enabled:
+            return default
+
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self._record("hit")
+                    return value
+                del self._data[key]
+                self._record_eviction("expired")
+            self._record("miss")
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """Store ``value`` under ``key``, evicting the oldest entry if full."""
+        if not self.enabled:
+            return
+
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._record_eviction("capacity")
+
+    def pop(self, key: Hashable) -> None:
+        """Remove ``key`` if present."""
+        with self._lock:
+            if self._data.pop(key, None) is not None:
+                self._record_eviction("invalidated")
+
+    def invalidate_where(self, predicate: Callable[[Any, Any], bool]) -> int:
+        """Remove every entry for which ``predicate(key, value)`` is true.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            doomed = [key for key, (_, value) in self._data.items() if predicate(key, value)]
+            for key in doomed:
+                del self._data[key]
+            if doomed:
+                self._record_eviction("invalidated", len(doomed))
+            return len(doomed)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not MISSING
+
+    def _record(self, result: str) -> None:
+        if self.name:
+            counter = self._lookup_counters.get(result)
+            if counter is None:
+                from src.core.metrics import cache_lookups_total
+
+                counter = self._lookup_counters[result] = cache_lookups_total.labels(cache=self.name, result=result)
+            counter.inc()
+
+    def _record_eviction(self, reason: str, count: int = 1) -> None:
+        if self.name:
+            counter = self._eviction_counters.get(reason)
+            if counter is None:
+                from src.core.metrics import cache_evictions_total
+
+                counter = self._eviction_counters[reason] = cache_evictions_total.labels(cache=self.name, reason=reason)
+            counter.inc(count)
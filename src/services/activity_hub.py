@@ -0,0 +1,346 @@
+"""Per-tenant fan-out hub for the Admin UI activity stream.
+
+Every SSE client used to poll audit_logs every 2 seconds from its own worker
+thread, so database load grew linearly with the number of open dashboards.
+The hub inverts that:
+
+- One producer thread per tenant with at least one subscriber fetches new
+  audit rows (by ``log_id``) and broadcasts them to every subscriber's queue.
+- The producer wakes when audit rows are written: directly from the audit log
+  writer in this process, and via Postgres LISTEN/NOTIFY for rows written by
+  other processes (A2A server, other workers).
+- A slow fallback poll per tenant covers missed notifications (e.g. PgBouncer
+  deployments where LISTEN is unavailable).
+
+Database load is therefore proportional to the number of tenants being
+watched and the rate of audit writes, not to the number of viewers.
+
+Environment variables:
+    ADCP_ACTIVITY_NOTIFY: "true"/"false". Publish pg_notify after audit writes
+        (default true, false when ADCP_TESTING=true)
+    ADCP_ACTIVITY_LISTEN: "true"/"false". LISTEN for notifications from other
+        processes (default true; always off behind PgBouncer)
+    ADCP_ACTIVITY_FALLBACK_POLL_INTERVAL: Seconds between safety-net polls per
+        watched tenant (default 5)
+"""
+
+import logging
+import os
+import queue
+import select
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from src.core.metrics import activity_stream_events_total, activity_stream_fetches_total, activity_stream_subscribers
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "adcp_activity"
+BACKLOG_SIZE = 50
+SUBSCRIBER_QUEUE_SIZE = 200
+FETCH_LIMIT = 100
+
+# fetch(tenant_id, after_id, limit) -> activities newest first (get_recent_activities format).
+# With after_id, the page holds the oldest ``limit`` activities after that id.
+FetchActivities = Callable[[str, int | None, int], list[dict[str, Any]]]
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.lower() == "true"
+
+
+class Subscription:
+    """One SSE client's view of a tenant channel."""
+
+    def __init__(self, tenant_id: str, backlog: list[dict[str, Any]]):
+        self.tenant_id = tenant_id
+        # Recent activities, oldest first, captured atomically with registration
+        self.backlog = backlog
+        self._queue: queue.Queue[dict[str, Any]] = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    def get(self, timeout: float) -> dict[str, Any] | None:
+        """Wait up to ``timeout`` seconds for the next activity (None on timeout)."""
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def _put(self, activity: dict[str, Any]) -> None:
+        try:
+            self._queue.put_nowait(activity)
+        except queue.Full:
+            # Slow client: drop its oldest undelivered event rather than block the producer
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._queue.put_nowait(activity)
+            activity_stream_events_total.labels(result="dropped").inc()
+
+
+class _TenantChannel:
+    """Subscribers and producer thread for one tenant."""
+
+    def __init__(self, hub: "ActivityHub", tenant_id: str):
+        self.hub = hub
+        self.tenant_id = tenant_id
+        self.subscribers: set[Subscription] = set()
+        self.backlog: deque[dict[str, Any]] = deque(maxlen=BACKLOG_SIZE)
+        self.last_id: int | None = None
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.ready = threading.Event()
+        self.closed = False
+        self.thread: threading.Thread | None = None
+
+    def prime(self) -> None:
+        """Load the initial backlog (one query shared by every subscriber) and start producing."""
+        try:
+            self._load_backlog()
+        except Exception as e:
+            logger.error(f"Activity stream backlog fetch failed for tenant {self.tenant_id}: {e}")
+        finally:
+            self.ready.set()
+        self.thread = threading.Thread(target=self._run, name=f"activity-{self.tenant_id}", daemon=True)
+        self.thread.start()
+
+    def _load_backlog(self) -> None:
+        self._ingest(self.hub.fetch(self.tenant_id, None, BACKLOG_SIZE))
+        activity_stream_fetches_total.labels(trigger="initial").inc()
+        if self.last_id is None:
+            # No history yet: page forward from the first row the tenant writes
+            self.last_id = 0
+
+    def _run(self) -> None:
+        while not self.closed:
+            notified = self.wake.wait(self.hub.fallback_poll_interval)
+            self.wake.clear()
+            if self.closed:
+                return
+            try:
+                if self.last_id is None:
+                    # The initial fetch failed; retry it rather than paging through the whole history
+                    self._load_backlog()
+                activities = self.hub.fetch(self.tenant_id, self.last_id, FETCH_LIMIT)
+                activity_stream_fetches_total.labels(trigger="notify" if notified else "poll").inc()
+                self._ingest(activities)
+                if len(activities) >= FETCH_LIMIT:
+                    # Burst larger than one page: fetch the next page right away
+                    self.wake.set()
+            except Exception as e:
+                logger.error(f"Activity stream fetch failed for tenant {self.tenant_id}: {e}")
+                time.sleep(min(self.hub.fallback_poll_interval, 5))
+
+    def _ingest(self, activities: list[dict[str, Any]]) -> None:
+        # fetch() returns newest first; deliver oldest first
+        fresh = [a for a in reversed(activities) if self.last_id is None or a["id"] > self.last_id]
+        if not fresh:
+            return
+        with self.lock:
+            self.last_id = max(a["id"] for a in fresh)
+            self.backlog.extend(fresh)
+            for subscription in self.subscribers:
+                for activity in fresh:
+                    subscription._put(activity)
+            delivered = len(fresh) * len(self.subscribers)
+        if delivered:
+            activity_stream_events_total.labels(result="delivered").inc(delivered)
+
+
+class ActivityHub:
+    """Fans audit activity out to SSE subscribers, one producer per tenant."""
+
+    def __init__(
+        self,
+        fetch: FetchActivities,
+        fallback_poll_interval: float = 5.0,
+        listen: bool = False,
+    ):
+        self.fetch = fetch
+        self.fallback_poll_interval = fallback_poll_interval
+        self.listen = listen
+        self._channels: dict[str, _TenantChannel] = {}
+        self._lock = threading.Lock()
+        self._listener: threading.Thread | None = None
+
+    def subscribe(self, tenant_id: str) -> Subscription:
+        """Register a subscriber; its ``backlog`` holds the most recent activities."""
+        while True:
+            with self._lock:
+                channel = self._channels.get(tenant_id)
+                new_channel = channel is None
+                if channel is None:
+                    channel = self._channels[tenant_id] = _TenantChannel(self, tenant_id)
+                if self.listen:
+                    self._ensure_listener()
+
+            if new_channel:
+                channel.prime()
+            else:
+                # Concurrent first subscribers share the one backlog query
+                channel.ready.wait(timeout=30)
+
+            with channel.lock:
+                if channel.closed:
+                    # Last subscriber left while we were waiting; start a fresh channel
+                    continue
+                subscription = Subscription(tenant_id, list(channel.backlog))
+                channel.subscribers.add(subscription)
+            activity_stream_subscribers.inc()
+            return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscriber; the tenant's producer stops with its last subscriber."""
+        with self._lock:
+            channel = self._channels.get(subscription.tenant_id)
+            if channel is None or subscription not in channel.subscribers:
+                return
+            with channel.lock:
+                channel.subscribers.discard(subscription)
+                if not channel.subscribers:
+                    channel.closed = True
+                    channel.wake.set()
+                    del self._channels[subscription.tenant_id]
+        activity_stream_subscribers.dec()
+
+    def notify(self, tenant_ids: Iterable[str]) -> None:
+        """Wake the producers for ``tenant_ids`` (no-op for unwatched tenants)."""
+        for tenant_id in tenant_ids:
+            channel = self._channels.get(tenant_id)
+            if channel is not None:
+                channel.wake.set()
+
+    def close(self) -> None:
+        """Stop every producer and drop all subscribers."""
+        with self._lock:
+            channels = list(self._channels.values())
+            self._channels.clear()
+        for channel in channels:
+            with channel.lock:
+                removed = len(channel.subscribers)
+                channel.subscribers.clear()
+                channel.closed = True
+                channel.wake.set()
+            activity_stream_subscribers.dec(removed)
+
+    def subscriber_count(self, tenant_id: str) -> int:
+        channel = self._channels.get(tenant_id)
+        return len(channel.subscribers) if channel else 0
+
+    def _ensure_listener(self) -> None:
+        if self._listener is None or not self._listener.is_alive():
+            self._listener = threading.Thread(target=self._listen_loop, name="activity-listener", daemon=True)
+            self._listener.start()
+
+    def _listen_loop(self) -> None:
+        """LISTEN for audit notifications from every process sharing the database."""
+        from src.core.database.database_session import get_engine
+
+        backoff = 1.0
+        while True:
+            connection = None
+            try:
+                connection = get_engine().raw_connection()
+                # Keep this connection out of the pool; it is parked in LISTEN for good
+                connection.detach()
+                dbapi_connection: Any = connection.dbapi_connection
+                dbapi_connection.autocommit = True
+                with dbapi_connection.cursor() as cursor:
+                    cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+                logger.info(f"Activity stream listening on '{NOTIFY_CHANNEL}'")
+                backoff = 1.0
+
+                while True:
+                    if select.select([dbapi_connection], [], [], 30.0) == ([], [], []):
+                        continue
+                    dbapi_connection.poll()
+                    tenant_ids = set()
+                    while dbapi_connection.notifies:
+                        tenant_ids.add(dbapi_connection.notifies.pop(0).payload)
+                    self.notify(tenant_ids)
+            except Exception as e:
+                logger.warning(f"Activity stream LISTEN connection lost, falling back to polling: {e}")
+            finally:
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 60.0)
+
+
+_hub: ActivityHub | None = None
+_hub_lock = threading.Lock()
+
+
+def _listen_enabled() -> bool:
+    if not _env_flag("ADCP_ACTIVITY_LISTEN", True):
+        return False
+    try:
+        from src.core.database.database_session import _is_pgbouncer_connection
+        from src.core.database.db_config import DatabaseConfig
+
+        # LISTEN needs a session-level connection; transaction pooling can't provide one
+        return not _is_pgbouncer_connection(DatabaseConfig.get_connection_string())
+    except Exception:
+        return False
+
+
+def get_activity_hub(fetch: FetchActivities) -> ActivityHub:
+    """Get the process-wide activity hub, creating it on first use."""
+    global _hub
+    if _hub is None:
+        with _hub_lock:
+            if _hub is None:
+                _hub = ActivityHub(
+                    fetch=fetch,
+                    fallback_poll_interval=float(os.environ.get("ADCP_ACTIVITY_FALLBACK_POLL_INTERVAL", "5")),
+                    listen=_listen_enabled(),
+                )
+    return _hub
+
+
+def publish_activity(tenant_ids: Iterable[str]) -> None:
+    """Signal that audit rows were written for ``tenant_ids``.
+
+    Wakes this process's producers immediately and, unless disabled, sends a
+    pg_notify so hubs in other processes pick the rows up too.
+    """
+    tenant_ids = sorted(set(tenant_ids))
+    if not tenant_ids:
+        return
+
+    if _hub is not None:
+        _hub.notify(tenant_ids)
+
+    if not _env_flag("ADCP_ACTIVITY_NOTIFY", os.environ.get("ADCP_TESTING") != "true"):
+        return
+    try:
+        from sqlalchemy import text
+
+        from src.core.database.database_session import get_db_session
+
+        with get_db_session() as db_session:
+            db_session.execute(
+                text("SELECT pg_notify(:channel, t) FROM unnest(CAST(:tenant_ids AS text[])) AS t"),
+                {"channel": NOTIFY_CHANNEL, "tenant_ids": tenant_ids},
+            )
+            db_session.commit()
+    except Exception as e:
+        logger.debug(f"Activity pg_notify failed: {e}")
+
+
+def reset_activity_hub() -> None:
+    """Drop the process-wide hub (tests)."""
+    global _hub
+    with _hub_lock:
+        if _hub is not None:
+            _hub.close()
+        _hub = None
@@ -8,6 +8,9 @@ from pydantic_ai import Agent
 
 logger = logging.getLogger(__name__)
 
+# Prefix of the warning returned when the model call fails and the brief is allowed by default
+POLICY_UNAVAILABLE_WARNING = "AI policy check unavailable"
+
 
 class PolicyAnalysis(BaseModel):
     """Structured output from AI policy analysis."""
@@ -119,5 +122,5 @@ async def check_policy_compliance(
         # Return allowed with warning on failure
         return PolicyAnalysis(
             status="allowed",
-            warnings=[f"AI policy check unavailable: {str(e)}"],
+            warnings=[f"{POLICY_UNAVAILABLE_WARNING}: {str(e)}"],
         )
@@ -1,5 +1,6 @@
 """Pydantic AI agent for product ranking based on brief relevance."""
 
+import json
 import logging
 from typing import Any
 
@@ -58,10 +59,42 @@ def create_ranking_agent(model: Any) -> Agent[None, ProductRankingResult]:
     )
 
 
+def build_product_digest(product: Any) -> str:
+    """Serialize the product fields the ranking prompt uses to compact JSON.
+
+    Digests depend only on catalog data, so callers can build them once per
+    catalog version and reuse them across requests.
+
+    Args:
+        product: Product schema object or product dictionary
+
+    Returns:
+        Compact JSON object string
+    """
+    if isinstance(product, dict):
+        data = {field: product.get(field) for field in ("product_id", "name", "description", "delivery_type")}
+        data["format_ids"] = product.get("format_ids") or []
+        data["channels"] = product.get("channels") or []
+    else:
+        data = product.model_dump(
+            mode="json", include={"product_id", "name", "description", "format_ids", "delivery_type"}
+        )
+        data["format_ids"] = data.get("format_ids") or []
+        # channels is an internal field excluded from model_dump()
+        data["channels"] = list(getattr(product, "channels", None) or [])
+    return json.dumps(data, separators=(",", ":"), default=_json_default)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize enums by value and anything else (URLs, etc.) as a string."""
+    return obj.value if hasattr(obj, "value") else str(obj)
+
+
 def build_ranking_prompt(
     custom_prompt: str,
     brief: str,
-    products: list[dict],
+    products: list[dict] | None = None,
+    product_digests: list[str] | None = None,
 ) -> str:
     """Build the user prompt for product ranking.
 
@@ -69,40 +102,14 @@ def build_ranking_prompt(
         custom_prompt: Tenant's custom ranking prompt
         brief: The buyer's brief/requirements
         products: List of product dictionaries to rank
+        product_digests: Pre-serialized products from build_product_digest (used instead of products)
 
     Returns:
         Formatted prompt string
     """
-    import json
-
-    def make_json_serializable(obj: Any) -> Any:
-        """Convert objects to JSON-serializable format."""
-        # Handle enums
-        if hasattr(obj, "value"):
-            return obj.value
-        # Handle Pydantic URLs and other objects with __str__
-        if hasattr(obj, "__str__") and not isinstance(obj, (dict, list, str, int, float, bool, type(None))):
-            return str(obj)
-        if isinstance(obj, dict):
-            return {k: make_json_serializable(v) for k, v in obj.items()}
-        if isinstance(obj, list):
-            return [make_json_serializable(item) for item in obj]
-        return obj
-
-    # Simplify product data for the prompt (only include relevant fields)
-    simplified_products = []
-    for p in products:
-        simplified = {
-            "product_id": p.get("product_id"),
-            "name": p.get("name"),
-            "description": p.get("description"),
-            "format_ids": make_json_serializable(p.get("format_ids", [])),
-            "channels": make_json_serializable(p.get("channels", [])),
-            "delivery_type": make_json_serializable(p.get("delivery_type")),
-        }
-        simplified_products.append(simplified)
-
-    products_str = json.dumps(simplified_products, indent=2)
+    if product_digests is None:
+        product_digests = [build_product_digest(p) for p in products or []]
+    products_str = "[" + ",".join(product_digests) + "]"
 
     return f"""Rank these products based on relevance to the buyer's brief.
 
@@ -121,7 +128,8 @@ async def rank_products_async(
     agent: Agent[None, ProductRankingResult],
     custom_prompt: str,
     brief: str,
-    products: list[dict],
+    products: list[dict] | None = None,
+    product_digests: list[str] | None = None,
 ) -> ProductRankingResult:
     """Rank products using the agent.
 
@@ -130,11 +138,12 @@ async def rank_products_async(
         custom_prompt: Tenant's custom ranking prompt
         brief: The buyer's brief
         products: List of product dictionaries
+        product_digests: Pre-serialized products from build_product_digest (used instead of products)
 
     Returns:
         ProductRankingResult with rankings for each product
     """
-    prompt = build_ranking_prompt(custom_prompt, brief, products)
+    prompt = build_ranking_prompt(custom_prompt, brief, products, product_digests)
     result = await agent.run(prompt)
     # pydantic-ai 1.x uses .output for structured data
     return result.output
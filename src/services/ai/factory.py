@@ -1,5 +1,6 @@
 """Factory for creating Pydantic AI models with tenant-aware configuration."""
 
+import hashlib
 import logging
 from functools import lru_cache
 from typing import Any
@@ -201,6 +202,27 @@ class AIServiceFactory:
             )
             return model_string
 
+    def get_model_key(self, tenant_ai_config: dict | TenantAIConfig | None = None) -> tuple[str, str, str]:
+        """Identify the model ``create_model()`` would build for this configuration.
+
+        Returns (provider, model, API key digest). Callers caching models or agents
+        use this as the cache key; the API key itself never appears in it.
+
+        Args:
+            tenant_ai_config: Tenant's AI configuration
+        """
+        if isinstance(tenant_ai_config, dict):
+            config = TenantAIConfig.model_validate(tenant_ai_config)
+        elif tenant_ai_config:
+            config = tenant_ai_config
+        else:
+            config = TenantAIConfig()
+
+        provider = config.provider or self._platform_defaults["provider"]
+        model_name = config.model or self._platform_defaults["model"]
+        api_key = config.api_key or self._platform_defaults.get("api_key") or ""
+        return provider, model_name, hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
     def is_ai_enabled(
         self,
         tenant_ai_config: dict | TenantAIConfig | None = None,
@@ -3,14 +3,23 @@ Delivery Webhook Scheduler
 
 Sends daily delivery reports via webhooks for media buys that have configured reporting_webhook.
 This runs as a background task and sends reports when GAM data is fresh (after 4 AM PT daily).
+
+Reports for a batch are generated concurrently, bounded overall and per webhook
+endpoint, and the "already sent in the last 24h" check is one query per chunk of
+media buys. Media buys can be sharded across several scheduler processes by a
+stable hash of tenant and media buy ID.
 """
 
 import asyncio
+import hashlib
 import logging
 import os
 import uuid
+from collections import Counter, defaultdict
+from collections.abc import Iterable
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import Any, Literal
+from urllib.parse import urlparse
 
 from sqlalchemy import func, select
 
@@ -30,11 +39,35 @@ logger = logging.getLogger(__name__)
 # Configurable via env var for testing
 SLEEP_INTERVAL_SECONDS = int(os.getenv("DELIVERY_WEBHOOK_INTERVAL") or "3600")
 
+# Reports generated at once across all endpoints, and at once per webhook endpoint (host)
+MAX_CONCURRENT_REPORTS = int(os.getenv("DELIVERY_WEBHOOK_CONCURRENCY") or "10")
+MAX_CONCURRENT_REPORTS_PER_ENDPOINT = int(os.getenv("DELIVERY_WEBHOOK_PER_ENDPOINT_CONCURRENCY") or "2")
+
+# Split media buys across scheduler processes: this process handles shard SHARD_INDEX of SHARD_COUNT
+SHARD_COUNT = int(os.getenv("DELIVERY_WEBHOOK_SHARD_COUNT") or "1")
+SHARD_INDEX = int(os.getenv("DELIVERY_WEBHOOK_SHARD_INDEX") or "0")
+
+# Media buys per duplicate-check query
+DEDUP_BATCH_SIZE = 500
+
+# Result of one media buy's report: delivered to the webhook, intentionally not sent, or errored
+ReportOutcome = Literal["sent", "skipped", "failed"]
+
+
+def media_buy_shard(tenant_id: str, media_buy_id: str, shard_count: int) -> int:
+    """Stable shard for a media buy (the same in every process, unlike hash())."""
+    digest = hashlib.sha256(f"{tenant_id}:{media_buy_id}".encode()).digest()
+    return int.from_bytes(digest[:8], "big") % shard_count
+
 
 class DeliveryWebhookScheduler:
     """Scheduler for sending delivery reports via webhooks."""
 
-    def __init__(self) -> None:
+    def __init__(self, shard_index: int = SHARD_INDEX, shard_count: int = SHARD_COUNT) -> None:
+        if shard_count < 1 or not 0 <= shard_index < shard_count:
+            raise ValueError(f"Invalid delivery webhook shard {shard_index} of {shard_count}")
+        self.shard_index = shard_index
+        self.shard_count = shard_count
         self.webhook_service = get_protocol_webhook_service()
         self.is_running = False
         self._task: asyncio.Task | None = None
@@ -84,8 +117,10 @@ class DeliveryWebhookScheduler:
                 await asyncio.sleep(SLEEP_INTERVAL_SECONDS)
 
     async def _send_reports(self) -> None:
-        """Send reports for all active media buys with configured webhooks."""
-        logger.info("Starting scheduled delivery report webhook batch")
+        """Send reports for all active media buys in this shard with configured webhooks."""
+        logger.info(
+            "Starting scheduled delivery report webhook batch (shard %d of %d)", self.shard_index + 1, self.shard_count
+        )
 
         try:
             with get_db_session() as session:
@@ -93,31 +128,73 @@ class DeliveryWebhookScheduler:
                 stmt = select(MediaBuy).where(MediaBuy.status.in_(["active", "approved"]))
                 media_buys = session.scalars(stmt).all()
 
-                reports_sent = 0
-                errors = 0
-
+                pending: list[tuple[Any, dict]] = []
                 for media_buy in media_buys:
-                    try:
-                        # Check if this media buy has a reporting webhook configured
-                        raw_request = media_buy.raw_request or {}
-                        reporting_webhook = raw_request.get("reporting_webhook")
+                    # Check if this media buy has a reporting webhook configured
+                    raw_request = media_buy.raw_request or {}
+                    reporting_webhook = raw_request.get("reporting_webhook")
+
+                    if not reporting_webhook:
+                        continue
+                    if (
+                        self.shard_count > 1
+                        and media_buy_shard(media_buy.tenant_id, media_buy.media_buy_id, self.shard_count)
+                        != self.shard_index
+                    ):
+                        continue
+                    pending.append((media_buy, reporting_webhook))
+
+                global_limit = asyncio.Semaphore(MAX_CONCURRENT_REPORTS)
+                endpoint_limits: defaultdict[str, asyncio.Semaphore] = defaultdict(
+                    lambda: asyncio.Semaphore(MAX_CONCURRENT_REPORTS_PER_ENDPOINT)
+                )
 
-                        if not reporting_webhook:
+                async def send(media_buy: Any, reporting_webhook: dict) -> ReportOutcome:
+                    endpoint = urlparse(str(reporting_webhook.get("url") or "")).netloc
+                    async with endpoint_limits[endpoint], global_limit:
+                        return await self._send_report_for_media_buy(
+                            media_buy, reporting_webhook, session, already_sent=False
+                        )
+
+                tasks: list[asyncio.Task] = []
+                skipped = 0
+                for offset in range(0, len(pending), DEDUP_BATCH_SIZE):
+                    chunk = pending[offset : offset + DEDUP_BATCH_SIZE]
+                    already_sent = self._recently_sent_media_buy_ids(session, (mb.media_buy_id for mb, _ in chunk))
+                    for media_buy, reporting_webhook in chunk:
+                        if media_buy.media_buy_id in already_sent:
+                            logger.info(
+                                "Skipping daily delivery webhook for media buy %s – already sent in the last 24 hours",
+                                media_buy.media_buy_id,
+                            )
+                            skipped += 1
                             continue
+                        tasks.append(asyncio.create_task(send(media_buy, reporting_webhook)))
 
-                        # Send delivery report
-                        await self._send_report_for_media_buy(media_buy, reporting_webhook, session)
-                        reports_sent += 1
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+                outcomes = Counter("failed" if isinstance(result, BaseException) else result for result in results)
 
-                    except Exception as e:
-                        logger.error(f"Error sending report for media buy {media_buy.media_buy_id}: {e}", exc_info=True)
-                        errors += 1
-
-                logger.info(f"Daily delivery report batch complete: {reports_sent} sent, {errors} errors")
+                logger.info(
+                    f"Daily delivery report batch complete: {outcomes['sent']} sent, "
+                    f"{skipped + outcomes['skipped']} skipped, {outcomes['failed']} errors"
+                )
 
         except Exception as e:
             logger.error(f"Error in daily delivery report batch: {e}", exc_info=True)
 
+    @staticmethod
+    def _recently_sent_media_buy_ids(session: Any, media_buy_ids: Iterable[str]) -> set[str]:
+        """IDs of media buys with a successful scheduled delivery webhook in the last 24 hours."""
+        one_day_ago = datetime.now(UTC) - timedelta(hours=24)
+        stmt = select(WebhookDeliveryLog.media_buy_id).where(
+            WebhookDeliveryLog.media_buy_id.in_(list(media_buy_ids)),
+            WebhookDeliveryLog.task_type == "media_buy_delivery",
+            WebhookDeliveryLog.notification_type == "scheduled",
+            WebhookDeliveryLog.status == "success",
+            WebhookDeliveryLog.created_at > one_day_ago,
+        )
+        return set(session.scalars(stmt).all())
+
     async def trigger_report_for_media_buy_by_id(self, media_buy_id: str, tenant_id: str) -> bool:
         """Manually trigger a delivery report for a single media buy by ID.
 
@@ -147,15 +224,20 @@ class DeliveryWebhookScheduler:
                     return False
 
                 # Force sending even if already sent today (for testing)
-                await self._send_report_for_media_buy(media_buy, reporting_webhook, session, force=True)
-                return True
+                outcome = await self._send_report_for_media_buy(media_buy, reporting_webhook, session, force=True)
+                return outcome != "failed"
         except Exception as e:
             logger.error(f"Error manually triggering report for {media_buy_id}: {e}", exc_info=True)
             return False
 
     async def _send_report_for_media_buy(
-        self, media_buy: Any, reporting_webhook: dict, session: Any, force: bool = False
-    ) -> None:
+        self,
+        media_buy: Any,
+        reporting_webhook: dict,
+        session: Any,
+        force: bool = False,
+        already_sent: bool | None = None,
+    ) -> ReportOutcome:
         """Send a delivery report for a single media buy.
 
         Args:
@@ -163,6 +245,12 @@ class DeliveryWebhookScheduler:
             reporting_webhook: Webhook configuration dict
             session: Database session
             force: If True, bypass frequency checks and duplicate checks
+            already_sent: Result of a bulk duplicate check done by the caller;
+                None looks it up for this media buy
+
+        Returns:
+            "sent", "skipped" (frequency, duplicate or missing URL) or "failed".
+            Errors are logged here rather than raised.
         """
         try:
             # Determine reporting frequency from AdCP config (hourly, daily, monthly)
@@ -175,33 +263,26 @@ class DeliveryWebhookScheduler:
                     raw_freq,
                     media_buy.media_buy_id,
                 )
-                return
+                return "skipped"
 
             # Calculate reporting period for daily frequency: yesterday (full day)
             start_date_obj = datetime.now(UTC).date() - timedelta(days=1)
             end_date_obj = datetime.now(UTC)
 
             # Check if we've already sent a scheduled delivery_report webhook for this media buy
-            # and reporting date. We use created_at::date as the period key.
+            # in the last 24 hours
             if not force:
-                # Look back 24 hours to find recent successful webhooks
-                one_day_ago = datetime.now(UTC) - timedelta(hours=24)
-                existing_stmt = select(WebhookDeliveryLog).where(
-                    WebhookDeliveryLog.media_buy_id == media_buy.media_buy_id,
-                    WebhookDeliveryLog.task_type == "media_buy_delivery",
-                    WebhookDeliveryLog.notification_type == "scheduled",
-                    WebhookDeliveryLog.status == "success",
-                    WebhookDeliveryLog.created_at > one_day_ago,
-                )
-                existing_log = session.scalars(existing_stmt).first()
-                if existing_log:
+                if already_sent is None:
+                    already_sent = media_buy.media_buy_id in self._recently_sent_media_buy_ids(
+                        session, [media_buy.media_buy_id]
+                    )
+                if already_sent:
                     logger.info(
-                        "Skipping daily delivery webhook for media buy %s and date %s – already sent (log id %s)",
+                        "Skipping daily delivery webhook for media buy %s and date %s – already sent",
                         media_buy.media_buy_id,
                         end_date_obj,
-                        existing_log.id,
                     )
-                    return
+                    return "skipped"
 
             # Fetch delivery metrics
             # Create a minimal context object for the delivery call
@@ -223,19 +304,21 @@ class DeliveryWebhookScheduler:
                 context=None,
             )
 
-            delivery_response = _get_media_buy_delivery_impl(req, context)
+            # Delivery fetches block on the ad server; run them off the event loop so
+            # reports for other media buys proceed concurrently
+            delivery_response = await asyncio.to_thread(_get_media_buy_delivery_impl, req, context)
 
             if not isinstance(delivery_response, GetMediaBuyDeliveryResponse):
                 logger.warning(
                     f"`Couldn't get media_delivery` for {media_buy.media_buy_id}. Result is {delivery_response.model_dump()}"
                 )
-                return
+                return "failed"
 
             if delivery_response.errors is not None:
                 logger.warning(
                     f"`Couldn't get media_delivery` for {media_buy.media_buy_id}. We have recieved error in the result. Result is {delivery_response.model_dump()}"
                 )
-                return
+                return "failed"
 
             # Get sequence number for this webhook (get max sequence + 1)
             sequence_number = 1
@@ -266,7 +349,7 @@ class DeliveryWebhookScheduler:
             webhook_url = reporting_webhook.get("url")
             if not webhook_url:
                 logger.warning(f"No webhook URL configured for media buy {media_buy.media_buy_id}")
-                return
+                return "skipped"
 
             # Try to find existing push notification config or create a temporary one
             auth_config = reporting_webhook.get("authentication", {})
@@ -322,17 +405,21 @@ class DeliveryWebhookScheduler:
 
             # Send webhook notification OUTSIDE the session context
             # This ensures the session is closed before async webhook call
-            await self.webhook_service.send_notification(
+            delivered = await self.webhook_service.send_notification(
                 push_notification_config=push_notification_config,
                 payload=media_buy_delivery_payload,
                 metadata=metadata
             )
+            if not delivered:
+                logger.warning(f"Delivery report webhook for media buy {media_buy.media_buy_id} was not delivered")
+                return "failed"
 
             logger.info(f"Sent delivery report webhook for media buy {media_buy.media_buy_id}")
+            return "sent"
 
         except Exception as e:
             logger.error(f"Error sending delivery report for media buy {media_buy.media_buy_id}: {e}", exc_info=True)
-            raise
+            return "failed"
 
 
 # Global scheduler instance
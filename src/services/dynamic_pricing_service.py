@@ -5,19 +5,146 @@ Calculates dynamic pricing from cached format performance metrics
 and updates product pricing_options with price_guidance.
 
 Uses historical GAM reporting data aggregated by country + creative format.
+
+Metrics are loaded once per (tenant, country, 30-day window) into a
+``PriceGuidanceTable`` indexed by normalized creative size, so enriching a
+request's products is a dictionary lookup per product instead of a metrics
+query per product. Tables are cached per process and reused while the tenant's
+metrics are unchanged (one ``count``/``max(last_updated)`` query per request);
+``FormatMetricsAggregationService`` drops a tenant's tables after each
+aggregation run.
+
+Environment variables:
+    ADCP_PRICE_GUIDANCE_TTL: Seconds a price guidance table is kept (default 3600, 0 disables caching)
+    ADCP_PRICE_GUIDANCE_MAX_ENTRIES: Maximum cached (tenant, country) tables per process (default 1024)
 """
 
 import logging
-from datetime import datetime, timedelta
+import os
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, func, select
 from sqlalchemy.orm import Session
 
 from src.core.database.models import FormatPerformanceMetrics
 from src.core.schemas import PriceGuidance, PricingModel, PricingOption, Product
+from src.core.utils.ttl_cache import MISSING, TTLCache
 
 logger = logging.getLogger(__name__)
 
+PRICE_GUIDANCE_TTL_SECONDS = float(os.environ.get("ADCP_PRICE_GUIDANCE_TTL", "3600"))
+PRICE_GUIDANCE_MAX_ENTRIES = int(os.environ.get("ADCP_PRICE_GUIDANCE_MAX_ENTRIES", "1024"))
+
+# (tenant_id, country_code, cutoff date) -> (metrics version, PriceGuidanceTable)
+_tables = TTLCache(maxsize=PRICE_GUIDANCE_MAX_ENTRIES, ttl=PRICE_GUIDANCE_TTL_SECONDS, name="price_guidance")
+
+
+def normalize_creative_size(size: str) -> str:
+    """Normalize a creative size for matching.
+
+    GAM returns sizes with spaces (e.g., "728 x 90") but product formats use no spaces ("728x90").
+    """
+    return size.replace(" ", "").lower()
+
+
+@dataclass
+class _SizeStats:
+    """Impression-weighted CPM sums for one creative size."""
+
+    first_row: int
+    period_days: int
+    impressions: int = 0
+    median_sum: float = 0.0
+    median_weight: int = 0
+    p75_sum: float = 0.0
+    p75_weight: int = 0
+    p90_sum: float = 0.0
+    p90_weight: int = 0
+
+
+@dataclass(frozen=True)
+class SizeGuidance:
+    """Aggregated pricing for a set of creative sizes."""
+
+    floor_cpm: float | None
+    p75_cpm: float | None
+    p90_cpm: float | None
+    estimated_exposures: int | None
+
+
+class PriceGuidanceTable:
+    """Format performance metrics for one tenant and country, indexed by creative size.
+
+    Guidance for each distinct combination of sizes is computed once and memoized,
+    so products sharing formats share the work.
+    """
+
+    def __init__(self, metrics: list[FormatPerformanceMetrics]):
+        self._sizes: dict[str, _SizeStats] = {}
+        for row, metric in enumerate(metrics):
+            size = normalize_creative_size(metric.creative_size)
+            stats = self._sizes.get(size)
+            if stats is None:
+                period_days = (
+                    date.fromisoformat(str(metric.period_end)) - date.fromisoformat(str(metric.period_start))
+                ).days
+                stats = self._sizes[size] = _SizeStats(first_row=row, period_days=period_days)
+            weight = metric.total_impressions
+            stats.impressions += weight
+            if weight > 0:
+                if metric.median_cpm is not None:
+                    stats.median_sum += float(metric.median_cpm) * weight
+                    stats.median_weight += weight
+                if metric.p75_cpm is not None:
+                    stats.p75_sum += float(metric.p75_cpm) * weight
+                    stats.p75_weight += weight
+                if metric.p90_cpm is not None:
+                    stats.p90_sum += float(metric.p90_cpm) * weight
+                    stats.p90_weight += weight
+        self._guidance: dict[frozenset[str], SizeGuidance | None] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def guidance(self, sizes: frozenset[str]) -> SizeGuidance | None:
+        """Return aggregated guidance across normalized ``sizes``, or None if none have metrics."""
+        if sizes in self._guidance:
+            return self._guidance[sizes]
+
+        stats = [self._sizes[size] for size in sizes if size in self._sizes]
+        result = None
+        if stats:
+            # Volume estimate uses the reporting period of the first matching metrics row
+            period_days = min(stats, key=lambda s: s.first_row).period_days
+            total_impressions = sum(s.impressions for s in stats)
+            result = SizeGuidance(
+                floor_cpm=_weighted_avg(sum(s.median_sum for s in stats), sum(s.median_weight for s in stats)),
+                p75_cpm=_weighted_avg(sum(s.p75_sum for s in stats), sum(s.p75_weight for s in stats)),
+                p90_cpm=_weighted_avg(sum(s.p90_sum for s in stats), sum(s.p90_weight for s in stats)),
+                # Average daily impressions * 30 days
+                estimated_exposures=int(total_impressions / period_days * 30) if period_days > 0 else None,
+            )
+        with self._lock:
+            self._guidance[sizes] = result
+        return result
+
+
+def _weighted_avg(weighted_sum: float, total_weight: int) -> float | None:
+    return weighted_sum / total_weight if total_weight > 0 else None
+
+
+def invalidate_price_guidance(tenant_id: str) -> None:
+    """Drop cached price guidance tables for a tenant (e.g. after new metrics are aggregated)."""
+    _tables.invalidate_where(lambda key, _: key[0] == tenant_id)
+
+
+def clear_price_guidance_cache() -> None:
+    """Drop all cached price guidance tables (tests)."""
+    _tables.clear()
+
 
 class DynamicPricingService:
     """Service for calculating dynamic pricing from cached format metrics."""
@@ -57,10 +184,11 @@ class DynamicPricingService:
 
         # Get recent metrics (last 30 days)
         cutoff_date = datetime.now().date() - timedelta(days=30)
+        table = self.get_price_guidance_table(tenant_id, country_code, cutoff_date)
 
         for product in products:
             try:
-                pricing = self._calculate_product_pricing(product, tenant_id, country_code, min_exposures, cutoff_date)
+                pricing = self._calculate_product_pricing(product, table, country_code, min_exposures)
 
                 # Update or add pricing option with dynamic price_guidance
                 self._update_pricing_options(product, pricing)
@@ -77,36 +205,47 @@ class DynamicPricingService:
 
         return products
 
+    def get_price_guidance_table(
+        self, tenant_id: str, country_code: str | None, cutoff_date: date
+    ) -> PriceGuidanceTable:
+        """Return the tenant's price guidance table, loading metrics only when they changed."""
+        conditions = [
+            FormatPerformanceMetrics.tenant_id == tenant_id,
+            FormatPerformanceMetrics.period_end >= cutoff_date,
+        ]
+        # Filter by country if specified
+        if country_code:
+            conditions.append(FormatPerformanceMetrics.country_code == country_code)
+
+        key = (tenant_id, country_code, cutoff_date)
+        cached = _tables.get(key)
+        version = None
+        if _tables.enabled:
+            version = tuple(
+                self.db.execute(
+                    select(func.count(), func.max(FormatPerformanceMetrics.last_updated)).where(and_(*conditions))
+                ).one()
+            )
+            if cached is not MISSING and cached[0] == version:
+                return cached[1]
+
+        table = PriceGuidanceTable(list(self.db.scalars(select(FormatPerformanceMetrics).where(and_(*conditions)))))
+        if version is not None:
+            _tables.set(key, (version, table))
+        logger.debug(
+            f"Loaded price guidance for {len(table)} creative sizes (tenant={tenant_id}, country={country_code})"
+        )
+        return table
+
     def _calculate_product_pricing(
         self,
         product: Product,
-        tenant_id: str,
+        table: PriceGuidanceTable,
         country_code: str | None,
         min_exposures: int | None,
-        cutoff_date,
     ) -> dict:
         """Calculate pricing for a single product based on its formats."""
-        # Extract creative sizes from product format IDs
-        # Format IDs like "display_300x250" -> "300x250"
-        creative_sizes = []
-        for format_id in product.format_ids:
-            # Handle FormatId objects (dict or object with .id attribute)
-            # Pydantic validation may return dict, object, or string depending on context
-            if isinstance(format_id, dict):
-                format_id_str = format_id.get("id", "")
-            elif hasattr(format_id, "id"):
-                format_id_str = format_id.id
-            else:
-                format_id_str = str(format_id)
-
-            # Extract size from format_id (e.g., "display_300x250" -> "300x250")
-            parts = format_id_str.split("_")
-            if len(parts) >= 2:
-                # Look for dimensions pattern (NxM)
-                for part in parts:
-                    if "x" in part.lower():
-                        creative_sizes.append(part)
-                        break
+        creative_sizes = self._extract_creative_sizes(product)
 
         if not creative_sizes:
             logger.warning(
@@ -114,67 +253,25 @@ class DynamicPricingService:
             )
             return self._default_pricing()
 
-        # Query format metrics for these sizes
-        # GAM returns sizes with spaces (e.g., "728 x 90") but product formats use no spaces ("728x90")
-        # Create normalized versions of both for matching
-        normalized_sizes = [size.replace(" ", "").lower() for size in creative_sizes]
-
-        # Query all metrics and filter with normalized comparison
-        stmt = select(FormatPerformanceMetrics).where(
-            and_(
-                FormatPerformanceMetrics.tenant_id == tenant_id,
-                FormatPerformanceMetrics.period_end >= cutoff_date,
-            )
-        )
-
-        # Filter by country if specified
-        if country_code:
-            stmt = stmt.where(FormatPerformanceMetrics.country_code == country_code)
-
-        all_metrics = self.db.scalars(stmt).all()
-
-        # Filter metrics by normalized creative_size matching
-        metrics = [m for m in all_metrics if m.creative_size.replace(" ", "").lower() in normalized_sizes]
+        guidance = table.guidance(frozenset(normalize_creative_size(size) for size in creative_sizes))
 
-        if not metrics:
+        if guidance is None:
             logger.debug(
                 f"No cached metrics found for product {product.product_id} "
                 f"(sizes={creative_sizes}, country={country_code})"
             )
             return self._default_pricing()
 
-        # Aggregate metrics across all formats
-        total_impressions = sum(m.total_impressions for m in metrics)
-        weighted_median_cpm = self._calculate_weighted_avg(
-            metrics, lambda m: m.median_cpm, lambda m: m.total_impressions
-        )
-        weighted_p75_cpm = self._calculate_weighted_avg(metrics, lambda m: m.p75_cpm, lambda m: m.total_impressions)
-        weighted_p90_cpm = self._calculate_weighted_avg(metrics, lambda m: m.p90_cpm, lambda m: m.total_impressions)
-
-        # Calculate estimated monthly impressions
-        # Average daily impressions * 30 days
-        # SQLAlchemy Date fields - convert to timedelta using total_seconds for mypy
-        period_start = metrics[0].period_start
-        period_end = metrics[0].period_end
-        # Use datetime for date subtraction (mypy compatible)
-        from datetime import date as date_type
-
-        period_days = (date_type.fromisoformat(str(period_end)) - date_type.fromisoformat(str(period_start))).days
-        if period_days > 0:
-            daily_impressions = total_impressions / period_days
-            estimated_monthly_impressions = int(daily_impressions * 30)
-        else:
-            estimated_monthly_impressions = None
-
         # Determine floor and recommended CPM
-        floor_cpm = weighted_median_cpm  # 50th percentile as floor
-        recommended_cpm = weighted_p75_cpm  # 75th percentile as standard recommendation
+        floor_cpm = guidance.floor_cpm  # 50th percentile as floor
+        recommended_cpm = guidance.p75_cpm  # 75th percentile as standard recommendation
+        estimated_monthly_impressions = guidance.estimated_exposures
 
         # If min_exposures specified and we can't meet it, recommend higher CPM
         if min_exposures and estimated_monthly_impressions:
             if estimated_monthly_impressions < min_exposures:
                 # Suggest p90 CPM to compete for more volume
-                recommended_cpm = weighted_p90_cpm
+                recommended_cpm = guidance.p90_cpm
                 logger.debug(
                     f"Product {product.product_id}: Estimated volume ({estimated_monthly_impressions}) "
                     f"< min_exposures ({min_exposures}), recommending p90 CPM"
@@ -187,19 +284,28 @@ class DynamicPricingService:
             "estimated_exposures": estimated_monthly_impressions,
         }
 
-    def _calculate_weighted_avg(self, metrics: list, value_func, weight_func) -> float | None:
-        """Calculate weighted average from metrics."""
-        total_weight = 0
-        weighted_sum = 0
-
-        for m in metrics:
-            value = value_func(m)
-            weight = weight_func(m)
-            if value is not None and weight > 0:
-                weighted_sum += float(value) * weight
-                total_weight += weight
+    def _extract_creative_sizes(self, product: Product) -> list[str]:
+        """Extract creative sizes from product format IDs ("display_300x250" -> "300x250")."""
+        creative_sizes = []
+        for format_id in product.format_ids:
+            # Handle FormatId objects (dict or object with .id attribute)
+            # Pydantic validation may return dict, object, or string depending on context
+            if isinstance(format_id, dict):
+                format_id_str = format_id.get("id", "")
+            elif hasattr(format_id, "id"):
+                format_id_str = format_id.id
+            else:
+                format_id_str = str(format_id)
 
-        return weighted_sum / total_weight if total_weight > 0 else None
+            # Extract size from format_id (e.g., "display_300x250" -> "300x250")
+            parts = format_id_str.split("_")
+            if len(parts) >= 2:
+                # Look for dimensions pattern (NxM)
+                for part in parts:
+                    if "x" in part.lower():
+                        creative_sizes.append(part)
+                        break
+        return creative_sizes
 
     def _default_pricing(self) -> dict:
         """Return default pricing when no metrics available."""
@@ -19,6 +19,7 @@ from sqlalchemy.orm import Session
 from src.adapters.gam_reporting_service import GAMReportingService
 from src.core.database.database_session import get_db_session
 from src.core.database.models import FormatPerformanceMetrics, Tenant
+from src.services.dynamic_pricing_service import invalidate_price_guidance
 
 logger = logging.getLogger(__name__)
 
@@ -233,6 +234,7 @@ class FormatMetricsAggregationService:
                 rows_created += 1
 
         self.db.commit()
+        invalidate_price_guidance(tenant_id)
 
         return {
             "rows_created": rows_created,
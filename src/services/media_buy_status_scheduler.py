@@ -8,14 +8,18 @@ their flight dates:
 
 This ensures media buys don't get stuck in transitional states when approved
 before their start date.
+
+Transitions are applied as bulk UPDATE statements in the database rather than
+by loading and inspecting each media buy.
 """
 
 import asyncio
 import logging
 import os
 from datetime import UTC, datetime
+from typing import cast
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, CursorResult, and_, or_, select, update
 
 from src.core.database.database_session import get_db_session
 from src.core.database.models import Creative, CreativeAssignment, MediaBuy
@@ -25,6 +29,10 @@ logger = logging.getLogger(__name__)
 # Configurable via env var - default 60 seconds
 STATUS_CHECK_INTERVAL_SECONDS = int(os.getenv("MEDIA_BUY_STATUS_CHECK_INTERVAL") or "60")
 
+# Statuses the scheduler moves forward; the partial flight-time indexes on
+# media_buys are restricted to these
+LIVE_STATUSES = ("pending_activation", "scheduled", "active")
+
 
 class MediaBuyStatusScheduler:
     """Scheduler for updating media buy statuses based on flight dates."""
@@ -73,129 +81,91 @@ class MediaBuyStatusScheduler:
                 # Wait before next check
                 await asyncio.sleep(STATUS_CHECK_INTERVAL_SECONDS)
 
-    async def _update_statuses(self) -> None:
-        """Check and update media buy statuses based on flight dates."""
+    async def _update_statuses(self) -> dict[str, int]:
+        """Apply due status transitions with set-based UPDATEs.
+
+        Each transition is a single UPDATE ... WHERE over every tenant, backed by
+        partial indexes on flight times, so a run costs a handful of index scans
+        instead of loading every live media buy into Python.
+
+        Returns:
+            Number of media buys moved per transition, keyed "old_status->new_status".
+        """
         now = datetime.now(UTC)
-        updated_count = 0
+        counts: dict[str, int] = {}
 
         try:
             with get_db_session() as session:
-                # Find media buys that need status updates
-                # 1. pending_activation or scheduled -> should become active if start_time passed
-                # 2. active -> should become completed if end_time passed
-                stmt = select(MediaBuy).where(MediaBuy.status.in_(["pending_activation", "scheduled", "active"]))
-                media_buys = session.scalars(stmt).all()
-
-                for media_buy in media_buys:
-                    new_status = self._compute_new_status(media_buy, now, session)
-
-                    if new_status and new_status != media_buy.status:
-                        old_status = media_buy.status
-                        media_buy.status = new_status
-                        updated_count += 1
-                        logger.info(
-                            f"Updated media buy {media_buy.media_buy_id} status: " f"{old_status} -> {new_status}"
-                        )
-
-                if updated_count > 0:
+                # Completion runs first so a buy whose flight already ended goes
+                # straight to completed rather than being activated
+                for old_status, new_status, condition in self._transitions(now):
+                    stmt = (
+                        update(MediaBuy)
+                        .where(MediaBuy.status == old_status, condition)
+                        .values(status=new_status)
+                        .execution_options(synchronize_session=False)
+                    )
+                    # UPDATE results are cursor results; Session.execute() is typed as the generic Result
+                    updated = cast(CursorResult, session.execute(stmt)).rowcount
+                    if updated:
+                        counts[f"{old_status}->{new_status}"] = updated
+                        logger.info(f"Updated {updated} media buy(s) status: {old_status} -> {new_status}")
+
+                if counts:
                     session.commit()
-                    logger.info(f"Updated {updated_count} media buy status(es)")
+                    logger.info(f"Updated {sum(counts.values())} media buy status(es)")
 
         except Exception as e:
             logger.error(f"Failed to update media buy statuses: {e}", exc_info=True)
+            return {}
 
-    def _compute_new_status(self, media_buy: MediaBuy, now: datetime, session) -> str | None:
-        """Compute the new status for a media buy based on flight dates.
-
-        Returns:
-            New status string if change needed, None otherwise.
-        """
-        # Get start and end times (prefer start_time/end_time over start_date/end_date)
-        start_time: datetime | None = None
-        if media_buy.start_time:
-            raw_start: datetime = media_buy.start_time
-            if raw_start.tzinfo is None:
-                start_time = raw_start.replace(tzinfo=UTC)
-            else:
-                start_time = raw_start
-        elif media_buy.start_date:
-            # datetime.min.time() returns time object, mypy doesn't recognize this
-            start_time = datetime.combine(media_buy.start_date, datetime.min.time()).replace(  # type: ignore[arg-type]
-                tzinfo=UTC
-            )
-
-        if start_time is None:
-            return None  # No start time defined
-
-        end_time: datetime | None = None
-        if media_buy.end_time:
-            raw_end: datetime = media_buy.end_time
-            if raw_end.tzinfo is None:
-                end_time = raw_end.replace(tzinfo=UTC)
-            else:
-                end_time = raw_end
-        elif media_buy.end_date:
-            # datetime.max.time() returns time object, mypy doesn't recognize this
-            end_time = datetime.combine(media_buy.end_date, datetime.max.time()).replace(  # type: ignore[arg-type]
-                tzinfo=UTC
-            )
-
-        if end_time is None:
-            return None  # No end time defined
-
-        current_status = media_buy.status
-
-        # Check if campaign has ended
-        if now > end_time:
-            if current_status != "completed":
-                return "completed"
-            return None
+        return counts
 
-        # Check if campaign should be active
-        if now >= start_time:
-            if current_status in ["pending_activation", "scheduled"]:
-                # Before activating, verify creatives are approved (for pending_activation)
-                if current_status == "pending_activation":
-                    if self._are_creatives_approved(media_buy, session):
-                        return "active"
-                    # Creatives not approved yet - stay pending
-                    return None
-                else:
-                    # scheduled -> active (no creative check needed, already validated)
-                    return "active"
+    @staticmethod
+    def _transitions(now: datetime) -> list[tuple[str, str, ColumnElement[bool]]]:
+        """Build the (old_status, new_status, condition) list for a run at ``now``.
 
-        return None
-
-    def _are_creatives_approved(self, media_buy: MediaBuy, session) -> bool:
-        """Check if all creatives for a media buy are approved.
-
-        Returns:
-            True if no creatives assigned OR all creatives are approved.
+        Flight times prefer start_time/end_time (naive UTC) and fall back to
+        start_date/end_date: a start_date starts at midnight UTC and an end_date
+        ends at the end of that day.
         """
-        # Get creative assignments for this media buy
-        stmt = select(CreativeAssignment).filter_by(tenant_id=media_buy.tenant_id, media_buy_id=media_buy.media_buy_id)
-        assignments = session.scalars(stmt).all()
+        now_naive = now.astimezone(UTC).replace(tzinfo=None)
+        today = now_naive.date()
 
-        if not assignments:
-            # No creatives assigned - can activate (some campaigns run without creatives initially)
-            return True
-
-        # Get all creative IDs
-        creative_ids = list({a.creative_id for a in assignments})
-
-        # Check creative statuses
-        creative_stmt = select(Creative).where(
-            Creative.tenant_id == media_buy.tenant_id,
-            Creative.creative_id.in_(creative_ids),
+        started = or_(
+            MediaBuy.start_time <= now_naive,
+            and_(MediaBuy.start_time.is_(None), MediaBuy.start_date <= today),
+        )
+        ended = or_(
+            MediaBuy.end_time < now_naive,
+            and_(MediaBuy.end_time.is_(None), MediaBuy.end_date < today),
         )
-        creatives = session.scalars(creative_stmt).all()
 
-        # All creatives must be approved
-        for creative in creatives:
-            if creative.status != "approved":
-                return False
+        # No assigned creative that exists and is not approved (buys without
+        # creatives can activate; some campaigns run without creatives initially)
+        creatives_approved = ~(
+            select(CreativeAssignment.assignment_id)
+            .join(
+                Creative,
+                and_(
+                    Creative.tenant_id == CreativeAssignment.tenant_id,
+                    Creative.creative_id == CreativeAssignment.creative_id,
+                ),
+            )
+            .where(
+                CreativeAssignment.tenant_id == MediaBuy.tenant_id,
+                CreativeAssignment.media_buy_id == MediaBuy.media_buy_id,
+                Creative.status != "approved",
+            )
+            .exists()
+        )
 
-        return True
+        return [
+            *((status, "completed", ended) for status in LIVE_STATUSES),
+            # scheduled -> active (no creative check needed, already validated)
+            ("scheduled", "active", started),
+            ("pending_activation", "active", and_(started, creatives_approved)),
+        ]
 
 
 # Global singleton instance
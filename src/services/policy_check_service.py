@@ -1,13 +1,35 @@
-"""Policy check service for analyzing advertising briefs."""
-
+"""Policy check service for analyzing advertising briefs.
+
+Policy decisions are cached per process, keyed by (model, tenant policy hash,
+normalized brief, brand hash), so buyers paging or re-filtering with the same
+brief do not pay for another model call. Concurrent checks of the same brief
+share one in-flight call, and policy agents are reused per model configuration.
+Failed model calls (allowed by default with a warning) are never cached.
+
+Environment variables:
+    ADCP_POLICY_CACHE_TTL: Seconds a policy decision is reused (default 900, 0 disables caching)
+    ADCP_POLICY_CACHE_MAX_ENTRIES: Maximum cached decisions per process (default 4096)
+"""
+
+import asyncio
+import hashlib
+import json
 import logging
+import os
+import threading
+from collections.abc import Hashable
 from datetime import UTC, datetime
 from enum import Enum
+from typing import Any
 
 from pydantic import BaseModel, Field
+from pydantic_ai import Agent
 
+from src.core.utils.ttl_cache import MISSING, TTLCache
 from src.services.ai import AIServiceFactory, TenantAIConfig
 from src.services.ai.agents.policy_agent import (
+    POLICY_UNAVAILABLE_WARNING,
+    PolicyAnalysis,
     check_policy_compliance,
     create_policy_agent,
 )
@@ -17,6 +39,42 @@ logger = logging.getLogger(__name__)
 # Sentinel value to distinguish "not provided" from "explicitly None"
 _UNSET = object()
 
+POLICY_CACHE_TTL_SECONDS = float(os.environ.get("ADCP_POLICY_CACHE_TTL", "900"))
+POLICY_CACHE_MAX_ENTRIES = int(os.environ.get("ADCP_POLICY_CACHE_MAX_ENTRIES", "4096"))
+
+# (model key, policy hash, normalized brief, brand hash) -> PolicyCheckResult
+_decisions = TTLCache(maxsize=POLICY_CACHE_MAX_ENTRIES, ttl=POLICY_CACHE_TTL_SECONDS, name="policy_decisions")
+
+# Model key -> policy agent. Agents keep no state between runs, so one per model
+# configuration is shared by every request (and keeps the provider's HTTP client warm).
+_agents = TTLCache(maxsize=64, ttl=3600.0, name="policy_agents")
+_agents_lock = threading.Lock()
+
+# (event loop id, decision key) -> in-flight check; tasks are bound to the loop that created them
+_inflight: dict[tuple[int, Hashable], "asyncio.Task[PolicyCheckResult]"] = {}
+
+
+def _get_policy_agent(model_key: tuple[str, str, str], build_model) -> Any:
+    """Return the shared policy agent for ``model_key``, creating it with ``build_model()`` if needed."""
+    agent = _agents.get(model_key)
+    if agent is MISSING:
+        with _agents_lock:
+            agent = _agents.get(model_key)
+            if agent is MISSING:
+                agent = create_policy_agent(build_model())
+                _agents.set(model_key, agent)
+    return agent
+
+
+def _digest(value: Any) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def clear_policy_cache() -> None:
+    """Drop cached policy decisions and agents (tests)."""
+    _decisions.clear()
+    _agents.clear()
+
 
 class PolicyStatus(str, Enum):
     """Policy compliance status options."""
@@ -70,15 +128,16 @@ class PolicyCheckService:
             # Explicit None means disable AI
             self.ai_enabled = False
             self._agent = None
+            self._model_key = None
             return
 
         # Get effective configuration
         effective_config = self._factory.get_effective_config(tenant_ai_config)
         self.ai_enabled = effective_config["has_api_key"]
+        self._model_key = self._factory.get_model_key(tenant_ai_config) if self.ai_enabled else None
 
-        if self.ai_enabled:
-            model_string = self._factory.create_model(tenant_ai_config)
-            self._agent = create_policy_agent(model_string)
+        if self._model_key:
+            self._agent = _get_policy_agent(self._model_key, lambda: self._factory.create_model(tenant_ai_config))
         else:
             logger.warning("No AI API key configured. Policy checks will use basic rules only.")
             self._agent = None
@@ -124,19 +183,47 @@ class PolicyCheckService:
 
         # Use AI analysis when available
         if self.ai_enabled and self._agent:
-            analysis = await check_policy_compliance(self._agent, full_context, tenant_policies)
-            return PolicyCheckResult(
-                status=PolicyStatus(analysis.status),
-                reason=analysis.reason,
-                restrictions=analysis.restrictions,
-                warnings=analysis.warnings,
+            key = (
+                self._model_key,
+                _digest(tenant_policies),
+                " ".join(brief.split()).casefold(),
+                _digest(brand_info),
             )
+            cached = _decisions.get(key)
+            if cached is not MISSING:
+                return cached.model_copy(deep=True)
+
+            # Identical concurrent checks share one model call
+            inflight_key = (id(asyncio.get_running_loop()), key)
+            task = _inflight.get(inflight_key)
+            if task is None:
+                task = asyncio.ensure_future(self._run_check(self._agent, key, full_context, tenant_policies))
+                _inflight[inflight_key] = task
+                task.add_done_callback(lambda _: _inflight.pop(inflight_key, None))
+            # Shield so one caller giving up doesn't cancel the check other callers share
+            result = await asyncio.shield(task)
+            return result.model_copy(deep=True)
         else:
             # Fallback if no AI is available - allow with warning
             return PolicyCheckResult(
                 status=PolicyStatus.ALLOWED, warnings=["Policy check unavailable - AI service not configured"]
             )
 
+    async def _run_check(
+        self, agent: Agent[None, PolicyAnalysis], key: Hashable, full_context: str, tenant_policies: dict | None
+    ) -> PolicyCheckResult:
+        """Run the model check with ``agent`` and cache the decision unless the model call failed."""
+        analysis = await check_policy_compliance(agent, full_context, tenant_policies)
+        result = PolicyCheckResult(
+            status=PolicyStatus(analysis.status),
+            reason=analysis.reason,
+            restrictions=analysis.restrictions,
+            warnings=analysis.warnings,
+        )
+        if not any(w.startswith(POLICY_UNAVAILABLE_WARNING) for w in analysis.warnings or []):
+            _decisions.set(key, result)
+        return result
+
     def _check_basic_rules(self, text: str) -> PolicyCheckResult:
         """Apply basic policy rules (deprecated - kept for compatibility).
 
@@ -0,0 +1,181 @@
+"""Cached, latency-bounded AI product ranking for get_products.
+
+When a tenant sets ``product_ranking_prompt``, get_products asks the model to
+score every eligible product against the brief. Scores depend only on the
+prompt, the brief and the catalog, so they are cached per
+(tenant, prompt hash, brief hash, catalog version) as a product_id -> score map.
+Later requests with the same brief only send products the map does not cover
+yet (e.g. ones a different filter let through) and merge the new scores in.
+
+Products are sent to the model as compact JSON digests
+(``build_product_digest``); digests of catalog products are built once per
+catalog version and shared across requests.
+
+With ``ADCP_RANKING_DEADLINE`` set, a ranking that takes longer than the budget
+is left running in the background to fill the cache, and the request gets None
+so it can return products in their deterministic (catalog) order.
+
+Environment variables:
+    ADCP_RANKING_CACHE_TTL: Seconds rankings and digests are kept (default 3600, 0 disables caching)
+    ADCP_RANKING_CACHE_MAX_ENTRIES: Maximum cached (tenant, prompt, brief) rankings per process (default 4096)
+    ADCP_RANKING_DEADLINE: Latency budget in seconds for ranking (default 0 = wait for the model)
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+from collections.abc import Hashable, Iterable
+from typing import Any
+
+from src.core.utils.ttl_cache import MISSING, TTLCache
+from src.services.ai.agents.ranking_agent import (
+    build_product_digest,
+    create_ranking_agent,
+    rank_products_async,
+)
+
+logger = logging.getLogger(__name__)
+
+RANKING_CACHE_TTL_SECONDS = float(os.environ.get("ADCP_RANKING_CACHE_TTL", "3600"))
+RANKING_CACHE_MAX_ENTRIES = int(os.environ.get("ADCP_RANKING_CACHE_MAX_ENTRIES", "4096"))
+RANKING_DEADLINE_SECONDS = float(os.environ.get("ADCP_RANKING_DEADLINE", "0"))
+
+# product_id -> (relevance_score, reason)
+Rankings = dict[str, tuple[float, str]]
+
+# (tenant_id, prompt hash, brief hash, catalog version) -> Rankings
+_rankings = TTLCache(maxsize=RANKING_CACHE_MAX_ENTRIES, ttl=RANKING_CACHE_TTL_SECONDS, name="product_rankings")
+
+# (tenant_id, catalog version) -> {product_id: digest}
+_digests = TTLCache(maxsize=256, ttl=RANKING_CACHE_TTL_SECONDS, name="product_ranking_digests")
+
+# Model key -> ranking agent, shared by every request using that model configuration
+_agents = TTLCache(maxsize=64, ttl=3600.0, name="ranking_agents")
+_agents_lock = threading.Lock()
+
+# (event loop id, ranking key, product ids) -> in-flight ranking
+_inflight: dict[tuple[int, Hashable, frozenset[str]], "asyncio.Task[Rankings]"] = {}
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def get_ranking_agent(factory: Any) -> Any:
+    """Return the shared ranking agent for the factory's platform model."""
+    model_key = factory.get_model_key()
+    agent = _agents.get(model_key)
+    if agent is MISSING:
+        with _agents_lock:
+            agent = _agents.get(model_key)
+            if agent is MISSING:
+                agent = create_ranking_agent(factory.create_model())
+                _agents.set(model_key, agent)
+    return agent
+
+
+def get_catalog_digests(tenant_id: str, catalog_version: int | None, products: Iterable[Any]) -> dict[str, str]:
+    """Return ranking digests for catalog products, built once per catalog version."""
+    if catalog_version is None:
+        return {p.product_id: build_product_digest(p) for p in products}
+    key = (tenant_id, catalog_version)
+    digests = _digests.get(key)
+    if digests is MISSING:
+        digests = {p.product_id: build_product_digest(p) for p in products}
+        _digests.set(key, digests)
+    return digests
+
+
+async def rank_products(
+    agent: Any,
+    tenant_id: str,
+    catalog_version: int | None,
+    custom_prompt: str,
+    brief: str,
+    products: list[Any],
+    catalog_digests: dict[str, str],
+    deadline: float | None = None,
+) -> Rankings | None:
+    """Score ``products`` against the brief, reusing cached scores where possible.
+
+    Args:
+        agent: Ranking agent (see get_ranking_agent)
+        tenant_id: Tenant the products belong to
+        catalog_version: Tenant catalog version (None disables caching)
+        custom_prompt: Tenant's product_ranking_prompt
+        brief: Buyer's brief
+        products: Products to rank
+        catalog_digests: Digests of catalog products (see get_catalog_digests); other
+            products (e.g. dynamic variants) are serialized on the fly
+        deadline: Latency budget in seconds; defaults to ADCP_RANKING_DEADLINE (0 = no budget)
+
+    Returns:
+        Scores for the products, or None if the budget ran out before the model answered
+    """
+    deadline = RANKING_DEADLINE_SECONDS if deadline is None else deadline
+    key = (tenant_id, _hash(custom_prompt), _hash(" ".join(brief.split())), catalog_version)
+    cacheable = catalog_version is not None
+
+    cached: Rankings = _rankings.get(key, {}) if cacheable else {}
+    missing = [p for p in products if p.product_id not in cached]
+    if not missing:
+        return cached
+
+    missing_ids = frozenset(p.product_id for p in missing)
+    inflight_key = (id(asyncio.get_running_loop()), key, missing_ids)
+    task = _inflight.get(inflight_key)
+    if task is None:
+        digests = [catalog_digests.get(p.product_id) or build_product_digest(p) for p in missing]
+        task = asyncio.ensure_future(
+            _rank(agent, key if cacheable else None, custom_prompt, brief, missing_ids, digests)
+        )
+        _inflight[inflight_key] = task
+        task.add_done_callback(lambda t: _finish(inflight_key, t))
+
+    # Shield so a caller giving up (or the deadline) doesn't cancel the ranking others share
+    try:
+        if deadline > 0:
+            new = await asyncio.wait_for(asyncio.shield(task), timeout=deadline)
+        else:
+            new = await asyncio.shield(task)
+    except TimeoutError:
+        logger.info(
+            f"[AI_RANKING] Ranking {len(missing)} products exceeded {deadline}s budget; "
+            "returning unranked order and caching the result when it completes"
+        )
+        return None
+    return {**cached, **new}
+
+
+async def _rank(
+    agent: Any,
+    key: Hashable | None,
+    custom_prompt: str,
+    brief: str,
+    product_ids: frozenset[str],
+    digests: list[str],
+) -> Rankings:
+    result = await rank_products_async(agent=agent, custom_prompt=custom_prompt, brief=brief, product_digests=digests)
+    # Products the model left out score 0, so they are not sent again on the next request
+    new: Rankings = dict.fromkeys(product_ids, (0.0, ""))
+    new.update({r.product_id: (r.relevance_score, r.reason) for r in result.rankings if r.product_id in product_ids})
+    if key is not None:
+        # Merge with scores cached meanwhile (e.g. another filter's ranking)
+        _rankings.set(key, {**_rankings.get(key, {}), **new})
+    return new
+
+
+def _finish(inflight_key: tuple, task: "asyncio.Task[Rankings]") -> None:
+    _inflight.pop(inflight_key, None)
+    if not task.cancelled() and task.exception() is not None:
+        # Retrieve the exception so background rankings that nobody awaits don't log "never retrieved"
+        logger.warning(f"[AI_RANKING] Ranking failed: {task.exception()}")
+
+
+def clear_ranking_cache() -> None:
+    """Drop cached rankings, digests and agents (tests)."""
+    _rankings.clear()
+    _digests.clear()
+    _agents.clear()
@@ -5,26 +5,36 @@ This service implements the AdCP webhook specification from PR #86:
 - Circuit breaker pattern (CLOSED/OPEN/HALF_OPEN states) for fault tolerance
 - Exponential backoff with jitter for retry logic
 - Replay attack prevention with 5-minute timestamp window
-- Bounded queues (1000 webhooks per endpoint)
+- Durable outbox: webhooks are persisted before delivery and delivered by async
+  workers with per-endpoint limits (see src/services/webhook_outbox.py)
 - Support for is_adjusted flag for late-arriving data
 - Per-endpoint isolation to prevent cascading failures
 """
 
+import asyncio
 import atexit
 import hashlib
 import hmac
 import json
 import logging
-import random
 import threading
-import time
-from collections import deque
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import Any
 
 import httpx
 
+from src.core.utils.ttl_cache import MISSING, TTLCache
+from src.services.webhook_outbox import (
+    DatabaseOutboxStore,
+    DeliveryResult,
+    OutboxItem,
+    OutboxStore,
+    WebhookOutbox,
+    outbox_settings_from_env,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -120,59 +130,14 @@ class CircuitBreaker:
                 logger.warning("Circuit breaker reopened (recovery test failed)")
 
 
-class WebhookQueue:
-    """Bounded queue for webhook delivery per endpoint."""
-
-    def __init__(self, max_size: int = 1000):
-        """Initialize webhook queue.
-
-        Args:
-            max_size: Maximum number of webhooks in queue
-        """
-        self.max_size = max_size
-        self.queue: deque = deque(maxlen=max_size)
-        self._lock = threading.Lock()
-        self._dropped_count = 0
-
-    def enqueue(self, webhook_data: dict[str, Any]) -> bool:
-        """Add webhook to queue.
+@dataclass(frozen=True)
+class _EndpointConfig:
+    """Delivery settings of a PushNotificationConfig, cached between attempts."""
 
-        Args:
-            webhook_data: Webhook payload and metadata
-
-        Returns:
-            True if enqueued, False if queue is full
-        """
-        with self._lock:
-            if len(self.queue) >= self.max_size:
-                self._dropped_count += 1
-                logger.warning(
-                    f"Webhook queue full ({self.max_size}), dropping webhook (total dropped: {self._dropped_count})"
-                )
-                return False
-
-            self.queue.append(webhook_data)
-            return True
-
-    def dequeue(self) -> dict[str, Any] | None:
-        """Remove and return oldest webhook from queue.
-
-        Returns:
-            Webhook data or None if queue is empty
-        """
-        with self._lock:
-            if self.queue:
-                return self.queue.popleft()
-            return None
-
-    def size(self) -> int:
-        """Get current queue size.
-
-        Returns:
-            Number of webhooks in queue
-        """
-        with self._lock:
-            return len(self.queue)
+    url: str
+    authentication_type: str | None
+    authentication_token: str | None
+    webhook_secret: str | None
 
 
 class WebhookDeliveryService:
@@ -182,12 +147,24 @@ class WebhookDeliveryService:
     circuit breakers, exponential backoff, and replay attack prevention.
     """
 
-    def __init__(self) -> None:
-        """Initialize enhanced webhook delivery service."""
+    def __init__(self, store: OutboxStore | None = None) -> None:
+        """Initialize enhanced webhook delivery service.
+
+        Args:
+            store: Outbox storage (default: the webhook_deliveries table)
+        """
         self._sequence_numbers: dict[str, int] = {}  # Track sequence per media buy
         self._lock = threading.Lock()  # Protect shared state
         self._circuit_breakers: dict[str, CircuitBreaker] = {}  # Per-endpoint circuit breakers
-        self._queues: dict[str, WebhookQueue] = {}  # Per-endpoint bounded queues
+        self._outbox = WebhookOutbox(
+            send=self._deliver_outbox_item,
+            store=store or DatabaseOutboxStore(event_types=("delivery_report",)),
+            on_stop=self._close_http_client,
+            **outbox_settings_from_env(),
+        )
+        self._configs = TTLCache(maxsize=1024, ttl=30, name="webhook_configs")
+        self._http_client: httpx.AsyncClient | None = None
+        self._http_client_loop: asyncio.AbstractEventLoop | None = None
 
         # Register graceful shutdown
         atexit.register(self._shutdown)
@@ -232,7 +209,7 @@ class WebhookDeliveryService:
             next_expected_interval_seconds: Seconds until next webhook
 
         Returns:
-            True if webhook sent successfully, False otherwise
+            True if the webhook was queued for at least one endpoint, False otherwise
         """
         try:
             # Thread-safe sequence number increment
@@ -351,7 +328,11 @@ class WebhookDeliveryService:
         media_buy_id: str,
         delivery_payload: dict[str, Any],
     ) -> bool:
-        """Send webhook with enhanced security and reliability features.
+        """Queue a webhook in the outbox for every configured endpoint.
+
+        Delivery (signing, retries, circuit breaking) happens asynchronously in
+        _deliver_outbox_item. Webhooks are queued even while an endpoint's
+        circuit breaker is open, and are delivered once it recovers.
 
         Args:
             tenant_id: Tenant identifier
@@ -360,7 +341,7 @@ class WebhookDeliveryService:
             delivery_payload: AdCP delivery payload
 
         Returns:
-            True if sent successfully, False otherwise
+            True if queued for at least one endpoint, False otherwise
         """
         try:
             # Get webhook configurations
@@ -373,145 +354,159 @@ class WebhookDeliveryService:
                 stmt = select(PushNotificationConfig).filter_by(
                     tenant_id=tenant_id, principal_id=principal_id, is_active=True
                 )
-                configs = db.scalars(stmt).all()
-
-                if not configs:
-                    logger.debug(f"⚠️ No webhooks configured for {tenant_id}/{principal_id}")
-                    return False
-
-                # Send to all configured webhooks
-                sent_count = 0
-                for config in configs:
-                    endpoint_key = f"{tenant_id}:{config.url}"
-
-                    # Get or create circuit breaker for this endpoint
-                    if endpoint_key not in self._circuit_breakers:
-                        self._circuit_breakers[endpoint_key] = CircuitBreaker()
-
-                    # Get or create queue for this endpoint
-                    if endpoint_key not in self._queues:
-                        self._queues[endpoint_key] = WebhookQueue(max_size=1000)
-
-                    circuit_breaker = self._circuit_breakers[endpoint_key]
-                    queue = self._queues[endpoint_key]
-
-                    # Check circuit breaker
-                    if not circuit_breaker.can_attempt():
-                        logger.warning(f"⚠️ Circuit breaker OPEN for {config.url}, skipping webhook delivery")
-                        continue
-
-                    # Add to queue (bounded)
-                    webhook_data = {
-                        "config": config,
-                        "payload": delivery_payload,
-                        "timestamp": datetime.now(UTC),
-                    }
+                configs = [(config.id, config.url) for config in db.scalars(stmt).all()]
 
-                    if not queue.enqueue(webhook_data):
-                        logger.warning(f"⚠️ Queue full for {config.url}, webhook dropped")
-                        continue
+            if not configs:
+                logger.debug(f"⚠️ No webhooks configured for {tenant_id}/{principal_id}")
+                return False
 
-                    # Deliver from queue with enhanced features
-                    if self._deliver_with_backoff(endpoint_key, circuit_breaker, queue):
-                        sent_count += 1
+            for config_id, url in configs:
+                self._outbox.enqueue(
+                    tenant_id=tenant_id,
+                    webhook_url=url,
+                    payload=delivery_payload,
+                    event_type="delivery_report",
+                    object_id=media_buy_id,
+                    config_id=config_id,
+                )
 
-                if sent_count > 0:
-                    logger.debug(f"✅ Delivery webhook sent to {sent_count} endpoint(s)")
-                    return True
-                else:
-                    logger.warning("⚠️ Failed to deliver webhook to any endpoint")
-                    return False
+            logger.debug(f"✅ Delivery webhook queued for {len(configs)} endpoint(s)")
+            return True
 
         except Exception as e:
             logger.error(f"❌ Error in webhook delivery: {e}", exc_info=True)
             return False
 
-    def _deliver_with_backoff(
-        self,
-        endpoint_key: str,
-        circuit_breaker: CircuitBreaker,
-        queue: WebhookQueue,
-    ) -> bool:
-        """Deliver webhook with exponential backoff and jitter.
+    def _load_endpoint_config(self, config_id: str | None) -> _EndpointConfig | None:
+        cached = self._configs.get(config_id)
+        if cached is not MISSING:
+            return cached
+
+        from sqlalchemy import select
+
+        from src.core.database.database_session import get_db_session
+        from src.core.database.models import PushNotificationConfig
+
+        with get_db_session() as db:
+            config = db.scalars(select(PushNotificationConfig).filter_by(id=config_id, is_active=True)).first()
+            endpoint = (
+                _EndpointConfig(
+                    url=config.url,
+                    authentication_type=config.authentication_type,
+                    authentication_token=config.authentication_token,
+                    webhook_secret=getattr(config, "webhook_secret", None),
+                )
+                if config
+                else None
+            )
+        self._configs.set(config_id, endpoint)
+        return endpoint
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        # One pooled client per event loop; the outbox runs a single loop per process
+        loop = asyncio.get_running_loop()
+        if self._http_client is None or self._http_client_loop is not loop:
+            self._http_client = httpx.AsyncClient(timeout=10.0)
+            self._http_client_loop = loop
+        return self._http_client
+
+    async def _close_http_client(self) -> None:
+        """Close the pooled client on the outbox loop before it stops (outbox stop hook)."""
+        client, self._http_client = self._http_client, None
+        self._http_client_loop = None
+        if client is not None:
+            await client.aclose()
+
+    async def _deliver_outbox_item(self, item: OutboxItem) -> DeliveryResult:
+        """Make one delivery attempt for a queued webhook (outbox send callback).
 
         Args:
-            endpoint_key: Unique endpoint identifier
-            circuit_breaker: Circuit breaker for this endpoint
-            queue: Webhook queue for this endpoint
+            item: Queued webhook
 
         Returns:
-            True if delivered successfully, False otherwise
+            Outcome of the attempt; the outbox handles retries and backoff
         """
-        max_retries = 3
-        base_delay = 1.0  # Initial delay in seconds
+        circuit_breaker = self._get_circuit_breaker(item.endpoint_key)
+        if not circuit_breaker.can_attempt():
+            logger.debug(f"Circuit breaker OPEN for {item.webhook_url}, deferring webhook {item.delivery_id}")
+            return DeliveryResult(
+                success=False, error="Circuit breaker open", retry_after=circuit_breaker.timeout_seconds
+            )
 
-        webhook_data = queue.dequeue()
-        if not webhook_data:
-            return False
+        config = await asyncio.to_thread(self._load_endpoint_config, item.config_id)
+        if config is None:
+            return DeliveryResult(success=False, error="Webhook configuration no longer active", retryable=False)
 
-        config = webhook_data["config"]
-        payload = webhook_data["payload"]
-        timestamp = webhook_data["timestamp"].isoformat()
+        payload = item.payload
+        # Timestamp of this attempt, for replay prevention
+        timestamp = datetime.now(UTC).isoformat()
 
         # Generate HMAC signature if webhook secret is configured
-        webhook_secret = getattr(config, "webhook_secret", None)
         headers = {
             "Content-Type": "application/json",
             "User-Agent": "AdCP-Sales-Agent/2.3 (Enhanced Webhooks)",
             "X-ADCP-Timestamp": timestamp,  # For replay prevention
         }
 
-        if webhook_secret:
-            if not self._verify_secret_strength(webhook_secret):
+        if config.webhook_secret:
+            if not self._verify_secret_strength(config.webhook_secret):
                 logger.warning(f"⚠️ Webhook secret for {config.url} is too weak (min 32 characters required)")
             else:
-                signature = self._generate_hmac_signature(payload, webhook_secret, timestamp)
+                signature = self._generate_hmac_signature(payload, config.webhook_secret, timestamp)
                 headers["X-ADCP-Signature"] = signature
 
         # Add authentication
         if config.authentication_type == "bearer" and config.authentication_token:
             headers["Authorization"] = f"Bearer {config.authentication_token}"
 
-        # Exponential backoff with jitter
-        for attempt in range(max_retries):
-            try:
-                # Calculate delay with exponential backoff and jitter
-                if attempt > 0:
-                    # Base delay * 2^attempt + random jitter (0-1 seconds)
-                    delay = (base_delay * (2**attempt)) + random.uniform(0, 1)
-                    logger.debug(f"Retrying webhook delivery after {delay:.2f}s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(delay)
-
-                # Send webhook
-                with httpx.Client(timeout=10.0) as client:
-                    response = client.post(
-                        config.url,
-                        json=payload,
-                        headers=headers,
-                    )
-
-                    if 200 <= response.status_code < 300:
-                        logger.debug(f"Webhook delivered to {config.url} (status: {response.status_code})")
-                        circuit_breaker.record_success()
-                        return True
-
-                    logger.warning(
-                        f"Webhook delivery to {config.url} returned "
-                        f"status {response.status_code} "
-                        f"(attempt: {attempt + 1}/{max_retries})"
-                    )
-
-            except httpx.TimeoutException:
-                logger.warning(f"Webhook delivery to {config.url} timed out (attempt: {attempt + 1}/{max_retries})")
-            except httpx.RequestError as e:
-                logger.warning(f"Webhook delivery to {config.url} failed: {e} (attempt: {attempt + 1}/{max_retries})")
-            except Exception as e:
-                logger.error(f"Unexpected error delivering to {config.url}: {e}", exc_info=True)
-                break
-
-        # All retries failed
+        try:
+            response = await self._get_http_client().post(item.webhook_url, json=payload, headers=headers)
+        except httpx.TimeoutException:
+            logger.warning(f"Webhook delivery to {item.webhook_url} timed out (attempt: {item.attempts + 1})")
+            circuit_breaker.record_failure()
+            return DeliveryResult(success=False, error="Request timed out")
+        except httpx.RequestError as e:
+            logger.warning(f"Webhook delivery to {item.webhook_url} failed: {e} (attempt: {item.attempts + 1})")
+            circuit_breaker.record_failure()
+            return DeliveryResult(success=False, error=str(e))
+
+        if 200 <= response.status_code < 300:
+            logger.debug(f"Webhook delivered to {item.webhook_url} (status: {response.status_code})")
+            circuit_breaker.record_success()
+            return DeliveryResult(success=True, response_code=response.status_code)
+
+        logger.warning(
+            f"Webhook delivery to {item.webhook_url} returned "
+            f"status {response.status_code} "
+            f"(attempt: {item.attempts + 1})"
+        )
         circuit_breaker.record_failure()
-        return False
+        # Client errors will not succeed on retry, except timeouts and rate limiting
+        retryable = response.status_code >= 500 or response.status_code in (408, 429)
+        return DeliveryResult(
+            success=False,
+            response_code=response.status_code,
+            error=f"HTTP {response.status_code}",
+            retryable=retryable,
+        )
+
+    def _get_circuit_breaker(self, endpoint_key: str) -> CircuitBreaker:
+        with self._lock:
+            if endpoint_key not in self._circuit_breakers:
+                self._circuit_breakers[endpoint_key] = CircuitBreaker()
+            return self._circuit_breakers[endpoint_key]
+
+    def start(self) -> None:
+        """Start delivering queued webhooks, including any persisted before a restart."""
+        self._outbox.start()
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Wait until every queued webhook has been attempted (used by tests and shutdown)."""
+        return self._outbox.flush(timeout)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop delivering: in-flight webhooks record their outcome, queued ones stay in the outbox."""
+        self._outbox.stop(timeout)
 
     def reset_sequence(self, media_buy_id: str):
         """Reset sequence number for a media buy.
@@ -557,10 +552,7 @@ class WebhookDeliveryService:
     def _shutdown(self):
         """Graceful shutdown handler."""
         try:
-            with self._lock:
-                # Clean up internal state without logging
-                # (logging stream may be closed during interpreter shutdown)
-                pass
+            self.stop()
         except (ValueError, OSError):
             # Logging stream may be closed during interpreter shutdown
             pass
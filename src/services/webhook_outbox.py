@@ -0,0 +1,605 @@
+"""
+Durable webhook outbox
+
+Delivery webhooks used to sit in a per-endpoint in-memory deque that dropped
+payloads once full and lost everything on restart, and each one was delivered
+inline with blocking retry sleeps. This module replaces that with an outbox on
+the webhook_deliveries table (WebhookDeliveryRecord):
+
+- enqueue() inserts a row (status "pending", next_attempt_at = now) before any
+  HTTP request is made, so queued webhooks survive restarts.
+- Each process runs a pool of async delivery workers on a background event
+  loop. Workers claim due rows with SELECT ... FOR UPDATE SKIP LOCKED and mark
+  them "sending" under a lease (next_attempt_at = now + lease), so any number of
+  processes can deliver from the same outbox. Rows held by a process that dies
+  mid-delivery are reclaimed once the lease expires (at-least-once delivery).
+  A worker that waited long for its endpoint slot renews the lease before
+  sending, and drops the item if another worker has re-claimed it meanwhile.
+- Deliveries are limited per endpoint, both in concurrent requests and in
+  requests per second. Limits of endpoints with nothing in flight are dropped
+  periodically, so their number stays bounded as webhook URLs change.
+- Outcomes are written back in batches: "delivered", "retrying" (with
+  exponential backoff in next_attempt_at) or "failed" after the last attempt.
+- Outbox depth and the age of the oldest undelivered webhook per tenant are
+  exported as the webhook_queue_size and webhook_queue_oldest_age_seconds gauges.
+
+Rows written by other code paths (src/core/webhook_delivery.py) leave
+next_attempt_at NULL and are never claimed. Several outboxes can share the table
+(delivery reports, workflow step notifications): each store only claims rows of
+its own event types, while queue stats cover the whole table.
+
+Environment variables:
+    ADCP_WEBHOOK_OUTBOX_WORKERS: Concurrent deliveries per process (default 8,
+        0 makes this process enqueue-only and leaves delivery to others)
+    ADCP_WEBHOOK_OUTBOX_PER_ENDPOINT_CONCURRENCY: Concurrent requests per
+        endpoint per process (default 2)
+    ADCP_WEBHOOK_OUTBOX_PER_ENDPOINT_RATE: Requests per second per endpoint per
+        process (default 10)
+    ADCP_WEBHOOK_OUTBOX_MAX_ATTEMPTS: Attempts before a webhook is marked
+        failed (default 5)
+    ADCP_WEBHOOK_OUTBOX_POLL_INTERVAL: Seconds between checks for webhooks
+        enqueued by other processes or due for retry (default 1.0)
+"""
+
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any, Protocol, cast
+
+from sqlalchemy import CursorResult, func, select, update
+
+from src.core.database.database_session import get_db_session
+from src.core.database.models import WebhookDeliveryRecord
+from src.core.metrics import (
+    webhook_delivery_attempts,
+    webhook_delivery_duration,
+    webhook_delivery_total,
+    webhook_queue_oldest_age,
+    webhook_queue_size,
+)
+
+logger = logging.getLogger(__name__)
+
+# Statuses of rows the outbox still owns
+OUTBOX_STATUSES = ("pending", "sending", "retrying")
+
+
+class OutboxConfig:
+    """Retry and bookkeeping settings for the webhook outbox."""
+
+    BACKOFF_BASE_SECONDS = 1.0
+    BACKOFF_MAX_SECONDS = 300.0
+    BACKOFF_JITTER_SECONDS = 1.0
+    LEASE_SECONDS = 120.0  # Must cover the request timeout; renewed after waiting for an endpoint slot
+    STATS_INTERVAL_SECONDS = 5.0
+
+
+def _utcnow() -> datetime:
+    # webhook_deliveries uses naive UTC timestamps
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+@dataclass
+class OutboxItem:
+    """One queued webhook."""
+
+    delivery_id: str
+    tenant_id: str
+    webhook_url: str
+    payload: dict[str, Any]
+    event_type: str
+    object_id: str | None = None
+    config_id: str | None = None
+    attempts: int = 0
+    created_at: datetime | None = None
+    # Expiry of this process's lease (the row's next_attempt_at while "sending")
+    lease_until: datetime | None = None
+
+    @property
+    def endpoint_key(self) -> str:
+        return f"{self.tenant_id}:{self.webhook_url}"
+
+
+@dataclass
+class DeliveryResult:
+    """Outcome of one delivery attempt, returned by the outbox's send callback."""
+
+    success: bool
+    response_code: int | None = None
+    error: str | None = None
+    # False for errors that will not go away on retry (e.g. 4xx, deleted config)
+    retryable: bool = True
+    # None means no request was made (e.g. open circuit breaker): the item is
+    # retried after ``retry_after`` seconds without using up an attempt
+    retry_after: float | None = None
+
+
+class OutboxStore(Protocol):
+    def add(self, item: OutboxItem) -> None: ...
+
+    def claim(self, limit: int, lease_seconds: float) -> list[OutboxItem]: ...
+
+    def renew(self, item: OutboxItem, lease_seconds: float) -> bool: ...
+
+    def complete(self, outcomes: list[dict[str, Any]]) -> None: ...
+
+    def stats(self) -> dict[str, tuple[int, datetime]]: ...
+
+
+class DatabaseOutboxStore:
+    """Outbox rows in the webhook_deliveries table."""
+
+    def __init__(self, event_types: tuple[str, ...] | None = None):
+        """Initialize the store.
+
+        Args:
+            event_types: Only claim rows with these event types (default: all)
+        """
+        self.event_types = event_types
+
+    def add(self, item: OutboxItem) -> None:
+        now = _utcnow()
+        with get_db_session() as session:
+            session.add(
+                WebhookDeliveryRecord(
+                    delivery_id=item.delivery_id,
+                    tenant_id=item.tenant_id,
+                    webhook_url=item.webhook_url,
+                    payload=item.payload,
+                    event_type=item.event_type,
+                    object_id=item.object_id,
+                    config_id=item.config_id,
+                    status="pending",
+                    attempts=0,
+                    next_attempt_at=now,
+                    created_at=now,
+                )
+            )
+            session.commit()
+
+    def claim(self, limit: int, lease_seconds: float) -> list[OutboxItem]:
+        """Lease up to ``limit`` due rows to this process."""
+        now = _utcnow()
+        lease_until = now + timedelta(seconds=lease_seconds)
+        with get_db_session() as session:
+            stmt = (
+                select(WebhookDeliveryRecord)
+                .where(
+                    WebhookDeliveryRecord.next_attempt_at <= now,
+                    WebhookDeliveryRecord.status.in_(OUTBOX_STATUSES),
+                )
+                .order_by(WebhookDeliveryRecord.next_attempt_at)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            if self.event_types is not None:
+                stmt = stmt.where(WebhookDeliveryRecord.event_type.in_(self.event_types))
+            records = session.scalars(stmt).all()
+            items = [
+                OutboxItem(
+                    delivery_id=record.delivery_id,
+                    tenant_id=record.tenant_id,
+                    webhook_url=record.webhook_url,
+                    payload=record.payload,
+                    event_type=record.event_type,
+                    object_id=record.object_id,
+                    config_id=record.config_id,
+                    attempts=record.attempts,
+                    created_at=record.created_at,
+                    lease_until=lease_until,
+                )
+                for record in records
+            ]
+            for record in records:
+                record.status = "sending"
+                record.next_attempt_at = lease_until
+            session.commit()
+            return items
+
+    def renew(self, item: OutboxItem, lease_seconds: float) -> bool:
+        """Extend this process's lease on a claimed row.
+
+        Returns:
+            False if the lease expired and another worker has claimed the row since
+        """
+        lease_until = _utcnow() + timedelta(seconds=lease_seconds)
+        with get_db_session() as session:
+            result = cast(
+                CursorResult,
+                session.execute(
+                    update(WebhookDeliveryRecord)
+                    .where(
+                        WebhookDeliveryRecord.delivery_id == item.delivery_id,
+                        WebhookDeliveryRecord.status == "sending",
+                        WebhookDeliveryRecord.next_attempt_at == item.lease_until,
+                    )
+                    .values(next_attempt_at=lease_until)
+                ),
+            )
+            session.commit()
+        if result.rowcount == 0:
+            return False
+        item.lease_until = lease_until
+        return True
+
+    def complete(self, outcomes: list[dict[str, Any]]) -> None:
+        """Write a batch of delivery outcomes (bulk UPDATE by delivery_id)."""
+        with get_db_session() as session:
+            session.execute(update(WebhookDeliveryRecord), outcomes)
+            session.commit()
+
+    def stats(self) -> dict[str, tuple[int, datetime]]:
+        """Undelivered webhook count and oldest created_at per tenant."""
+        with get_db_session() as session:
+            rows = session.execute(
+                select(
+                    WebhookDeliveryRecord.tenant_id,
+                    func.count(),
+                    func.min(WebhookDeliveryRecord.created_at),
+                )
+                .where(WebhookDeliveryRecord.next_attempt_at.is_not(None))
+                .group_by(WebhookDeliveryRecord.tenant_id)
+            ).all()
+            return {tenant_id: (count, oldest) for tenant_id, count, oldest in rows}
+
+
+class _RateLimiter:
+    """Spaces calls at least 1/rate seconds apart."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_at = 0.0
+
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        wait = self._next_at - now
+        self._next_at = max(now, self._next_at) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def idle(self) -> bool:
+        """True if the next call would not have to wait."""
+        return self._next_at <= time.monotonic()
+
+
+@dataclass
+class _EndpointLimits:
+    """Concurrency and rate limits of one endpoint, shared by the items in flight to it."""
+
+    slots: asyncio.Semaphore
+    rate: _RateLimiter
+    users: int = 0
+
+
+class WebhookOutbox:
+    """Durable webhook queue with a pool of async delivery workers."""
+
+    def __init__(
+        self,
+        send: Callable[[OutboxItem], Awaitable[DeliveryResult]],
+        store: OutboxStore | None = None,
+        workers: int = 8,
+        per_endpoint_concurrency: int = 2,
+        per_endpoint_rate: float = 10.0,
+        max_attempts: int = 5,
+        poll_interval: float = 1.0,
+        on_stop: Callable[[], Awaitable[None]] | None = None,
+    ):
+        """Initialize the outbox.
+
+        Args:
+            send: Makes one delivery attempt for an item
+            store: Outbox storage (default: every row of the webhook_deliveries table)
+            workers: Concurrent deliveries (0 makes this process enqueue-only)
+            per_endpoint_concurrency: Concurrent requests per endpoint
+            per_endpoint_rate: Requests per second per endpoint
+            max_attempts: Attempts before an item is marked failed
+            poll_interval: Seconds between checks for items enqueued elsewhere or due for retry
+            on_stop: Awaited on the worker loop when the workers stop (e.g. to close HTTP clients)
+        """
+        self._send = send
+        self._on_stop = on_stop
+        self._store = store or DatabaseOutboxStore()
+        self.workers = workers
+        self.per_endpoint_concurrency = per_endpoint_concurrency
+        self.per_endpoint_rate = per_endpoint_rate
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+        self._start_lock = threading.Lock()
+        self._stopping = False
+
+        # Bumped on every local enqueue; flush() waits for the worker to go idle
+        # after having seen the latest generation
+        self._idle = threading.Condition()
+        self._generation = 0
+        self._idle_generation = 0
+
+        self._outcomes: list[dict[str, Any]] = []
+        self._endpoints: dict[str, _EndpointLimits] = {}
+        self._reported_tenants: set[str] = set()
+
+    def enqueue(
+        self,
+        tenant_id: str,
+        webhook_url: str,
+        payload: dict[str, Any],
+        event_type: str,
+        object_id: str | None = None,
+        config_id: str | None = None,
+    ) -> str:
+        """Durably queue a webhook and wake the local workers.
+
+        Returns:
+            The delivery_id of the webhook_deliveries row
+        """
+        item = OutboxItem(
+            delivery_id=f"whd_{uuid.uuid4().hex}",
+            tenant_id=tenant_id,
+            webhook_url=webhook_url,
+            payload=payload,
+            event_type=event_type,
+            object_id=object_id,
+            config_id=config_id,
+        )
+        self._store.add(item)
+        with self._idle:
+            self._generation += 1
+        self.start()
+        self._notify()
+        return item.delivery_id
+
+    def start(self) -> None:
+        """Start the delivery workers (no-op when running or configured with 0 workers)."""
+        if self.workers <= 0 or self._stopping or self._is_running():
+            return
+        with self._start_lock:
+            if self._is_running():
+                return
+            # A forked child inherits this object but not the worker thread or its loop
+            self._pid = os.getpid()
+            self._loop = None
+            self._endpoints = {}
+            self._outcomes = []
+            ready = threading.Event()
+            self._thread = threading.Thread(target=self._run_loop, args=(ready,), name="webhook-outbox", daemon=True)
+            self._thread.start()
+            ready.wait(5)
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Block until every webhook due so far has been attempted and its outcome written.
+
+        Returns:
+            True if the workers went idle within ``timeout``
+        """
+        deadline = time.monotonic() + timeout
+        with self._idle:
+            target = self._generation
+            while self._idle_generation < target:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._is_running():
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the workers, letting in-flight deliveries finish and record their outcome."""
+        self._stopping = True
+        if self._is_running():
+            self._notify()
+            assert self._thread is not None
+            self._thread.join(timeout)
+
+    def _is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive() and self._pid == os.getpid()
+
+    def _notify(self) -> None:
+        loop, wake = self._loop, self._wake
+        if loop is not None and wake is not None:
+            try:
+                loop.call_soon_threadsafe(wake.set)
+            except RuntimeError:
+                pass  # Loop already closed
+
+    def _run_loop(self, ready: threading.Event) -> None:
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self._run(ready))
+        except Exception as e:
+            logger.error(f"Webhook outbox worker crashed: {e}", exc_info=True)
+        finally:
+            loop.close()
+
+    async def _run(self, ready: threading.Event) -> None:
+        self._wake = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        ready.set()
+
+        in_flight: set[asyncio.Task] = set()
+        next_stats_at = 0.0
+
+        while not self._stopping:
+            with self._idle:
+                generation = self._generation
+
+            # Record finished attempts first so due retries are claimable below
+            await self._write_outcomes()
+
+            capacity = self.workers - len(in_flight)
+            claimed: list[OutboxItem] = []
+            if capacity > 0:
+                try:
+                    claimed = await asyncio.to_thread(self._store.claim, capacity, OutboxConfig.LEASE_SECONDS)
+                except Exception as e:
+                    logger.error(f"Failed to claim webhooks from outbox: {e}", exc_info=True)
+            for item in claimed:
+                task = asyncio.create_task(self._process(item))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+                task.add_done_callback(lambda _: self._wake.set() if self._wake else None)
+
+            if time.monotonic() >= next_stats_at:
+                await self._report_stats()
+                self._evict_idle_endpoints()
+                next_stats_at = time.monotonic() + OutboxConfig.STATS_INTERVAL_SECONDS
+
+            if capacity > 0 and len(claimed) == capacity:
+                continue  # More may be due right now
+
+            if not in_flight and not self._outcomes:
+                with self._idle:
+                    self._idle_generation = generation
+                    self._idle.notify_all()
+
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+            except TimeoutError:
+                pass
+            self._wake.clear()
+
+        if in_flight:
+            await asyncio.wait(in_flight, timeout=OutboxConfig.LEASE_SECONDS)
+        await self._write_outcomes()
+
+        if self._on_stop is not None:
+            try:
+                await self._on_stop()
+            except Exception as e:
+                logger.warning(f"Webhook outbox stop hook failed: {e}")
+
+    async def _process(self, item: OutboxItem) -> None:
+        key = item.endpoint_key
+        endpoint = self._endpoints.get(key)
+        if endpoint is None:
+            endpoint = self._endpoints[key] = _EndpointLimits(
+                slots=asyncio.Semaphore(self.per_endpoint_concurrency),
+                rate=_RateLimiter(self.per_endpoint_rate),
+            )
+
+        endpoint.users += 1
+        try:
+            async with endpoint.slots:
+                await endpoint.rate.acquire()
+                if not await self._renew_lease(item):
+                    return
+                start = time.perf_counter()
+                try:
+                    result = await self._send(item)
+                except Exception as e:
+                    logger.error(f"Unexpected error delivering webhook {item.delivery_id}: {e}", exc_info=True)
+                    result = DeliveryResult(success=False, error=str(e))
+                if result.retry_after is None:
+                    webhook_delivery_duration.labels(tenant_id=item.tenant_id, event_type=item.event_type).observe(
+                        time.perf_counter() - start
+                    )
+        finally:
+            endpoint.users -= 1
+
+        self._outcomes.append(self._outcome(item, result))
+
+    def _evict_idle_endpoints(self) -> None:
+        """Forget the limits of endpoints with nothing in flight whose rate window has passed."""
+        for key in [key for key, endpoint in self._endpoints.items() if not endpoint.users and endpoint.rate.idle()]:
+            del self._endpoints[key]
+
+    async def _renew_lease(self, item: OutboxItem) -> bool:
+        """Make sure the lease still covers the request; False if the item now belongs to another worker."""
+        if item.lease_until is None:
+            return True
+        remaining = (item.lease_until - _utcnow()).total_seconds()
+        if remaining >= OutboxConfig.LEASE_SECONDS / 2:
+            return True  # Did not wait long for the slot: no extra round trip
+        try:
+            renewed = await asyncio.to_thread(self._store.renew, item, OutboxConfig.LEASE_SECONDS)
+        except Exception as e:
+            # Leave it to lease expiry rather than risk a duplicate delivery
+            logger.error(f"Failed to renew lease on webhook {item.delivery_id}: {e}", exc_info=True)
+            return False
+        if not renewed:
+            logger.info(f"Webhook {item.delivery_id} was re-claimed while waiting for its endpoint; skipping")
+        return renewed
+
+    def _outcome(self, item: OutboxItem, result: DeliveryResult) -> dict[str, Any]:
+        now = _utcnow()
+        if result.retry_after is not None:
+            # Not attempted: put it back without using up an attempt
+            return {
+                "delivery_id": item.delivery_id,
+                "status": "retrying" if item.attempts else "pending",
+                "next_attempt_at": now + timedelta(seconds=result.retry_after),
+            }
+
+        attempts = item.attempts + 1
+        outcome: dict[str, Any] = {
+            "delivery_id": item.delivery_id,
+            "attempts": attempts,
+            "last_attempt_at": now,
+            "response_code": result.response_code,
+            "last_error": result.error,
+            "delivered_at": None,
+            "next_attempt_at": None,
+        }
+        if result.success:
+            outcome.update(status="delivered", delivered_at=now, last_error=None)
+            webhook_delivery_total.labels(tenant_id=item.tenant_id, event_type=item.event_type, status="success").inc()
+            webhook_delivery_attempts.labels(tenant_id=item.tenant_id, event_type=item.event_type).observe(attempts)
+        elif result.retryable and attempts < self.max_attempts:
+            delay = min(
+                OutboxConfig.BACKOFF_BASE_SECONDS * 2 ** (attempts - 1), OutboxConfig.BACKOFF_MAX_SECONDS
+            ) + random.uniform(0, OutboxConfig.BACKOFF_JITTER_SECONDS)
+            outcome.update(status="retrying", next_attempt_at=now + timedelta(seconds=delay))
+            logger.debug(f"Webhook {item.delivery_id} attempt {attempts} failed, retrying in {delay:.1f}s")
+        else:
+            outcome.update(status="failed")
+            webhook_delivery_total.labels(tenant_id=item.tenant_id, event_type=item.event_type, status="failed").inc()
+            logger.warning(
+                f"Webhook {item.delivery_id} to {item.webhook_url} failed after {attempts} attempt(s): {result.error}"
+            )
+        return outcome
+
+    async def _write_outcomes(self) -> None:
+        if not self._outcomes:
+            return
+        batch, self._outcomes = self._outcomes, []
+        try:
+            await asyncio.to_thread(self._store.complete, batch)
+        except Exception as e:
+            # Leases expire and the rows are redelivered; nothing is lost
+            logger.error(f"Failed to record {len(batch)} webhook outcome(s): {e}", exc_info=True)
+
+    async def _report_stats(self) -> None:
+        try:
+            stats = await asyncio.to_thread(self._store.stats)
+        except Exception as e:
+            logger.debug(f"Could not read webhook outbox stats: {e}")
+            return
+        now = _utcnow()
+        for tenant_id, (count, oldest) in stats.items():
+            webhook_queue_size.labels(tenant_id=tenant_id).set(count)
+            webhook_queue_oldest_age.labels(tenant_id=tenant_id).set(max(0.0, (now - oldest).total_seconds()))
+        for tenant_id in self._reported_tenants - stats.keys():
+            webhook_queue_size.labels(tenant_id=tenant_id).set(0)
+            webhook_queue_oldest_age.labels(tenant_id=tenant_id).set(0)
+        self._reported_tenants = set(stats)
+
+
+def outbox_settings_from_env() -> dict[str, Any]:
+    """WebhookOutbox keyword arguments from ADCP_WEBHOOK_OUTBOX_* environment variables."""
+    return {
+        "workers": int(os.environ.get("ADCP_WEBHOOK_OUTBOX_WORKERS", "8")),
+        "per_endpoint_concurrency": int(os.environ.get("ADCP_WEBHOOK_OUTBOX_PER_ENDPOINT_CONCURRENCY", "2")),
+        "per_endpoint_rate": float(os.environ.get("ADCP_WEBHOOK_OUTBOX_PER_ENDPOINT_RATE", "10")),
+        "max_attempts": int(os.environ.get("ADCP_WEBHOOK_OUTBOX_MAX_ATTEMPTS", "5")),
+        "poll_interval": float(os.environ.get("ADCP_WEBHOOK_OUTBOX_POLL_INTERVAL", "1.0")),
+    }
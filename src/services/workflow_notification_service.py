@@ -0,0 +1,199 @@
+"""Out-of-band push notifications for workflow step status changes.
+
+ContextManager.update_workflow_step used to find the step's push notification
+targets and POST to the buyer's webhook inside the caller's request (blocking,
+via asyncio.run, when no event loop was running), once per object mapping and
+per active config. A slow buyer endpoint stalled admin approvals and tool calls.
+
+Status changes are now queued after the step is committed, as "workflow_step"
+rows in the webhook outbox (src/services/webhook_outbox.py), and delivered by
+its async workers: a pooled HTTP client, per-endpoint concurrency and rate
+limits, and retries with backoff. Queuing costs the caller one INSERT, however
+many webhooks the principal has.
+
+Webhook credentials stay in the step's request_data and are read (and cached
+briefly) when a notification is delivered.
+
+Environment variables:
+    ADCP_WEBHOOK_OUTBOX_*: Worker pool and per-endpoint limits (see webhook_outbox.py)
+"""
+
+import asyncio
+import atexit
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+from adcp import get_adcp_signed_headers_for_webhook
+from sqlalchemy import select
+
+from src.core.database.database_session import get_db_session
+from src.core.database.models import WorkflowStep
+from src.core.utils.ttl_cache import MISSING, TTLCache
+from src.services.protocol_webhook_service import _normalize_localhost_for_docker
+from src.services.webhook_outbox import (
+    DatabaseOutboxStore,
+    DeliveryResult,
+    OutboxItem,
+    OutboxStore,
+    WebhookOutbox,
+    outbox_settings_from_env,
+)
+
+logger = logging.getLogger(__name__)
+
+WORKFLOW_STEP_EVENT = "workflow_step"
+
+
+@dataclass(frozen=True)
+class _StepAuth:
+    """Authentication of a step's push_notification_config."""
+
+    authentication_type: str | None
+    authentication_token: str | None
+
+
+class WorkflowNotificationService:
+    """Queues workflow step push notifications and delivers them from the outbox."""
+
+    def __init__(self, store: OutboxStore | None = None) -> None:
+        """Initialize the service.
+
+        Args:
+            store: Outbox storage (default: "workflow_step" rows of the webhook_deliveries table)
+        """
+        self._outbox = WebhookOutbox(
+            send=self._deliver,
+            store=store or DatabaseOutboxStore(event_types=(WORKFLOW_STEP_EVENT,)),
+            on_stop=self._close_http_client,
+            **outbox_settings_from_env(),
+        )
+        self._auth = TTLCache(maxsize=1024, ttl=30, name="workflow_webhook_auth")
+        self._http_client: httpx.AsyncClient | None = None
+        self._http_client_loop: asyncio.AbstractEventLoop | None = None
+
+        atexit.register(self._shutdown)
+
+    def enqueue(self, tenant_id: str, step_id: str, url: str, payload: dict[str, Any]) -> str:
+        """Queue a push notification for a step status change.
+
+        Args:
+            tenant_id: Tenant of the step's context
+            step_id: Workflow step whose status changed
+            url: Buyer webhook URL from the step's push_notification_config
+            payload: Serialized A2A or MCP webhook payload
+
+        Returns:
+            The delivery_id of the queued notification
+        """
+        return self._outbox.enqueue(
+            tenant_id=tenant_id,
+            webhook_url=url,
+            payload=payload,
+            event_type=WORKFLOW_STEP_EVENT,
+            object_id=step_id,
+        )
+
+    def start(self) -> None:
+        """Start delivering queued notifications, including any persisted before a restart."""
+        self._outbox.start()
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Wait until every queued notification has been attempted (used by tests and shutdown)."""
+        return self._outbox.flush(timeout)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop delivering: in-flight notifications record their outcome, queued ones stay in the outbox."""
+        self._outbox.stop(timeout)
+
+    def _load_step_auth(self, step_id: str | None) -> _StepAuth:
+        cached = self._auth.get(step_id)
+        if cached is not MISSING:
+            return cached
+
+        with get_db_session() as session:
+            request_data = session.scalar(select(WorkflowStep.request_data).filter_by(step_id=step_id))
+        authentication = ((request_data or {}).get("push_notification_config") or {}).get("authentication") or {}
+        schemes = authentication.get("schemes") or []
+        auth = _StepAuth(
+            authentication_type=schemes[0] if isinstance(schemes, list) and schemes else None,
+            authentication_token=authentication.get("credentials"),
+        )
+        self._auth.set(step_id, auth)
+        return auth
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        # One pooled client per event loop; the outbox runs a single loop per process
+        loop = asyncio.get_running_loop()
+        if self._http_client is None or self._http_client_loop is not loop:
+            self._http_client = httpx.AsyncClient(timeout=10.0)
+            self._http_client_loop = loop
+        return self._http_client
+
+    async def _close_http_client(self) -> None:
+        """Close the pooled client on the outbox loop before it stops (outbox stop hook)."""
+        client, self._http_client = self._http_client, None
+        self._http_client_loop = None
+        if client is not None:
+            await client.aclose()
+
+    async def _deliver(self, item: OutboxItem) -> DeliveryResult:
+        """Make one delivery attempt for a queued notification (outbox send callback)."""
+        auth = await asyncio.to_thread(self._load_step_auth, item.object_id)
+
+        headers = {"Content-Type": "application/json", "User-Agent": "AdCP-Sales-Agent/1.0"}
+        if auth.authentication_type == "HMAC-SHA256" and auth.authentication_token:
+            get_adcp_signed_headers_for_webhook(headers, auth.authentication_token, str(int(time.time())), item.payload)
+        elif auth.authentication_type == "Bearer" and auth.authentication_token:
+            headers["Authorization"] = f"Bearer {auth.authentication_token}"
+
+        url = _normalize_localhost_for_docker(item.webhook_url)
+        try:
+            response = await self._get_http_client().post(url, json=item.payload, headers=headers)
+        except httpx.TimeoutException:
+            logger.warning(f"Workflow step webhook to {url} timed out (attempt: {item.attempts + 1})")
+            return DeliveryResult(success=False, error="Request timed out")
+        except httpx.RequestError as e:
+            logger.warning(f"Workflow step webhook to {url} failed: {e} (attempt: {item.attempts + 1})")
+            return DeliveryResult(success=False, error=str(e))
+
+        if 200 <= response.status_code < 300:
+            logger.info(f"Workflow step webhook delivered for step {item.object_id} (status: {response.status_code})")
+            return DeliveryResult(success=True, response_code=response.status_code)
+
+        logger.warning(
+            f"Workflow step webhook to {url} returned status {response.status_code} (attempt: {item.attempts + 1})"
+        )
+        # Client errors will not succeed on retry, except timeouts and rate limiting
+        retryable = response.status_code >= 500 or response.status_code in (408, 429)
+        return DeliveryResult(
+            success=False,
+            response_code=response.status_code,
+            error=f"HTTP {response.status_code}",
+            retryable=retryable,
+        )
+
+    def _shutdown(self) -> None:
+        """Stop the service at interpreter exit."""
+        try:
+            self.stop()
+        except (ValueError, OSError):
+            # Logging stream may be closed during interpreter shutdown
+            pass
+
+
+_service: WorkflowNotificationService | None = None
+_service_lock = threading.Lock()
+
+
+def get_workflow_notification_service() -> WorkflowNotificationService:
+    """Get or create the process-wide workflow notification service."""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = WorkflowNotificationService()
+    return _service
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""Benchmark GAM report download parsing: buffered DictReader vs streaming aggregation.
+
+Generates a synthetic gzipped CSV_DUMP report with a multi-million-row body and
+compares:
+- legacy: response.content read fully into memory, gunzipped through BytesIO,
+  parsed into a list of DictReader dicts (capped at MAX_ROWS_PER_REPORT), then
+  re-normalized and aggregated row by row
+- streaming: GAMReportingService._run_aggregated_report, which decompresses the
+  body chunk by chunk and aggregates into per-key accumulators with no row cap
+
+Each mode runs in a fresh child process so peak RSS is measured independently.
+Before timing, both implementations are checked to produce identical output on a
+report small enough to fit under the legacy row cap.
+
+Usage:
+    python tests/benchmarks/benchmark_gam_report_parsing.py [rows]
+"""
+
+import csv
+import gzip
+import io
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.adapters.gam_reporting_service import REPORT_COLUMN_MAPPINGS, GAMReportingService, ReportingConfig
+
+HEADER = [
+    "Dimension.DATE",
+    "Dimension.ADVERTISER_ID",
+    "Dimension.ORDER_ID",
+    "Dimension.LINE_ITEM_ID",
+    "Dimension.COUNTRY_NAME",
+    "Column.AD_SERVER_IMPRESSIONS",
+    "Column.AD_SERVER_CLICKS",
+    "Column.AD_SERVER_CPM_AND_CPC_REVENUE",
+]
+COUNTRIES = ["United States", "Canada", "United Kingdom", "Germany", "France", "Japan", "Brazil", "India"]
+
+
+class FileResponse:
+    """requests.Response stand-in backed by a file on disk."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    @property
+    def content(self) -> bytes:
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def iter_content(self, chunk_size: int = 1):
+        with open(self.path, "rb") as f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+
+    def close(self) -> None:
+        pass
+
+
+def write_report(path: str, rows: int) -> None:
+    """Write a synthetic report: 30 days x 40 line items x 8 countries of keys, repeated."""
+    with gzip.open(path, "wt", compresslevel=1, newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        for i in range(rows):
+            line_item = i % 40
+            writer.writerow(
+                [
+                    f"2025-01-{1 + (i // 320) % 30:02d}",
+                    f"{5000 + line_item % 5}",
+                    f"{7000 + line_item % 10}",
+                    f"{9000 + line_item}",
+                    COUNTRIES[(i // 40) % 8],
+                    (i * 7) % 500,
+                    (i * 3) % 5,
+                    ((i * 7) % 500) * 2500,
+                ]
+            )
+
+
+def legacy_parse(service: GAMReportingService, response: FileResponse) -> tuple[list[dict], int]:
+    """The pre-streaming _run_report parsing plus _process_report_data aggregation."""
+    data = []
+    with gzip.open(io.BytesIO(response.content), "rt") as gz_file:
+        for i, row in enumerate(csv.DictReader(gz_file)):
+            if i >= ReportingConfig.MAX_ROWS_PER_REPORT:
+                break
+            data.append(row)
+
+    aggregated: dict[tuple, dict] = {}
+    for row in data:
+        normalized = {REPORT_COLUMN_MAPPINGS.get(key, key): value for key, value in row.items()}
+        impressions = int(normalized.get("AD_SERVER_IMPRESSIONS", 0) or 0)
+        if impressions == 0:
+            continue
+        timestamp = service._parse_timestamp(normalized, "daily")
+        key = (
+            timestamp,
+            normalized.get("ADVERTISER_ID", ""),
+            normalized.get("ORDER_ID", ""),
+            normalized.get("LINE_ITEM_ID", ""),
+            normalized.get("COUNTRY_NAME", ""),
+            normalized.get("AD_UNIT_ID", ""),
+        )
+        if key not in aggregated:
+            aggregated[key] = {
+                "timestamp": timestamp,
+                "advertiser_id": normalized.get("ADVERTISER_ID", ""),
+                "advertiser_name": normalized.get("ADVERTISER_NAME", ""),
+                "order_id": normalized.get("ORDER_ID", ""),
+                "order_name": normalized.get("ORDER_NAME", ""),
+                "line_item_id": normalized.get("LINE_ITEM_ID", ""),
+                "line_item_name": normalized.get("LINE_ITEM_NAME", ""),
+                "country": normalized.get("COUNTRY_NAME", ""),
+                "ad_unit_id": normalized.get("AD_UNIT_ID", ""),
+                "ad_unit_name": normalized.get("AD_UNIT_NAME", ""),
+                "impressions": 0,
+                "clicks": 0,
+                "revenue_micros": 0,
+                "row_count": 0,
+            }
+        agg = aggregated[key]
+        agg["impressions"] += impressions
+        agg["clicks"] += int(normalized.get("AD_SERVER_CLICKS", 0) or 0)
+        agg["revenue_micros"] += float(normalized.get("AD_SERVER_CPM_AND_CPC_REVENUE", 0) or 0)
+        agg["row_count"] += 1
+
+    processed = []
+    for agg in aggregated.values():
+        spend = agg["revenue_micros"] / 1_000_000
+        impressions, clicks = agg["impressions"], agg["clicks"]
+        processed.append(
+            {
+                "timestamp": agg["timestamp"],
+                "advertiser_id": agg["advertiser_id"],
+                "advertiser_name": agg["advertiser_name"],
+                "order_id": agg["order_id"],
+                "order_name": agg["order_name"],
+                "line_item_id": agg["line_item_id"],
+                "line_item_name": agg["line_item_name"],
+                "country": agg["country"],
+                "ad_unit_id": agg["ad_unit_id"],
+                "ad_unit_name": agg["ad_unit_name"],
+                "impressions": impressions,
+                "clicks": clicks,
+                "ctr": round((clicks / impressions * 100) if impressions > 0 else 0.0, 4),
+                "spend": round(spend, 2),
+                "cpm": round((spend / impressions * 1000) if impressions > 0 else 0.0, 2),
+                "aggregated_rows": agg["row_count"],
+            }
+        )
+    processed.sort(key=lambda x: (x["timestamp"], -x["spend"]))
+    return processed, len(data)
+
+
+def make_service() -> GAMReportingService:
+    service = GAMReportingService(MagicMock(), network_timezone="America/New_York")
+    service.report_service.getReportJobStatus.return_value = "COMPLETED"
+    return service
+
+
+def streaming_parse(service: GAMReportingService, response: FileResponse) -> tuple[list[dict], int]:
+    with patch.object(service, "_download_report", return_value=response):
+        return service._run_aggregated_report({}, "daily")
+
+
+MODES = {"legacy": legacy_parse, "streaming": streaming_parse}
+
+
+def _child(mode: str, path: str, results) -> None:
+    service = make_service()
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    processed, raw_rows = MODES[mode](service, FileResponse(path))
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results.put((elapsed, raw_rows, len(processed), (peak_kb - baseline_kb) / 1024))
+
+
+def run(mode: str, path: str) -> tuple[float, int, int, float]:
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    process = context.Process(target=_child, args=(mode, path, results))
+    process.start()
+    result = results.get()
+    process.join()
+    return result
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Equivalence check on a report under the legacy row cap
+        small = os.path.join(tmp, "small.csv.gz")
+        write_report(small, 20_000)
+        service = make_service()
+        assert legacy_parse(service, FileResponse(small)) == streaming_parse(service, FileResponse(small))
+        print("✅ Legacy and streaming outputs match on a 20,000-row report")
+
+        path = os.path.join(tmp, "report.csv.gz")
+        print(f"Generating {rows:,}-row gzipped report...")
+        write_report(path, rows)
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+
+        legacy = run("legacy", path)
+        streaming = run("streaming", path)
+
+    print(f"\n{'=' * 70}")
+    print(f"📊 GAM report parsing ({rows:,} rows, {size_mb:.1f} MB gzipped)")
+    print(f"{'=' * 70}")
+    print(f"{'mode':<12}{'time':>10}{'rows read':>14}{'agg rows':>11}{'peak RSS':>13}{'rows/s':>12}")
+    for name, (elapsed, raw_rows, agg_rows, peak_mb) in (("legacy", legacy), ("streaming", streaming)):
+        print(
+            f"{name:<12}{elapsed:>9.2f}s{raw_rows:>14,}{agg_rows:>11,}{peak_mb:>10.1f} MB{raw_rows / elapsed:>12,.0f}"
+        )
+
+    if legacy[1] < rows:
+        print(f"\n⚠️  Legacy parsing stopped at the {ReportingConfig.MAX_ROWS_PER_REPORT:,}-row cap", end="")
+        print(f" ({rows - legacy[1]:,} rows silently dropped)")
+    print(f"   Streaming read every row with {streaming[3]:.1f} MB peak RSS growth")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Benchmark media buy delivery fetching: serial per-buy calls vs the batched adapter API.
+
+Registers synthetic media buys (default 1,000) with the mock adapter and fetches
+delivery for all of them using:
+- serial: one adapter.get_media_buy_delivery call per buy (the pre-batch loop)
+- batched: adapter.get_media_buys_delivery, the API get_media_buy_delivery now uses
+
+The mock adapter computes delivery in-process, so each call is wrapped with a
+simulated ad server round-trip (default 50 ms) to model a real platform API.
+Both modes must return delivery for every buy.
+
+No database is needed:
+    python tests/benchmarks/benchmark_media_buy_delivery.py [buys] [latency_ms]
+"""
+
+import io
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from rich.console import Console
+
+from src.adapters import base
+from src.adapters.mock_ad_server import MockAdServer
+from src.core.schemas import Principal, ReportingPeriod
+
+
+def build_adapter(buys: int, latency: float) -> MockAdServer:
+    principal = Principal(principal_id="bench_principal", name="Benchmark Principal", platform_mappings={})
+    adapter = MockAdServer({}, principal, dry_run=False, tenant_id="bench_delivery")
+    adapter.console = Console(file=io.StringIO())  # Keep per-call logging out of the measurement
+
+    now = datetime.now(UTC)
+    for i in range(buys):
+        adapter._media_buys[f"bench_mb_{i}"] = {
+            "id": f"bench_mb_{i}",
+            "buyer_ref": f"ref_{i}",
+            "packages": [{"package_id": f"pkg_{i}_1"}, {"package_id": f"pkg_{i}_2"}],
+            "total_budget": 1000.0 + i,
+            "start_time": now - timedelta(days=10),
+            "end_time": now + timedelta(days=20),
+            "creatives": [],
+            "test_scenario": None,
+        }
+
+    compute = adapter.get_media_buy_delivery
+
+    def with_round_trip(media_buy_id, date_range, today):
+        time.sleep(latency)
+        return compute(media_buy_id, date_range, today)
+
+    adapter.get_media_buy_delivery = with_round_trip  # type: ignore[method-assign]
+    return adapter
+
+
+def main() -> None:
+    buys = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    latency_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 50.0
+
+    adapter = build_adapter(buys, latency_ms / 1000)
+    media_buy_ids = [f"bench_mb_{i}" for i in range(buys)]
+    today = datetime.now(UTC)
+    date_range = ReportingPeriod(start=(today - timedelta(days=30)).isoformat(), end=today.isoformat())
+
+    start = time.perf_counter()
+    serial = {
+        media_buy_id: adapter.get_media_buy_delivery(media_buy_id, date_range, today) for media_buy_id in media_buy_ids
+    }
+    serial_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = adapter.get_media_buys_delivery(media_buy_ids, date_range, today)
+    batched_time = time.perf_counter() - start
+
+    errors = [media_buy_id for media_buy_id, result in batched.items() if isinstance(result, Exception)]
+    assert not errors, f"Batched fetch failed for {len(errors)} media buys, e.g. {errors[:3]}"
+    assert batched.keys() == serial.keys()
+
+    print(f"\n{'=' * 70}")
+    print(f"📊 Media buy delivery fetch ({buys:,} buys, {latency_ms:.0f} ms simulated round-trip)")
+    print(f"{'=' * 70}")
+    print(f"{'mode':<12}{'time':>10}")
+    print(f"{'serial':<12}{serial_time:>9.2f}s")
+    print(f"{'batched':<12}{batched_time:>9.2f}s   (concurrency {base.DELIVERY_FETCH_CONCURRENCY})")
+    print(f"\n✅ Delivery for every buy, {serial_time / batched_time:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Benchmark per-request cost of tenant detection logging in get_principal_from_context.
+
+Compares:
+- legacy: the Rich console output and INFO "TENANT DETECTION" banner that
+  every request used to emit (replayed here against /dev/null)
+- current (diagnostics off): the default hot path, no diagnostic output
+- current (diagnostics on): one structured JSON record per request
+
+Database lookups are patched out and the auth caches are pre-warmed so the
+numbers isolate logging overhead.
+
+Usage:
+    python tests/benchmarks/benchmark_tenant_detection.py [iterations]
+"""
+
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from rich.console import Console
+
+from src.core import auth
+from src.core.auth_cache import cache_principal, cache_tenant, clear_auth_cache
+
+HEADERS = {
+    "host": "acme.sales-agent.example.com",
+    "x-adcp-auth": "tok_benchmark_token_123456",
+    "user-agent": "benchmark",
+    "accept": "application/json",
+    "content-type": "application/json",
+}
+TENANT = {"tenant_id": "acme", "name": "Acme", "subdomain": "acme"}
+
+devnull = open(os.devnull, "w")
+legacy_console = Console(file=devnull, force_terminal=True)
+legacy_logger = logging.getLogger("benchmark.legacy_auth")
+
+
+def legacy_detection_output(headers: dict) -> None:
+    """Replay the per-request output the auth hot path used to produce."""
+    host = headers.get("host")
+    legacy_logger.info("=" * 80)
+    legacy_logger.info("TENANT DETECTION - Auth Headers Debug:")
+    legacy_logger.info(f"  Host: {host}")
+    legacy_logger.info(f"  Apx-Incoming-Host: {None}")
+    legacy_logger.info(f"  x-adcp-tenant: {None}")
+    legacy_logger.info(f"  Total headers available: {len(headers)}")
+    legacy_logger.info("=" * 80)
+    legacy_console.print("[blue]Auth Headers Debug:[/blue]")
+    legacy_console.print(f"  Host: {host}")
+    legacy_console.print(f"  Apx-Incoming-Host: {None}")
+    legacy_console.print(f"  x-adcp-tenant: {None}")
+    legacy_console.print(f"[blue]Checking Host header: {host}[/blue]")
+    legacy_console.print(f"[blue]No virtual host match, extracting subdomain from Host header: {'acme'}[/blue]")
+    legacy_console.print(f"[blue]Looking up tenant by subdomain: {'acme'}[/blue]")
+    legacy_console.print(f"[green]Tenant detected from subdomain: acme → tenant_id: {TENANT['tenant_id']}[/green]")
+    legacy_console.print(f"[bold green]Final tenant_id: {TENANT['tenant_id']} (via subdomain)[/bold green]")
+    legacy_console.print("  x-adcp-auth: Present")
+    legacy_console.print(f"[blue]Looking up principal: tenant_id=acme, token=***{headers['x-adcp-auth'][-6:]}[/blue]")
+    legacy_console.print("[blue]Searching for principal in tenant 'acme'[/blue]")
+    legacy_console.print("[green]Found principal 'principal_1' in tenant 'acme'[/green]")
+
+
+def run(iterations: int, headers: dict, extra=None, repeats: int = 3) -> float:
+    """Return best-of-``repeats`` mean microseconds per get_principal_from_context call."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            auth.get_principal_from_context(None)
+            if extra:
+                extra(headers)
+        timings.append((time.perf_counter() - start) / iterations * 1_000_000)
+    return min(timings)
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    # Route all log output to /dev/null with the usual formatter so formatting cost is included
+    handler = logging.StreamHandler(devnull)
+    handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+    root = logging.getLogger()
+    root.handlers = [handler]
+    root.setLevel(logging.INFO)
+
+    clear_auth_cache()
+    cache_tenant("virtual_host", HEADERS["host"], None)
+    cache_tenant("subdomain", "acme", TENANT)
+    cache_principal(HEADERS["x-adcp-auth"], "acme", "principal_1", "acme")
+
+    debug_headers = {**HEADERS, auth.TENANT_DETECTION_DEBUG_HEADER: "true"}
+
+    with patch("src.core.auth.get_http_headers", return_value=HEADERS):
+        run(1000, HEADERS, repeats=1)  # warm up
+        baseline = run(iterations, HEADERS)
+        legacy = run(iterations, HEADERS, extra=legacy_detection_output)
+
+    with (
+        patch("src.core.auth.get_http_headers", return_value=debug_headers),
+        patch("src.core.auth.TENANT_DETECTION_DEBUG_HEADER_ENABLED", True),
+    ):
+        diagnostics = run(iterations, debug_headers)
+
+    print(f"\n{'=' * 70}")
+    print(f"📊 Tenant detection cost per request ({iterations} iterations)")
+    print(f"{'=' * 70}")
+    print(f"  Legacy (Rich console + INFO banner): {legacy:8.1f} µs")
+    print(f"  Current, diagnostics off:            {baseline:8.1f} µs")
+    print(f"  Current, diagnostics on (1 record):  {diagnostics:8.1f} µs")
+    print(f"\n  Saved per request: {legacy - baseline:.1f} µs ({legacy / baseline:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
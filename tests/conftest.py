@@ -619,9 +619,35 @@ def cleanup_env():
 def reset_singletons():
     """Reset singleton instances between tests."""
     # Reset any singleton instances that might carry state
+    from src.adapters.gam_report_jobs import clear_report_cache
+    from src.core.adapter_pool import clear_adapter_pool
+    from src.core.auth_cache import clear_auth_cache
+    from src.core.product_catalog import clear_product_catalog_cache
+    from src.core.product_index import clear_product_indexes
+    from src.services.dynamic_pricing_service import clear_price_guidance_cache
+    from src.services.policy_check_service import clear_policy_cache
+    from src.services.product_ranking_service import clear_ranking_cache
+
+    clear_auth_cache()
+    clear_report_cache()
+    clear_adapter_pool()
+    clear_product_indexes()
+    clear_product_catalog_cache()
+    clear_policy_cache()
+    clear_ranking_cache()
+    clear_price_guidance_cache()
+
     yield
 
     # Add any singleton reset logic here
+    clear_auth_cache()
+    clear_report_cache()
+    clear_adapter_pool()
+    clear_product_indexes()
+    clear_product_catalog_cache()
+    clear_policy_cache()
+    clear_ranking_cache()
+    clear_price_guidance_cache()
 
 
 # ============================================================================
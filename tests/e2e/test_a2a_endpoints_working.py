@@ -266,8 +266,8 @@ class TestA2ARequestHandler:
     def test_handler_initialization(self):
         """Test that handler initializes correctly."""
         assert self.handler is not None
-        assert hasattr(self.handler, "tasks")
-        assert isinstance(self.handler.tasks, dict)
+        assert hasattr(self.handler, "task_store")
+        assert self.handler.task_store.get("task_unknown") is None
 
     def test_handler_has_required_methods(self):
         """Test that handler has all required A2A methods."""
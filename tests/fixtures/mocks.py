@@ -5,8 +5,10 @@ These mocks simulate external dependencies and services.
 """
 
 import json
+import threading
 import uuid
-from datetime import UTC, datetime
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from unittest.mock import Mock
 
@@ -306,3 +308,75 @@ class MockHTTPResponse:
         if isinstance(self.data, dict):
             return json.dumps(self.data)
         return str(self.data)
+
+
+class MockOutboxStore:
+    """In-memory webhook outbox store (same contract as DatabaseOutboxStore)."""
+
+    def __init__(self):
+        """Initialize empty outbox."""
+        self.rows: dict[str, dict[str, Any]] = {}
+        self.completed_batches: list[list[dict[str, Any]]] = []
+        self._lock = threading.Lock()
+
+    def add(self, item):
+        """Queue an item as pending and due now."""
+        now = datetime.now(UTC).replace(tzinfo=None)
+        with self._lock:
+            self.rows[item.delivery_id] = {
+                "item": replace(item, created_at=now),
+                "status": "pending",
+                "attempts": 0,
+                "next_attempt_at": now,
+            }
+
+    def claim(self, limit: int, lease_seconds: float):
+        """Lease up to ``limit`` due rows."""
+        now = datetime.now(UTC).replace(tzinfo=None)
+        with self._lock:
+            due = [
+                row
+                for row in self.rows.values()
+                if row["next_attempt_at"] is not None and row["next_attempt_at"] <= now
+            ]
+            due.sort(key=lambda row: row["next_attempt_at"])
+            claimed = []
+            for row in due[:limit]:
+                row["status"] = "sending"
+                row["next_attempt_at"] = now + timedelta(seconds=lease_seconds)
+                claimed.append(replace(row["item"], attempts=row["attempts"], lease_until=row["next_attempt_at"]))
+            return claimed
+
+    def renew(self, item, lease_seconds: float) -> bool:
+        """Extend a claimed row's lease unless another claim has taken it over."""
+        now = datetime.now(UTC).replace(tzinfo=None)
+        with self._lock:
+            row = self.rows[item.delivery_id]
+            if row["status"] != "sending" or row["next_attempt_at"] != item.lease_until:
+                return False
+            row["next_attempt_at"] = item.lease_until = now + timedelta(seconds=lease_seconds)
+            return True
+
+    def complete(self, outcomes: list[dict[str, Any]]):
+        """Apply a batch of outcomes."""
+        with self._lock:
+            self.completed_batches.append(outcomes)
+            for outcome in outcomes:
+                self.rows[outcome["delivery_id"]].update({k: v for k, v in outcome.items() if k != "delivery_id"})
+
+    def stats(self):
+        """Undelivered count and oldest created_at per tenant."""
+        with self._lock:
+            stats: dict[str, tuple[int, datetime]] = {}
+            for row in self.rows.values():
+                if row["next_attempt_at"] is None:
+                    continue
+                item = row["item"]
+                count, oldest = stats.get(item.tenant_id, (0, item.created_at))
+                stats[item.tenant_id] = (count + 1, min(oldest, item.created_at))
+            return stats
+
+    def statuses(self) -> list[str]:
+        """Status of every row, in insertion order."""
+        with self._lock:
+            return [row["status"] for row in self.rows.values()]
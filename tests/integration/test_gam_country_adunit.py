@@ -58,6 +58,9 @@ def mock_requests_get(url, **kwargs):
     # Create mock response
     mock_response = unittest.mock.Mock()
     mock_response.content = gz_buffer.getvalue()
+    mock_response.iter_content = lambda chunk_size=1: (
+        mock_response.content[i : i + chunk_size] for i in range(0, len(mock_response.content), chunk_size)
+    )
     mock_response.raise_for_status = unittest.mock.Mock()
     return mock_response
 
@@ -593,3 +593,55 @@ async def test_scheduler_idempotent(integration_db):
     # Run scheduler third time - still no-op
     await scheduler._update_statuses()
     assert _get_media_buy_status(tenant_id, media_buy_id) == "active"
+
+
+@pytest.mark.requires_db
+@pytest.mark.asyncio
+async def test_scheduler_returns_per_transition_counts(integration_db):
+    """_update_statuses reports how many media buys moved per transition."""
+    tenant_id = _create_test_tenant("tenant_counts")
+    principal_id = _create_test_principal(tenant_id)
+    now = datetime.now(UTC)
+    started = {"start_time": now - timedelta(hours=1), "end_time": now + timedelta(days=7)}
+    ended = {"start_time": now - timedelta(days=7), "end_time": now - timedelta(hours=1)}
+
+    for i in range(3):
+        _create_media_buy(tenant_id, principal_id, f"mb_counts_scheduled_{i}", "scheduled", **started)
+    _create_media_buy(tenant_id, principal_id, "mb_counts_pending", "pending_activation", **started)
+    for i in range(2):
+        _create_media_buy(tenant_id, principal_id, f"mb_counts_active_{i}", "active", **ended)
+
+    scheduler = MediaBuyStatusScheduler()
+
+    assert await scheduler._update_statuses() == {
+        "scheduled->active": 3,
+        "pending_activation->active": 1,
+        "active->completed": 2,
+    }
+    # Nothing left to move
+    assert await scheduler._update_statuses() == {}
+
+
+@pytest.mark.requires_db
+@pytest.mark.asyncio
+async def test_ended_pending_activation_completes_regardless_of_creatives(integration_db):
+    """A pending buy whose flight has ended is completed, even with unapproved creatives."""
+    tenant_id = _create_test_tenant("tenant_pending_ended")
+    principal_id = _create_test_principal(tenant_id)
+    now = datetime.now(UTC)
+
+    media_buy_id = _create_media_buy(
+        tenant_id=tenant_id,
+        principal_id=principal_id,
+        media_buy_id="mb_pending_ended",
+        status="pending_activation",
+        start_time=now - timedelta(days=7),
+        end_time=now - timedelta(hours=1),
+    )
+    creative_id = _create_creative(tenant_id, principal_id, "creative_pending_ended", status="pending")
+    _create_creative_assignment(tenant_id, media_buy_id, creative_id)
+
+    scheduler = MediaBuyStatusScheduler()
+
+    assert await scheduler._update_statuses() == {"pending_activation->completed": 1}
+    assert _get_media_buy_status(tenant_id, media_buy_id) == "completed"
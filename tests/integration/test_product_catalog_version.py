@@ -0,0 +1,154 @@
+"""Integration tests for tenants.product_catalog_version bumps.
+
+The before_flush hook in src/core/database/models.py is what invalidates converted
+product catalogs cached by other processes (src/core/product_catalog.py), so every
+write that changes a tenant's catalog must bump the version and unrelated writes
+must not.
+"""
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+
+from src.core.database.database_session import get_db_session
+from src.core.database.models import InventoryProfile, PricingOption, Principal, Product, Tenant
+from tests.helpers.adcp_factories import create_test_db_product_with_pricing
+
+
+def _version(tenant_id: str) -> int:
+    with get_db_session() as session:
+        return session.scalar(select(Tenant.product_catalog_version).where(Tenant.tenant_id == tenant_id))
+
+
+def _bumps(tenant_id: str, change) -> int:
+    """Apply ``change(session)`` in one commit and return how much the tenant's version moved."""
+    before = _version(tenant_id)
+    with get_db_session() as session:
+        change(session)
+        session.commit()
+    return _version(tenant_id) - before
+
+
+def _add_product(tenant_id: str, product_id: str = "catalog_version_product"):
+    def change(session):
+        product, pricing_option = create_test_db_product_with_pricing(tenant_id=tenant_id, product_id=product_id)
+        session.add(product)
+        session.add(pricing_option)
+
+    return change
+
+
+@pytest.mark.requires_db
+def test_product_writes_bump_version(integration_db, sample_tenant):
+    tenant_id = sample_tenant["tenant_id"]
+
+    def rename(session):
+        product = session.scalars(select(Product).filter_by(tenant_id=tenant_id)).one()
+        product.name = "Renamed product"
+
+    def delete(session):
+        session.delete(session.scalars(select(Product).filter_by(tenant_id=tenant_id)).one())
+
+    assert _bumps(tenant_id, _add_product(tenant_id)) == 1
+    assert _bumps(tenant_id, rename) == 1
+    assert _bumps(tenant_id, delete) == 1
+
+
+@pytest.mark.requires_db
+def test_pricing_option_writes_bump_version(integration_db, sample_tenant):
+    tenant_id = sample_tenant["tenant_id"]
+    _bumps(tenant_id, _add_product(tenant_id))
+
+    def add_option(session):
+        session.add(
+            PricingOption(
+                tenant_id=tenant_id,
+                product_id="catalog_version_product",
+                pricing_model="cpc",
+                rate=Decimal("1.50"),
+                currency="USD",
+                is_fixed=True,
+            )
+        )
+
+    def change_rate(session):
+        option = session.scalars(select(PricingOption).filter_by(tenant_id=tenant_id, pricing_model="cpc")).one()
+        option.rate = Decimal("2.00")
+
+    assert _bumps(tenant_id, add_option) == 1
+    assert _bumps(tenant_id, change_rate) == 1
+
+
+@pytest.mark.requires_db
+def test_inventory_profile_writes_bump_version(integration_db, sample_tenant):
+    tenant_id = sample_tenant["tenant_id"]
+
+    def add_profile(session):
+        session.add(
+            InventoryProfile(
+                tenant_id=tenant_id,
+                profile_id="catalog_version_profile",
+                name="Catalog version profile",
+                inventory_config={"ad_units": ["unit_1"], "placements": [], "include_descendants": False},
+                format_ids=[{"agent_url": "https://test.example.com", "id": "format_a"}],
+                publisher_properties=[
+                    {
+                        "property_type": "website",
+                        "name": "Example Website",
+                        "identifiers": [{"type": "domain", "value": "example.com"}],
+                        "publisher_domain": "example.com",
+                    }
+                ],
+            )
+        )
+
+    def change_formats(session):
+        profile = session.scalars(select(InventoryProfile).filter_by(profile_id="catalog_version_profile")).one()
+        profile.format_ids = [{"agent_url": "https://test.example.com", "id": "format_b"}]
+
+    assert _bumps(tenant_id, add_profile) == 1
+    assert _bumps(tenant_id, change_formats) == 1
+
+
+@pytest.mark.requires_db
+def test_tenant_routing_changes_bump_version(integration_db, sample_tenant):
+    tenant_id = sample_tenant["tenant_id"]
+
+    def set_tenant(**values):
+        def change(session):
+            tenant = session.scalars(select(Tenant).filter_by(tenant_id=tenant_id)).one()
+            for field, value in values.items():
+                setattr(tenant, field, value)
+
+        return change
+
+    assert _bumps(tenant_id, set_tenant(subdomain="catalog-version")) == 1
+    assert _bumps(tenant_id, set_tenant(virtual_host="catalog-version.example.com")) == 1
+    # Fields product conversion does not read leave cached catalogs valid
+    assert _bumps(tenant_id, set_tenant(name="Renamed tenant")) == 0
+
+
+@pytest.mark.requires_db
+def test_unrelated_writes_do_not_bump_version(integration_db, sample_tenant):
+    tenant_id = sample_tenant["tenant_id"]
+    _bumps(tenant_id, _add_product(tenant_id))
+
+    def add_principal(session):
+        session.add(
+            Principal(
+                tenant_id=tenant_id,
+                principal_id="catalog_version_principal",
+                name="Catalog version principal",
+                platform_mappings={"mock": {"advertiser_id": "adv_1"}},
+                access_token="catalog_version_token",
+            )
+        )
+
+    def read_only(session):
+        product = session.scalars(select(Product).filter_by(tenant_id=tenant_id)).one()
+        # Assigning the current value leaves the row unmodified
+        product.name = product.name
+
+    assert _bumps(tenant_id, add_principal) == 0
+    assert _bumps(tenant_id, read_only) == 0
@@ -0,0 +1,110 @@
+"""Tests for concurrent explicit skill execution in one A2A message."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from a2a.types import DataPart, Message, MessageSendParams, Part, Role, TaskState
+
+from src.a2a_server.adcp_a2a_server import AdCPRequestHandler, _skill_batches
+from src.a2a_server.task_store import InMemoryTaskStore
+
+
+def _params(*skills: str) -> MessageSendParams:
+    parts = [Part(root=DataPart(data={"skill": skill, "parameters": {}})) for skill in skills]
+    return MessageSendParams(message=Message(message_id="msg_1", role=Role.user, parts=parts))
+
+
+def _invocations(*skills: str) -> list[dict]:
+    return [{"skill": skill, "parameters": {}} for skill in skills]
+
+
+@pytest.fixture
+def handler():
+    handler = AdCPRequestHandler(task_store=InMemoryTaskStore(maxsize=10, ttl=60))
+    with (
+        patch.object(handler, "_get_auth_token", return_value="token"),
+        patch.object(handler, "_create_tool_context_from_a2a", return_value=MagicMock()),
+        patch.object(handler, "_log_a2a_operation"),
+    ):
+        yield handler
+
+
+def test_only_consecutive_discovery_skills_share_a_batch():
+    invocations = _invocations(
+        "get_products",
+        "list_creative_formats",
+        "create_media_buy",
+        "sync_creatives",
+        "list_authorized_properties",
+        "get_products",
+    )
+
+    assert _skill_batches(invocations) == [[0, 1], [2], [3], [4, 5]]
+
+
+def test_batches_are_capped_at_the_concurrency_limit():
+    with patch("src.a2a_server.adcp_a2a_server.A2A_SKILL_CONCURRENCY", 2):
+        assert _skill_batches(_invocations(*["get_products"] * 5)) == [[0, 1], [2, 3], [4]]
+
+
+@pytest.mark.asyncio
+async def test_discovery_skills_run_concurrently_and_keep_message_order(handler):
+    running = 0
+    peak = 0
+
+    async def skill(skill_name, parameters, auth_token, push_notification_config=None):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        # The first skill finishes last
+        await asyncio.sleep(0.03 if skill_name == "get_products" else 0.01)
+        running -= 1
+        return {"skill": skill_name}
+
+    skills = ("get_products", "list_creative_formats", "list_authorized_properties")
+    with patch.object(handler, "_handle_explicit_skill", side_effect=skill):
+        task = await handler.on_message_send(_params(*skills))
+
+    assert peak == 3
+    assert [a.name for a in task.artifacts] == [f"{skill}_result" for skill in skills]
+    assert [a.artifact_id for a in task.artifacts] == ["skill_result_1", "skill_result_2", "skill_result_3"]
+
+
+@pytest.mark.asyncio
+async def test_side_effecting_skills_run_in_order(handler):
+    calls = []
+
+    async def skill(skill_name, parameters, auth_token, push_notification_config=None):
+        calls.append(("start", skill_name))
+        await asyncio.sleep(0.01)
+        calls.append(("end", skill_name))
+        return {"skill": skill_name}
+
+    with patch.object(handler, "_handle_explicit_skill", side_effect=skill):
+        await handler.on_message_send(_params("sync_creatives", "create_media_buy"))
+
+    assert calls == [
+        ("start", "sync_creatives"),
+        ("end", "sync_creatives"),
+        ("start", "create_media_buy"),
+        ("end", "create_media_buy"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_timeout_fails_only_the_slow_skill(handler):
+    async def skill(skill_name, parameters, auth_token, push_notification_config=None):
+        if skill_name == "get_products":
+            await asyncio.sleep(1)
+        return {"skill": skill_name}
+
+    with (
+        patch("src.a2a_server.adcp_a2a_server.A2A_SKILL_TIMEOUT", 0.05),
+        patch.object(handler, "_handle_explicit_skill", side_effect=skill),
+    ):
+        task = await handler.on_message_send(_params("get_products", "list_creative_formats"))
+
+    assert task.status.state == TaskState.completed
+    assert [a.name for a in task.artifacts] == ["error_result", "list_creative_formats_result"]
+    assert "timed out" in task.artifacts[0].parts[-1].root.data["error"]
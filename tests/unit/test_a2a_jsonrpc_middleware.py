@@ -0,0 +1,91 @@
+"""Tests for single-pass JSON-RPC pre-processing of A2A requests."""
+
+import json
+from contextvars import ContextVar
+
+import pytest
+
+from src.a2a_server.jsonrpc_middleware import (
+    JSONRPCPreprocessMiddleware,
+    extract_auth_token,
+    normalize_jsonrpc_ids,
+)
+
+auth_token_var: ContextVar[str | None] = ContextVar("test_auth_token", default=None)
+headers_var: ContextVar[dict | None] = ContextVar("test_headers", default=None)
+
+
+def _scope(path: str = "/a2a", method: str = "POST", headers: dict[str, str] | None = None) -> dict:
+    return {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "headers": [(k.encode(), v.encode()) for k, v in (headers or {}).items()],
+    }
+
+
+async def _call(scope: dict, chunks: list[bytes]) -> dict:
+    """Run the middleware over an app that records what it sees."""
+    seen: dict = {}
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1} for i, chunk in enumerate(chunks)
+    ]
+    messages.append({"type": "http.disconnect"})
+
+    async def receive():
+        return messages.pop(0)
+
+    async def app(scope, receive, send):
+        seen["body"] = (await receive())["body"]
+        seen["next"] = (await receive())["type"]
+        seen["token"] = auth_token_var.get()
+        seen["headers"] = headers_var.get()
+
+    middleware = JSONRPCPreprocessMiddleware(app, auth_token_var=auth_token_var, headers_var=headers_var)
+    await middleware(scope, receive, None)
+    return seen
+
+
+def test_bearer_token_takes_precedence_over_x_adcp_auth():
+    assert extract_auth_token({"authorization": "Bearer abc", "x-adcp-auth": "xyz"}) == ("abc", "Authorization")
+    assert extract_auth_token({"authorization": "Basic abc", "x-adcp-auth": " xyz "}) == ("xyz", "x-adcp-auth")
+    assert extract_auth_token({}) == (None, None)
+
+
+def test_numeric_ids_become_strings():
+    body = json.dumps({"jsonrpc": "2.0", "id": 7, "params": {"message": {"messageId": 42}}}).encode()
+
+    data = json.loads(normalize_jsonrpc_ids(body))
+
+    assert data["id"] == "7"
+    assert data["params"]["message"]["messageId"] == "42"
+
+
+def test_bodies_without_numeric_ids_are_not_reencoded():
+    body = b'{"jsonrpc": "2.0", "id": "a", "params": {"message": {"messageId": "m"}}}'
+    assert normalize_jsonrpc_ids(body) is body
+    assert normalize_jsonrpc_ids(b"not json") == b"not json"
+
+
+@pytest.mark.asyncio
+async def test_a2a_request_body_is_replayed_with_auth_context():
+    body = json.dumps({"jsonrpc": "2.0", "id": 1, "method": "message/send"}).encode()
+    scope = _scope(headers={"authorization": "Bearer tok_123", "host": "acme.example.com"})
+
+    seen = await _call(scope, [body[:10], body[10:]])
+
+    assert json.loads(seen["body"])["id"] == "1"
+    assert seen["next"] == "http.disconnect"
+    assert seen["token"] == "tok_123"
+    assert seen["headers"]["host"] == "acme.example.com"
+    assert auth_token_var.get() is None
+    assert headers_var.get() is None
+
+
+@pytest.mark.asyncio
+async def test_other_routes_pass_through_untouched():
+    seen = await _call(_scope(path="/agent.json", headers={"authorization": "Bearer tok_123"}), [b"{}"])
+
+    assert seen["body"] == b"{}"
+    assert seen["token"] is None
+    assert seen["headers"] is None
@@ -0,0 +1,161 @@
+"""Tests for progressive message/stream events."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from a2a.types import (
+    DataPart,
+    InternalError,
+    Message,
+    MessageSendParams,
+    Part,
+    Role,
+    TaskArtifactUpdateEvent,
+    TaskState,
+    TaskStatusUpdateEvent,
+)
+from a2a.utils.errors import ServerError
+
+from src.a2a_server.adcp_a2a_server import AdCPRequestHandler, _background_runs
+from src.a2a_server.task_store import InMemoryTaskStore
+
+
+def _params(*skills: str) -> MessageSendParams:
+    parts = [Part(root=DataPart(data={"skill": skill, "parameters": {}})) for skill in skills]
+    return MessageSendParams(message=Message(message_id="msg_1", role=Role.user, parts=parts))
+
+
+@pytest.fixture
+def handler():
+    handler = AdCPRequestHandler(task_store=InMemoryTaskStore(maxsize=10, ttl=60))
+    with (
+        patch.object(handler, "_get_auth_token", return_value="token"),
+        patch.object(handler, "_create_tool_context_from_a2a", return_value=MagicMock()),
+        patch.object(handler, "_log_a2a_operation"),
+    ):
+        yield handler
+
+
+@pytest.mark.asyncio
+async def test_working_status_is_sent_before_skills_finish(handler):
+    release = asyncio.Event()
+
+    async def slow_skill(skill_name, parameters, auth_token, push_notification_config=None):
+        await release.wait()
+        return {"formats": []}
+
+    with patch.object(handler, "_handle_explicit_skill", side_effect=slow_skill):
+        stream = handler.on_message_send_stream(_params("list_creative_formats"))
+        first = await asyncio.wait_for(anext(stream), timeout=1)
+
+        assert isinstance(first, TaskStatusUpdateEvent)
+        assert first.status.state == TaskState.working
+        assert first.final is False
+
+        release.set()
+        rest = [event async for event in stream]
+
+    assert isinstance(rest[0], TaskArtifactUpdateEvent)
+    assert rest[-1].final is True
+    assert rest[-1].status.state == TaskState.completed
+    assert handler.task_store.get(first.task_id).status.state == TaskState.completed
+
+
+@pytest.mark.asyncio
+async def test_one_artifact_event_per_skill(handler):
+    async def skill(skill_name, parameters, auth_token, push_notification_config=None):
+        return {"skill": skill_name}
+
+    with patch.object(handler, "_handle_explicit_skill", side_effect=skill):
+        events = [event async for event in handler.on_message_send_stream(_params("list_creatives", "get_products"))]
+
+    artifacts = [e.artifact for e in events if isinstance(e, TaskArtifactUpdateEvent)]
+    assert [a.artifact_id for a in artifacts] == ["skill_result_1", "skill_result_2"]
+    assert [a.name for a in artifacts] == ["list_creatives_result", "get_products_result"]
+
+
+@pytest.mark.asyncio
+async def test_artifacts_stream_as_each_skill_completes(handler):
+    release = asyncio.Event()
+
+    async def skill(skill_name, parameters, auth_token, push_notification_config=None):
+        if skill_name == "create_media_buy":
+            await release.wait()
+        return {"skill": skill_name}
+
+    with patch.object(handler, "_handle_explicit_skill", side_effect=skill):
+        stream = handler.on_message_send_stream(_params("get_products", "create_media_buy"))
+        await anext(stream)  # working status
+        first_artifact = await asyncio.wait_for(anext(stream), timeout=1)
+
+        assert isinstance(first_artifact, TaskArtifactUpdateEvent)
+        assert first_artifact.artifact.name == "get_products_result"
+
+        release.set()
+        rest = [event async for event in stream]
+
+    assert [e.artifact.name for e in rest if isinstance(e, TaskArtifactUpdateEvent)] == ["create_media_buy_result"]
+    assert rest[-1].status.state == TaskState.completed
+
+
+@pytest.mark.asyncio
+async def test_submitted_task_streams_no_artifacts(handler):
+    async def skill(skill_name, parameters, auth_token, push_notification_config=None):
+        return {"status": "submitted"} if skill_name == "create_media_buy" else {"skill": skill_name}
+
+    with (
+        patch.object(handler, "_handle_explicit_skill", side_effect=skill),
+        patch.object(handler, "_send_protocol_webhook"),
+    ):
+        events = [
+            event async for event in handler.on_message_send_stream(_params("create_media_buy", "sync_creatives"))
+        ]
+
+    assert not [e for e in events if isinstance(e, TaskArtifactUpdateEvent)]
+    assert events[-1].final is True
+    assert events[-1].status.state == TaskState.submitted
+
+
+@pytest.mark.asyncio
+async def test_failed_background_run_is_logged(handler):
+    release = asyncio.Event()
+
+    async def failing_skill(skill_name, parameters, auth_token, push_notification_config=None):
+        await release.wait()
+        raise ServerError(InternalError(message="boom"))
+
+    with (
+        patch.object(handler, "_handle_explicit_skill", side_effect=failing_skill),
+        patch("src.a2a_server.adcp_a2a_server.logger") as logger,
+    ):
+        stream = handler.on_message_send_stream(_params("list_creative_formats"))
+        await anext(stream)
+        await stream.aclose()
+        assert len(_background_runs) == 1
+
+        release.set()
+        while _background_runs:
+            await asyncio.sleep(0.01)
+
+    assert "client disconnected" in logger.error.call_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_large_product_lists_are_sent_in_batches(handler):
+    products = [{"product_id": f"p{i}"} for i in range(120)]
+
+    async def get_products(skill_name, parameters, auth_token, push_notification_config=None):
+        return {"products": products}
+
+    with (
+        patch("src.a2a_server.adcp_a2a_server.A2A_STREAM_PRODUCT_BATCH", 50),
+        patch.object(handler, "_handle_explicit_skill", side_effect=get_products),
+    ):
+        events = [event async for event in handler.on_message_send_stream(_params("get_products"))]
+
+    chunks = [e for e in events if isinstance(e, TaskArtifactUpdateEvent)]
+    assert [(bool(c.append), c.last_chunk) for c in chunks] == [(False, False), (True, False), (True, True)]
+    streamed = [p for c in chunks for p in c.artifact.parts[-1].root.data["products"]]
+    assert streamed == products
+    assert {c.artifact.artifact_id for c in chunks} == {"skill_result_1"}
@@ -0,0 +1,58 @@
+"""Tests for the bounded A2A task store."""
+
+import time
+
+import pytest
+from a2a.types import Task, TaskIdParams, TaskQueryParams, TaskState, TaskStatus
+
+from src.a2a_server.adcp_a2a_server import AdCPRequestHandler
+from src.a2a_server.task_store import InMemoryTaskStore, new_task_id
+
+
+def _task(task_id: str | None = None) -> Task:
+    return Task(
+        id=task_id or new_task_id(),
+        context_id="ctx_1",
+        kind="task",
+        status=TaskStatus(state=TaskState.working),
+    )
+
+
+def test_task_ids_are_unique():
+    assert len({new_task_id() for _ in range(1000)}) == 1000
+
+
+def test_least_recently_used_task_is_evicted_when_full():
+    store = InMemoryTaskStore(maxsize=2, ttl=60)
+    first, second, third = _task("t1"), _task("t2"), _task("t3")
+    store.save(first)
+    store.save(second)
+    store.get("t1")  # t1 is now more recently used than t2
+    store.save(third)
+
+    assert store.get("t1") is first
+    assert store.get("t2") is None
+    assert store.get("t3") is third
+    assert len(store) == 2
+
+
+def test_tasks_expire_after_ttl():
+    store = InMemoryTaskStore(maxsize=10, ttl=0.01)
+    store.save(_task("t1"))
+    time.sleep(0.02)
+
+    assert store.get("t1") is None
+
+
+@pytest.mark.asyncio
+async def test_handler_reads_and_cancels_through_the_store():
+    store = InMemoryTaskStore(maxsize=10, ttl=60)
+    handler = AdCPRequestHandler(task_store=store)
+    store.save(_task("t1"))
+
+    assert (await handler.on_get_task(TaskQueryParams(id="t1"))).id == "t1"
+    canceled = await handler.on_cancel_task(TaskIdParams(id="t1"))
+
+    assert canceled.status.state == TaskState.canceled
+    assert store.get("t1").status.state == TaskState.canceled
+    assert await handler.on_get_task(TaskQueryParams(id="missing")) is None
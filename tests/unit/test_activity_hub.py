@@ -0,0 +1,182 @@
+"""Tests for the per-tenant activity stream fan-out hub."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.services import activity_hub
+from src.services.activity_hub import ActivityHub
+
+
+class FakeAuditLog:
+    """In-memory audit_logs table exposing the hub's fetch callback."""
+
+    def __init__(self):
+        self.rows: dict[str, list[dict]] = {}
+        self.next_id = 1
+        self.fetches = 0
+        self.lock = threading.Lock()
+
+    def add(self, tenant_id: str, operation: str = "op") -> dict:
+        with self.lock:
+            activity = {"id": self.next_id, "operation": operation}
+            self.next_id += 1
+            self.rows.setdefault(tenant_id, []).append(activity)
+            return activity
+
+    def fetch(self, tenant_id: str, after_id: int | None, limit: int) -> list[dict]:
+        with self.lock:
+            self.fetches += 1
+            rows = self.rows.get(tenant_id, [])
+            if after_id is None:
+                return list(reversed(rows))[:limit]
+            return list(reversed([r for r in rows if r["id"] > after_id][:limit]))
+
+
+@pytest.fixture
+def audit_log():
+    return FakeAuditLog()
+
+
+@pytest.fixture
+def hub(audit_log):
+    # Long fallback poll so tests only see notification-driven fetches
+    hub = ActivityHub(fetch=audit_log.fetch, fallback_poll_interval=60)
+    yield hub
+    hub.close()
+
+
+def _drain(subscription, count: int, timeout: float = 2.0) -> list[dict]:
+    received = []
+    deadline = time.monotonic() + timeout
+    while len(received) < count and time.monotonic() < deadline:
+        activity = subscription.get(timeout=0.05)
+        if activity is not None:
+            received.append(activity)
+    return received
+
+
+def test_backlog_is_shared_and_oldest_first(hub, audit_log):
+    for i in range(3):
+        audit_log.add("t1", f"op_{i}")
+
+    first = hub.subscribe("t1")
+    second = hub.subscribe("t1")
+
+    assert [a["operation"] for a in first.backlog] == ["op_0", "op_1", "op_2"]
+    assert second.backlog == first.backlog
+    # One backlog query for the tenant, not one per subscriber
+    assert audit_log.fetches == 1
+
+
+def test_notify_fans_out_with_constant_queries(hub, audit_log):
+    subscriptions = [hub.subscribe("t1") for _ in range(20)]
+    fetches_before = audit_log.fetches
+
+    audit_log.add("t1", "create_media_buy")
+    hub.notify(["t1"])
+
+    for subscription in subscriptions:
+        assert [a["operation"] for a in _drain(subscription, 1)] == ["create_media_buy"]
+    assert audit_log.fetches - fetches_before == 1
+
+
+def test_events_are_not_redelivered(hub, audit_log):
+    subscription = hub.subscribe("t1")
+
+    audit_log.add("t1", "a")
+    hub.notify(["t1"])
+    assert len(_drain(subscription, 1)) == 1
+
+    hub.notify(["t1"])
+    assert _drain(subscription, 1, timeout=0.2) == []
+
+
+def test_burst_larger_than_fetch_limit_is_delivered_in_order(hub, audit_log):
+    subscription = hub.subscribe("t1")
+
+    with patch.object(activity_hub, "FETCH_LIMIT", 10):
+        for i in range(25):
+            audit_log.add("t1", f"op_{i}")
+        hub.notify(["t1"])
+
+        received = _drain(subscription, 25)
+
+    assert [a["operation"] for a in received] == [f"op_{i}" for i in range(25)]
+
+
+def test_failed_backlog_fetch_is_retried(hub, audit_log):
+    audit_log.add("t1", "before_outage")
+    with patch.object(hub, "fetch", side_effect=RuntimeError("db down")):
+        subscription = hub.subscribe("t1")
+    assert subscription.backlog == []
+
+    audit_log.add("t1", "after_outage")
+    hub.notify(["t1"])
+
+    # The retried backlog fetch delivers the recent rows the subscriber missed
+    assert [a["operation"] for a in _drain(subscription, 2)] == ["before_outage", "after_outage"]
+
+
+def test_tenants_are_isolated(hub, audit_log):
+    t1 = hub.subscribe("t1")
+    t2 = hub.subscribe("t2")
+
+    audit_log.add("t2", "other_tenant")
+    hub.notify(["t1", "t2"])
+
+    assert [a["operation"] for a in _drain(t2, 1)] == ["other_tenant"]
+    assert _drain(t1, 1, timeout=0.2) == []
+
+
+def test_producer_stops_with_last_subscriber(hub, audit_log):
+    first = hub.subscribe("t1")
+    second = hub.subscribe("t1")
+    channel = hub._channels["t1"]
+
+    hub.unsubscribe(first)
+    assert hub.subscriber_count("t1") == 1
+    hub.unsubscribe(second)
+
+    assert "t1" not in hub._channels
+    channel.thread.join(timeout=2)
+    assert not channel.thread.is_alive()
+
+
+def test_fallback_poll_without_notification(audit_log):
+    hub = ActivityHub(fetch=audit_log.fetch, fallback_poll_interval=0.05)
+    subscription = hub.subscribe("t1")
+
+    audit_log.add("t1", "from_other_process")
+
+    assert [a["operation"] for a in _drain(subscription, 1)] == ["from_other_process"]
+    hub.close()
+
+
+def test_slow_subscriber_drops_oldest(hub, audit_log):
+    subscription = hub.subscribe("t1")
+
+    with patch.object(activity_hub, "SUBSCRIBER_QUEUE_SIZE", 2):
+        slow = hub.subscribe("t1")
+    for i in range(4):
+        audit_log.add("t1", f"op_{i}")
+    hub.notify(["t1"])
+
+    assert [a["operation"] for a in _drain(subscription, 4)] == ["op_0", "op_1", "op_2", "op_3"]
+    assert [a["operation"] for a in _drain(slow, 2)] == ["op_2", "op_3"]
+
+
+def test_publish_activity_wakes_local_hub(monkeypatch, audit_log):
+    monkeypatch.setattr(activity_hub, "_hub", ActivityHub(fetch=audit_log.fetch, fallback_poll_interval=60))
+    subscription = activity_hub._hub.subscribe("t1")
+
+    audit_log.add("t1", "written_by_audit_writer")
+    with patch("src.core.database.database_session.get_db_session") as mock_session:
+        activity_hub.publish_activity(["t1", "t1"])
+
+    assert [a["operation"] for a in _drain(subscription, 1)] == ["written_by_audit_writer"]
+    # pg_notify is off in testing mode
+    mock_session.assert_not_called()
+    activity_hub.reset_activity_hub()
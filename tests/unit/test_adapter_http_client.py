@@ -0,0 +1,155 @@
+"""Tests for the pooled ad server HTTP client (connection reuse, retries, rate limiting)."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from src.adapters import http_client
+from src.adapters.http_client import (
+    AdapterHTTPClient,
+    HTTPClientSettings,
+    RateLimiter,
+    RetryConfig,
+    get_http_client,
+)
+
+BASE_URL = "https://api.adserver.example.com/v1"
+
+
+@pytest.fixture(autouse=True)
+def no_backoff():
+    with patch.object(RetryConfig, "BACKOFF_BASE_SECONDS", 0.0):
+        yield
+    http_client.reset_http_clients()
+
+
+def _response(status_code: int) -> Mock:
+    return Mock(status_code=status_code, headers={})
+
+
+def _client(*outcomes, **settings) -> AdapterHTTPClient:
+    client = AdapterHTTPClient("test", BASE_URL, HTTPClientSettings(**settings))
+    client.session.request = Mock(side_effect=list(outcomes))
+    return client
+
+
+def test_clients_are_shared_per_adapter_and_base_url():
+    client = get_http_client("kevel", BASE_URL)
+
+    assert get_http_client("kevel", BASE_URL + "/") is client
+    assert get_http_client("triton", BASE_URL) is not client
+    assert get_http_client("kevel", "https://other.example.com") is not client
+
+
+def test_requests_get_default_timeouts():
+    client = _client(_response(200), connect_timeout=3, read_timeout=12)
+
+    client.get(f"{BASE_URL}/flight", params={"campaignId": "1"})
+
+    assert client.session.request.call_args.kwargs["timeout"] == (3, 12)
+    assert client.session.request.call_args.kwargs["params"] == {"campaignId": "1"}
+
+
+def test_idempotent_request_retried_on_server_error():
+    client = _client(_response(503), _response(502), _response(200), max_retries=2)
+
+    response = client.get(f"{BASE_URL}/flight")
+
+    assert response.status_code == 200
+    assert client.session.request.call_count == 3
+
+
+def test_retries_stop_at_max_and_return_last_response():
+    client = _client(_response(503), _response(503), max_retries=1)
+
+    assert client.put(f"{BASE_URL}/flight/1").status_code == 503
+    assert client.session.request.call_count == 2
+
+
+def test_post_not_retried_on_server_error_but_retried_on_429():
+    client = _client(_response(503))
+    assert client.post(f"{BASE_URL}/campaign").status_code == 503
+    assert client.session.request.call_count == 1
+
+    client = _client(_response(429), _response(200))
+    assert client.post(f"{BASE_URL}/campaign").status_code == 200
+    assert client.session.request.call_count == 2
+
+
+def test_post_not_retried_after_read_timeout():
+    client = _client(requests.exceptions.ReadTimeout("slow"), _response(200))
+
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        client.post(f"{BASE_URL}/campaign")
+    assert client.session.request.call_count == 1
+
+
+def test_connect_timeout_retried_for_any_method():
+    client = _client(requests.exceptions.ConnectTimeout("no route"), _response(200))
+
+    assert client.post(f"{BASE_URL}/campaign").status_code == 200
+    assert client.session.request.call_count == 2
+
+
+def test_get_retried_on_connection_error():
+    client = _client(requests.exceptions.ConnectionError("reset"), _response(200))
+
+    assert client.get(f"{BASE_URL}/flight").status_code == 200
+
+
+def test_rate_limiter_spaces_requests():
+    limiter = RateLimiter(rate=20)
+
+    waits = [limiter.reserve() for _ in range(4)]
+
+    assert waits[0] == 0
+    assert waits[3] == pytest.approx(0.15, abs=0.02)
+    assert RateLimiter(rate=0).reserve() == 0
+
+
+def test_connections_are_reused_across_requests():
+    connections = set()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            connections.add(self.client_address)
+            self.rfile.read(int(self.headers["Content-Length"]))
+            body = json.dumps({"Id": len(connections)}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = AdapterHTTPClient("test", f"http://127.0.0.1:{server.server_port}", HTTPClientSettings())
+        for i in range(5):
+            client.post(f"{client.base_url}/flight", json={"Name": f"package {i}"}).raise_for_status()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert len(connections) == 1
+
+
+def test_kevel_adapters_share_one_client():
+    from src.adapters.kevel import Kevel
+
+    principal = Mock()
+    principal.get_adapter_id.return_value = "123"
+    config = {"api_key": "key", "network_id": "1"}
+
+    adapters = [Kevel(config=config, principal=principal, tenant_id="tenant_1") for _ in range(2)]
+
+    assert adapters[0].http is adapters[1].http
@@ -0,0 +1,149 @@
+"""Tests for the per-tenant ad server client pool."""
+
+import threading
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.adapter_pool import (
+    clear_adapter_pool,
+    get_gam_client_manager,
+    get_pooled_client,
+    invalidate_adapter_pool,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_pool():
+    clear_adapter_pool()
+    yield
+    clear_adapter_pool()
+
+
+class TestGetPooledClient:
+    def test_reuses_client_for_same_key(self):
+        build = MagicMock(side_effect=lambda: object())
+        key = ("t1", "google_ad_manager", "v1", "digest")
+
+        first = get_pooled_client(key, build)
+        second = get_pooled_client(key, build)
+
+        assert first is second
+        assert build.call_count == 1
+
+    def test_new_config_version_builds_new_client_and_drops_old(self):
+        build = MagicMock(side_effect=lambda: object())
+
+        old = get_pooled_client(("t1", "google_ad_manager", "v1", "d"), build)
+        new = get_pooled_client(("t1", "google_ad_manager", "v2", "d"), build)
+        again_old = get_pooled_client(("t1", "google_ad_manager", "v1", "d"), build)
+
+        assert old is not new
+        assert again_old is not old
+        assert build.call_count == 3
+
+    def test_failed_build_is_not_pooled(self):
+        key = ("t1", "google_ad_manager", "v1", "d")
+        with pytest.raises(RuntimeError):
+            get_pooled_client(key, MagicMock(side_effect=RuntimeError("auth failed")))
+
+        client = object()
+        assert get_pooled_client(key, lambda: client) is client
+
+    def test_concurrent_misses_build_once(self):
+        key = ("t1", "google_ad_manager", "v1", "d")
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_build():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return object()
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_pooled_client(key, slow_build))) for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        started.wait(5)
+        release.set()
+        for t in threads:
+            t.join(5)
+
+        assert len(calls) == 1
+        assert len({id(r) for r in results}) == 1
+
+    def test_invalidate_only_affects_tenant(self):
+        build = MagicMock(side_effect=lambda: object())
+        t1 = get_pooled_client(("t1", "google_ad_manager", "v1", "d"), build)
+        t2 = get_pooled_client(("t2", "google_ad_manager", "v1", "d"), build)
+
+        invalidate_adapter_pool("t1")
+
+        assert get_pooled_client(("t1", "google_ad_manager", "v1", "d"), build) is not t1
+        assert get_pooled_client(("t2", "google_ad_manager", "v1", "d"), build) is t2
+
+
+class TestGetGamClientManager:
+    def test_builds_initialized_manager_once(self):
+        with patch("src.adapters.gam.client.GAMClientManager") as manager_cls:
+            manager = manager_cls.return_value
+            manager.refresh_credentials_if_expiring.return_value = False
+
+            first = get_gam_client_manager("t1", "v1", "123", {"refresh_token": "rt"})
+            second = get_gam_client_manager("t1", "v1", "123", {"refresh_token": "rt"})
+
+        assert first is second is manager
+        manager_cls.assert_called_once_with({"refresh_token": "rt"}, "123")
+        manager.get_client.assert_called_once()
+        assert manager.refresh_credentials_if_expiring.call_count == 2
+
+    def test_changed_refresh_token_builds_new_manager(self):
+        with patch("src.adapters.gam.client.GAMClientManager") as manager_cls:
+            manager_cls.side_effect = lambda *args: MagicMock()
+
+            first = get_gam_client_manager("t1", "v1", "123", {"refresh_token": "old"})
+            second = get_gam_client_manager("t1", "v1", "123", {"refresh_token": "new"})
+
+        assert first is not second
+
+    def test_refresh_failure_does_not_fail_request(self):
+        with patch("src.adapters.gam.client.GAMClientManager") as manager_cls:
+            manager = manager_cls.return_value
+            manager.refresh_credentials_if_expiring.side_effect = RuntimeError("token endpoint down")
+
+            assert get_gam_client_manager("t1", "v1", "123", {"refresh_token": "rt"}) is manager
+
+
+class TestRefreshCredentialsIfExpiring:
+    def _manager(self, expiry):
+        from src.adapters.gam.client import GAMClientManager
+
+        manager = GAMClientManager({"refresh_token": "rt"}, "123")
+        manager._client = MagicMock()
+        manager._client.oauth2_client.creds.expiry = expiry
+        return manager
+
+    def test_refreshes_token_close_to_expiry(self):
+        now = datetime.now(UTC).replace(tzinfo=None)
+        manager = self._manager(now + timedelta(seconds=60))
+
+        assert manager.refresh_credentials_if_expiring(300) is True
+        manager._client.oauth2_client.Refresh.assert_called_once()
+
+    def test_leaves_fresh_token_alone(self):
+        now = datetime.now(UTC).replace(tzinfo=None)
+        manager = self._manager(now + timedelta(hours=1))
+
+        assert manager.refresh_credentials_if_expiring(300) is False
+        manager._client.oauth2_client.Refresh.assert_not_called()
+
+    def test_uninitialized_client_is_not_refreshed(self):
+        from src.adapters.gam.client import GAMClientManager
+
+        manager = GAMClientManager({"refresh_token": "rt"}, "123")
+        assert manager.refresh_credentials_if_expiring(300) is False
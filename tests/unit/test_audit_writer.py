@@ -0,0 +1,222 @@
+"""Tests for the background batched audit log writer."""
+
+import json
+import logging
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.audit_writer import AuditLogWriter, AuditRecord
+
+
+def _record(i: int, tenant_id: str | None = "tenant_1", after_write=None) -> AuditRecord:
+    return AuditRecord(
+        row={"tenant_id": tenant_id, "operation": f"Test.op_{i}", "success": True, "details": {"i": i}},
+        backup_file="structured.jsonl",
+        backup_entry={"operation": f"op_{i}"},
+        log_lines=[(logging.INFO, f"Test.op_{i}")],
+        after_write=after_write,
+    )
+
+
+@pytest.fixture
+def mock_session():
+    session = MagicMock()
+    session.__enter__ = MagicMock(return_value=session)
+    session.__exit__ = MagicMock(return_value=None)
+    with patch("src.core.audit_writer.get_db_session", return_value=session):
+        yield session
+
+
+@pytest.fixture
+def writer(tmp_path, monkeypatch):
+    monkeypatch.setenv("ADCP_AUDIT_LOG_ASYNC", "true")
+    writer = AuditLogWriter(
+        log_dir=tmp_path, audit_logger=logging.getLogger("test.audit"), batch_size=50, flush_interval=0.05
+    )
+    yield writer
+    writer.shutdown()
+
+
+def _inserted_rows(session) -> list[dict]:
+    rows = []
+    for call in session.execute.call_args_list:
+        rows.extend(call.args[1])
+    return rows
+
+
+def test_records_are_written_in_batches(writer, mock_session):
+    for i in range(120):
+        assert writer.submit(_record(i))
+
+    assert writer.flush(timeout=5)
+
+    rows = _inserted_rows(mock_session)
+    assert [r["operation"] for r in rows] == [f"Test.op_{i}" for i in range(120)]
+    # 120 records with batch_size=50 -> at most a handful of INSERTs, never one per record
+    assert mock_session.execute.call_count <= 5
+    assert mock_session.commit.call_count == mock_session.execute.call_count
+
+
+def test_submit_does_not_touch_database_on_caller_thread(writer, mock_session):
+    with patch.object(writer, "_ensure_started"):  # worker not running
+        writer.submit(_record(1))
+
+    mock_session.execute.assert_not_called()
+
+
+def test_backup_file_written_with_single_handle(writer, mock_session, tmp_path):
+    real_open = open
+    with patch("builtins.open", side_effect=real_open) as mock_open:
+        for i in range(10):
+            writer.submit(_record(i))
+        writer.flush(timeout=5)
+        for i in range(10, 20):
+            writer.submit(_record(i))
+        writer.flush(timeout=5)
+
+    assert mock_open.call_count == 1
+    lines = (tmp_path / "structured.jsonl").read_text().splitlines()
+    assert [json.loads(line)["operation"] for line in lines] == [f"op_{i}" for i in range(20)]
+
+
+def test_queue_full_drops_records(tmp_path, monkeypatch, mock_session):
+    from src.core.metrics import audit_log_records_total
+
+    monkeypatch.setenv("ADCP_AUDIT_LOG_ASYNC", "true")
+    writer = AuditLogWriter(log_dir=tmp_path, audit_logger=logging.getLogger("test.audit"), max_queue_size=2)
+    dropped = audit_log_records_total.labels(result="dropped")
+    initial = dropped._value.get()
+
+    with patch.object(writer, "_ensure_started"):  # keep the worker from draining
+        results = [writer.submit(_record(i)) for i in range(5)]
+
+    assert results == [True, True, False, False, False]
+    assert dropped._value.get() == initial + 3
+
+    # Shutdown still writes what was queued
+    writer.shutdown()
+    assert len(_inserted_rows(mock_session)) == 2
+
+
+def test_shutdown_drains_pending_records(writer, mock_session):
+    for i in range(30):
+        writer.submit(_record(i))
+
+    writer.shutdown()
+
+    assert len(_inserted_rows(mock_session)) == 30
+
+
+def test_failed_batch_falls_back_to_row_inserts(writer, mock_session):
+    mock_session.execute.side_effect = [Exception("batch failed"), None, None, None]
+
+    writer._write_batch([_record(1), _record(2), _record(3)])
+
+    assert mock_session.execute.call_count == 4
+    assert [call.args[1] for call in mock_session.execute.call_args_list[1:]] == [
+        [_record(1).row],
+        [_record(2).row],
+        [_record(3).row],
+    ]
+
+
+def test_rows_without_tenant_are_skipped(writer, mock_session):
+    writer._write_batch([_record(1, tenant_id=None), _record(2)])
+
+    assert _inserted_rows(mock_session) == [_record(2).row]
+
+
+def test_after_write_runs_after_persisting(writer, mock_session):
+    calls = []
+    notified = threading.Event()
+    mock_session.commit.side_effect = lambda: calls.append("commit")
+
+    def notify():
+        calls.append("notify")
+        notified.set()
+
+    writer._write_batch([_record(1, after_write=notify)])
+
+    assert notified.wait(5)
+    assert calls == ["commit", "notify"]
+
+
+def test_slow_after_write_does_not_block_batches(writer, mock_session):
+    release = threading.Event()
+    writer.submit(_record(1, after_write=release.wait))
+    writer.submit(_record(2))
+
+    try:
+        assert writer.flush(timeout=5)
+        assert len(_inserted_rows(mock_session)) == 2
+    finally:
+        release.set()
+
+
+def test_synchronous_in_testing_mode(tmp_path, monkeypatch, mock_session):
+    monkeypatch.delenv("ADCP_AUDIT_LOG_ASYNC", raising=False)
+    monkeypatch.setenv("ADCP_TESTING", "true")
+    writer = AuditLogWriter(log_dir=tmp_path, audit_logger=logging.getLogger("test.audit"))
+
+    writer.submit(_record(1))
+
+    assert writer._thread is None
+    assert len(_inserted_rows(mock_session)) == 1
+
+
+def test_log_operation_emits_single_log_line(monkeypatch):
+    from src.core.audit_logger import AuditLogger
+
+    submitted = []
+    fake_writer = MagicMock(submit=submitted.append)
+    with patch("src.core.audit_logger.get_audit_log_writer", return_value=fake_writer):
+        AuditLogger("GAM", "tenant_1").log_operation(
+            operation="get_products",
+            principal_name="Acme",
+            principal_id="p1",
+            adapter_id="123",
+            details={"brief": "sports", "count": 3},
+        )
+
+    record = submitted[0]
+    assert record.row["operation"] == "GAM.get_products"
+    assert record.row["tenant_id"] == "tenant_1"
+    assert len(record.log_lines) == 1
+    assert "brief: sports" in record.log_lines[0][1]
+    assert "count: 3" in record.log_lines[0][1]
+    # get_products is not a sensitive operation
+    assert record.after_write is None
+
+
+def test_sensitive_operation_schedules_slack_notification():
+    from src.core.audit_logger import AuditLogger
+
+    submitted = []
+    fake_writer = MagicMock(submit=submitted.append)
+    with patch("src.core.audit_logger.get_audit_log_writer", return_value=fake_writer):
+        AuditLogger("GAM", "tenant_1").log_operation(
+            operation="create_media_buy", principal_name="Acme", principal_id="p1", adapter_id="123"
+        )
+
+    assert submitted[0].after_write is not None
+
+
+def test_log_operation_snapshots_details():
+    from src.core.audit_logger import AuditLogger
+
+    submitted = []
+    fake_writer = MagicMock(submit=submitted.append)
+    details = {"status": "pending", "line_items": ["li_1"]}
+    with patch("src.core.audit_logger.get_audit_log_writer", return_value=fake_writer):
+        AuditLogger("GAM", "tenant_1").log_operation(
+            operation="get_products", principal_name="Acme", principal_id="p1", adapter_id="123", details=details
+        )
+
+    details["status"] = "active"
+    details["line_items"].append("li_2")
+
+    record = submitted[0]
+    assert record.row["details"] == {"status": "pending", "line_items": ["li_1"]}
+    assert record.backup_entry["details"] == {"status": "pending", "line_items": ["li_1"]}
@@ -0,0 +1,194 @@
+"""Tests for the in-process auth resolution cache."""
+
+from unittest.mock import MagicMock, patch
+
+from src.core.auth_cache import (
+    cache_principal,
+    cache_tenant,
+    get_cached_principal,
+    get_cached_tenant,
+    hash_token,
+    invalidate_principal_auth_cache,
+    invalidate_tenant_auth_cache,
+)
+from src.core.utils.ttl_cache import MISSING, TTLCache
+
+
+class TestTTLCache:
+    """Tests for the generic bounded TTL cache."""
+
+    def test_get_returns_missing_for_unknown_key(self):
+        cache = TTLCache(maxsize=10, ttl=60)
+        assert cache.get("nope") is MISSING
+
+    def test_caches_none_values(self):
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("key", None)
+        assert cache.get("key") is None
+
+    def test_entries_expire(self):
+        cache = TTLCache(maxsize=10, ttl=60)
+        with patch("src.core.utils.ttl_cache.time.monotonic", return_value=1000.0):
+            cache.set("key", "value")
+        with patch("src.core.utils.ttl_cache.time.monotonic", return_value=1059.0):
+            assert cache.get("key") == "value"
+        with patch("src.core.utils.ttl_cache.time.monotonic", return_value=1061.0):
+            assert cache.get("key") is MISSING
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is MISSING
+        assert cache.get("c") == 3
+
+    def test_zero_ttl_disables_cache(self):
+        cache = TTLCache(maxsize=10, ttl=0)
+        cache.set("key", "value")
+        assert cache.get("key") is MISSING
+
+    def test_invalidate_where(self):
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set(("t1", "x"), 1)
+        cache.set(("t2", "y"), 2)
+
+        removed = cache.invalidate_where(lambda key, value: key[0] == "t1")
+
+        assert removed == 1
+        assert cache.get(("t1", "x")) is MISSING
+        assert cache.get(("t2", "y")) == 2
+
+    def test_records_hit_and_miss_metrics(self):
+        from src.core.metrics import cache_lookups_total
+
+        cache = TTLCache(maxsize=10, ttl=60, name="test_metrics_cache")
+        hits = cache_lookups_total.labels(cache="test_metrics_cache", result="hit")
+        misses = cache_lookups_total.labels(cache="test_metrics_cache", result="miss")
+        initial_hits, initial_misses = hits._value.get(), misses._value.get()
+
+        cache.get("key")
+        cache.set("key", "value")
+        cache.get("key")
+
+        assert hits._value.get() == initial_hits + 1
+        assert misses._value.get() == initial_misses + 1
+
+
+class TestAuthCache:
+    """Tests for token and tenant resolution caching helpers."""
+
+    def test_token_is_not_stored_in_clear_text(self):
+        cache_principal("secret_token", "tenant_1", "principal_1", "tenant_1")
+
+        from src.core.auth_cache import _principal_cache
+
+        keys = list(_principal_cache._data.keys())
+        assert keys == [(hash_token("secret_token"), "tenant_1")]
+        assert "secret_token" not in repr(keys)
+
+    def test_principal_round_trip(self):
+        cache_principal("tok", None, "principal_1", "tenant_1", {"tenant_id": "tenant_1"})
+
+        assert get_cached_principal("tok", None) == ("principal_1", {"tenant_id": "tenant_1"})
+        assert get_cached_principal("tok", "tenant_1") is None
+
+    def test_cached_tenant_dict_is_a_copy(self):
+        cache_tenant("subdomain", "acme", {"tenant_id": "acme"})
+
+        tenant = get_cached_tenant("subdomain", "acme")
+        tenant["tenant_id"] = "mutated"
+
+        assert get_cached_tenant("subdomain", "acme") == {"tenant_id": "acme"}
+
+    def test_negative_tenant_lookup_is_cached(self):
+        cache_tenant("virtual_host", "unknown.example.com", None)
+
+        assert get_cached_tenant("virtual_host", "unknown.example.com") is None
+        assert get_cached_tenant("virtual_host", "other.example.com") is MISSING
+
+    def test_invalidate_tenant(self):
+        cache_principal("tok_a", "tenant_a", "p_a", "tenant_a")
+        cache_principal("tok_global", None, "p_a2", "tenant_a", {"tenant_id": "tenant_a"})
+        cache_principal("tok_b", "tenant_b", "p_b", "tenant_b")
+        cache_tenant("subdomain", "a", {"tenant_id": "tenant_a"})
+
+        invalidate_tenant_auth_cache("tenant_a")
+
+        assert get_cached_principal("tok_a", "tenant_a") is None
+        assert get_cached_principal("tok_global", None) is None
+        assert get_cached_principal("tok_b", "tenant_b") == ("p_b", None)
+        assert get_cached_tenant("subdomain", "a") is MISSING
+
+    def test_invalidate_principal(self):
+        cache_principal("tok_1", "tenant_a", "p_1", "tenant_a")
+        cache_principal("tok_2", "tenant_a", "p_2", "tenant_a")
+
+        invalidate_principal_auth_cache("tenant_a", "p_1")
+
+        assert get_cached_principal("tok_1", "tenant_a") is None
+        assert get_cached_principal("tok_2", "tenant_a") == ("p_2", None)
+
+
+class TestGetPrincipalFromTokenCaching:
+    """Tests that get_principal_from_token consults the cache before the database."""
+
+    def _mock_session(self, principal, tenant):
+        session = MagicMock()
+        session.__enter__ = MagicMock(return_value=session)
+        session.__exit__ = MagicMock(return_value=None)
+        session.scalars.return_value.first.side_effect = [principal, tenant]
+        return session
+
+    def test_global_lookup_hits_database_once(self):
+        from src.core.auth import get_principal_from_token
+
+        principal = MagicMock(principal_id="principal_1", tenant_id="tenant_1")
+        tenant = MagicMock(tenant_id="tenant_1")
+        session = self._mock_session(principal, tenant)
+
+        with (
+            patch("src.core.auth.get_db_session", return_value=session) as mock_db,
+            patch(
+                "src.core.utils.tenant_utils.serialize_tenant_to_dict", return_value={"tenant_id": "tenant_1"}
+            ) as mock_serialize,
+            patch("src.core.auth.set_current_tenant") as mock_set_tenant,
+        ):
+            assert get_principal_from_token("tok", None) == "principal_1"
+            assert get_principal_from_token("tok", None) == "principal_1"
+
+        assert mock_db.call_count == 1
+        assert mock_serialize.call_count == 1
+        # Tenant context is still set on a cache hit
+        assert mock_set_tenant.call_count == 2
+        mock_set_tenant.assert_called_with({"tenant_id": "tenant_1"})
+
+    def test_invalid_token_is_not_cached(self):
+        from src.core.auth import get_principal_from_token
+
+        session = self._mock_session(None, None)
+        session.scalars.return_value.first.side_effect = None
+        session.scalars.return_value.first.return_value = None
+
+        with patch("src.core.auth.get_db_session", return_value=session) as mock_db:
+            assert get_principal_from_token("bad", None) is None
+            assert get_principal_from_token("bad", None) is None
+
+        assert mock_db.call_count == 2
+
+    def test_tenant_lookup_from_host_is_cached(self):
+        from src.core.auth import get_principal_from_context
+
+        headers = {"host": "acme.example.com"}
+        with (
+            patch("src.core.auth.get_http_headers", return_value=headers),
+            patch("src.core.auth.get_tenant_by_virtual_host", return_value={"tenant_id": "acme"}) as mock_virtual_host,
+        ):
+            assert get_principal_from_context(None) == (None, {"tenant_id": "acme"})
+            assert get_principal_from_context(None) == (None, {"tenant_id": "acme"})
+
+        assert mock_virtual_host.call_count == 1
@@ -1,10 +1,14 @@
 """Unit tests for Creative Agent Registry adcp library integration."""
 
-from unittest.mock import AsyncMock, Mock
+import asyncio
+import threading
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from src.core.creative_agent_registry import CreativeAgent, CreativeAgentRegistry
+from src.core.creative_agent_registry import CachedFormats, CreativeAgent, CreativeAgentRegistry, FormatIndex
 
 
 class TestCreativeAgentRegistry:
@@ -283,3 +287,144 @@ class TestCreativeAgentRegistry:
         # Verify format was constructed
         assert len(formats) == 1
         assert formats[0].format_id.id == "display_300x250"
+
+
+def _fmt(name, fmt_type="display", dims=(), asset_types=(), responsive=False):
+    """Build a minimal format stand-in with the attributes the registry indexes."""
+    renders = [
+        SimpleNamespace(
+            dimensions=SimpleNamespace(
+                width=w, height=h, responsive=SimpleNamespace(width=responsive, height=False) if responsive else None
+            )
+        )
+        for w, h in dims
+    ]
+    assets = [SimpleNamespace(asset_type=SimpleNamespace(value=at)) for at in asset_types]
+    return SimpleNamespace(name=name, type=SimpleNamespace(value=fmt_type), renders=renders, assets_required=assets)
+
+
+class TestFormatIndex:
+    """Local filtering of cached format lists."""
+
+    def setup_method(self):
+        self.banner = _fmt("Medium Rectangle", dims=[(300, 250)], asset_types=["image"])
+        self.leaderboard = _fmt("Leaderboard", dims=[(728, 90)], asset_types=["image", "html"])
+        self.video = _fmt("Outstream Video", fmt_type="video", dims=[(640, 360)], asset_types=["video"])
+        self.native = _fmt("Native Responsive", fmt_type="native", dims=[(None, None)], responsive=True)
+        self.index = FormatIndex([self.banner, self.leaderboard, self.video, self.native])
+
+    def test_no_filters_returns_all_in_order(self):
+        assert self.index.filter() == [self.banner, self.leaderboard, self.video, self.native]
+
+    def test_filters_by_type_and_asset_type(self):
+        assert self.index.filter(type_filter="display") == [self.banner, self.leaderboard]
+        assert self.index.filter(asset_types=["html", "video"]) == [self.leaderboard, self.video]
+
+    def test_dimension_filters_exclude_formats_without_dimensions(self):
+        assert self.index.filter(max_width=700) == [self.banner, self.video]
+        assert self.index.filter(min_width=600, max_height=100) == [self.leaderboard]
+
+    def test_responsive_and_name_filters(self):
+        assert self.index.filter(is_responsive=True) == [self.native]
+        assert self.index.filter(is_responsive=False, name_search="VIDEO") == [self.video]
+
+
+class TestFormatCaching:
+    """Caching, single-flight and stale-while-revalidate behaviour."""
+
+    agent = CreativeAgent(agent_url="https://agent.example.com", name="Agent", timeout=5)
+
+    @pytest.mark.asyncio
+    async def test_filtered_queries_use_cached_full_list(self):
+        registry = CreativeAgentRegistry()
+        banner = _fmt("Banner", dims=[(300, 250)])
+        video = _fmt("Video", fmt_type="video")
+
+        with (
+            patch.object(registry, "_build_adcp_client"),
+            patch.object(registry, "_fetch_formats_from_agent", AsyncMock(return_value=[banner, video])) as fetch,
+        ):
+            assert await registry.get_formats_for_agent(self.agent) == [banner, video]
+            assert await registry.get_formats_for_agent(self.agent, type_filter="video") == [video]
+            assert await registry.get_formats_for_agent(self.agent, max_width=300) == [banner]
+
+        assert fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_fetch(self):
+        registry = CreativeAgentRegistry()
+        release = threading.Event()
+        calls = []
+
+        async def slow_fetch(client, agent):
+            calls.append(agent.agent_url)
+            await asyncio.to_thread(release.wait, 5)
+            return [_fmt("Banner")]
+
+        with (
+            patch.object(registry, "_build_adcp_client"),
+            patch.object(registry, "_fetch_formats_from_agent", side_effect=slow_fetch),
+        ):
+            waiters = [asyncio.ensure_future(registry.get_formats_for_agent(self.agent)) for _ in range(3)]
+            await asyncio.sleep(0.05)
+            release.set()
+            results = await asyncio.gather(*waiters)
+
+        assert len(calls) == 1
+        assert all(len(r) == 1 for r in results)
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_served_while_refreshing(self):
+        registry = CreativeAgentRegistry()
+        old = [_fmt("Old")]
+        registry._format_cache[self.agent.agent_url] = CachedFormats(
+            formats=old, fetched_at=datetime.now(UTC) - timedelta(hours=2), ttl_seconds=3600
+        )
+        fresh = [_fmt("Fresh")]
+
+        with (
+            patch.object(registry, "_build_adcp_client"),
+            patch.object(registry, "_fetch_formats_from_agent", AsyncMock(return_value=fresh)),
+        ):
+            assert await registry.get_formats_for_agent(self.agent) == old
+            await asyncio.to_thread(registry._executor.shutdown, wait=True)  # let the background refresh finish
+            assert await registry.get_formats_for_agent(self.agent) == fresh
+
+    @pytest.mark.asyncio
+    async def test_list_all_formats_skips_failing_agents(self):
+        registry = CreativeAgentRegistry()
+        good = CreativeAgent(agent_url="https://good.example.com", name="Good", priority=1)
+        bad = CreativeAgent(agent_url="https://bad.example.com", name="Bad", priority=2)
+        banner = _fmt("Banner")
+
+        async def fetch(client, agent):
+            if agent is bad:
+                raise RuntimeError("Connection failed")
+            return [banner]
+
+        with (
+            patch.object(registry, "_get_tenant_agents", return_value=[good, bad]),
+            patch.object(registry, "_build_adcp_client"),
+            patch.object(registry, "_fetch_formats_from_agent", side_effect=fetch),
+        ):
+            assert await registry.list_all_formats(tenant_id="t1") == [banner]
+
+    def test_timed_out_refresh_backs_off(self):
+        registry = CreativeAgentRegistry()
+        agent = CreativeAgent(agent_url="https://hung.example.com", name="Hung", timeout=0.05)
+        stale = CachedFormats(
+            formats=[_fmt("Old")], fetched_at=datetime.now(UTC) - timedelta(hours=2), ttl_seconds=3600
+        )
+        registry._format_cache[agent.agent_url] = stale
+
+        async def hang(client, agent):
+            await asyncio.sleep(5)
+
+        with (
+            patch.object(registry, "_build_adcp_client"),
+            patch.object(registry, "_fetch_formats_from_agent", side_effect=hang),
+        ):
+            with pytest.raises(RuntimeError, match="timed out"):
+                registry._refresh(agent).result(timeout=5)
+
+        assert stale.refresh_failed_at is not None
@@ -1,11 +1,13 @@
 """Tests for get_media_buy_delivery with real GAM metrics."""
 
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from freezegun import freeze_time
 
+from src.adapters.base import AdServerAdapter
 from src.adapters.gam_reporting_service import ReportingData
 from src.adapters.google_ad_manager import GoogleAdManager
 from src.core.schemas import Principal, ReportingPeriod
@@ -204,3 +206,101 @@ def test_get_media_buy_delivery_with_real_gam_data(mock_reporting_service_class,
         pkg_2 = next(p for p in result.by_package if p.package_id == "pkg_2")
         assert pkg_2.impressions == 3000
         assert pkg_2.spend == 150.0
+
+
+@patch("src.core.database.database_session.get_db_session")
+@patch("src.adapters.gam_reporting_service.GAMReportingService")
+def test_get_media_buys_delivery_runs_one_report_for_all_orders(mock_reporting_service_class, mock_db, gam_adapter):
+    """Batched delivery runs one GAM report filtered to every order and splits rows by order."""
+    gam_adapter.dry_run = False
+    gam_adapter.client = Mock()
+
+    mock_session = MagicMock()
+    mock_db.return_value.__enter__.return_value = mock_session
+    mock_session.execute.return_value = [
+        SimpleNamespace(
+            media_buy_id="1001",
+            currency="USD",
+            raw_request={"packages": [{"package_id": "pkg_1", "platform_line_item_id": "111"}]},
+        ),
+        SimpleNamespace(media_buy_id="1002", currency="EUR", raw_request={"packages": []}),
+    ]
+
+    now = datetime.now()
+    mock_reporting_service_class.return_value.get_reporting_data.return_value = ReportingData(
+        data=[
+            {
+                "order_id": "1001",
+                "line_item_id": "111",
+                "date": "2025-01-15",
+                "impressions": 5000,
+                "clicks": 50,
+                "spend": 250.0,
+            },
+            {
+                "order_id": "1001",
+                "line_item_id": "112",
+                "date": "2025-01-16",
+                "impressions": 1000,
+                "clicks": 0,
+                "spend": 50.0,
+            },
+            {
+                "order_id": "1002",
+                "line_item_id": "222",
+                "date": "2025-01-15",
+                "impressions": 3000,
+                "clicks": 30,
+                "spend": 150.0,
+            },
+        ],
+        start_date=now,
+        end_date=now + timedelta(days=7),
+        requested_timezone="America/New_York",
+        data_timezone="America/New_York",
+        data_valid_until=now + timedelta(days=7),
+        query_type="this_month",
+        dimensions=["ORDER_ID", "LINE_ITEM_ID"],
+        metrics={},
+    )
+
+    date_range = ReportingPeriod(start=now.isoformat(), end=(now + timedelta(days=7)).isoformat())
+    with patch("src.adapters.google_ad_manager.validate_and_log_freshness", return_value=True):
+        results = gam_adapter.get_media_buys_delivery(["1001", "1002", "missing"], date_range, now)
+
+    mock_reporting_service_class.return_value.get_reporting_data.assert_called_once()
+    assert mock_reporting_service_class.return_value.get_reporting_data.call_args.kwargs["order_ids"] == [
+        "1001",
+        "1002",
+    ]
+
+    assert results["1001"].totals.impressions == 6000
+    assert results["1001"].totals.spend == 300.0
+    assert [(p.package_id, p.impressions) for p in results["1001"].by_package] == [("pkg_1", 5000)]
+    assert results["1002"].totals.impressions == 3000
+    assert results["1002"].currency == "EUR"
+    assert results["missing"].totals.impressions == 0
+    # Same daily breakdown as the single media buy path, per order
+    assert results["1001"].daily_breakdown == [
+        {"date": "2025-01-15", "impressions": 5000.0, "spend": 250.0},
+        {"date": "2025-01-16", "impressions": 1000.0, "spend": 50.0},
+    ]
+    assert results["1002"].daily_breakdown == [{"date": "2025-01-15", "impressions": 3000.0, "spend": 150.0}]
+    assert results["missing"].daily_breakdown is None
+
+
+def test_default_get_media_buys_delivery_collects_errors_per_media_buy(gam_adapter):
+    """The base implementation fetches each media buy and reports failures individually."""
+
+    def fetch(media_buy_id, date_range, today):
+        if media_buy_id == "bad":
+            raise RuntimeError("platform error")
+        return media_buy_id.upper()
+
+    date_range = ReportingPeriod(start=datetime.now().isoformat(), end=datetime.now().isoformat())
+    with patch.object(gam_adapter, "get_media_buy_delivery", side_effect=fetch):
+        results = AdServerAdapter.get_media_buys_delivery(gam_adapter, ["a", "bad", "c"], date_range, datetime.now())
+
+    assert results["a"] == "A"
+    assert results["c"] == "C"
+    assert isinstance(results["bad"], RuntimeError)
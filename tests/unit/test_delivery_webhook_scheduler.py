@@ -0,0 +1,197 @@
+"""Tests for concurrent, sharded delivery webhook batches."""
+
+import asyncio
+import logging
+from collections import Counter
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.services import delivery_webhook_scheduler as module
+from src.core.schemas import GetMediaBuyDeliveryResponse
+from src.services.delivery_webhook_scheduler import DeliveryWebhookScheduler, media_buy_shard
+
+
+def _media_buy(index: int, host: str = "buyer.example.com") -> Mock:
+    media_buy = Mock()
+    media_buy.media_buy_id = f"mb_{index}"
+    media_buy.tenant_id = f"tenant_{index % 3}"
+    media_buy.principal_id = "principal_1"
+    media_buy.raw_request = {"reporting_webhook": {"url": f"https://{host}/hook", "frequency": "daily"}}
+    return media_buy
+
+
+def _session(media_buys: list, sent_ids: set[str] = frozenset()) -> Mock:
+    """Mock session: the first scalars() call lists media buys, later ones are duplicate checks."""
+    session = Mock()
+    dedup_queries = []
+
+    def scalars(stmt):
+        result = Mock()
+        if not dedup_queries and stmt.column_descriptions[0]["name"] == "MediaBuy":
+            result.all.return_value = media_buys
+        else:
+            dedup_queries.append(stmt)
+            ids = stmt.compile().params
+            requested = next(v for k, v in ids.items() if k.startswith("media_buy_id"))
+            result.all.return_value = [mb_id for mb_id in requested if mb_id in sent_ids]
+        return result
+
+    session.scalars.side_effect = scalars
+    session.dedup_queries = dedup_queries
+    return session
+
+
+@pytest.fixture
+def scheduler():
+    with patch("src.services.delivery_webhook_scheduler.get_protocol_webhook_service"):
+        yield DeliveryWebhookScheduler()
+
+
+async def _run(scheduler, session, send):
+    with (
+        patch("src.services.delivery_webhook_scheduler.get_db_session") as mock_db_session,
+        patch.object(scheduler, "_send_report_for_media_buy", side_effect=send),
+    ):
+        mock_db_session.return_value.__enter__.return_value = session
+        await scheduler._send_reports()
+
+
+def test_shards_are_stable_and_partition_media_buys():
+    ids = [(f"tenant_{i % 7}", f"mb_{i}") for i in range(1000)]
+
+    shards = [media_buy_shard(tenant_id, media_buy_id, 4) for tenant_id, media_buy_id in ids]
+
+    assert shards == [media_buy_shard(tenant_id, media_buy_id, 4) for tenant_id, media_buy_id in ids]
+    assert set(Counter(shards)) == {0, 1, 2, 3}
+    assert min(Counter(shards).values()) > 150
+
+
+@pytest.mark.asyncio
+async def test_each_shard_sends_only_its_media_buys():
+    media_buys = [_media_buy(i) for i in range(40)]
+    sent_by_shard = []
+
+    for shard_index in range(3):
+        with patch("src.services.delivery_webhook_scheduler.get_protocol_webhook_service"):
+            scheduler = DeliveryWebhookScheduler(shard_index=shard_index, shard_count=3)
+        sent: list[str] = []
+
+        async def send(media_buy, *args, sent=sent, **kwargs):
+            sent.append(media_buy.media_buy_id)
+
+        await _run(scheduler, _session(media_buys), send)
+        sent_by_shard.append(set(sent))
+
+    assert set.union(*sent_by_shard) == {mb.media_buy_id for mb in media_buys}
+    assert sum(len(sent) for sent in sent_by_shard) == len(media_buys)
+
+
+def test_invalid_shard_rejected():
+    with pytest.raises(ValueError, match="Invalid delivery webhook shard"):
+        DeliveryWebhookScheduler(shard_index=2, shard_count=2)
+
+
+@pytest.mark.asyncio
+async def test_duplicate_check_is_one_query_per_batch(scheduler):
+    media_buys = [_media_buy(i) for i in range(12)]
+    session = _session(media_buys, sent_ids={"mb_1", "mb_7"})
+    sent = []
+
+    async def send(media_buy, reporting_webhook, session, force=False, already_sent=None):
+        assert already_sent is False
+        sent.append(media_buy.media_buy_id)
+
+    with patch.object(module, "DEDUP_BATCH_SIZE", 5):
+        await _run(scheduler, session, send)
+
+    assert len(session.dedup_queries) == 3
+    assert sorted(sent) == sorted(f"mb_{i}" for i in range(12) if i not in (1, 7))
+
+
+@pytest.mark.asyncio
+async def test_reports_run_concurrently_within_limits(scheduler):
+    media_buys = [_media_buy(i, host="a.example.com") for i in range(6)]
+    media_buys += [_media_buy(i, host="b.example.com") for i in range(6, 12)]
+    running: Counter = Counter()
+    peaks: Counter = Counter()
+
+    async def send(media_buy, reporting_webhook, *args, **kwargs):
+        host = reporting_webhook["url"].split("/")[2]
+        running[host] += 1
+        running["total"] += 1
+        peaks[host] = max(peaks[host], running[host])
+        peaks["total"] = max(peaks["total"], running["total"])
+        await asyncio.sleep(0.01)
+        running[host] -= 1
+        running["total"] -= 1
+
+    with (
+        patch.object(module, "MAX_CONCURRENT_REPORTS", 3),
+        patch.object(module, "MAX_CONCURRENT_REPORTS_PER_ENDPOINT", 2),
+    ):
+        await _run(scheduler, _session(media_buys), send)
+
+    assert peaks["total"] == 3
+    assert peaks["a.example.com"] == 2
+    assert peaks["b.example.com"] <= 2
+
+
+@pytest.mark.asyncio
+async def test_one_failing_report_does_not_stop_the_batch(scheduler):
+    media_buys = [_media_buy(i) for i in range(5)]
+    sent = []
+
+    async def send(media_buy, *args, **kwargs):
+        if media_buy.media_buy_id == "mb_2":
+            raise RuntimeError("adapter unavailable")
+        sent.append(media_buy.media_buy_id)
+
+    await _run(scheduler, _session(media_buys), send)
+
+    assert sorted(sent) == ["mb_0", "mb_1", "mb_3", "mb_4"]
+
+
+@pytest.mark.asyncio
+async def test_batch_summary_counts_report_outcomes(scheduler, caplog):
+    media_buys = [_media_buy(i) for i in range(6)]
+    outcomes = {"mb_0": "sent", "mb_1": "sent", "mb_2": "failed", "mb_3": "skipped", "mb_4": "sent"}
+
+    async def send(media_buy, *args, **kwargs):
+        return outcomes[media_buy.media_buy_id]
+
+    with caplog.at_level(logging.INFO, logger=module.__name__):
+        await _run(scheduler, _session(media_buys, sent_ids={"mb_5"}), send)
+
+    assert "3 sent, 2 skipped, 1 errors" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_report_errors_are_returned_as_failed(scheduler):
+    media_buy = _media_buy(0)
+
+    with patch.object(module, "_get_media_buy_delivery_impl", side_effect=RuntimeError("adapter unavailable")):
+        outcome = await scheduler._send_report_for_media_buy(
+            media_buy, media_buy.raw_request["reporting_webhook"], Mock(), already_sent=False
+        )
+
+    assert outcome == "failed"
+
+
+@pytest.mark.asyncio
+async def test_undelivered_webhook_is_counted_as_failed(scheduler):
+    media_buy = _media_buy(0)
+    delivery = Mock(spec=GetMediaBuyDeliveryResponse, errors=None)
+    delivery.model_dump.return_value = {}
+    scheduler.webhook_service.send_notification = AsyncMock(return_value=False)
+
+    with (
+        patch.object(module, "_get_media_buy_delivery_impl", return_value=delivery),
+        patch.object(module, "create_mcp_webhook_payload", return_value={}),
+    ):
+        outcome = await scheduler._send_report_for_media_buy(
+            media_buy, media_buy.raw_request["reporting_webhook"], Mock(), already_sent=False
+        )
+
+    scheduler.webhook_service.send_notification.assert_awaited_once()
+    assert outcome == "failed"
@@ -0,0 +1,193 @@
+"""Tests for the shared GAM report job manager (polling, in-flight dedup, result cache)."""
+
+import threading
+import time
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+import pytz
+
+from src.adapters.gam_report_jobs import GAMReportJobManager, ReportJobConfig
+from src.adapters.gam_reporting_service import GAMReportingService
+
+
+class FakeReportService:
+    """ReportService stand-in whose jobs complete after ``polls_until_complete`` status checks."""
+
+    def __init__(self, polls_until_complete: int = 1, final_status: str = "COMPLETED"):
+        self.polls_until_complete = polls_until_complete
+        self.final_status = final_status
+        self.jobs_started = 0
+        self.status_checks = 0
+        self.lock = threading.Lock()
+
+    def runReportJob(self, job):
+        with self.lock:
+            self.jobs_started += 1
+            return {"id": f"job_{self.jobs_started}"}
+
+    def getReportJobStatus(self, job_id):
+        with self.lock:
+            self.status_checks += 1
+            return self.final_status if self.status_checks >= self.polls_until_complete else "IN_PROGRESS"
+
+
+@pytest.fixture(autouse=True)
+def fast_backoff():
+    with (
+        patch.object(ReportJobConfig, "POLL_MAX_INTERVAL_SECONDS", 0.02),
+        patch.object(ReportJobConfig, "POLL_INITIAL_INTERVAL_SECONDS", 0.01),
+    ):
+        yield
+
+
+@pytest.fixture
+def manager():
+    return GAMReportJobManager(cache_max_ttl=60)
+
+
+def test_polls_until_complete_without_extra_status_call(manager):
+    report_service = FakeReportService(polls_until_complete=3)
+
+    future = manager.submit(report_service, {}, fetch=lambda job_id: f"rows of {job_id}", timeout=5)
+
+    assert future.result(timeout=5) == "rows of job_1"
+    assert report_service.status_checks == 3
+
+
+def test_backoff_grows_between_polls(manager):
+    report_service = FakeReportService(polls_until_complete=5)
+    intervals = []
+    original_schedule = manager._schedule
+
+    def record(job):
+        intervals.append(job.interval)
+        original_schedule(job)
+
+    with patch.object(manager, "_schedule", side_effect=record):
+        manager.submit(report_service, {}, fetch=lambda job_id: None, timeout=5).result(timeout=5)
+
+    assert intervals == sorted(intervals)
+    assert intervals[-1] == ReportJobConfig.POLL_MAX_INTERVAL_SECONDS
+
+
+def test_concurrent_identical_queries_share_one_job(manager):
+    report_service = FakeReportService(polls_until_complete=3)
+    release = threading.Event()
+
+    def fetch(job_id):
+        release.wait(5)
+        return ["row"]
+
+    futures = [manager.submit(report_service, {}, fetch=fetch, timeout=5, cache_key="k", ttl=60) for _ in range(5)]
+    release.set()
+
+    assert all(f.result(timeout=5) == ["row"] for f in futures)
+    assert report_service.jobs_started == 1
+
+
+def test_slow_downloads_do_not_block_status_checks(manager):
+    release = threading.Event()
+    blocked = [
+        manager.submit(FakeReportService(), {}, fetch=lambda job_id: release.wait(5), timeout=5)
+        for _ in range(ReportJobConfig.DOWNLOAD_WORKERS)
+    ]
+    report_service = FakeReportService(polls_until_complete=3)
+
+    try:
+        manager.submit(report_service, {}, fetch=lambda job_id: None, timeout=5)
+        # Every download worker is busy, yet the other job is still polled to completion
+        deadline = time.monotonic() + 2
+        while report_service.status_checks < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert report_service.status_checks == 3
+    finally:
+        release.set()
+    assert all(future.result(timeout=5) for future in blocked)
+
+
+def test_completed_results_are_cached(manager):
+    report_service = FakeReportService()
+
+    first = manager.submit(report_service, {}, fetch=lambda job_id: job_id, timeout=5, cache_key="k", ttl=60)
+    assert first.result(timeout=5) == "job_1"
+    second = manager.submit(report_service, {}, fetch=lambda job_id: job_id, timeout=5, cache_key="k", ttl=60)
+
+    assert second.result(timeout=5) == "job_1"
+    assert report_service.jobs_started == 1
+
+
+def test_zero_ttl_is_not_cached(manager):
+    report_service = FakeReportService()
+
+    for _ in range(2):
+        manager.submit(report_service, {}, fetch=lambda job_id: job_id, timeout=5, cache_key="k", ttl=0).result(5)
+
+    assert report_service.jobs_started == 2
+
+
+def test_failed_job_is_not_cached(manager):
+    report_service = FakeReportService(final_status="FAILED")
+
+    future = manager.submit(report_service, {}, fetch=lambda job_id: job_id, timeout=5, cache_key="k", ttl=60)
+    with pytest.raises(Exception, match="GAM report job failed"):
+        future.result(timeout=5)
+
+    report_service.final_status = "COMPLETED"
+    retry = manager.submit(report_service, {}, fetch=lambda job_id: job_id, timeout=5, cache_key="k", ttl=60)
+    assert retry.result(timeout=5) == "job_2"
+
+
+def test_timeout(manager):
+    report_service = FakeReportService(polls_until_complete=10**9)
+
+    future = manager.submit(report_service, {}, fetch=lambda job_id: job_id, timeout=0.1)
+
+    with pytest.raises(Exception, match="timed out"):
+        future.result(timeout=5)
+
+
+def test_reporting_service_shares_reports_per_network():
+    gam_client = MagicMock(network_code="12345")
+    service = GAMReportingService(gam_client, network_timezone="America/New_York")
+    manager = GAMReportJobManager(cache_max_ttl=60)
+    row = {"timestamp": "t", "advertiser_id": "1", "order_id": "2", "line_item_id": "3"}
+    aggregate = MagicMock(return_value=([{**row, "impressions": 10, "clicks": 1, "spend": 1.0}], 1))
+
+    with (
+        patch("src.adapters.gam_reporting_service.get_report_job_manager", return_value=manager),
+        patch.object(service, "report_service", FakeReportService()) as report_service,
+        patch.object(service, "_aggregate_report", aggregate),
+    ):
+        first = service.get_reporting_data("this_month")
+        second = service.get_reporting_data("this_month")
+        service.get_reporting_data("today")
+
+    assert first.data == second.data
+    # Callers get their own copies of cached rows
+    assert first.data[0] is not second.data[0]
+    assert report_service.jobs_started == 2
+
+
+def test_no_sharing_without_network_code():
+    service = GAMReportingService(MagicMock(spec=["GetService"]), network_timezone="America/New_York")
+
+    assert service._report_cache_key({}, "daily", "this_month", "America/New_York") is None
+
+
+@pytest.mark.parametrize(
+    ("date_range", "now", "expected_seconds"),
+    [
+        ("today", datetime(2025, 1, 15, 10, 45), 15 * 60),
+        ("this_month", datetime(2025, 1, 15, 5, 0), 2 * 3600),
+        ("lifetime", datetime(2025, 1, 15, 8, 0), 23 * 3600),
+    ],
+)
+def test_cache_ttl_follows_data_validity(date_range, now, expected_seconds):
+    service = GAMReportingService(MagicMock(), network_timezone="America/New_York")
+    tz = pytz.timezone("America/New_York")
+
+    with patch("src.adapters.gam_reporting_service.datetime") as mock_datetime:
+        mock_datetime.now.return_value = tz.localize(now)
+        assert service._report_cache_ttl(date_range, "America/New_York") == expected_seconds
@@ -0,0 +1,129 @@
+"""Tests for streaming GAM report download and on-the-fly aggregation."""
+
+import csv
+import gzip
+import io
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.adapters.gam_reporting_service import GAMReportingService, ReportingConfig
+
+HEADER = [
+    "Dimension.DATE",
+    "Dimension.ADVERTISER_ID",
+    "Dimension.ORDER_ID",
+    "Dimension.LINE_ITEM_ID",
+    "Column.AD_SERVER_IMPRESSIONS",
+    "Column.AD_SERVER_CLICKS",
+    "Column.AD_SERVER_CPM_AND_CPC_REVENUE",
+]
+
+
+class FakeResponse:
+    """Streaming response stand-in that hands out the body in small chunks."""
+
+    def __init__(self, body: bytes, chunk_size: int = 7):
+        self.body = body
+        self.chunk_size = chunk_size
+        self.closed = False
+
+    def iter_content(self, chunk_size=None):
+        for i in range(0, len(self.body), self.chunk_size):
+            yield self.body[i : i + self.chunk_size]
+
+    def close(self):
+        self.closed = True
+
+
+def _gzip_csv(header: list[str], rows: list[list]) -> bytes:
+    text = io.StringIO()
+    writer = csv.writer(text)
+    writer.writerow(header)
+    writer.writerows(rows)
+    return gzip.compress(text.getvalue().encode())
+
+
+@pytest.fixture
+def service():
+    service = GAMReportingService(MagicMock(), network_timezone="America/New_York")
+    service.report_service.getReportJobStatus.return_value = "COMPLETED"
+    return service
+
+
+def _rows(count: int) -> list[list]:
+    return [
+        [f"2025-01-{1 + i % 3:02d}", f"adv_{i % 2}", f"order_{i % 4}", f"li_{i % 5}", i % 7, i % 3, i * 1000]
+        for i in range(count)
+    ]
+
+
+def test_streamed_aggregation_matches_dict_processing(service):
+    rows = _rows(500)
+    response = FakeResponse(_gzip_csv(HEADER, rows))
+
+    with patch.object(service, "_download_report", return_value=response):
+        processed, raw_count = service._run_aggregated_report({}, "daily")
+
+    dict_rows = [dict(zip(HEADER, [str(v) for v in row], strict=True)) for row in rows]
+    assert processed == service._process_report_data(dict_rows, "daily", "America/New_York")
+    assert raw_count == 500
+    assert response.closed
+
+
+def test_aggregates_per_key(service):
+    rows = [
+        ["2025-01-01", "adv_1", "order_1", "li_1", "100", "2", "500000"],
+        ["2025-01-01", "adv_1", "order_1", "li_1", "300", "1", "1500000"],
+        ["2025-01-01", "adv_1", "order_1", "li_2", "0", "0", "0"],  # zero impressions are skipped
+    ]
+
+    with patch.object(service, "_download_report", return_value=FakeResponse(_gzip_csv(HEADER, rows))):
+        processed, raw_count = service._run_aggregated_report({}, "daily")
+
+    assert raw_count == 3
+    assert len(processed) == 1
+    row = processed[0]
+    assert row["timestamp"] == "2025-01-01T00:00:00"
+    assert (row["impressions"], row["clicks"], row["spend"]) == (400, 3, 2.0)
+    assert row["cpm"] == 5.0
+    assert row["aggregated_rows"] == 2
+    # Dimensions absent from the report come back as empty strings
+    assert row["country"] == "" and row["ad_unit_name"] == ""
+
+
+def test_no_row_cap_when_streaming(service):
+    rows = _rows(50)
+
+    with (
+        patch.object(ReportingConfig, "MAX_ROWS_PER_REPORT", 10),
+        patch.object(service, "_download_report", return_value=FakeResponse(_gzip_csv(HEADER, rows))),
+    ):
+        _, raw_count = service._run_aggregated_report({}, "daily")
+        truncated = service._run_report({})
+
+    assert raw_count == 50
+    # The materializing path keeps its cap
+    assert len(truncated) == 10
+    assert truncated[0]["Dimension.ADVERTISER_ID"] == "adv_0"
+
+
+def test_multi_member_gzip(service):
+    body = _gzip_csv(HEADER, _rows(3)) + gzip.compress(b"2025-01-02,adv_9,order_9,li_9,10,1,1000\n")
+
+    with patch.object(service, "_download_report", return_value=FakeResponse(body)):
+        processed, raw_count = service._run_aggregated_report({}, "daily")
+
+    assert raw_count == 4
+    assert any(row["advertiser_id"] == "adv_9" for row in processed)
+
+
+def test_empty_report(service):
+    with patch.object(service, "_download_report", return_value=FakeResponse(gzip.compress(b""))):
+        assert service._run_aggregated_report({}, "daily") == ([], 0)
+
+
+def test_corrupt_download_raises(service):
+    with patch.object(service, "_download_report", return_value=FakeResponse(b"not gzip data")):
+        with pytest.raises(Exception, match="Failed to parse GAM report CSV data"):
+            service._run_aggregated_report({}, "daily")
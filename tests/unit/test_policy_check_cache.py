@@ -0,0 +1,97 @@
+"""Tests for policy decision caching and coalescing in PolicyCheckService."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.services.ai import AIServiceFactory
+from src.services.ai.agents.policy_agent import PolicyAnalysis
+from src.services.policy_check_service import PolicyCheckService, PolicyStatus, clear_policy_cache
+
+AI_CONFIG = {"provider": "gemini", "model": "gemini-2.0-flash", "api_key": "test-key"}
+
+
+@pytest.fixture(autouse=True)
+def agent_factory():
+    clear_policy_cache()
+    with (
+        patch.object(AIServiceFactory, "create_model", return_value="test:model"),
+        patch("src.services.policy_check_service.create_policy_agent", side_effect=lambda model: object()) as create,
+    ):
+        yield create
+    clear_policy_cache()
+
+
+@pytest.fixture
+def check():
+    analysis = PolicyAnalysis(status="restricted", restrictions=["no alcohol"])
+    with patch("src.services.policy_check_service.check_policy_compliance", new=AsyncMock(return_value=analysis)) as m:
+        yield m
+
+
+@pytest.mark.asyncio
+async def test_repeated_brief_skips_the_model(check):
+    service = PolicyCheckService(tenant_ai_config=AI_CONFIG)
+
+    first = await service.check_brief_compliance("Craft beer  launch", promoted_offering="Acme Brewing")
+    second = await service.check_brief_compliance("craft beer launch", promoted_offering="Acme Brewing")
+
+    assert first.status == second.status == PolicyStatus.RESTRICTED
+    assert second.restrictions == ["no alcohol"]
+    assert check.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_key_includes_brand_and_tenant_policies(check):
+    service = PolicyCheckService(tenant_ai_config=AI_CONFIG)
+
+    await service.check_brief_compliance("Craft beer launch", promoted_offering="Acme Brewing")
+    await service.check_brief_compliance("Craft beer launch", promoted_offering="Other Brewing")
+    await service.check_brief_compliance(
+        "Craft beer launch", promoted_offering="Acme Brewing", tenant_policies={"prohibited_categories": ["alcohol"]}
+    )
+
+    assert check.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_checks_share_one_call():
+    release = asyncio.Event()
+
+    async def slow_check(agent, text, tenant_policies=None):
+        await release.wait()
+        return PolicyAnalysis(status="allowed")
+
+    with patch("src.services.policy_check_service.check_policy_compliance", side_effect=slow_check) as check:
+        service = PolicyCheckService(tenant_ai_config=AI_CONFIG)
+        pending = [asyncio.ensure_future(service.check_brief_compliance("Running shoes")) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*pending)
+
+    assert [r.status for r in results] == [PolicyStatus.ALLOWED] * 3
+    assert check.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_model_call_is_not_cached():
+    unavailable = PolicyAnalysis(status="allowed", warnings=["AI policy check unavailable: timeout"])
+    with patch(
+        "src.services.policy_check_service.check_policy_compliance", new=AsyncMock(return_value=unavailable)
+    ) as check:
+        service = PolicyCheckService(tenant_ai_config=AI_CONFIG)
+        await service.check_brief_compliance("Running shoes")
+        await service.check_brief_compliance("Running shoes")
+
+    assert check.await_count == 2
+
+
+def test_agents_are_reused_per_model_config(agent_factory):
+    first = PolicyCheckService(tenant_ai_config=AI_CONFIG)
+    second = PolicyCheckService(tenant_ai_config=AI_CONFIG)
+    other = PolicyCheckService(tenant_ai_config={**AI_CONFIG, "api_key": "other-key"})
+
+    assert first._agent is second._agent
+    assert other._agent is not first._agent
+    assert agent_factory.call_count == 2
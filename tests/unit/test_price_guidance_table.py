@@ -0,0 +1,95 @@
+"""Tests for bulk-loaded dynamic pricing guidance."""
+
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.services.dynamic_pricing_service import (
+    DynamicPricingService,
+    PriceGuidanceTable,
+    clear_price_guidance_cache,
+    invalidate_price_guidance,
+)
+
+CUTOFF = date(2025, 1, 1)
+
+
+def _metric(size: str, impressions: int, median: str, p75: str, p90: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        creative_size=size,
+        period_start=date(2025, 1, 1),
+        period_end=date(2025, 1, 31),
+        total_impressions=impressions,
+        median_cpm=Decimal(median),
+        p75_cpm=Decimal(p75),
+        p90_cpm=Decimal(p90),
+    )
+
+
+def _session(version: tuple, metrics: list) -> MagicMock:
+    session = MagicMock()
+    session.execute.return_value.one.return_value = version
+    session.scalars.return_value = metrics
+    return session
+
+
+def _product(*format_ids: str) -> SimpleNamespace:
+    return SimpleNamespace(product_id="p1", format_ids=list(format_ids))
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    clear_price_guidance_cache()
+    yield
+    clear_price_guidance_cache()
+
+
+def test_guidance_is_impression_weighted_across_sizes():
+    table = PriceGuidanceTable(
+        [_metric("300 x 250", 3000, "2.00", "3.00", "4.00"), _metric("728x90", 1000, "6.00", "7.00", "8.00")]
+    )
+
+    guidance = table.guidance(frozenset({"300x250", "728x90"}))
+
+    assert guidance.floor_cpm == pytest.approx(3.0)
+    assert guidance.p75_cpm == pytest.approx(4.0)
+    assert guidance.p90_cpm == pytest.approx(5.0)
+    assert guidance.estimated_exposures == 4000
+    assert table.guidance(frozenset({"160x600"})) is None
+
+
+def test_min_exposures_recommends_p90():
+    table = PriceGuidanceTable([_metric("300x250", 3000, "2.00", "3.00", "4.00")])
+    service = DynamicPricingService(MagicMock())
+
+    pricing = service._calculate_product_pricing(_product("display_300x250"), table, None, min_exposures=10_000)
+
+    assert pricing["floor_cpm"] == 2.0
+    assert pricing["recommended_cpm"] == 4.0
+
+
+def test_table_is_reused_until_metrics_change():
+    metrics = [_metric("300x250", 3000, "2.00", "3.00", "4.00")]
+    first = DynamicPricingService(_session((1, "t0"), metrics)).get_price_guidance_table("t1", None, CUTOFF)
+
+    session = _session((1, "t0"), metrics)
+    assert DynamicPricingService(session).get_price_guidance_table("t1", None, CUTOFF) is first
+    session.scalars.assert_not_called()
+
+    session = _session((2, "t1"), metrics)
+    assert DynamicPricingService(session).get_price_guidance_table("t1", None, CUTOFF) is not first
+    session.scalars.assert_called_once()
+
+
+def test_invalidate_drops_only_that_tenant():
+    metrics = [_metric("300x250", 3000, "2.00", "3.00", "4.00")]
+    t1 = DynamicPricingService(_session((1, "t0"), metrics)).get_price_guidance_table("t1", None, CUTOFF)
+    t2 = DynamicPricingService(_session((1, "t0"), metrics)).get_price_guidance_table("t2", "US", CUTOFF)
+
+    invalidate_price_guidance("t1")
+
+    assert DynamicPricingService(_session((1, "t0"), metrics)).get_price_guidance_table("t1", None, CUTOFF) is not t1
+    assert DynamicPricingService(_session((1, "t0"), metrics)).get_price_guidance_table("t2", "US", CUTOFF) is t2
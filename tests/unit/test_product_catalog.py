@@ -0,0 +1,63 @@
+"""Tests for the versioned per-tenant product catalog cache."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.product_catalog import clear_product_catalog_cache, load_product_catalog
+
+
+def _session(version: int | None, product_ids: list[str]) -> MagicMock:
+    session = MagicMock()
+    session.scalar.return_value = version
+    session.scalars.return_value.all.return_value = [SimpleNamespace(product_id=pid) for pid in product_ids]
+    return session
+
+
+@pytest.fixture(autouse=True)
+def convert():
+    clear_product_catalog_cache()
+    with patch(
+        "src.core.product_catalog.convert_product_model_to_schema",
+        side_effect=lambda model: SimpleNamespace(product_id=model.product_id),
+    ) as mock_convert:
+        yield mock_convert
+    clear_product_catalog_cache()
+
+
+def test_unchanged_version_reuses_converted_products(convert):
+    first = load_product_catalog(_session(3, ["a", "b"]), "t1")
+    session = _session(3, ["a", "b"])
+    second = load_product_catalog(session, "t1")
+
+    assert second.version == 3
+    assert [p.product_id for p in second.products] == ["a", "b"]
+    assert all(x is y for x, y in zip(first.products, second.products, strict=True))
+    assert convert.call_count == 2
+    session.scalars.assert_not_called()
+
+
+def test_bumped_version_reloads(convert):
+    load_product_catalog(_session(3, ["a"]), "t1")
+    catalog = load_product_catalog(_session(4, ["a", "b"]), "t1")
+
+    assert catalog.version == 4
+    assert [p.product_id for p in catalog.products] == ["a", "b"]
+    assert convert.call_count == 3
+
+
+def test_catalogs_are_per_tenant(convert):
+    load_product_catalog(_session(1, ["a"]), "t1")
+    catalog = load_product_catalog(_session(1, ["x"]), "t2")
+
+    assert [p.product_id for p in catalog.products] == ["x"]
+
+
+def test_conversion_failure_raises_and_is_not_cached(convert):
+    convert.side_effect = RuntimeError("bad format_ids")
+    with pytest.raises(ValueError, match="Product 'a' failed to convert"):
+        load_product_catalog(_session(1, ["a"]), "t1")
+
+    convert.side_effect = lambda model: SimpleNamespace(product_id=model.product_id)
+    assert [p.product_id for p in load_product_catalog(_session(1, ["a"]), "t1").products] == ["a"]
@@ -0,0 +1,153 @@
+"""Tests for the per-tenant product filter index."""
+
+import threading
+from types import SimpleNamespace
+
+from adcp.types import ProductFilters
+
+from src.core.product_index import ProductIndex, clear_product_indexes, get_product_index
+
+
+def _product(
+    product_id: str,
+    delivery_type: str = "guaranteed",
+    format_ids: list[str] | None = None,
+    countries: list[str] | None = None,
+    channels: list[str] | None = None,
+    allowed_principal_ids: list[str] | None = None,
+):
+    return SimpleNamespace(
+        product_id=product_id,
+        delivery_type=delivery_type,
+        format_ids=[{"agent_url": "https://creative.example.com", "id": f} for f in format_ids or ["display_300x250"]],
+        countries=countries,
+        channels=channels,
+        allowed_principal_ids=allowed_principal_ids,
+    )
+
+
+def _ids(index: ProductIndex, mask: int) -> list[str]:
+    return [p.product_id for p in index.products(mask)]
+
+
+class TestProductIndex:
+    def test_access_control(self):
+        index = ProductIndex()
+        index.sync(
+            [
+                _product("open"),
+                _product("acme_only", allowed_principal_ids=["acme"]),
+                _product("shared", allowed_principal_ids=["acme", "globex"]),
+            ]
+        )
+
+        assert _ids(index, index.visible_to(None)) == ["open"]
+        assert _ids(index, index.visible_to("acme")) == ["open", "acme_only", "shared"]
+        assert _ids(index, index.visible_to("globex")) == ["open", "shared"]
+
+    def test_filters_intersect(self):
+        index = ProductIndex()
+        index.sync(
+            [
+                _product("us_display", countries=["US"], channels=["display"]),
+                _product("us_video", delivery_type="non_guaranteed", countries=["US"], channels=["video"]),
+                _product("global_display", channels=["Display"]),
+                _product("fr_display", countries=["FR"], channels=["display"]),
+            ]
+        )
+
+        filters = ProductFilters(countries=["US"], channels=["display"])
+        assert _ids(index, index.matching(filters)) == ["us_display", "global_display"]
+
+        filters = ProductFilters(delivery_type="non_guaranteed")
+        assert _ids(index, index.matching(filters)) == ["us_video"]
+
+    def test_format_filters(self):
+        index = ProductIndex()
+        index.sync(
+            [
+                _product("standard", format_ids=["display_300x250", "video_15s"]),
+                _product("custom", format_ids=["display_300x250", "homepage_takeover"]),
+            ]
+        )
+
+        by_id = ProductFilters(format_ids=[{"agent_url": "https://creative.example.com", "id": "video_15s"}])
+        assert _ids(index, index.matching(by_id)) == ["standard"]
+        assert _ids(index, index.matching(ProductFilters(standard_formats_only=True))) == ["standard"]
+
+    def test_products_without_channels_use_adapter_defaults(self):
+        index = ProductIndex()
+        index.sync([_product("no_channels")])
+
+        filters = ProductFilters(channels=["audio"])
+        assert _ids(index, index.matching(filters, adapter_channels=["display", "video"])) == []
+        assert _ids(index, index.matching(filters, adapter_channels=["audio"])) == ["no_channels"]
+        assert _ids(index, index.matching(filters, adapter_channels=[])) == ["no_channels"]
+
+    def test_sync_applies_changes_and_removals(self):
+        index = ProductIndex()
+        index.sync([_product("a", countries=["US"]), _product("b", countries=["US"])])
+
+        index.sync([_product("a", countries=["FR"]), _product("c", countries=["US"])])
+
+        assert len(index) == 2
+        assert _ids(index, index.matching(ProductFilters(countries=["US"]))) == ["c"]
+        assert _ids(index, index.matching(ProductFilters(countries=["FR"]))) == ["a"]
+
+    def test_results_follow_latest_catalog_order(self):
+        index = ProductIndex()
+        index.sync([_product("b"), _product("c")])
+        index.sync([_product("a"), _product("b"), _product("c")])
+
+        assert _ids(index, index.visible_to(None)) == ["a", "b", "c"]
+
+    def test_unchanged_product_objects_are_not_rekeyed(self, monkeypatch):
+        product = _product("a")
+        index = ProductIndex()
+        index.sync([product])
+
+        calls = []
+        monkeypatch.setattr("src.core.product_index.ProductKeys.from_product", lambda p: calls.append(p))
+        index.sync([product])
+
+        assert calls == []
+
+    def test_query_syncs_and_filters_in_one_call(self):
+        index = ProductIndex()
+        catalog = [
+            _product("open", countries=["US"]),
+            _product("acme_us", countries=["US"], allowed_principal_ids=["acme"]),
+            _product("acme_fr", countries=["FR"], allowed_principal_ids=["acme"]),
+        ]
+
+        products, visible_count = index.query(catalog, "acme", ProductFilters(countries=["US"]))
+
+        assert [p.product_id for p in products] == ["open", "acme_us"]
+        assert visible_count == 3
+
+    def test_query_is_consistent_under_concurrent_syncs(self):
+        index = ProductIndex()
+        catalogs = [[_product(f"{name}_{i}") for i in range(50)] for name in ("a", "b")]
+        mismatches = []
+
+        def run(catalog):
+            expected = [p.product_id for p in catalog]
+            for _ in range(200):
+                products, _ = index.query(catalog, None, None)
+                if [p.product_id for p in products] != expected:
+                    mismatches.append(expected[0])
+
+        threads = [threading.Thread(target=run, args=(catalog,)) for catalog in catalogs]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mismatches == []
+
+
+def test_get_product_index_is_per_tenant():
+    clear_product_indexes()
+
+    assert get_product_index("t1") is get_product_index("t1")
+    assert get_product_index("t1") is not get_product_index("t2")
@@ -0,0 +1,138 @@
+"""Tests for cached, latency-bounded AI product ranking."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.services.ai.agents.ranking_agent import (
+    ProductRanking,
+    ProductRankingResult,
+    build_product_digest,
+    build_ranking_prompt,
+)
+from src.services.product_ranking_service import clear_ranking_cache, get_catalog_digests, rank_products
+
+
+def _product(product_id: str) -> SimpleNamespace:
+    return SimpleNamespace(product_id=product_id)
+
+
+def _result(*scores: tuple[str, float]) -> ProductRankingResult:
+    return ProductRankingResult(
+        rankings=[ProductRanking(product_id=pid, relevance_score=score, reason="match") for pid, score in scores]
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    clear_ranking_cache()
+    yield
+    clear_ranking_cache()
+
+
+def _rank(products, version=1, brief="Sports fans", deadline=0.0):
+    digests = {p.product_id: f'{{"product_id":"{p.product_id}"}}' for p in products}
+    return rank_products(
+        agent=object(),
+        tenant_id="t1",
+        catalog_version=version,
+        custom_prompt="Prefer video",
+        brief=brief,
+        products=products,
+        catalog_digests=digests,
+        deadline=deadline,
+    )
+
+
+@pytest.mark.asyncio
+async def test_cached_scores_skip_the_model():
+    calls = []
+
+    async def fake_rank(agent, custom_prompt, brief, product_digests):
+        calls.append(product_digests)
+        return _result(("a", 0.9), ("b", 0.2))
+
+    with patch("src.services.product_ranking_service.rank_products_async", side_effect=fake_rank):
+        first = await _rank([_product("a"), _product("b")])
+        second = await _rank([_product("a"), _product("b")], brief="  Sports   fans ")
+
+    assert first == second == {"a": (0.9, "match"), "b": (0.2, "match")}
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_only_unscored_products_are_sent():
+    calls = []
+
+    async def fake_rank(agent, custom_prompt, brief, product_digests):
+        calls.append(product_digests)
+        return _result(*[(pid, 0.5) for pid in ("a", "b", "c") if f'"{pid}"' in "".join(product_digests)])
+
+    with patch("src.services.product_ranking_service.rank_products_async", side_effect=fake_rank):
+        await _rank([_product("a"), _product("b")])
+        rankings = await _rank([_product("b"), _product("c")])
+
+    assert calls[1] == ['{"product_id":"c"}']
+    assert set(rankings) >= {"b", "c"}
+
+
+@pytest.mark.asyncio
+async def test_new_catalog_version_reranks():
+    with patch(
+        "src.services.product_ranking_service.rank_products_async", return_value=_result(("a", 0.9))
+    ) as mock_rank:
+        await _rank([_product("a")], version=1)
+        await _rank([_product("a")], version=2)
+
+    assert mock_rank.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_products_left_out_by_the_model_score_zero():
+    with patch("src.services.product_ranking_service.rank_products_async", return_value=_result(("a", 0.9))):
+        rankings = await _rank([_product("a"), _product("b")])
+
+    assert rankings["b"] == (0.0, "")
+
+
+@pytest.mark.asyncio
+async def test_deadline_returns_none_and_fills_cache_in_background():
+    release = asyncio.Event()
+
+    async def slow_rank(agent, custom_prompt, brief, product_digests):
+        await release.wait()
+        return _result(("a", 0.7))
+
+    with patch("src.services.product_ranking_service.rank_products_async", side_effect=slow_rank) as mock_rank:
+        assert await _rank([_product("a")], deadline=0.01) is None
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert await _rank([_product("a")], deadline=0.01) == {"a": (0.7, "match")}
+
+    assert mock_rank.call_count == 1
+
+
+def test_catalog_digests_are_built_once_per_version():
+    with patch(
+        "src.services.product_ranking_service.build_product_digest", side_effect=lambda p: p.product_id
+    ) as build:
+        get_catalog_digests("t1", 1, [_product("a"), _product("b")])
+        get_catalog_digests("t1", 1, [_product("a"), _product("b")])
+        get_catalog_digests("t1", 2, [_product("a"), _product("b")])
+
+    assert build.call_count == 4
+
+
+def test_ranking_prompt_is_compact_json():
+    product = {"product_id": "a", "name": "Video", "delivery_type": "guaranteed", "channels": ["video"]}
+
+    prompt = build_ranking_prompt("Prefer video", "Sports fans", [product])
+
+    assert build_product_digest(product) == (
+        '{"product_id":"a","name":"Video","description":null,"delivery_type":"guaranteed",'
+        '"format_ids":[],"channels":["video"]}'
+    )
+    assert f"[{build_product_digest(product)}]" in prompt
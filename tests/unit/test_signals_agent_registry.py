@@ -1,6 +1,7 @@
 """Unit tests for signals agent registry (adcp v1.0.1 migration)."""
 
-from unittest.mock import AsyncMock, Mock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
@@ -248,3 +249,65 @@ class TestSignalsAgentRegistry:
             assert result["success"] is False
             assert "error" in result
             assert "Authentication" in result["error"] or "failed" in result["error"]
+
+
+class TestGetSignalsConcurrency:
+    """get_signals fan-out, deadline and caching."""
+
+    fast = SignalsAgent(agent_url="https://fast.example.com", name="Fast")
+    slow = SignalsAgent(agent_url="https://slow.example.com", name="Slow")
+    broken = SignalsAgent(agent_url="https://broken.example.com", name="Broken")
+
+    @staticmethod
+    async def _fetch(client, agent, **kwargs):
+        if agent.name == "Slow":
+            await asyncio.sleep(5)
+        if agent.name == "Broken":
+            raise RuntimeError("Connection failed")
+        return [{"signal_agent_segment_id": f"{agent.name}-1"}]
+
+    @pytest.mark.asyncio
+    async def test_returns_partial_results_at_deadline(self):
+        registry = SignalsAgentRegistry()
+
+        with (
+            patch.object(registry, "_get_tenant_agents", return_value=[self.fast, self.slow]),
+            patch.object(registry, "_build_adcp_client", return_value=MagicMock()),
+            patch.object(registry, "_get_signals_from_agent", side_effect=self._fetch),
+            patch("src.core.signals_agent_registry.SIGNALS_DEADLINE_SECONDS", 0.1),
+        ):
+            signals = await registry.get_signals(brief="cars", tenant_id="t1")
+
+        assert signals == [{"signal_agent_segment_id": "Fast-1"}]
+
+    @pytest.mark.asyncio
+    async def test_caches_results_by_normalized_brief(self):
+        registry = SignalsAgentRegistry()
+        context = {"deliver_to": {"countries": ["US"]}}
+
+        with (
+            patch.object(registry, "_get_tenant_agents", return_value=[self.fast]),
+            patch.object(registry, "_build_adcp_client", return_value=MagicMock()),
+            patch.object(registry, "_get_signals_from_agent", side_effect=self._fetch) as fetch,
+        ):
+            first = await registry.get_signals(brief="Electric  Cars", tenant_id="t1", context=context)
+            second = await registry.get_signals(brief="electric cars ", tenant_id="t1", context=context)
+            await registry.get_signals(brief="electric cars", tenant_id="t1", context={"deliver_to": None})
+
+        assert first == second
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_skips_recently_failed_agent(self):
+        registry = SignalsAgentRegistry()
+
+        with (
+            patch.object(registry, "_get_tenant_agents", return_value=[self.broken, self.fast]),
+            patch.object(registry, "_build_adcp_client", return_value=MagicMock()),
+            patch.object(registry, "_get_signals_from_agent", side_effect=self._fetch) as fetch,
+        ):
+            assert await registry.get_signals(brief="cars", tenant_id="t1") == [{"signal_agent_segment_id": "Fast-1"}]
+            assert await registry.get_signals(brief="boats", tenant_id="t1") == [{"signal_agent_segment_id": "Fast-1"}]
+
+        queried = [call.args[1].name for call in fetch.await_args_list]
+        assert queried.count("Broken") == 1
@@ -0,0 +1,107 @@
+"""Tests for the sync_creatives validation / prefetch pipeline.
+
+Formats are looked up once per distinct format, existing creatives are loaded in
+one query, and creative agent previews run concurrently with bounded concurrency
+while results are still reported per creative in payload order.
+"""
+
+import asyncio
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from src.core.database.models import Creative as DBCreative
+from src.core.tools.creatives import _sync_creatives_impl
+
+FORMAT_ID = {"agent_url": "https://creative.example.com", "id": "display_300x250_image"}
+
+
+def _creative(creative_id: str, **overrides) -> dict:
+    return {
+        "creative_id": creative_id,
+        "name": f"Creative {creative_id}",
+        "format_id": FORMAT_ID,
+        "assets": {"banner_image": {"url": f"https://example.com/{creative_id}.png"}},
+        **overrides,
+    }
+
+
+@pytest.fixture
+def registry():
+    format_spec = Mock()
+    format_spec.format_id = FORMAT_ID
+    format_spec.agent_url = FORMAT_ID["agent_url"]
+    format_spec.output_format_ids = None
+
+    state = {"in_flight": 0, "max_in_flight": 0, "format_lookups": 0}
+
+    async def list_all_formats(tenant_id=None):
+        return [format_spec]
+
+    async def get_format(agent_url, format_id):
+        state["format_lookups"] += 1
+        return format_spec
+
+    async def preview_creative(agent_url, format_id, creative_manifest):
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        return {"previews": [{"renders": [{"preview_url": "https://example.com/preview.png"}]}]}
+
+    mock_registry = Mock()
+    mock_registry.list_all_formats = list_all_formats
+    mock_registry.get_format = get_format
+    mock_registry.preview_creative = preview_creative
+    mock_registry.state = state
+    return mock_registry
+
+
+@pytest.fixture
+def session():
+    with (
+        patch("src.core.tools.creatives.get_principal_id_from_context", return_value="principal_123"),
+        patch(
+            "src.core.tools.creatives.get_current_tenant",
+            return_value={"tenant_id": "tenant_123", "approval_mode": "auto-approve"},
+        ),
+        patch("src.core.tools.creatives.get_db_session") as mock_db,
+        patch("src.core.tools.creatives.get_audit_logger"),
+        patch("src.core.tools.creatives.log_tool_activity"),
+    ):
+        mock_session = MagicMock()
+        mock_session.scalars.return_value.all.return_value = []
+        mock_db.return_value.__enter__.return_value = mock_session
+        yield mock_session
+
+
+def test_previews_run_concurrently_and_results_keep_payload_order(session, registry):
+    creatives = [_creative(f"c{i}") for i in range(6)] + [_creative("bad", name="")]
+
+    with (
+        patch("src.core.creative_agent_registry.get_creative_agent_registry", return_value=registry),
+        patch("src.core.tools.creatives.SYNC_CREATIVES_AGENT_CONCURRENCY", 3),
+    ):
+        response = _sync_creatives_impl(creatives=creatives, ctx=Mock())
+
+    assert [r.creative_id for r in response.creatives] == [f"c{i}" for i in range(6)] + ["bad"]
+    assert [r.action for r in response.creatives] == ["created"] * 6 + ["failed"]
+    assert registry.state["max_in_flight"] == 3
+    assert registry.state["format_lookups"] == 1
+    # Existing creatives are loaded with a single IN query (the other query is the audit principal lookup)
+    statements = [call.args[0] for call in session.scalars.call_args_list]
+    creative_queries = [stmt for stmt in statements if stmt.column_descriptions[0]["entity"] is DBCreative]
+    assert len(creative_queries) == 1
+    assert " IN " in str(creative_queries[0])
+
+
+def test_existing_creatives_from_bulk_load_are_updated(session, registry):
+    existing = MagicMock(creative_id="c1", data={}, format_parameters=None)
+    existing.name = "Old name"
+    session.scalars.return_value.all.return_value = [existing]
+
+    with patch("src.core.creative_agent_registry.get_creative_agent_registry", return_value=registry):
+        response = _sync_creatives_impl(creatives=[_creative("c1"), _creative("c2")], ctx=Mock())
+
+    assert [(r.creative_id, r.action) for r in response.creatives] == [("c1", "updated"), ("c2", "created")]
+    assert existing.name == "Creative c1"
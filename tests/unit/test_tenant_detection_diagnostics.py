@@ -0,0 +1,99 @@
+"""Tests for sampled tenant detection diagnostics in get_principal_from_context."""
+
+import json
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from src.core.auth import TENANT_DETECTION_DEBUG_HEADER, get_principal_from_context
+
+TENANT = {"tenant_id": "acme", "name": "Acme"}
+
+
+@pytest.fixture
+def resolve(caplog):
+    """Run tenant detection for the given headers and return emitted diagnostic records."""
+
+    def _resolve(headers):
+        caplog.clear()
+        with (
+            caplog.at_level(logging.INFO, logger="adcp.tenant_detection"),
+            patch("src.core.auth.get_http_headers", return_value=headers),
+            patch("src.core.auth.get_tenant_by_virtual_host", return_value=None),
+            patch("src.core.auth.get_tenant_by_subdomain", return_value=TENANT),
+        ):
+            result = get_principal_from_context(None)
+        records = [json.loads(r.getMessage()) for r in caplog.records if r.name == "adcp.tenant_detection"]
+        return result, records
+
+    return _resolve
+
+
+def test_no_diagnostics_by_default(resolve):
+    result, records = resolve({"host": "acme.example.com"})
+
+    assert result == (None, TENANT)
+    assert records == []
+
+
+def test_request_header_is_ignored_unless_enabled(resolve):
+    _, records = resolve({"host": "acme.example.com", TENANT_DETECTION_DEBUG_HEADER: "true"})
+
+    assert records == []
+
+
+def test_request_header_enables_single_structured_record(resolve):
+    with patch("src.core.auth.TENANT_DETECTION_DEBUG_HEADER_ENABLED", True):
+        _, records = resolve({"host": "acme.example.com", TENANT_DETECTION_DEBUG_HEADER: "true"})
+
+    assert len(records) == 1
+    record = records[0]
+    assert record["type"] == "tenant_detection"
+    assert record["outcome"] == "no_auth"
+    assert record["tenant_id"] == "acme"
+    assert record["detection_method"] == "subdomain"
+    assert record["auth_token_present"] is False
+    assert "duration_ms" in record
+
+
+def test_per_tenant_switch(resolve):
+    with patch("src.core.auth.TENANT_DETECTION_DIAGNOSTICS_TENANTS", frozenset({"acme"})):
+        _, records = resolve({"host": "acme.example.com"})
+
+    assert len(records) == 1
+    assert records[0]["tenant_id"] == "acme"
+
+
+def test_sample_rate(resolve):
+    with patch("src.core.auth.TENANT_DETECTION_DIAGNOSTICS_SAMPLE_RATE", 1.0):
+        _, records = resolve({"host": "acme.example.com"})
+
+    assert len(records) == 1
+
+
+def test_request_header_is_honored_for_tenant_admin(resolve):
+    headers = {"host": "acme.example.com", "x-adcp-auth": "admin_token", TENANT_DETECTION_DEBUG_HEADER: "true"}
+
+    with patch("src.core.auth.get_principal_from_token", return_value="principal_1"):
+        _, records = resolve(headers)
+    assert records == []
+
+    with patch("src.core.auth.get_principal_from_token", return_value="acme_admin"):
+        _, records = resolve(headers)
+    assert len(records) == 1
+    assert records[0]["principal_id"] == "acme_admin"
+
+
+def test_auth_token_is_never_logged(resolve):
+    with (
+        patch("src.core.auth.TENANT_DETECTION_DEBUG_HEADER_ENABLED", True),
+        patch("src.core.auth.get_principal_from_token", return_value="principal_1"),
+    ):
+        _, records = resolve(
+            {"host": "acme.example.com", "x-adcp-auth": "super_secret_token", TENANT_DETECTION_DEBUG_HEADER: "1"}
+        )
+
+    assert records[0]["outcome"] == "authenticated"
+    assert records[0]["principal_id"] == "principal_1"
+    assert "super_secret_token" not in json.dumps(records[0])
@@ -5,17 +5,44 @@ Tests the thread-safe webhook delivery service that's shared by all adapters.
 
 import threading
 from datetime import UTC, datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.services.webhook_delivery_service import CircuitState, WebhookDeliveryService
+from tests.fixtures.mocks import MockOutboxStore
 
 
 @pytest.fixture
 def webhook_service():
-    """Create a fresh webhook service for each test."""
-    return WebhookDeliveryService()
+    """Create a fresh webhook service with an in-memory outbox for each test."""
+    service = WebhookDeliveryService(store=MockOutboxStore())
+    yield service
+    service.stop()
+
+
+def _mock_config(**overrides) -> MagicMock:
+    config = MagicMock()
+    config.id = "cfg_1"
+    config.url = "https://example.com/webhook"
+    config.authentication_type = None
+    config.validation_token = None
+    config.webhook_secret = None
+    for name, value in overrides.items():
+        setattr(config, name, value)
+    return config
+
+
+def _use_config(mock_db_session, config):
+    """Return ``config`` both when queueing (scalars().all()) and when delivering (scalars().first())."""
+    mock_db_session.scalars.return_value.all.return_value = [config]
+    mock_db_session.scalars.return_value.first.return_value = config
+
+
+def _mock_async_client(mock_client, *responses):
+    post = AsyncMock(side_effect=list(responses))
+    mock_client.return_value.post = post
+    return post
 
 
 @pytest.fixture
@@ -94,20 +121,11 @@ def test_adcp_payload_structure(webhook_service, mock_db_session):
     start_time = datetime.now(UTC)
 
     # Mock httpx to capture the payload
-    with patch("src.services.webhook_delivery_service.httpx.Client") as mock_client:
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_client.return_value.__enter__.return_value.post.return_value = mock_response
-
-        # Mock webhook config
-        mock_config = MagicMock()
-        mock_config.url = "https://example.com/webhook"
-        mock_config.authentication_type = None
-        mock_config.validation_token = None
-        mock_config.webhook_secret = None  # No HMAC for this test
+    with patch("src.services.webhook_delivery_service.httpx.AsyncClient") as mock_client:
+        post = _mock_async_client(mock_client, MagicMock(status_code=200))
 
-        # Update mock to return config for SQLAlchemy 2.0
-        mock_db_session.scalars.return_value.all.return_value = [mock_config]
+        # Mock webhook config (no HMAC for this test)
+        _use_config(mock_db_session, _mock_config())
 
         # Send webhook
         webhook_service.send_delivery_webhook(
@@ -123,10 +141,11 @@ def test_adcp_payload_structure(webhook_service, mock_db_session):
             is_final=False,
             next_expected_interval_seconds=60.0,
         )
+        assert webhook_service.flush()
 
         # Verify httpx was called
-        assert mock_client.return_value.__enter__.return_value.post.called
-        call_args = mock_client.return_value.__enter__.return_value.post.call_args
+        assert post.called
+        call_args = post.call_args
 
         # Check new payload structure (PR #86 - no wrapper, direct payload)
         payload = call_args.kwargs["json"]
@@ -154,17 +173,9 @@ def test_final_notification_type(webhook_service, mock_db_session):
     media_buy_id = "buy_final"
     start_time = datetime.now(UTC)
 
-    with patch("src.services.webhook_delivery_service.httpx.Client") as mock_client:
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_client.return_value.__enter__.return_value.post.return_value = mock_response
-
-        mock_config = MagicMock()
-        mock_config.url = "https://example.com/webhook"
-        mock_config.authentication_type = None
-        mock_config.validation_token = None
-        mock_config.webhook_secret = None
-        mock_db_session.scalars.return_value.all.return_value = [mock_config]
+    with patch("src.services.webhook_delivery_service.httpx.AsyncClient") as mock_client:
+        post = _mock_async_client(mock_client, MagicMock(status_code=200))
+        _use_config(mock_db_session, _mock_config())
 
         # Send final webhook
         webhook_service.send_delivery_webhook(
@@ -178,9 +189,10 @@ def test_final_notification_type(webhook_service, mock_db_session):
             status="completed",
             is_final=True,
         )
+        assert webhook_service.flush()
 
         # Check notification_type (direct payload structure in PR #86)
-        payload = mock_client.return_value.__enter__.return_value.post.call_args.kwargs["json"]
+        payload = post.call_args.kwargs["json"]
         assert payload["notification_type"] == "final"
         assert payload["is_adjusted"] is False
         assert "next_expected_at" not in payload
@@ -216,29 +228,10 @@ def test_failure_tracking(webhook_service, mock_db_session):
     media_buy_id = "buy_fail"
     start_time = datetime.now(UTC)
 
-    with patch("src.services.webhook_delivery_service.httpx.Client") as mock_client:
-        # First call succeeds
-        mock_response_ok = MagicMock()
-        mock_response_ok.status_code = 200
-
-        # Second call fails (with retries)
-        mock_response_fail = MagicMock()
-        mock_response_fail.status_code = 500
-
-        # Mock will be called 3 times total (1 success, then 2 failure attempts with retries)
-        mock_client.return_value.__enter__.return_value.post.side_effect = [
-            mock_response_ok,  # First webhook succeeds
-            mock_response_fail,  # Second webhook attempt 1 fails
-            mock_response_fail,  # Second webhook attempt 2 fails (retry)
-            mock_response_fail,  # Second webhook attempt 3 fails (retry)
-        ]
-
-        mock_config = MagicMock()
-        mock_config.url = "https://example.com/webhook"
-        mock_config.authentication_type = None
-        mock_config.validation_token = None
-        mock_config.webhook_secret = None
-        mock_db_session.scalars.return_value.all.return_value = [mock_config]
+    with patch("src.services.webhook_delivery_service.httpx.AsyncClient") as mock_client:
+        # First webhook succeeds, the second gets a server error
+        _mock_async_client(mock_client, MagicMock(status_code=200), MagicMock(status_code=500))
+        _use_config(mock_db_session, _mock_config())
 
         # First webhook - success
         result1 = webhook_service.send_delivery_webhook(
@@ -251,6 +244,7 @@ def test_failure_tracking(webhook_service, mock_db_session):
             spend=100.0,
         )
         assert result1 is True
+        assert webhook_service.flush()
 
         # Check circuit breaker state after success (should be CLOSED)
         endpoint_key = "tenant1:https://example.com/webhook"
@@ -258,7 +252,7 @@ def test_failure_tracking(webhook_service, mock_db_session):
         assert state == CircuitState.CLOSED
         assert failures == 0
 
-        # Second webhook - failure (will retry 3 times)
+        # Second webhook - queued, first attempt fails and is scheduled for retry
         result2 = webhook_service.send_delivery_webhook(
             media_buy_id=media_buy_id,
             tenant_id="tenant1",
@@ -268,7 +262,9 @@ def test_failure_tracking(webhook_service, mock_db_session):
             impressions=2000,
             spend=200.0,
         )
-        assert result2 is False
+        assert result2 is True
+        assert webhook_service.flush()
+        assert webhook_service._outbox._store.statuses() == ["delivered", "retrying"]
 
         # Check circuit breaker recorded the failure
         state, failures = webhook_service.get_circuit_breaker_state(endpoint_key)
@@ -281,19 +277,18 @@ def test_authentication_headers(webhook_service, mock_db_session):
     media_buy_id = "buy_auth"
     start_time = datetime.now(UTC)
 
-    with patch("src.services.webhook_delivery_service.httpx.Client") as mock_client:
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_client.return_value.__enter__.return_value.post.return_value = mock_response
+    with patch("src.services.webhook_delivery_service.httpx.AsyncClient") as mock_client:
+        post = _mock_async_client(mock_client, MagicMock(status_code=200))
 
         # Test bearer auth
-        mock_config = MagicMock()
-        mock_config.url = "https://example.com/webhook"
-        mock_config.authentication_type = "bearer"
-        mock_config.authentication_token = "secret_token"
-        mock_config.validation_token = "validation_token"
-        mock_config.webhook_secret = None
-        mock_db_session.scalars.return_value.all.return_value = [mock_config]
+        _use_config(
+            mock_db_session,
+            _mock_config(
+                authentication_type="bearer",
+                authentication_token="secret_token",
+                validation_token="validation_token",
+            ),
+        )
 
         webhook_service.send_delivery_webhook(
             media_buy_id=media_buy_id,
@@ -304,9 +299,10 @@ def test_authentication_headers(webhook_service, mock_db_session):
             impressions=1000,
             spend=100.0,
         )
+        assert webhook_service.flush()
 
         # Verify headers (PR #86 added X-ADCP-Timestamp, no longer uses X-Webhook-Token)
-        call_args = mock_client.return_value.__enter__.return_value.post.call_args
+        call_args = post.call_args
         headers = call_args.kwargs["headers"]
         assert headers["Authorization"] == "Bearer secret_token"
         assert "X-ADCP-Timestamp" in headers  # NEW in PR #86
@@ -330,3 +326,30 @@ def test_no_webhooks_configured(webhook_service, mock_db_session):
 
     # Should return False but not error
     assert result is False
+
+
+def test_webhooks_are_queued_while_circuit_is_open(webhook_service, mock_db_session):
+    """An open circuit defers delivery instead of dropping the webhook."""
+    _use_config(mock_db_session, _mock_config())
+    breaker = webhook_service._get_circuit_breaker("tenant1:https://example.com/webhook")
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+    with patch("src.services.webhook_delivery_service.httpx.AsyncClient") as mock_client:
+        post = _mock_async_client(mock_client)
+        result = webhook_service.send_delivery_webhook(
+            media_buy_id="buy_open_circuit",
+            tenant_id="tenant1",
+            principal_id="principal1",
+            reporting_period_start=datetime.now(UTC),
+            reporting_period_end=datetime.now(UTC),
+            impressions=1000,
+            spend=100.0,
+        )
+        assert webhook_service.flush()
+
+    assert result is True
+    assert not post.called
+    row = next(iter(webhook_service._outbox._store.rows.values()))
+    assert row["status"] == "pending"
+    assert row["attempts"] == 0
@@ -0,0 +1,260 @@
+"""Tests for the durable webhook outbox (retries, per-endpoint limits, batched outcomes)."""
+
+import asyncio
+import time
+from collections import Counter
+from datetime import timedelta
+
+import pytest
+
+from src.core.metrics import webhook_queue_oldest_age, webhook_queue_size
+from src.services.webhook_outbox import DeliveryResult, OutboxConfig, OutboxItem, WebhookOutbox
+from tests.fixtures.mocks import MockOutboxStore
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(OutboxConfig, "BACKOFF_BASE_SECONDS", 0.0)
+    monkeypatch.setattr(OutboxConfig, "BACKOFF_JITTER_SECONDS", 0.0)
+
+
+@pytest.fixture
+def store():
+    return MockOutboxStore()
+
+
+@pytest.fixture
+def make_outbox(store):
+    outboxes = []
+
+    def make(send, **kwargs):
+        kwargs.setdefault("poll_interval", 0.05)
+        outbox = WebhookOutbox(send=send, store=store, **kwargs)
+        outboxes.append(outbox)
+        return outbox
+
+    yield make
+    for outbox in outboxes:
+        outbox.stop()
+
+
+def _enqueue(outbox, tenant_id="tenant1", url="https://buyer.example.com/hook"):
+    return outbox.enqueue(tenant_id=tenant_id, webhook_url=url, payload={"n": 1}, event_type="delivery_report")
+
+
+def test_webhook_is_persisted_then_delivered(store, make_outbox):
+    sent = []
+
+    async def send(item):
+        sent.append(item.delivery_id)
+        return DeliveryResult(success=True, response_code=200)
+
+    outbox = make_outbox(send)
+    delivery_id = _enqueue(outbox)
+
+    assert outbox.flush(5)
+    assert sent == [delivery_id]
+    row = store.rows[delivery_id]
+    assert row["status"] == "delivered"
+    assert row["attempts"] == 1
+    assert row["next_attempt_at"] is None
+
+
+def test_retryable_failures_are_retried_until_delivered(store, make_outbox):
+    results = [DeliveryResult(success=False, response_code=503), DeliveryResult(success=False, error="timeout")]
+
+    async def send(item):
+        return results.pop(0) if results else DeliveryResult(success=True, response_code=200)
+
+    outbox = make_outbox(send)
+    delivery_id = _enqueue(outbox)
+
+    assert outbox.flush(5)
+    assert store.rows[delivery_id]["status"] == "delivered"
+    assert store.rows[delivery_id]["attempts"] == 3
+
+
+def test_failed_after_max_attempts(store, make_outbox):
+    async def send(item):
+        return DeliveryResult(success=False, response_code=500, error="HTTP 500")
+
+    outbox = make_outbox(send, max_attempts=3)
+    delivery_id = _enqueue(outbox)
+
+    assert outbox.flush(5)
+    row = store.rows[delivery_id]
+    assert row["status"] == "failed"
+    assert row["attempts"] == 3
+    assert row["last_error"] == "HTTP 500"
+    assert row["next_attempt_at"] is None
+
+
+def test_non_retryable_failure_is_not_retried(store, make_outbox):
+    async def send(item):
+        return DeliveryResult(success=False, response_code=404, retryable=False)
+
+    outbox = make_outbox(send, max_attempts=5)
+    delivery_id = _enqueue(outbox)
+
+    assert outbox.flush(5)
+    assert store.rows[delivery_id]["status"] == "failed"
+    assert store.rows[delivery_id]["attempts"] == 1
+
+
+def test_deferred_delivery_does_not_use_an_attempt(store, make_outbox):
+    async def send(item):
+        return DeliveryResult(success=False, retry_after=60)
+
+    outbox = make_outbox(send)
+    delivery_id = _enqueue(outbox)
+
+    assert outbox.flush(5)
+    row = store.rows[delivery_id]
+    assert row["status"] == "pending"
+    assert row["attempts"] == 0
+
+
+def test_backoff_is_exponential_and_capped(monkeypatch):
+    monkeypatch.setattr(OutboxConfig, "BACKOFF_BASE_SECONDS", 1.0)
+    outbox = WebhookOutbox(send=None, store=MockOutboxStore(), max_attempts=20)
+    failure = DeliveryResult(success=False, response_code=503)
+
+    delays = []
+    for attempts in (0, 1, 2, 3, 15):
+        item = OutboxItem(
+            "whd_1", "tenant1", "https://buyer.example.com/hook", {}, "delivery_report", attempts=attempts
+        )
+        outcome = outbox._outcome(item, failure)
+        delays.append(round((outcome["next_attempt_at"] - outcome["last_attempt_at"]) / timedelta(seconds=1)))
+
+    assert delays == [1, 2, 4, 8, OutboxConfig.BACKOFF_MAX_SECONDS]
+
+
+def test_per_endpoint_concurrency_is_limited(store, make_outbox):
+    running: Counter = Counter()
+    peaks: Counter = Counter()
+
+    async def send(item):
+        running[item.webhook_url] += 1
+        running["total"] += 1
+        peaks[item.webhook_url] = max(peaks[item.webhook_url], running[item.webhook_url])
+        peaks["total"] = max(peaks["total"], running["total"])
+        await asyncio.sleep(0.02)
+        running[item.webhook_url] -= 1
+        running["total"] -= 1
+        return DeliveryResult(success=True, response_code=200)
+
+    outbox = make_outbox(send, workers=8, per_endpoint_concurrency=2, per_endpoint_rate=0)
+    for _ in range(6):
+        _enqueue(outbox, url="https://a.example.com/hook")
+        _enqueue(outbox, url="https://b.example.com/hook")
+
+    assert outbox.flush(5)
+    assert peaks["https://a.example.com/hook"] == 2
+    assert peaks["https://b.example.com/hook"] == 2
+    assert peaks["total"] == 4
+    assert store.statuses() == ["delivered"] * 12
+
+
+def test_lease_is_renewed_after_waiting_for_endpoint(store, make_outbox, monkeypatch):
+    monkeypatch.setattr(OutboxConfig, "LEASE_SECONDS", 0.3)
+    sent = []
+
+    async def send(item):
+        sent.append(item.delivery_id)
+        await asyncio.sleep(0.1)
+        return DeliveryResult(success=True, response_code=200)
+
+    # Two "processes" sharing one outbox table; items queue behind one endpoint slot
+    # for longer than the lease, so the other outbox may re-claim them
+    first = make_outbox(send, workers=8, per_endpoint_concurrency=1, per_endpoint_rate=0)
+    second = make_outbox(send, workers=8, per_endpoint_concurrency=1, per_endpoint_rate=0)
+    delivery_ids = [_enqueue(first) for _ in range(6)]
+    second.start()
+
+    deadline = time.monotonic() + 5
+    while store.statuses() != ["delivered"] * 6 and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert store.statuses() == ["delivered"] * 6
+    assert sorted(sent) == sorted(delivery_ids)
+
+
+def test_idle_endpoint_limits_are_evicted(store, make_outbox, monkeypatch):
+    monkeypatch.setattr(OutboxConfig, "STATS_INTERVAL_SECONDS", 0.0)
+
+    async def send(item):
+        return DeliveryResult(success=True, response_code=200)
+
+    outbox = make_outbox(send, per_endpoint_rate=0)
+    for i in range(3):
+        _enqueue(outbox, url=f"https://buyer{i}.example.com/hook")
+    assert outbox.flush(5)
+
+    deadline = time.monotonic() + 5
+    while outbox._endpoints and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert outbox._endpoints == {}
+
+
+def test_stop_hook_runs_on_worker_loop(store, make_outbox):
+    loops = []
+
+    async def send(item):
+        return DeliveryResult(success=True, response_code=200)
+
+    async def on_stop():
+        loops.append(asyncio.get_running_loop())
+
+    outbox = make_outbox(send, on_stop=on_stop)
+    _enqueue(outbox)
+    assert outbox.flush(5)
+    outbox.stop()
+
+    assert loops == [outbox._loop]
+
+
+def test_outcomes_are_written_in_batches(store, make_outbox):
+    async def send(item):
+        await asyncio.sleep(0.01)
+        return DeliveryResult(success=True, response_code=200)
+
+    outbox = make_outbox(send, workers=10, per_endpoint_concurrency=10, per_endpoint_rate=0)
+    outbox.start()
+    # Queue everything before the workers claim anything
+    for _ in range(10):
+        outbox._store.add(OutboxItem(f"whd_{_}", "tenant1", "https://buyer.example.com/hook", {}, "delivery_report"))
+    _enqueue(outbox)
+
+    assert outbox.flush(5)
+    assert store.statuses() == ["delivered"] * 11
+    assert len(store.completed_batches) < 11
+
+
+def test_enqueue_only_process_does_not_deliver(store, make_outbox):
+    async def send(item):
+        raise AssertionError("should not be called")
+
+    outbox = make_outbox(send, workers=0)
+    delivery_id = _enqueue(outbox)
+
+    assert store.rows[delivery_id]["status"] == "pending"
+    assert not outbox._is_running()
+
+
+def test_queue_gauges(store, make_outbox):
+    async def send(item):
+        return DeliveryResult(success=False, retry_after=60)
+
+    outbox = make_outbox(send)
+    _enqueue(outbox, tenant_id="tenant_gauge")
+    _enqueue(outbox, tenant_id="tenant_gauge")
+
+    assert outbox.flush(5)
+    asyncio.run(outbox._report_stats())
+
+    assert webhook_queue_size.labels(tenant_id="tenant_gauge")._value.get() == 2
+    assert webhook_queue_oldest_age.labels(tenant_id="tenant_gauge")._value.get() >= 0
+
+    store.rows.clear()
+    asyncio.run(outbox._report_stats())
+    assert webhook_queue_size.labels(tenant_id="tenant_gauge")._value.get() == 0
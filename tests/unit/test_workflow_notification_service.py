@@ -0,0 +1,120 @@
+"""Tests for out-of-band workflow step push notifications."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.context_manager import ContextManager
+from src.services.webhook_outbox import OutboxConfig
+from src.services.workflow_notification_service import WorkflowNotificationService, _StepAuth
+from tests.fixtures.mocks import MockOutboxStore
+
+
+class FakeHttpClient:
+    """Records posts and answers with a fixed status code."""
+
+    def __init__(self, status_code: int = 200):
+        self.status_code = status_code
+        self.posts: list[dict] = []
+
+    async def post(self, url, json, headers):
+        self.posts.append({"url": url, "json": json, "headers": headers})
+        return SimpleNamespace(status_code=self.status_code)
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(OutboxConfig, "BACKOFF_BASE_SECONDS", 0.0)
+    monkeypatch.setattr(OutboxConfig, "BACKOFF_JITTER_SECONDS", 0.0)
+
+
+@pytest.fixture
+def store():
+    return MockOutboxStore()
+
+
+@pytest.fixture
+def make_service(store):
+    services = []
+
+    def make(client: FakeHttpClient, auth: _StepAuth):
+        service = WorkflowNotificationService(store=store)
+        service._outbox.poll_interval = 0.05
+        service._get_http_client = lambda: client
+        service._load_step_auth = lambda step_id: auth
+        services.append(service)
+        return service
+
+    yield make
+    for service in services:
+        service.stop()
+
+
+def test_notification_is_delivered_with_bearer_auth(store, make_service):
+    client = FakeHttpClient()
+    service = make_service(client, _StepAuth("Bearer", "secret"))
+
+    delivery_id = service.enqueue("tenant1", "step_1", "https://buyer.example.com/hook", {"status": "completed"})
+
+    assert service.flush(5)
+    assert store.rows[delivery_id]["status"] == "delivered"
+    assert client.posts == [
+        {
+            "url": "https://buyer.example.com/hook",
+            "json": {"status": "completed"},
+            "headers": {
+                "Content-Type": "application/json",
+                "User-Agent": "AdCP-Sales-Agent/1.0",
+                "Authorization": "Bearer secret",
+            },
+        }
+    ]
+
+
+def test_client_errors_are_not_retried(store, make_service):
+    client = FakeHttpClient(status_code=404)
+    service = make_service(client, _StepAuth(None, None))
+
+    delivery_id = service.enqueue("tenant1", "step_1", "https://buyer.example.com/hook", {})
+
+    assert service.flush(5)
+    assert store.rows[delivery_id]["status"] == "failed"
+    assert len(client.posts) == 1
+
+
+def _step(url: str | None = "https://buyer.example.com/hook") -> SimpleNamespace:
+    return SimpleNamespace(
+        step_id="step_1",
+        context_id="ctx_1",
+        tool_name="create_media_buy",
+        request_data={"protocol": "a2a", "push_notification_config": {"url": url} if url else {}},
+        response_data={"media_buy_id": "mb_1"},
+    )
+
+
+def test_status_change_queues_one_notification_without_sending():
+    session = MagicMock()
+    session.execute.return_value.first.return_value = ("tenant1", "principal1", "create")
+
+    with patch("src.core.context_manager.get_workflow_notification_service") as get_service:
+        ContextManager()._send_push_notifications(_step(), "completed", session)
+
+    session.execute.assert_called_once()
+    enqueue = get_service.return_value.enqueue
+    enqueue.assert_called_once()
+    assert enqueue.call_args.kwargs["tenant_id"] == "tenant1"
+    assert enqueue.call_args.kwargs["url"] == "https://buyer.example.com/hook"
+    assert enqueue.call_args.kwargs["payload"]["status"]["state"] == "completed"
+
+
+def test_nothing_is_queued_without_a_target():
+    session = MagicMock()
+    session.execute.return_value.first.return_value = None
+
+    with patch("src.core.context_manager.get_workflow_notification_service") as get_service:
+        ContextManager()._send_push_notifications(_step(), "completed", session)
+        ContextManager()._send_push_notifications(_step(url=None), "completed", session)
+
+    get_service.return_value.enqueue.assert_not_called()
+    session.execute.assert_called_once()